@@ -0,0 +1,19 @@
+"""
+Performance benchmarks for the DAG engine and the hot ETL handlers.
+
+Run from the repository root:
+
+    python -m benchmarks --list
+    python -m benchmarks --output bench.json                   # offline suite, small scale
+    python -m benchmarks --only dag. --scale full --repeats 10
+    python -m benchmarks --db --output bench.json              # + Postgres benchmarks
+    python -m benchmarks --baseline baseline.json --fail-on-regression
+
+Results are a JSON document (see benchmarks.harness) whose metrics declare
+their unit and better-direction, so --baseline can flag regressions without
+per-benchmark knowledge. Compare runs from the same machine only.
+
+--db benchmarks use the app's configured database (POSTGIS_* env vars) and
+write to app.workflow_* and geo.bench_load_*; point them at a disposable
+instance, never a shared one.
+"""
@@ -0,0 +1,102 @@
+"""
+Benchmark runner CLI: python -m benchmarks [options]
+
+Exit status: 0 on success, 1 if any benchmark errored or (with
+--fail-on-regression) any metric regressed beyond --tolerance.
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks import bench_dag, bench_handlers  # noqa: F401 - registers benchmarks
+from benchmarks.harness import (
+    BenchmarkContext, compare_to_baseline, registered, run_benchmarks,
+)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", nargs="*", default=None, metavar="PREFIX",
+                        help="Run benchmarks whose name starts with any PREFIX (e.g. dag. raster.)")
+    parser.add_argument("--scale", choices=("small", "full"), default="small",
+                        help="Input sizes: small (CI/laptop, default) or full (realistic)")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repetitions per measurement")
+    parser.add_argument("--db", action="store_true",
+                        help="Also run benchmarks against the configured (disposable!) Postgres")
+    parser.add_argument("--work-dir", default="/tmp/geoetl-bench", help="Scratch directory for inputs")
+    parser.add_argument("--output", help="Write the results document to this JSON file")
+    parser.add_argument("--baseline", help="Results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed fractional slowdown before a metric counts as regressed")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit 1 when any metric regresses beyond --tolerance")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    return parser.parse_args(argv)
+
+
+def _print_results(doc):
+    for r in doc["results"]:
+        if r["status"] != "ok":
+            reason = (r.get("reason") or "").splitlines()[0] if r.get("reason") else ""
+            print(f"{r['name']:<28} {r['status'].upper():<8} {reason}")
+            continue
+        print(f"{r['name']:<28} ok       ({r['elapsed_seconds']:.1f}s) {r['params']}")
+        for key, m in r["metrics"].items():
+            print(f"    {key:<28} {m['value']:>14,.2f} {m['unit']}")
+
+
+def _print_comparison(rows, tolerance):
+    print(f"\nBaseline comparison (tolerance {tolerance:.0%}):")
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"  {row['name']:<28} {row['metric']:<28} "
+            f"{row['baseline']:>12,.2f} -> {row['current']:>12,.2f} {row['unit']:<10} "
+            f"{row['change_pct']:+6.1f}% {flag}"
+        )
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    available = registered()
+
+    if args.list:
+        for name, requires_db in available.items():
+            print(f"{name}{'  (--db)' if requires_db else ''}")
+        return 0
+
+    names = [
+        name for name in available
+        if not args.only or any(name.startswith(prefix) for prefix in args.only)
+    ]
+    if not names:
+        print(f"No benchmarks match {args.only}", file=sys.stderr)
+        return 1
+
+    ctx = BenchmarkContext(
+        scale=args.scale, repeats=max(1, args.repeats), use_db=args.db, work_dir=args.work_dir,
+    )
+    doc = run_benchmarks(names, ctx)
+    _print_results(doc)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(doc, fh, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    exit_code = 1 if any(r["status"] == "error" for r in doc["results"]) else 0
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        rows = compare_to_baseline(doc, baseline, args.tolerance)
+        _print_comparison(rows, args.tolerance)
+        if args.fail_on_regression and any(row["regression"] for row in rows):
+            exit_code = 1
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
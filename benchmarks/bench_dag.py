@@ -0,0 +1,373 @@
+# ============================================================================
+# CLAUDE CONTEXT - DAG ENGINE BENCHMARKS
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Tooling - Fan-out/fan-in, orchestrator tick and claim benchmarks
+# PURPOSE: Measure the DAG engine's hot paths: expanding N fan-out children,
+#          aggregating N results, orchestrator ticks per second, and worker
+#          claim latency under contention (SKIP LOCKED, database only)
+# CREATED: 18 OCT 2026
+# EXPORTS: (registers dag.* benchmarks)
+# DEPENDENCIES: core.dag_*, benchmarks.fake_repo, infrastructure (dag.claim_contention)
+# ============================================================================
+"""
+DAG engine benchmarks.
+
+dag.fan_out_expand, dag.fan_in_aggregate and dag.orchestrator_cycles run the
+real engine functions against InMemoryWorkflowRepository, so they measure
+engine CPU cost (graph walks, parameter resolution, child construction) and
+are stable enough to compare between commits on the same machine.
+
+dag.claim_contention needs --db: it seeds READY tasks in app.workflow_tasks
+and has W threads claim them concurrently through WorkflowRunRepository. It
+refuses to run if the database already holds claimable tasks, because the
+claim query is not scoped to a run.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.fake_repo import InMemoryWorkflowRepository
+from benchmarks.harness import (
+    BenchmarkContext, BenchmarkResult, SkipBenchmark, benchmark, median, percentile,
+)
+
+_PLATFORM_VERSION = "bench"
+
+
+def _workflow_def():
+    """prepare -> fan_out(process) -> fan_in(collect) -> finish."""
+    from core.models.workflow_definition import WorkflowDefinition
+
+    return WorkflowDefinition.model_validate({
+        "workflow": "bench_fan_out",
+        "description": "Synthetic scatter/gather workflow for benchmarks",
+        "version": 1,
+        "parameters": {
+            "item_count": {"type": "int", "required": True},
+            "nonce": {"type": "str", "required": True},
+        },
+        "nodes": {
+            "prepare": {
+                "type": "task",
+                "handler": "bench_prepare",
+                "params": ["item_count"],
+            },
+            "process": {
+                "type": "fan_out",
+                "depends_on": ["prepare"],
+                "source": "prepare.items",
+                "max_fan_out": 10000,
+                "task": {
+                    "handler": "bench_process",
+                    "params": {"index": "{{ item.index }}", "label": "{{ item.label }}"},
+                },
+            },
+            "collect": {
+                "type": "fan_in",
+                "depends_on": ["process"],
+                "aggregation": "collect",
+            },
+            "finish": {
+                "type": "task",
+                "handler": "bench_finish",
+                "depends_on": ["collect"],
+            },
+        },
+    })
+
+
+def _items(n: int) -> list:
+    return [{"index": i, "label": f"item-{i}"} for i in range(n)]
+
+
+def _new_run(repo: InMemoryWorkflowRepository, workflow_def, n: int) -> str:
+    from core.dag_initializer import DAGInitializer
+
+    run = DAGInitializer(repo).create_run(
+        workflow_def, {"item_count": n, "nonce": uuid.uuid4().hex}, _PLATFORM_VERSION,
+    )
+    return run.run_id
+
+
+def _task_row(repo: InMemoryWorkflowRepository, run_id: str, task_name: str) -> dict:
+    return next(
+        row for row in repo.tasks.values()
+        if row["run_id"] == run_id and row["task_name"] == task_name
+        and row["fan_out_source"] is None
+    )
+
+
+def _snapshot(repo: InMemoryWorkflowRepository, run_id: str):
+    """tasks, deps and predecessor_outputs exactly as the orchestrator builds them."""
+    from core.models.workflow_enums import WorkflowTaskStatus
+
+    tasks = repo.get_tasks_for_run(run_id)
+    deps = repo.get_deps_for_run(run_id)
+    predecessor_outputs = {
+        t.task_name: t.result_data or {}
+        for t in tasks
+        if t.status in (WorkflowTaskStatus.COMPLETED, WorkflowTaskStatus.EXPANDED)
+        and t.fan_out_source is None
+    }
+    return tasks, deps, predecessor_outputs
+
+
+def _stage_ready_fan_out(workflow_def, n: int):
+    """A run whose prepare task completed with n items and whose fan-out template is READY."""
+    repo = InMemoryWorkflowRepository()
+    run_id = _new_run(repo, workflow_def, n)
+    _task_row(repo, run_id, "prepare").update(
+        status="completed", result_data={"items": _items(n), "count": n},
+    )
+    _task_row(repo, run_id, "process")["status"] = "ready"
+    return repo, run_id
+
+
+@benchmark("dag.fan_out_expand")
+def bench_fan_out_expand(ctx: BenchmarkContext) -> BenchmarkResult:
+    """expand_fan_outs() for one template with N children."""
+    from core.dag_fan_engine import expand_fan_outs
+    from core.dag_workflow_plan import compile_workflow_plan
+
+    n = ctx.pick(1000, 5000)
+    workflow_def = _workflow_def()
+    plan = compile_workflow_plan(workflow_def)  # as the orchestrator passes it
+    result = BenchmarkResult(name="dag.fan_out_expand", params={"children": n})
+
+    samples = []
+    for i in range(ctx.repeats + 1):
+        repo, run_id = _stage_ready_fan_out(workflow_def, n)
+        tasks, deps, outputs = _snapshot(repo, run_id)
+        t0 = time.perf_counter()
+        fr = expand_fan_outs(
+            run_id, workflow_def, tasks, deps, outputs, {"item_count": n}, repo, plan=plan,
+        )
+        elapsed = time.perf_counter() - t0
+        if fr.children_created != n:
+            raise RuntimeError(f"expected {n} children, got {fr.children_created}")
+        if i:  # first iteration is warmup
+            samples.append(elapsed)
+
+    p50 = median(samples)
+    result.add("elapsed_ms_p50", p50 * 1000, "ms", "lower")
+    result.add("children_per_second", n / p50, "tasks/s", "higher")
+    return result
+
+
+@benchmark("dag.fan_in_aggregate")
+def bench_fan_in_aggregate(ctx: BenchmarkContext) -> BenchmarkResult:
+    """aggregate_fan_ins() over N completed children (collect mode)."""
+    from core.dag_fan_engine import aggregate_fan_ins, expand_fan_outs
+    from core.dag_workflow_plan import compile_workflow_plan
+
+    n = ctx.pick(1000, 5000)
+    workflow_def = _workflow_def()
+    plan = compile_workflow_plan(workflow_def)
+    result = BenchmarkResult(name="dag.fan_in_aggregate", params={"children": n})
+
+    samples = []
+    for i in range(ctx.repeats + 1):
+        repo, run_id = _stage_ready_fan_out(workflow_def, n)
+        tasks, deps, outputs = _snapshot(repo, run_id)
+        expand_fan_outs(run_id, workflow_def, tasks, deps, outputs, {"item_count": n}, repo, plan=plan)
+        for row in repo.tasks.values():
+            if row["fan_out_source"] is not None:
+                row.update(status="completed", result_data={"index": row["fan_out_index"]})
+        _task_row(repo, run_id, "collect")["status"] = "ready"
+        tasks, deps, _ = _snapshot(repo, run_id)
+
+        t0 = time.perf_counter()
+        ar = aggregate_fan_ins(run_id, workflow_def, tasks, deps, repo, plan=plan)
+        elapsed = time.perf_counter() - t0
+        if len(ar.aggregated) != 1:
+            raise RuntimeError(f"fan-in did not aggregate (failed={ar.failed})")
+        if i:
+            samples.append(elapsed)
+
+    p50 = median(samples)
+    result.add("elapsed_ms_p50", p50 * 1000, "ms", "lower")
+    result.add("results_per_second", n / p50, "results/s", "higher")
+    return result
+
+
+def _drain_workers(repo: InMemoryWorkflowRepository, n: int) -> int:
+    """Simulated workers: claim and complete every claimable task."""
+    done = 0
+    while True:
+        row = repo.claim_ready_workflow_task("bench-worker")
+        if row is None:
+            return done
+        if row["task_name"] == "prepare":
+            result_data = {"items": _items(n), "count": n}
+        else:
+            result_data = {"ok": True, "index": row["fan_out_index"]}
+        repo.complete_workflow_task(row["task_instance_id"], result_data)
+        done += 1
+
+
+@benchmark("dag.orchestrator_cycles")
+def bench_orchestrator_cycles(ctx: BenchmarkContext) -> BenchmarkResult:
+    """
+    Single-tick DAGOrchestrator.run() calls driving a scatter/gather run to completion.
+
+    Workers are simulated between ticks, so every tick sees new work, the way
+    the Brain's poll loop does. ms_per_tick covers load + all four engines +
+    terminal detection.
+    """
+    from core.dag_orchestrator import DAGOrchestrator
+    from core.models.workflow_enums import WorkflowRunStatus
+
+    n = ctx.pick(200, 2000)
+    workflow_def = _workflow_def()
+    result = BenchmarkResult(name="dag.orchestrator_cycles", params={"children": n})
+
+    tick_samples = []
+    run_seconds = []
+    ticks_per_run = 0
+    for i in range(ctx.repeats + 1):
+        repo = InMemoryWorkflowRepository()
+        run_id = _new_run(repo, workflow_def, n)
+        orchestrator = DAGOrchestrator(repo)
+        # Runs without release_id never touch the release repo, but run()
+        # resolves it eagerly; pre-seed it so no DB config is needed.
+        orchestrator._release_repo = object()
+        ticks, run_ticks, status = 0, [], WorkflowRunStatus.PENDING
+        t_run = time.perf_counter()
+        while status not in (WorkflowRunStatus.COMPLETED, WorkflowRunStatus.FAILED):
+            if ticks > 50:
+                raise RuntimeError(f"run did not finish after {ticks} ticks (status={status})")
+            t0 = time.perf_counter()
+            status = orchestrator.run(run_id, max_cycles=1, cycle_interval=0.0).final_status
+            run_ticks.append(time.perf_counter() - t0)
+            ticks += 1
+            _drain_workers(repo, n)
+        elapsed = time.perf_counter() - t_run
+        if status != WorkflowRunStatus.COMPLETED:
+            raise RuntimeError(f"run ended {status.value}")
+        if i:
+            tick_samples.extend(run_ticks)
+            run_seconds.append(elapsed)
+            ticks_per_run = ticks
+
+    total_tick_time = sum(tick_samples)
+    result.params["ticks_per_run"] = ticks_per_run
+    result.add("ticks_per_second", len(tick_samples) / total_tick_time, "ticks/s", "higher")
+    result.add("ms_per_tick_p50", median(tick_samples) * 1000, "ms", "lower")
+    result.add("ms_per_tick_p95", percentile(tick_samples, 95) * 1000, "ms", "lower")
+    result.add("run_ms_p50", median(run_seconds) * 1000, "ms", "lower")
+    return result
+
+
+# ============================================================================
+# DATABASE
+# ============================================================================
+
+def _claimable_count(repo) -> int:
+    from psycopg import sql
+
+    query = sql.SQL(
+        "SELECT COUNT(*) AS n FROM {schema}.workflow_tasks "
+        "WHERE status = 'ready' "
+        "  AND handler NOT IN ('__conditional__', '__fan_out__', '__fan_in__', '__gate__')"
+    ).format(schema=sql.Identifier("app"))
+    with repo._get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query)
+            row = cur.fetchone()
+    return row["n"] if isinstance(row, dict) else row[0]
+
+
+def _delete_run(repo, run_id: str) -> None:
+    """Remove a seeded run (deps -> tasks -> run, reverse FK order)."""
+    from psycopg import sql
+
+    schema = sql.Identifier("app")
+    statements = [
+        sql.SQL(
+            "DELETE FROM {schema}.workflow_task_deps WHERE task_instance_id IN "
+            "(SELECT task_instance_id FROM {schema}.workflow_tasks WHERE run_id = %s)"
+        ).format(schema=schema),
+        sql.SQL("DELETE FROM {schema}.workflow_tasks WHERE run_id = %s").format(schema=schema),
+        sql.SQL("DELETE FROM {schema}.workflow_runs WHERE run_id = %s").format(schema=schema),
+    ]
+    with repo._get_connection() as conn:
+        with conn.cursor() as cur:
+            for statement in statements:
+                cur.execute(statement, (run_id,))
+        conn.commit()
+
+
+@benchmark("dag.claim_contention", requires_db=True)
+def bench_claim_contention(ctx: BenchmarkContext) -> BenchmarkResult:
+    """W threads claiming M READY tasks via FOR UPDATE SKIP LOCKED."""
+    from core.models.workflow_enums import WorkflowRunStatus, WorkflowTaskStatus
+    from core.models.workflow_run import WorkflowRun
+    from core.models.workflow_task import WorkflowTask
+    from infrastructure.workflow_run_repository import WorkflowRunRepository
+
+    n_tasks = ctx.pick(500, 5000)
+    n_workers = ctx.pick(8, 32)
+    result = BenchmarkResult(
+        name="dag.claim_contention", params={"tasks": n_tasks, "workers": n_workers},
+    )
+
+    seed_repo = WorkflowRunRepository()
+    existing = _claimable_count(seed_repo)
+    if existing:
+        raise SkipBenchmark(
+            f"{existing} claimable tasks already in app.workflow_tasks; "
+            "point the app config at a disposable database"
+        )
+
+    run_id = f"bench-{uuid.uuid4().hex[:24]}"
+    run = WorkflowRun(
+        run_id=run_id, workflow_name="bench_claim", parameters={},
+        status=WorkflowRunStatus.RUNNING, definition={}, platform_version=_PLATFORM_VERSION,
+    )
+    tasks = [
+        WorkflowTask(
+            task_instance_id=f"{run_id[:18]}-t{i}", run_id=run_id,
+            task_name=f"t{i}", handler="bench_process", status=WorkflowTaskStatus.READY,
+        )
+        for i in range(n_tasks)
+    ]
+    if not seed_repo.insert_run_atomic(run, tasks, []):
+        raise RuntimeError(f"seed run {run_id} already exists")
+
+    latencies, claimed = [], []
+    lock = threading.Lock()
+
+    def worker(worker_idx: int) -> None:
+        repo = WorkflowRunRepository()
+        mine, mine_claimed = [], 0
+        while True:
+            t0 = time.perf_counter()
+            task = repo.claim_ready_workflow_task(f"bench-worker-{worker_idx}")
+            elapsed = time.perf_counter() - t0
+            if task is None:
+                break
+            mine.append(elapsed)
+            mine_claimed += 1
+        with lock:
+            latencies.extend(mine)
+            claimed.append(mine_claimed)
+
+    try:
+        t_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="bench-claim") as pool:
+            list(pool.map(worker, range(n_workers)))
+        wall = time.perf_counter() - t_start
+    finally:
+        _delete_run(seed_repo, run_id)
+
+    if sum(claimed) != n_tasks:
+        raise RuntimeError(f"claimed {sum(claimed)} of {n_tasks} tasks (double claim or leak)")
+
+    result.add("claims_per_second", n_tasks / wall, "claims/s", "higher")
+    result.add("claim_ms_p50", percentile(latencies, 50) * 1000, "ms", "lower")
+    result.add("claim_ms_p95", percentile(latencies, 95) * 1000, "ms", "lower")
+    result.add("claim_ms_p99", percentile(latencies, 99) * 1000, "ms", "lower")
+    return result
@@ -0,0 +1,295 @@
+# ============================================================================
+# CLAUDE CONTEXT - HOT HANDLER BENCHMARKS
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Tooling - Vector load and COG conversion throughput benchmarks
+# PURPOSE: Measure rows/s through the vector pipeline (prepare, GeoParquet
+#          staging, PostGIS chunk insert) and MB/s through COG creation
+# CREATED: 18 OCT 2026
+# EXPORTS: (registers vector.* and raster.* benchmarks)
+# DEPENDENCIES: geopandas, shapely, rasterio, rio-cogeo, numpy (skipped if absent)
+# ============================================================================
+"""
+Handler benchmarks.
+
+Inputs are generated deterministically under BenchmarkContext.work_dir so
+two runs on the same machine process byte-identical data:
+
+    vector.prepare_gdf        VectorToPostGISHandler.prepare_gdf on N polygons
+                              (needs --db: the handler connects on construction)
+    vector.geoparquet_stream  stream_to_geoparquet on an N-row lat/lon CSV
+    vector.postgis_load       create_table_with_batch_tracking + chunked
+                              insert_chunk_idempotent into geo.bench_load_*
+                              (needs --db; the table is dropped afterwards)
+    raster.cog_convert        cog_translate of a synthetic 3-band GeoTIFF with
+                              the DEFLATE profile, single-threaded and with the
+                              worker's GDAL thread budget, plus a reprojecting
+                              WarpedVRT pass
+
+Benchmarks that construct VectorToPostGISHandler are skipped, not failed,
+when the app config cannot be loaded.
+"""
+
+import os
+import shutil
+import time
+import uuid
+
+from benchmarks.harness import (
+    BenchmarkContext, BenchmarkResult, SkipBenchmark, benchmark, median,
+)
+
+_SEED = 20261018
+
+
+def _require(*modules: str) -> None:
+    import importlib
+
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            raise SkipBenchmark(f"{module} not installed ({e})")
+
+
+def _work_dir(ctx: BenchmarkContext, name: str) -> str:
+    path = os.path.join(ctx.work_dir, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _synthetic_polygons(n: int):
+    """n small square polygons with a few typed attribute columns, EPSG:4326."""
+    import geopandas as gpd
+    import numpy as np
+    from shapely.geometry import box
+
+    rng = np.random.default_rng(_SEED)
+    xs = rng.uniform(-170.0, 170.0, n)
+    ys = rng.uniform(-80.0, 80.0, n)
+    sizes = rng.uniform(0.001, 0.05, n)
+    return gpd.GeoDataFrame(
+        {
+            "name": [f"feature_{i}" for i in range(n)],
+            "category": rng.integers(0, 12, n),
+            "score": rng.normal(50.0, 15.0, n),
+            "geometry": [box(x, y, x + s, y + s) for x, y, s in zip(xs, ys, sizes)],
+        },
+        crs="EPSG:4326",
+    )
+
+
+def _vector_handler():
+    try:
+        from services.vector.postgis_handler import VectorToPostGISHandler
+        return VectorToPostGISHandler()
+    except ImportError:
+        raise
+    except Exception as e:
+        raise SkipBenchmark(f"app config unavailable: {type(e).__name__}: {e}")
+
+
+@benchmark("vector.prepare_gdf", requires_db=True)
+def bench_prepare_gdf(ctx: BenchmarkContext) -> BenchmarkResult:
+    """Validation/normalisation pass of the vector ETL on N polygons."""
+    _require("geopandas", "shapely", "numpy")
+    n = ctx.pick(20_000, 200_000)
+    result = BenchmarkResult(name="vector.prepare_gdf", params={"rows": n})
+
+    gdf = _synthetic_polygons(n)
+    handler = _vector_handler()
+    samples = []
+    for i in range(ctx.repeats + 1):
+        source = gdf.copy()
+        t0 = time.perf_counter()
+        handler.prepare_gdf(source)
+        if i:
+            samples.append(time.perf_counter() - t0)
+
+    p50 = median(samples)
+    result.add("elapsed_ms_p50", p50 * 1000, "ms", "lower")
+    result.add("rows_per_second", n / p50, "rows/s", "higher")
+    return result
+
+
+@benchmark("vector.geoparquet_stream")
+def bench_geoparquet_stream(ctx: BenchmarkContext) -> BenchmarkResult:
+    """CSV (lat/lon) -> GeoParquet staging via the streaming converter."""
+    _require("numpy", "pyogrio", "pyarrow")
+    import numpy as np
+    from services.vector.converters import stream_to_geoparquet
+
+    n = ctx.pick(100_000, 1_000_000)
+    result = BenchmarkResult(name="vector.geoparquet_stream", params={"rows": n})
+
+    work = _work_dir(ctx, "geoparquet_stream")
+    csv_path = os.path.join(work, f"points_{n}.csv")
+    if not os.path.exists(csv_path):
+        rng = np.random.default_rng(_SEED)
+        lats = rng.uniform(-80.0, 80.0, n)
+        lons = rng.uniform(-170.0, 170.0, n)
+        tmp = f"{csv_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write("id,name,value,lat,lon\n")
+            for i in range(n):
+                fh.write(f"{i},site_{i},{i % 997},{lats[i]:.6f},{lons[i]:.6f}\n")
+        os.replace(tmp, csv_path)
+    source_mb = os.path.getsize(csv_path) / (1024 * 1024)
+
+    samples = []
+    mode = None
+    for i in range(ctx.repeats + 1):
+        output = os.path.join(work, f"out_{i}.parquet")
+        t0 = time.perf_counter()
+        info = stream_to_geoparquet(csv_path, "csv", output, lat_name="lat", lon_name="lon")
+        elapsed = time.perf_counter() - t0
+        os.remove(output)
+        if info["row_count"] != n:
+            raise RuntimeError(f"expected {n} rows, got {info['row_count']}")
+        mode = info.get("mode")
+        if i:
+            samples.append(elapsed)
+
+    p50 = median(samples)
+    result.params["mode"] = mode
+    result.add("elapsed_ms_p50", p50 * 1000, "ms", "lower")
+    result.add("rows_per_second", n / p50, "rows/s", "higher")
+    result.add("source_mb_per_second", source_mb / p50, "MB/s", "higher")
+    return result
+
+
+@benchmark("vector.postgis_load", requires_db=True)
+def bench_postgis_load(ctx: BenchmarkContext) -> BenchmarkResult:
+    """Chunked idempotent inserts into a scratch table in the geo schema."""
+    _require("geopandas", "shapely", "numpy")
+    from psycopg import sql
+
+    n = ctx.pick(50_000, 500_000)
+    chunk_size = 20_000
+    schema = "geo"
+    table = f"bench_load_{uuid.uuid4().hex[:12]}"
+    result = BenchmarkResult(
+        name="vector.postgis_load", params={"rows": n, "chunk_size": chunk_size},
+    )
+
+    handler = _vector_handler()
+    prepared = handler.prepare_gdf(_synthetic_polygons(n))
+    gdf = next(iter(prepared.values()))
+
+    try:
+        with handler._pg_repo._get_connection() as conn:
+            handler.create_table_with_batch_tracking(table, schema, gdf, conn=conn)
+            conn.commit()
+            t0 = time.perf_counter()
+            inserted = 0
+            for idx, start in enumerate(range(0, len(gdf), chunk_size)):
+                chunk = gdf.iloc[start:start + chunk_size]
+                stats = handler.insert_chunk_idempotent(
+                    chunk, table, schema, f"bench-chunk-{idx}", conn=conn,
+                )
+                inserted += stats["rows_inserted"]
+            elapsed = time.perf_counter() - t0
+    finally:
+        with handler._pg_repo._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql.SQL("DROP TABLE IF EXISTS {}.{}").format(
+                    sql.Identifier(schema), sql.Identifier(table),
+                ))
+            conn.commit()
+
+    result.params["rows_prepared"] = len(gdf)
+    result.add("elapsed_ms", elapsed * 1000, "ms", "lower")
+    result.add("rows_per_second", inserted / elapsed, "rows/s", "higher")
+    return result
+
+
+def _synthetic_geotiff(path: str, size: int) -> None:
+    """3-band uint8 GeoTIFF (EPSG:32633), smooth gradients plus noise, striped."""
+    import numpy as np
+    import rasterio
+    from rasterio.transform import from_origin
+
+    rng = np.random.default_rng(_SEED)
+    yy, xx = np.mgrid[0:size, 0:size].astype("float32") / size
+    profile = {
+        "driver": "GTiff", "width": size, "height": size, "count": 3,
+        "dtype": "uint8", "crs": "EPSG:32633",
+        "transform": from_origin(500000.0, 5000000.0, 10.0, 10.0),
+    }
+    tmp = f"{path}.tmp.tif"
+    with rasterio.open(tmp, "w", **profile) as dst:
+        for band, base in enumerate((xx, yy, (xx + yy) / 2), start=1):
+            noise = rng.integers(0, 24, (size, size), dtype="uint8")
+            dst.write((base * 200).astype("uint8") + noise, band)
+    os.replace(tmp, path)
+
+
+@benchmark("raster.cog_convert")
+def bench_cog_convert(ctx: BenchmarkContext) -> BenchmarkResult:
+    """COG creation MB/s: 1 thread vs the worker thread budget, and with a warp."""
+    _require("numpy", "rasterio", "rio_cogeo")
+    from rasterio.enums import Resampling
+    from rasterio.vrt import WarpedVRT
+    import rasterio
+    from rio_cogeo.cogeo import cog_translate
+    from rio_cogeo.profiles import cog_profiles
+
+    from services.raster.cog_threads import (
+        compute_thread_budget, cog_gdal_options, warp_thread_options,
+    )
+
+    size = ctx.pick(2048, 8192)
+    work = _work_dir(ctx, "cog_convert")
+    source = os.path.join(work, f"source_{size}.tif")
+    if not os.path.exists(source):
+        _synthetic_geotiff(source, size)
+    source_mb = size * size * 3 / (1024 * 1024)  # uncompressed pixels
+
+    budget = compute_thread_budget(task_slots=1, num_threads=0)
+    single = compute_thread_budget(task_slots=1, num_threads=1)
+    result = BenchmarkResult(
+        name="raster.cog_convert",
+        params={"size": size, "bands": 3, "profile": "deflate", "threads": budget["threads"]},
+    )
+    output = os.path.join(work, "out.tif")
+
+    def translate(thread_budget):
+        cog_translate(
+            source, output, cog_profiles.get("deflate"),
+            config=cog_gdal_options(thread_budget),
+            overview_resampling="average", in_memory=False, quiet=True,
+        )
+
+    def translate_warped(thread_budget):
+        with rasterio.open(source) as src:
+            with WarpedVRT(src, crs="EPSG:3857", resampling=Resampling.bilinear,
+                           **warp_thread_options(thread_budget)) as vrt:
+                cog_translate(
+                    vrt, output, cog_profiles.get("deflate"),
+                    config=cog_gdal_options(thread_budget),
+                    overview_resampling="average", in_memory=False, quiet=True,
+                )
+
+    repeats = max(1, ctx.repeats // 2) if ctx.scale == "full" else ctx.repeats
+    timings = {}
+    for label, fn, thread_budget in (
+        ("single", translate, single),
+        ("budget", translate, budget),
+        ("warp_budget", translate_warped, budget),
+    ):
+        samples = []
+        for i in range(repeats + 1):
+            t0 = time.perf_counter()
+            fn(thread_budget)
+            if i:
+                samples.append(time.perf_counter() - t0)
+        timings[label] = median(samples)
+    os.remove(output)
+    if ctx.scale == "full":
+        shutil.rmtree(work, ignore_errors=True)  # ~200 MB source, don't keep it around
+
+    result.add("mb_per_second_1_thread", source_mb / timings["single"], "MB/s", "higher")
+    result.add("mb_per_second", source_mb / timings["budget"], "MB/s", "higher")
+    result.add("mb_per_second_reproject", source_mb / timings["warp_budget"], "MB/s", "higher")
+    result.add("thread_speedup", timings["single"] / timings["budget"], "x", "higher")
+    return result
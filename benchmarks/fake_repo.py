@@ -0,0 +1,194 @@
+# ============================================================================
+# CLAUDE CONTEXT - IN-MEMORY DAG REPOSITORY (BENCHMARK STAND-IN)
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Tooling - DAGRepositoryProtocol implementation backed by dicts
+# PURPOSE: Let benchmarks drive DAGInitializer, DAGOrchestrator and the fan
+#          engines without Postgres, so engine CPU cost is measured in isolation
+# CREATED: 18 OCT 2026
+# EXPORTS: InMemoryWorkflowRepository
+# DEPENDENCIES: core.dag_graph_utils, core.models
+# ============================================================================
+"""
+In-memory stand-in for WorkflowRunRepository.
+
+Implements DAGRepositoryProtocol plus the writes DAGInitializer and a worker
+need (insert_run_atomic, claim_ready_workflow_task, complete_workflow_task)
+with the same compare-and-swap guards as the SQL, so the engines see the
+state transitions they would see against the database. Round-trip latency is
+deliberately absent: orchestrator benchmarks against this repository measure
+engine cost only; dag.claim_contention covers the database side.
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from core.dag_graph_utils import TaskSummary
+from core.models.workflow_enums import WorkflowRunStatus, WorkflowTaskStatus
+from core.models.workflow_run import WorkflowRun
+
+# Handlers owned by the orchestrator, never claimed by workers
+_SENTINEL_HANDLERS = frozenset({'__conditional__', '__fan_out__', '__fan_in__', '__gate__'})
+
+# Column order of fan-out child tuples (core.dag_fan_engine._build_child_tuple)
+_CHILD_FIELDS = (
+    "task_instance_id", "run_id", "task_name", "handler", "status",
+    "fan_out_index", "fan_out_source", "when_clause", "parameters",
+    "result_data", "error_details", "retry_count", "max_retries",
+    "claimed_by", "last_pulse", "execute_after", "started_at",
+    "completed_at", "created_at", "updated_at",
+)
+
+
+class InMemoryWorkflowRepository:
+    """Dict-backed DAG repository with the SQL repository's CAS semantics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.runs: Dict[str, WorkflowRun] = {}
+        self.tasks: Dict[str, dict] = {}
+        self.deps: Dict[str, List[Tuple[str, str, bool]]] = {}  # run_id -> edges
+        self._task_order: List[str] = []
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, op: str) -> None:
+        self.calls[op] = self.calls.get(op, 0) + 1
+
+    def _cas(self, task_instance_id: str, allowed: tuple, **updates) -> bool:
+        with self._lock:
+            row = self.tasks.get(task_instance_id)
+            if row is None or row["status"] not in allowed:
+                return False
+            row.update(updates)
+            return True
+
+    # ------------------------------------------------------------------
+    # Initializer / worker side
+    # ------------------------------------------------------------------
+
+    def insert_run_atomic(self, run, tasks, deps) -> bool:
+        self._count("insert_run_atomic")
+        with self._lock:
+            if run.run_id in self.runs:
+                return False
+            self.runs[run.run_id] = run.model_copy()
+            for t in tasks:
+                self.tasks[t.task_instance_id] = {
+                    "task_instance_id": t.task_instance_id,
+                    "run_id": t.run_id,
+                    "task_name": t.task_name,
+                    "handler": t.handler,
+                    "status": t.status.value,
+                    "fan_out_index": t.fan_out_index,
+                    "fan_out_source": t.fan_out_source,
+                    "parameters": t.parameters,
+                    "result_data": t.result_data,
+                    "best_effort": t.best_effort,
+                }
+                self._task_order.append(t.task_instance_id)
+            self.deps[run.run_id] = [
+                (d.task_instance_id, d.depends_on_instance_id, d.optional) for d in deps
+            ]
+        return True
+
+    def claim_ready_workflow_task(self, worker_id: str) -> Optional[dict]:
+        self._count("claim_ready_workflow_task")
+        with self._lock:
+            for iid in self._task_order:
+                row = self.tasks[iid]
+                if row["status"] == "ready" and row["handler"] not in _SENTINEL_HANDLERS:
+                    row["status"] = "running"
+                    row["claimed_by"] = worker_id
+                    return dict(row)
+        return None
+
+    def complete_workflow_task(self, task_instance_id: str, result_data: dict) -> None:
+        self._count("complete_workflow_task")
+        self._cas(task_instance_id, ("running",), status="completed",
+                  result_data=result_data, claimed_by=None)
+
+    # ------------------------------------------------------------------
+    # DAGRepositoryProtocol
+    # ------------------------------------------------------------------
+
+    def get_by_run_id(self, run_id: str):
+        self._count("get_by_run_id")
+        run = self.runs.get(run_id)
+        return run.model_copy() if run else None
+
+    def get_tasks_for_run(self, run_id: str) -> list:
+        self._count("get_tasks_for_run")
+        with self._lock:
+            return [
+                TaskSummary(
+                    task_instance_id=row["task_instance_id"],
+                    task_name=row["task_name"],
+                    handler=row["handler"],
+                    status=WorkflowTaskStatus(row["status"]),
+                    result_data=row["result_data"],
+                    fan_out_source=row["fan_out_source"],
+                    fan_out_index=row["fan_out_index"],
+                    best_effort=row.get("best_effort", False),
+                )
+                for row in self.tasks.values() if row["run_id"] == run_id
+            ]
+
+    def get_deps_for_run(self, run_id: str) -> list:
+        self._count("get_deps_for_run")
+        with self._lock:
+            return list(self.deps.get(run_id, []))
+
+    def update_run_status(self, run_id: str, status: WorkflowRunStatus) -> bool:
+        self._count("update_run_status")
+        with self._lock:
+            run = self.runs.get(run_id)
+            if run is None or run.status in (WorkflowRunStatus.COMPLETED, WorkflowRunStatus.FAILED):
+                return False
+            run.status = status
+            return True
+
+    def get_release_for_waiting_run(self, run_id: str):
+        return None
+
+    def complete_gate_node(self, run_id: str, gate_node_name: str, result_data: dict) -> bool:
+        return False
+
+    def skip_gate_node(self, run_id: str, gate_node_name: str, result_data: dict) -> None:
+        return None
+
+    def promote_task(self, task_instance_id, from_status, to_status) -> bool:
+        self._count("promote_task")
+        return self._cas(task_instance_id, (from_status.value,), status=to_status.value)
+
+    def skip_task(self, task_instance_id: str) -> bool:
+        self._count("skip_task")
+        return self._cas(task_instance_id, ("pending", "ready"), status="skipped")
+
+    def fail_task(self, task_instance_id: str, error_details: str) -> None:
+        self._count("fail_task")
+        self._cas(task_instance_id, ("running", "ready", "pending"), status="failed",
+                  error_details=error_details, result_data={"error": error_details})
+
+    def set_params_and_promote(self, task_instance_id, params, from_status, to_status) -> bool:
+        self._count("set_params_and_promote")
+        return self._cas(task_instance_id, (from_status.value,),
+                         status=to_status.value, parameters=params)
+
+    def expand_fan_out(self, template_id: str, children: list, deps: list) -> bool:
+        self._count("expand_fan_out")
+        with self._lock:
+            template = self.tasks.get(template_id)
+            if template is None or template["status"] != "ready":
+                return False
+            template["status"] = "expanded"
+            for child in children:
+                row = dict(zip(_CHILD_FIELDS, child))
+                row["best_effort"] = False
+                self.tasks[row["task_instance_id"]] = row
+                self._task_order.append(row["task_instance_id"])
+            self.deps.setdefault(template["run_id"], []).extend(deps)
+        return True
+
+    def aggregate_fan_in(self, fan_in_id: str, aggregated_result: dict) -> None:
+        self._count("aggregate_fan_in")
+        self._cas(fan_in_id, ("ready",), status="completed", result_data=aggregated_result)
@@ -0,0 +1,232 @@
+# ============================================================================
+# CLAUDE CONTEXT - BENCHMARK HARNESS
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Tooling - Registry, timing and baseline comparison for benchmarks
+# PURPOSE: Run registered benchmarks, collect metrics into a JSON document and
+#          compare a run against a stored baseline
+# CREATED: 18 OCT 2026
+# EXPORTS: Metric, BenchmarkResult, BenchmarkContext, SkipBenchmark, benchmark,
+#          registered, time_repeated, run_benchmarks, compare_to_baseline
+# DEPENDENCIES: stdlib only
+# ============================================================================
+"""
+Benchmark harness.
+
+A benchmark is a function registered with @benchmark("group.name") that
+takes a BenchmarkContext and returns a BenchmarkResult. Benchmarks that need
+an optional dependency or the database raise SkipBenchmark with a reason;
+they are reported as skipped, never as failures.
+
+Every metric declares which direction is better, so compare_to_baseline can
+flag regressions without knowing what the metric measures:
+
+    {"name": "dag.fan_out_expand", "status": "ok",
+     "params": {"children": 5000},
+     "metrics": {"children_per_second": {"value": 41234.5, "unit": "tasks/s",
+                                         "better": "higher"}, ...}}
+"""
+
+import math
+import os
+import platform
+import statistics
+import subprocess
+import time
+import traceback
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+RESULTS_FORMAT_VERSION = 1
+
+# name -> (function, requires_db)
+_REGISTRY: Dict[str, tuple] = {}
+
+
+class SkipBenchmark(Exception):
+    """Raised by a benchmark that cannot run in this environment."""
+
+
+@dataclass
+class Metric:
+    value: float
+    unit: str
+    better: str  # "higher" | "lower"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"value": round(self.value, 4), "unit": self.unit, "better": self.better}
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    status: str = "ok"  # ok | skipped | error
+    params: Dict[str, Any] = field(default_factory=dict)
+    metrics: Dict[str, Metric] = field(default_factory=dict)
+    reason: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    def add(self, key: str, value: float, unit: str, better: str) -> None:
+        self.metrics[key] = Metric(value=float(value), unit=unit, better=better)
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {
+            "name": self.name,
+            "status": self.status,
+            "params": self.params,
+            "metrics": {k: m.to_dict() for k, m in self.metrics.items()},
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+        if self.reason:
+            out["reason"] = self.reason
+        return out
+
+
+@dataclass
+class BenchmarkContext:
+    """Run-wide settings handed to every benchmark."""
+    scale: str = "small"          # small | full
+    repeats: int = 5
+    use_db: bool = False          # Benchmarks against the configured Postgres
+    work_dir: str = "/tmp/geoetl-bench"
+
+    def pick(self, small: Any, full: Any) -> Any:
+        """Choose a size parameter by scale."""
+        return full if self.scale == "full" else small
+
+
+def benchmark(name: str, requires_db: bool = False) -> Callable:
+    """Register a benchmark function under a dotted name."""
+    def decorator(fn: Callable[[BenchmarkContext], BenchmarkResult]) -> Callable:
+        _REGISTRY[name] = (fn, requires_db)
+        return fn
+    return decorator
+
+
+def registered() -> Dict[str, bool]:
+    """Registered benchmark names -> requires_db."""
+    return {name: requires_db for name, (_fn, requires_db) in sorted(_REGISTRY.items())}
+
+
+def time_repeated(fn: Callable[[], Any], repeats: int, warmup: int = 1) -> List[float]:
+    """
+    Wall-clock seconds for `repeats` calls of fn after `warmup` untimed calls.
+
+    fn is responsible for its own setup; use a closure that rebuilds state
+    if the measured operation is not idempotent.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def median(samples: List[float]) -> float:
+    return statistics.median(samples)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _host_info() -> Dict[str, Any]:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cpus = os.cpu_count()
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": cpus,
+    }
+
+
+def run_benchmarks(names: List[str], ctx: BenchmarkContext) -> Dict[str, Any]:
+    """Run the named benchmarks in order and return the results document."""
+    results = []
+    for name in names:
+        fn, requires_db = _REGISTRY[name]
+        t0 = time.perf_counter()
+        if requires_db and not ctx.use_db:
+            result = BenchmarkResult(name=name, status="skipped",
+                                     reason="needs --db (configured Postgres)")
+        else:
+            try:
+                result = fn(ctx)
+            except SkipBenchmark as e:
+                result = BenchmarkResult(name=name, status="skipped", reason=str(e))
+            except Exception as e:
+                result = BenchmarkResult(
+                    name=name, status="error",
+                    reason=f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=5)}",
+                )
+        result.elapsed_seconds = time.perf_counter() - t0
+        results.append(result.to_dict())
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "host": _host_info(),
+        "scale": ctx.scale,
+        "repeats": ctx.repeats,
+        "results": results,
+    }
+
+
+def compare_to_baseline(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float,
+) -> List[Dict[str, Any]]:
+    """
+    Per-metric comparison of two results documents.
+
+    Only benchmarks that ran ("ok") in both documents with identical params
+    are compared. change_pct is signed so that negative is always worse.
+
+    Returns:
+        One entry per compared metric with name, metric, baseline, current,
+        change_pct and regression (worse by more than tolerance).
+    """
+    base_by_name = {r["name"]: r for r in baseline.get("results", []) if r.get("status") == "ok"}
+    rows = []
+    for result in current.get("results", []):
+        base = base_by_name.get(result["name"])
+        if result.get("status") != "ok" or base is None or base.get("params") != result.get("params"):
+            continue
+        for key, metric in result["metrics"].items():
+            base_metric = base["metrics"].get(key)
+            if not base_metric or not base_metric["value"]:
+                continue
+            ratio = metric["value"] / base_metric["value"]
+            change = (ratio - 1.0) if metric["better"] == "higher" else (1.0 - ratio)
+            rows.append({
+                "name": result["name"],
+                "metric": key,
+                "unit": metric["unit"],
+                "baseline": base_metric["value"],
+                "current": metric["value"],
+                "change_pct": round(change * 100, 1),
+                "regression": change < -tolerance,
+            })
+    return rows
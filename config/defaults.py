@@ -487,6 +487,7 @@ class TaskRoutingDefaults:
         "vector_finalize",
         "release_link_tables",
         "vector_build_stac_item",
+        "vector_build_tile_archive",
 
         # =====================================================================
         # RASTER ATOMIC HANDLERS (v0.10.5 DAG decomposition)
@@ -590,6 +591,21 @@ class RasterDefaults:
     COG_TILE_SIZE = 512
     COG_IN_MEMORY = False  # Disk-based (/tmp) - safer with concurrency
 
+    # COG encoding threads (18 OCT 2026): GDAL_NUM_THREADS for compression and
+    # overviews, NUM_THREADS for the reprojection warp.
+    COG_NUM_THREADS = 0  # 0 = auto: available CPUs // COG_TASK_SLOTS
+    COG_TASK_SLOTS = 1   # COG tasks a worker runs at once (Docker queue worker is serial)
+
+    # ==========================================================================
+    # SOURCE ACCESS (18 OCT 2026)
+    # ==========================================================================
+    # How DAG raster handlers read the bronze source:
+    #   "auto"   - stream tiled GeoTIFFs via /vsiaz/, stage everything else
+    #   "mount"  - always copy the blob to the ETL mount first
+    #   "stream" - always read via /vsiaz/ (no mount copy)
+    SOURCE_ACCESS_MODE = "auto"
+    VSI_CACHE_MB = 256  # Per-process GDAL /vsiaz/ block cache
+
     # ==========================================================================
     # MEMORY ESTIMATION - Dtype-aware peak multipliers (23 DEC 2025)
     # ==========================================================================
@@ -632,6 +648,12 @@ class DockerDefaults:
 
     ETL_MOUNT_PATH = None  # No default — RASTER_ETL_MOUNT_PATH must be set explicitly
 
+    # Mount space manager (18 OCT 2026) — see infrastructure/mount_space.py
+    MOUNT_MIN_FREE_GB = 10.0            # Headroom never handed out to reservations
+    MOUNT_CLAIM_MIN_FREE_GB = 25.0      # Below this (after eviction) workers stop claiming
+    MOUNT_RESERVATION_TTL_SECONDS = 21600  # Reservation markers from crashed workers expire (6h)
+    MOUNT_ORPHAN_GRACE_HOURS = 24.0     # Dirs with no known run/job evictable after this idle time
+
 
 # =============================================================================
 # VECTOR DEFAULTS (PostGIS ETL)
@@ -653,6 +675,16 @@ class VectorDefaults:
 
     # Multi-source collection limits (08 MAR 2026)
     MAX_VECTOR_SOURCES = 10  # Max files or GPKG layers per collection job
+    MULTI_SOURCE_WORKERS = 4  # Sources loaded concurrently per multi-source job
+
+    # Generalized low-zoom views (processing_options.generalize)
+    GENERALIZATION_ZOOMS = (4, 7, 10)  # Max zoom served by each {table}_z{N} level
+
+    # Pre-rendered PMTiles archives (processing_options.tile_archive)
+    TILE_ARCHIVE_MIN_ZOOM = 0
+    TILE_ARCHIVE_MAX_ZOOM = 8
+    TILE_ARCHIVE_ZOOM_LIMIT = 14  # Hard ceiling on requested max_zoom
+    TILE_ARCHIVE_MAX_TILES = 100_000  # max_zoom is lowered to stay under this
 
 
 # =============================================================================
@@ -765,6 +797,12 @@ class STACDefaults:
         "gold": "GeoParquet exports optimized for analytical queries",
     }
 
+    # ==========================================================================
+    # ISO3 ATTRIBUTION
+    # ==========================================================================
+    ISO3_ADMIN0_CACHE_TTL_SECONDS = 300       # Resolved admin0 table/columns, per process
+    ISO3_BATCH_SIZE = 2000                    # Bboxes per set-based attribution query
+
 
 # =============================================================================
 # OBSERVABILITY DEFAULTS (10 JAN 2026 - F7.12.C Flag Consolidation)
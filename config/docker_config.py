@@ -14,6 +14,10 @@ so vector processing can use the same mount for large file streaming.
 
 Environment Variables:
     RASTER_ETL_MOUNT_PATH     = /mount/etl-temp  (Azure Files mount path)
+    ETL_MOUNT_MIN_FREE_GB            = 10    (headroom kept out of reservations)
+    ETL_MOUNT_CLAIM_MIN_FREE_GB      = 25    (workers pause claiming below this)
+    ETL_MOUNT_RESERVATION_TTL_SECONDS = 21600 (stale reservation marker expiry)
+    ETL_MOUNT_ORPHAN_GRACE_HOURS     = 24    (idle time before unowned dirs are evictable)
 
 Mount availability is derived from APP_MODE:
     worker_docker  → RASTER_ETL_MOUNT_PATH is REQUIRED (reports unhealthy without it)
@@ -28,6 +32,8 @@ import logging
 from typing import Optional
 from pydantic import BaseModel, Field
 
+from .defaults import DockerDefaults
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +62,24 @@ class DockerConfig(BaseModel):
         description="Set when APP_MODE=worker_docker but RASTER_ETL_MOUNT_PATH is missing."
     )
 
+    # Mount space manager (18 OCT 2026)
+    mount_min_free_gb: float = Field(
+        default=DockerDefaults.MOUNT_MIN_FREE_GB,
+        description="Free space on the mount never handed out to reservations."
+    )
+    mount_claim_min_free_gb: float = Field(
+        default=DockerDefaults.MOUNT_CLAIM_MIN_FREE_GB,
+        description="Workers stop claiming tasks while unreserved free space is below this."
+    )
+    mount_reservation_ttl_seconds: int = Field(
+        default=DockerDefaults.MOUNT_RESERVATION_TTL_SECONDS,
+        description="Age after which a reservation marker (e.g. from a crashed worker) is ignored."
+    )
+    mount_orphan_grace_hours: float = Field(
+        default=DockerDefaults.MOUNT_ORPHAN_GRACE_HOURS,
+        description="Idle time before a mount dir with no known run/job becomes evictable."
+    )
+
     @classmethod
     def from_environment(cls) -> "DockerConfig":
         """Load from environment variables.
@@ -88,10 +112,28 @@ class DockerConfig(BaseModel):
             logger.error("=" * 60)
             return cls(etl_mount_path=None, mount_error=error_msg)
 
-        return cls(etl_mount_path=mount_path)
+        return cls(
+            etl_mount_path=mount_path,
+            mount_min_free_gb=float(os.environ.get(
+                "ETL_MOUNT_MIN_FREE_GB", str(DockerDefaults.MOUNT_MIN_FREE_GB)
+            )),
+            mount_claim_min_free_gb=float(os.environ.get(
+                "ETL_MOUNT_CLAIM_MIN_FREE_GB", str(DockerDefaults.MOUNT_CLAIM_MIN_FREE_GB)
+            )),
+            mount_reservation_ttl_seconds=int(os.environ.get(
+                "ETL_MOUNT_RESERVATION_TTL_SECONDS", str(DockerDefaults.MOUNT_RESERVATION_TTL_SECONDS)
+            )),
+            mount_orphan_grace_hours=float(os.environ.get(
+                "ETL_MOUNT_ORPHAN_GRACE_HOURS", str(DockerDefaults.MOUNT_ORPHAN_GRACE_HOURS)
+            )),
+        )
 
     def debug_dict(self) -> dict:
         """Return safe debug representation."""
         return {
             "etl_mount_path": self.etl_mount_path,
+            "mount_min_free_gb": self.mount_min_free_gb,
+            "mount_claim_min_free_gb": self.mount_claim_min_free_gb,
+            "mount_reservation_ttl_seconds": self.mount_reservation_ttl_seconds,
+            "mount_orphan_grace_hours": self.mount_orphan_grace_hours,
         }
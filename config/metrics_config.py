@@ -26,6 +26,8 @@ METRICS_ENABLED: Master switch for metrics collection (default: true)
 METRICS_DEBUG_MODE: Enable chattery stdout logging (default: false)
 METRICS_SAMPLE_INTERVAL: Seconds between snapshots (default: 5)
 METRICS_RETENTION_MINUTES: Auto-cleanup old metrics (default: 60)
+METRICS_FLUSH_INTERVAL: Seconds between buffered progress writes (default: 5)
+METRICS_BUFFER_MAX_EVENTS: Queued events before oldest are dropped (default: 1000)
 
 Usage:
 ------
@@ -93,6 +95,16 @@ class MetricsConfig(BaseModel):
     log_prefix: Prefix for debug log messages
         - Default: "[METRICS]"
         - Helps filter logs in Application Insights
+
+    flush_interval: Seconds between progress write buffer flushes
+        - Snapshots, events and checkpoints are coalesced in-process and
+          written in one batch per interval (infrastructure.progress_buffer)
+        - 0 = write every record immediately (no buffering)
+        - Default: 5 seconds
+
+    buffer_max_events: Bound on queued metric events
+        - Oldest events are dropped (and counted) beyond this
+        - Default: 1000
     """
 
     enabled: bool = Field(
@@ -145,6 +157,27 @@ class MetricsConfig(BaseModel):
         )
     )
 
+    flush_interval: int = Field(
+        default=5,
+        ge=0,
+        le=60,
+        description=(
+            "Seconds between batched writes of buffered progress snapshots, "
+            "events and task checkpoints. 0 = write-through (no buffering). "
+            "Default: 5 seconds."
+        )
+    )
+
+    buffer_max_events: int = Field(
+        default=1000,
+        ge=10,
+        le=100000,
+        description=(
+            "Maximum metric events queued between flushes; the oldest are "
+            "dropped beyond this. Default: 1000."
+        )
+    )
+
     @classmethod
     def from_environment(cls) -> "MetricsConfig":
         """
@@ -157,6 +190,8 @@ class MetricsConfig(BaseModel):
         METRICS_SAMPLE_INTERVAL: Snapshot frequency in seconds (default: "5")
         METRICS_RETENTION_MINUTES: Cleanup threshold (default: "60")
         METRICS_LOG_PREFIX: Log message prefix (default: "[METRICS]")
+        METRICS_FLUSH_INTERVAL: Buffered write interval in seconds (default: "5")
+        METRICS_BUFFER_MAX_EVENTS: Event queue bound (default: "1000")
 
         Returns:
             MetricsConfig: Configured metrics settings
@@ -174,7 +209,13 @@ class MetricsConfig(BaseModel):
             retention_minutes=int(
                 os.environ.get("METRICS_RETENTION_MINUTES", "60")
             ),
-            log_prefix=os.environ.get("METRICS_LOG_PREFIX", "[METRICS]")
+            log_prefix=os.environ.get("METRICS_LOG_PREFIX", "[METRICS]"),
+            flush_interval=int(
+                os.environ.get("METRICS_FLUSH_INTERVAL", "5")
+            ),
+            buffer_max_events=int(
+                os.environ.get("METRICS_BUFFER_MAX_EVENTS", "1000")
+            )
         )
 
     def debug_dict(self) -> dict:
@@ -189,7 +230,9 @@ class MetricsConfig(BaseModel):
             "debug_mode": self.debug_mode,
             "sample_interval": self.sample_interval,
             "retention_minutes": self.retention_minutes,
-            "log_prefix": self.log_prefix
+            "log_prefix": self.log_prefix,
+            "flush_interval": self.flush_interval,
+            "buffer_max_events": self.buffer_max_events
         }
 
     def should_log(self) -> bool:
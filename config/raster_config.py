@@ -54,6 +54,8 @@ Processing Settings (Handler Layer):
     RASTER_COG_IN_MEMORY = false      # Use disk-based processing (safer)
     RASTER_COG_COMPRESSION = deflate  # COG compression algorithm
     RASTER_COG_TILE_SIZE = 512        # Internal COG tile size (pixels)
+    RASTER_COG_NUM_THREADS = 0        # GDAL threads per COG task (0 = CPUs // task slots)
+    RASTER_COG_TASK_SLOTS = 1         # Concurrent COG tasks per worker
 
 Validation Settings:
     RASTER_TARGET_CRS = EPSG:4326     # Target coordinate reference system
@@ -234,6 +236,34 @@ class RasterConfig(BaseModel):
         description="Enable strict validation (fails on warnings)"
     )
 
+    # COG encoding threads (18 OCT 2026)
+    cog_num_threads: int = Field(
+        default=RasterDefaults.COG_NUM_THREADS,
+        ge=0,
+        description="GDAL threads per COG task for warping, compression and overviews "
+                    "(0 = available CPUs divided by cog_task_slots)"
+    )
+
+    cog_task_slots: int = Field(
+        default=RasterDefaults.COG_TASK_SLOTS,
+        ge=1,
+        description="COG tasks a worker may run concurrently (divides the CPU budget)"
+    )
+
+    # Source access (18 OCT 2026)
+    source_access_mode: str = Field(
+        default=RasterDefaults.SOURCE_ACCESS_MODE,
+        description="How raster handlers read bronze sources: auto (stream tiled "
+                    "GeoTIFFs via /vsiaz/, stage others on the mount), mount, or stream",
+        examples=["auto", "mount", "stream"]
+    )
+
+    vsi_cache_mb: int = Field(
+        default=RasterDefaults.VSI_CACHE_MB,
+        ge=0,
+        description="GDAL VSI block cache size (MB) for /vsiaz/ source reads"
+    )
+
     # stac_default_collection removed (14 JAN 2026)
     # collection_id is now a required parameter for all raster jobs - no more "system-rasters" catch-all
 
@@ -263,10 +293,15 @@ class RasterConfig(BaseModel):
             cog_jpeg_quality=int(os.environ.get("RASTER_COG_JPEG_QUALITY", str(RasterDefaults.COG_JPEG_QUALITY))),
             cog_tile_size=int(os.environ.get("RASTER_COG_TILE_SIZE", str(RasterDefaults.COG_TILE_SIZE))),
             cog_in_memory=os.environ.get("RASTER_COG_IN_MEMORY", str(RasterDefaults.COG_IN_MEMORY).lower()).lower() == "true",
+            cog_num_threads=int(os.environ.get("RASTER_COG_NUM_THREADS", str(RasterDefaults.COG_NUM_THREADS))),
+            cog_task_slots=int(os.environ.get("RASTER_COG_TASK_SLOTS", str(RasterDefaults.COG_TASK_SLOTS))),
             # Validation settings
             target_crs=os.environ.get("RASTER_TARGET_CRS", RasterDefaults.TARGET_CRS),
             overview_resampling=os.environ.get("RASTER_OVERVIEW_RESAMPLING", RasterDefaults.OVERVIEW_RESAMPLING),
             reproject_resampling=os.environ.get("RASTER_REPROJECT_RESAMPLING", RasterDefaults.REPROJECT_RESAMPLING),
             strict_validation=os.environ.get("RASTER_STRICT_VALIDATION", str(RasterDefaults.STRICT_VALIDATION).lower()).lower() == "true",
+            # Source access (18 OCT 2026)
+            source_access_mode=os.environ.get("RASTER_SOURCE_ACCESS_MODE", RasterDefaults.SOURCE_ACCESS_MODE).lower(),
+            vsi_cache_mb=int(os.environ.get("RASTER_VSI_CACHE_MB", str(RasterDefaults.VSI_CACHE_MB))),
             # stac_default_collection removed (14 JAN 2026) - collection_id required
         )
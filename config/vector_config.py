@@ -42,6 +42,11 @@ PostGIS:
     VECTOR_CREATE_SPATIAL_INDEXES  Default: "true"
                                    Create spatial indexes on geometry columns
 
+Multi-source:
+    VECTOR_MULTI_SOURCE_WORKERS    Default: 4 (range: 1-16)
+                                   Sources (files/GPKG layers) loaded concurrently
+                                   by vector_multi_source_complete
+
 ================================================================================
 EXPORTS
 ================================================================================
@@ -72,6 +77,7 @@ class VectorConfig(BaseModel):
         auto_chunk_sizing: Enable automatic chunk sizing
         target_schema: Target PostgreSQL schema
         create_spatial_indexes: Create spatial indexes on geometry columns
+        multi_source_workers: Concurrent sources per multi-source job (1-16)
     """
 
     # Pickle storage for chunked processing
@@ -111,6 +117,14 @@ class VectorConfig(BaseModel):
         description="Automatically create spatial indexes on geometry columns"
     )
 
+    # Multi-source collections
+    multi_source_workers: int = Field(
+        default=VectorDefaults.MULTI_SOURCE_WORKERS,
+        ge=1,
+        le=16,
+        description="Sources loaded concurrently by the multi-source vector handler"
+    )
+
     @classmethod
     def from_environment(cls) -> "VectorConfig":
         """
@@ -146,5 +160,9 @@ class VectorConfig(BaseModel):
             create_spatial_indexes=os.environ.get(
                 "VECTOR_CREATE_SPATIAL_INDEXES",
                 str(VectorDefaults.CREATE_SPATIAL_INDEXES).lower()
-            ).lower() == "true"
+            ).lower() == "true",
+            multi_source_workers=int(os.environ.get(
+                "VECTOR_MULTI_SOURCE_WORKERS",
+                str(VectorDefaults.MULTI_SOURCE_WORKERS)
+            ))
         )
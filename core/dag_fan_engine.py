@@ -34,6 +34,7 @@ from uuid import uuid4
 
 if TYPE_CHECKING:
     from core.dag_repository_protocol import DAGRepositoryProtocol
+    from core.dag_workflow_plan import CompiledWorkflowPlan
 
 from core.dag_graph_utils import TaskSummary, build_adjacency, get_descendants
 from core.models.workflow_definition import (
@@ -457,6 +458,7 @@ def expand_fan_outs(
     predecessor_outputs: dict[str, dict],
     job_params: dict,
     repo: DAGRepositoryProtocol,
+    plan: CompiledWorkflowPlan | None = None,
 ) -> FanOutResult:
     """
     Expand READY fan-out template tasks into N child instances.
@@ -492,6 +494,10 @@ def expand_fan_outs(
         Top-level job parameters.
     repo:
         DAGRepositoryProtocol implementation.
+    plan:
+        Optional compiled plan for workflow_def. Supplies pre-compiled Jinja2
+        param templates and the fan-in nodes fed by each fan-out, instead of
+        compiling per child and scanning every dep edge.
 
     Returns
     -------
@@ -560,12 +566,15 @@ def expand_fan_outs(
             )
 
         # Step 3: Build child task tuples
+        fan_out_plan = plan.fan_outs.get(template_task.task_name) if plan is not None else None
+        compiled_templates = fan_out_plan.templates if fan_out_plan is not None else None
         child_tuples = []
         for index, item in enumerate(source_value):
             child_id = str(uuid4())
             try:
                 params = resolve_fan_out_params(
-                    node_def.task, item, index, job_params, predecessor_outputs
+                    node_def.task, item, index, job_params, predecessor_outputs,
+                    compiled_templates=compiled_templates,
                 )
             except ParameterResolutionError as exc:
                 logger.error(
@@ -596,12 +605,19 @@ def expand_fan_outs(
             # Step 4: Build dep edges for fan-in nodes that depend on this template
             dep_tuples: list[tuple[str, str, bool]] = []
             # Find fan-in tasks that have a dep on this template
-            fan_in_task_iids = [
-                task_iid for (task_iid, dep_iid, _opt) in deps
-                if dep_iid == template_task.task_instance_id
-                and task_iid in id_to_task  # C2 fix: guard against unknown task_iid
-                and isinstance(workflow_def.nodes.get(id_to_task[task_iid].task_name), FanInNode)
-            ]
+            if fan_out_plan is not None:
+                fan_in_task_iids = [
+                    name_to_task[name].task_instance_id
+                    for name in fan_out_plan.fan_in_names
+                    if name in name_to_task
+                ]
+            else:
+                fan_in_task_iids = [
+                    task_iid for (task_iid, dep_iid, _opt) in deps
+                    if dep_iid == template_task.task_instance_id
+                    and task_iid in id_to_task  # C2 fix: guard against unknown task_iid
+                    and isinstance(workflow_def.nodes.get(id_to_task[task_iid].task_name), FanInNode)
+                ]
 
             for child_tuple in child_tuples:
                 child_id = child_tuple[0]
@@ -643,6 +659,7 @@ def aggregate_fan_ins(
     tasks: list[TaskSummary],
     deps: list[tuple[str, str, bool]],
     repo: DAGRepositoryProtocol,
+    plan: CompiledWorkflowPlan | None = None,
 ) -> FanInResult:
     """
     Aggregate completed fan-out children into fan-in task result data.
@@ -677,6 +694,9 @@ def aggregate_fan_ins(
         All dep edges for this run.
     repo:
         DAGRepositoryProtocol implementation.
+    plan:
+        Optional compiled plan for workflow_def; locates each fan-in's
+        fan-out template by node name instead of scanning dep edges.
 
     Returns
     -------
@@ -710,17 +730,27 @@ def aggregate_fan_ins(
                 f"but got {type(node_def).__name__}. DB/definition mismatch."
             )
 
-        # Step 1: Locate the fan-out template from deps
-        upstream_ids = [
-            dep_iid for (task_iid, dep_iid, _opt) in deps
-            if task_iid == fan_in_task.task_instance_id
-        ]
+        # Step 1: Locate the fan-out template (plan: by node name; else from deps)
         template_task: TaskSummary | None = None
-        for up_id in upstream_ids:
-            upstream = id_to_task.get(up_id)
-            if upstream and isinstance(workflow_def.nodes.get(upstream.task_name), FanOutNode):
-                template_task = upstream
-                break
+        if plan is not None:
+            source_name = plan.fan_in_sources.get(fan_in_task.task_name)
+            template_task = next(
+                (
+                    t for t in tasks
+                    if t.task_name == source_name and t.fan_out_source is None
+                ),
+                None,
+            )
+        else:
+            upstream_ids = [
+                dep_iid for (task_iid, dep_iid, _opt) in deps
+                if task_iid == fan_in_task.task_instance_id
+            ]
+            for up_id in upstream_ids:
+                upstream = id_to_task.get(up_id)
+                if upstream and isinstance(workflow_def.nodes.get(upstream.task_name), FanOutNode):
+                    template_task = upstream
+                    break
 
         if template_task is None:
             logger.debug(
@@ -421,3 +421,76 @@ class DAGInitializer:
         # Return the existing run if fetchable; fall back to the constructed model
         # if the fetch returned None (race condition window, extremely unlikely).
         return existing if existing is not None else run
+
+    def create_runs_bulk(self, submissions: list[dict]) -> list[dict]:
+        """
+        Create many WorkflowRuns in one repository transaction.
+
+        Bulk counterpart of create_run for manifest submission. Each submission
+        dict carries the create_run arguments (workflow_def, parameters,
+        platform_version, and optional request_id / asset_id / release_id /
+        legacy_job_id / schedule_id).
+
+        Structural failures (ContractViolationError from _build_tasks_and_deps)
+        are isolated to their own entry; every valid entry is persisted via a
+        single repo.insert_runs_bulk call. Two submissions that hash to the same
+        run_id within one batch are collapsed — the later one is reported as a
+        duplicate, matching what sequential create_run calls would have done.
+
+        Returns:
+          One outcome dict per submission, in input order:
+            {"run_id": str | None, "status": "created" | "duplicate" | "invalid",
+             "error": str (invalid only)}
+
+        Raises:
+          BusinessLogicError / DatabaseError — transient DB failures from the
+          repository layer (the whole batch is rolled back).
+        """
+        t_start = time.monotonic()
+        outcomes: list[dict] = []
+        to_insert: list[tuple[WorkflowRun, list[WorkflowTask], list[WorkflowTaskDep]]] = []
+        seen_run_ids: set[str] = set()
+
+        for sub in submissions:
+            workflow_def = sub["workflow_def"]
+            parameters = sub["parameters"]
+            try:
+                run_id = _generate_run_id(workflow_def.workflow, parameters)
+                if run_id in seen_run_ids:
+                    outcomes.append({"run_id": run_id, "status": "duplicate"})
+                    continue
+                tasks, deps = _build_tasks_and_deps(run_id, workflow_def, job_params=parameters)
+            except ContractViolationError as exc:
+                outcomes.append({"run_id": None, "status": "invalid", "error": str(exc)})
+                continue
+
+            seen_run_ids.add(run_id)
+            run = WorkflowRun(
+                run_id=run_id,
+                workflow_name=workflow_def.workflow,
+                parameters=parameters,
+                status=WorkflowRunStatus.PENDING,
+                definition=workflow_def.model_dump(),
+                platform_version=sub["platform_version"],
+                request_id=sub.get("request_id"),
+                asset_id=sub.get("asset_id"),
+                release_id=sub.get("release_id"),
+                legacy_job_id=sub.get("legacy_job_id"),
+                schedule_id=sub.get("schedule_id"),
+            )
+            to_insert.append((run, tasks, deps))
+            outcomes.append({"run_id": run_id, "status": "pending"})
+
+        created = self._repo.insert_runs_bulk(to_insert)
+
+        for outcome in outcomes:
+            if outcome["status"] == "pending":
+                outcome["status"] = "created" if outcome["run_id"] in created else "duplicate"
+
+        logger.info(
+            "WorkflowRuns bulk-created: submitted=%d created=%d elapsed_ms=%d",
+            len(submissions),
+            len(created),
+            round((time.monotonic() - t_start) * 1000),
+        )
+        return outcomes
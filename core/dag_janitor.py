@@ -6,6 +6,7 @@
 # PURPOSE: Background sweep that reclaims stuck RUNNING tasks with stale
 #          heartbeats. Retries if eligible, fails permanently if exhausted.
 #          Covers app.workflow_tasks (DAG), app.tasks (legacy), and ETL mount dirs.
+#          Also archives terminal workflow runs past retention (hot/archive split).
 # LAST_REVIEWED: 23 MAR 2026
 # EXPORTS: JanitorConfig, JanitorResult, DAGJanitor
 # DEPENDENCIES: logging, threading, time, dataclasses,
@@ -59,8 +60,11 @@ class JanitorConfig:
     max_retries: int = 3             # Max retry attempts before permanent FAILED
     backoff_base: int = 30           # Base delay for exponential backoff (seconds)
     backoff_cap: int = 600           # Maximum backoff delay (seconds)
-    batch_limit: int = 50            # Max tasks to process per scan
+    batch_limit: int = 500           # Max tasks to recover per scan (applied set-based)
     mount_cleanup_max_age_days: int = 30  # Delete ETL mount dirs older than this
+    archive_retention_days: int = 90  # Archive terminal runs completed longer ago (0 = off)
+    archive_batch_size: int = 200     # Runs moved to Parquet per archive pass
+    archive_interval: int = 3600      # Minimum seconds between archive passes
 
     @classmethod
     def from_environment(cls) -> 'JanitorConfig':
@@ -72,8 +76,11 @@ class JanitorConfig:
             max_retries=int(os.environ.get('JANITOR_MAX_RETRIES', '3')),
             backoff_base=int(os.environ.get('JANITOR_BACKOFF_BASE', '30')),
             backoff_cap=int(os.environ.get('JANITOR_BACKOFF_CAP', '600')),
-            batch_limit=int(os.environ.get('JANITOR_BATCH_LIMIT', '50')),
+            batch_limit=int(os.environ.get('JANITOR_BATCH_LIMIT', '500')),
             mount_cleanup_max_age_days=int(os.environ.get('JANITOR_MOUNT_MAX_AGE_DAYS', '30')),
+            archive_retention_days=int(os.environ.get('JANITOR_ARCHIVE_RETENTION_DAYS', '90')),
+            archive_batch_size=int(os.environ.get('JANITOR_ARCHIVE_BATCH_SIZE', '200')),
+            archive_interval=int(os.environ.get('JANITOR_ARCHIVE_INTERVAL', '3600')),
         )
 
 
@@ -91,6 +98,11 @@ class JanitorResult:
     legacy_tasks_retried: int = 0
     legacy_tasks_failed: int = 0
     mount_dirs_removed: int = 0
+    runs_archived: int = 0
+    # One entry per stale task: {"kind": "workflow"|"legacy", "task_id",
+    # "outcome": "retried"|"failed"|"skipped", ...}. "skipped" means the
+    # task left RUNNING/PROCESSING between detection and recovery.
+    task_outcomes: list[dict] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     elapsed_ms: float = 0.0
 
@@ -122,6 +134,7 @@ class DAGJanitor:
         self._config = config or JanitorConfig.from_environment()
         self._thread: Optional[threading.Thread] = None
         self._last_sweep_at: Optional[datetime] = None
+        self._last_archive_at: Optional[float] = None  # monotonic
         self._total_sweeps: int = 0
 
     def start(self, stop_event: threading.Event) -> None:
@@ -151,16 +164,17 @@ class DAGJanitor:
                 total_actions = (
                     result.workflow_tasks_retried + result.workflow_tasks_failed
                     + result.legacy_tasks_retried + result.legacy_tasks_failed
-                    + result.mount_dirs_removed
+                    + result.mount_dirs_removed + result.runs_archived
                 )
                 if total_actions > 0:
                     logger.info(
                         "DAGJanitor sweep #%d: wf_retried=%d wf_failed=%d "
-                        "legacy_retried=%d legacy_failed=%d mount_cleaned=%d elapsed_ms=%.1f",
+                        "legacy_retried=%d legacy_failed=%d mount_cleaned=%d "
+                        "runs_archived=%d elapsed_ms=%.1f",
                         self._total_sweeps,
                         result.workflow_tasks_retried, result.workflow_tasks_failed,
                         result.legacy_tasks_retried, result.legacy_tasks_failed,
-                        result.mount_dirs_removed, result.elapsed_ms,
+                        result.mount_dirs_removed, result.runs_archived, result.elapsed_ms,
                     )
                 else:
                     logger.debug(
@@ -205,6 +219,13 @@ class DAGJanitor:
             logger.error("DAGJanitor phase 3 (mount_cleanup) error: %s", exc)
             result.errors.append(f"mount_cleanup: {exc}")
 
+        # Phase 4: Archive terminal workflow runs (at most every archive_interval)
+        try:
+            self._archive_terminal_runs(result)
+        except Exception as exc:
+            logger.error("DAGJanitor phase 4 (run_archive) error: %s", exc)
+            result.errors.append(f"run_archive: {exc}")
+
         result.elapsed_ms = (time.monotonic() - t0) * 1000
         return result
 
@@ -221,55 +242,62 @@ class DAGJanitor:
         (wr.status != 'awaiting_approval'), so no explicit per-task skip is
         needed here. Gate node sentinel tasks (__gate__) are also excluded by
         the handler NOT IN filter in the query.
+
+        Recovery is set-based (recover_stale_workflow_tasks): after a worker
+        dies with many tasks in flight, the whole batch is rescheduled or
+        failed in one transaction rather than one UPDATE per task.
         """
         stale_tasks = self._workflow_repo.get_stale_workflow_tasks(
             stale_threshold_seconds=self._config.stale_threshold,
             limit=self._config.batch_limit,
         )
         result.workflow_tasks_scanned = len(stale_tasks)
+        if not stale_tasks:
+            return
 
-        for task in stale_tasks:
-            retry_count = task.get('retry_count', 0)
-            max_retries = task.get('max_retries', self._config.max_retries)
-            task_id = task['task_instance_id']
-            task_name = task.get('task_name', 'unknown')
-
-            if retry_count < max_retries:
-                # Retry with exponential backoff
-                backoff = min(
-                    self._config.backoff_base * (2 ** retry_count),
-                    self._config.backoff_cap,
-                )
-                self._workflow_repo.retry_workflow_task(
-                    task_instance_id=task_id,
-                    backoff_seconds=backoff,
-                )
-                result.workflow_tasks_retried += 1
-                logger.info(
-                    "DAGJanitor: retrying workflow task=%s (%s) "
-                    "attempt=%d/%d backoff=%ds",
-                    task_id[:20], task_name, retry_count + 1, max_retries, backoff,
-                )
-            else:
-                # Exhausted retries → permanent FAILED
-                self._workflow_repo.fail_task(
-                    task_id,
-                    f"Janitor: task unresponsive after {retry_count} retries "
-                    f"(stale_threshold={self._config.stale_threshold}s)",
-                )
-                result.workflow_tasks_failed += 1
-                logger.warning(
-                    "DAGJanitor: FAILED workflow task=%s (%s) — "
-                    "max retries exhausted (%d/%d)",
-                    task_id[:20], task_name, retry_count, max_retries,
-                )
+        # Set-based: one retry UPDATE (per-row backoff) + one fail UPDATE
+        recovered = self._workflow_repo.recover_stale_workflow_tasks(
+            [t['task_instance_id'] for t in stale_tasks],
+            backoff_base=self._config.backoff_base,
+            backoff_cap=self._config.backoff_cap,
+            stale_threshold_seconds=self._config.stale_threshold,
+        )
+
+        for row in recovered['retried']:
+            result.workflow_tasks_retried += 1
+            result.task_outcomes.append({
+                "kind": "workflow", "task_id": row['task_instance_id'],
+                "outcome": "retried", "attempt": row['retry_count'],
+                "backoff_seconds": row['backoff_seconds'],
+            })
+            logger.info(
+                "DAGJanitor: retrying workflow task=%s (%s) "
+                "attempt=%d/%d backoff=%ds",
+                row['task_instance_id'][:20], row['task_name'],
+                row['retry_count'], row['max_retries'], row['backoff_seconds'],
+            )
+
+        for row in recovered['failed']:
+            result.workflow_tasks_failed += 1
+            result.task_outcomes.append({
+                "kind": "workflow", "task_id": row['task_instance_id'],
+                "outcome": "failed", "retry_count": row['retry_count'],
+            })
+            logger.warning(
+                "DAGJanitor: FAILED workflow task=%s (%s) — "
+                "max retries exhausted (%d/%d)",
+                row['task_instance_id'][:20], row['task_name'],
+                row['retry_count'], row['max_retries'],
+            )
+
+        self._record_skipped(result, "workflow", stale_tasks, 'task_instance_id', recovered)
 
     def _sweep_legacy_tasks(self, result: JanitorResult) -> None:
         """
         Find and recover stale PROCESSING legacy tasks (app.tasks).
 
-        Uses the existing increment_task_retry_count SQL function for
-        atomic retry with exponential backoff.
+        TaskRepository.recover_stale_tasks applies the whole batch in two
+        statements, using the same backoff as increment_task_retry_count.
         """
         try:
             from infrastructure.jobs_tasks import TaskRepository
@@ -283,29 +311,47 @@ class DAGJanitor:
             limit=self._config.batch_limit,
         )
         result.legacy_tasks_scanned = len(stale_tasks)
+        if not stale_tasks:
+            return
 
-        for task in stale_tasks:
-            retry_count = task.get('retry_count', 0)
-            task_id = task['task_id']
-
-            if retry_count < self._config.max_retries:
-                retry_result = task_repo.increment_task_retry_count(
-                    task_id,
-                    error_details=f"Janitor: stale PROCESSING (threshold={self._config.stale_threshold}s)",
-                )
-                if retry_result:
-                    result.legacy_tasks_retried += 1
-                else:
-                    result.legacy_tasks_failed += 1
-            else:
-                task_repo.fail_task(
-                    task_id,
-                    f"Janitor: max retries exhausted ({retry_count}/{self._config.max_retries})",
-                )
-                result.legacy_tasks_failed += 1
+        recovered = task_repo.recover_stale_tasks(
+            [t['task_id'] for t in stale_tasks],
+            max_retries=self._config.max_retries,
+            retry_error_details=f"Janitor: stale PROCESSING (threshold={self._config.stale_threshold}s)",
+        )
 
-                # Propagate to parent job if all tasks are now terminal
-                self._maybe_fail_parent_job(task, task_repo)
+        for row in recovered['retried']:
+            result.legacy_tasks_retried += 1
+            result.task_outcomes.append({
+                "kind": "legacy", "task_id": row['task_id'],
+                "outcome": "retried", "attempt": row['new_retry_count'],
+            })
+
+        for row in recovered['failed']:
+            result.legacy_tasks_failed += 1
+            result.task_outcomes.append({
+                "kind": "legacy", "task_id": row['task_id'],
+                "outcome": "failed", "retry_count": row['retry_count'],
+            })
+
+        self._record_skipped(result, "legacy", stale_tasks, 'task_id', recovered)
+
+        # Propagate to parent jobs whose tasks are now all terminal (once per job)
+        for job_id in sorted({row['parent_job_id'] for row in recovered['failed'] if row['parent_job_id']}):
+            self._maybe_fail_parent_job({'parent_job_id': job_id}, task_repo)
+
+    @staticmethod
+    def _record_skipped(
+        result: JanitorResult, kind: str, stale_tasks: list[dict], id_key: str, recovered: dict,
+    ) -> None:
+        """Report stale tasks that neither recovery statement touched."""
+        handled = {row[id_key] for row in recovered['retried']}
+        handled.update(row[id_key] for row in recovered['failed'])
+        for task in stale_tasks:
+            if task[id_key] not in handled:
+                result.task_outcomes.append({
+                    "kind": kind, "task_id": task[id_key], "outcome": "skipped",
+                })
 
     def _sweep_mount_dirs(self, result: JanitorResult) -> None:
         """
@@ -313,7 +359,9 @@ class DAGJanitor:
 
         The ETL mount (e.g. /mnt/etl) accumulates per-run directories from
         raster and vector handlers. This phase removes directories whose
-        modification time is older than the configured threshold.
+        modification time is older than the configured threshold, then lets
+        MountSpaceManager evict finished runs if free space is still below
+        the claim watermark.
         """
         import os
         import shutil
@@ -371,6 +419,40 @@ class DAGJanitor:
                     safe_name, exc,
                 )
 
+        # Capacity pass: if the mount is still below the claim watermark,
+        # evict finished runs LRU-first so workers can resume claiming.
+        from infrastructure.mount_space import get_mount_space_manager
+        manager = get_mount_space_manager()
+        if manager is not None:
+            evicted = manager.evict_to_watermark()
+            result.mount_dirs_removed += evicted["dirs_removed"]
+
+    def _archive_terminal_runs(self, result: JanitorResult) -> None:
+        """
+        Move one batch of old terminal runs from the hot DAG tables to Parquet.
+
+        Throttled to archive_interval: the janitor scans every minute but
+        archival only needs to keep pace with daily completions. The timestamp
+        is recorded before the attempt so a failing export is not retried on
+        every scan.
+        """
+        if self._config.archive_retention_days <= 0:
+            return
+
+        now = time.monotonic()
+        if (self._last_archive_at is not None
+                and now - self._last_archive_at < self._config.archive_interval):
+            return
+        self._last_archive_at = now
+
+        from services.workflow_archive import WorkflowArchiveService
+
+        summary = WorkflowArchiveService(repo=self._workflow_repo).archive_terminal_runs(
+            retention_days=self._config.archive_retention_days,
+            batch_size=self._config.archive_batch_size,
+        )
+        result.runs_archived += summary.get("archived", 0)
+
     def _maybe_fail_parent_job(self, task: dict, task_repo) -> None:
         """
         After permanently failing a task, check if the parent job should
@@ -11,7 +11,7 @@
 # EXPORTS: OrchestratorResult, DAGOrchestrator
 # DEPENDENCIES: logging, threading, time, psycopg,
 #               core.dag_graph_utils, core.dag_transition_engine,
-#               core.dag_fan_engine, core.dag_repository_protocol,
+#               core.dag_fan_engine, core.dag_workflow_plan, core.dag_repository_protocol,
 #               core.models.workflow_definition, core.models.workflow_enums,
 #               exceptions
 # ============================================================================
@@ -44,6 +44,7 @@ from util_logger import LoggerFactory, ComponentType
 from core.dag_graph_utils import is_run_terminal
 from core.dag_transition_engine import evaluate_transitions
 from core.dag_fan_engine import evaluate_conditionals, expand_fan_outs, aggregate_fan_ins
+from core.dag_workflow_plan import get_workflow_plan
 from core.models.workflow_definition import WorkflowDefinition
 from core.models.workflow_enums import WorkflowRunStatus, WorkflowTaskStatus
 from core.dag_repository_protocol import DAGRepositoryProtocol
@@ -472,9 +473,11 @@ class DAGOrchestrator:
                     )
 
             # ----------------------------------------------------------
-            # Step 4: Parse workflow definition from JSONB snapshot
+            # Step 4: Compiled plan for the JSONB definition snapshot
+            # (validated + analysed once per process, not once per tick)
             # ----------------------------------------------------------
-            workflow_def = WorkflowDefinition.model_validate(run.definition)
+            plan = get_workflow_plan(run.definition)
+            workflow_def = plan.workflow_def
             job_params: dict = run.parameters or {}
 
             logger.info(
@@ -531,7 +534,7 @@ class DAGOrchestrator:
                     # 5b: Fixed dispatch order (ARB decision)
                     tr = evaluate_transitions(
                         run_id, workflow_def, tasks, deps,
-                        predecessor_outputs, job_params, self._repo,
+                        predecessor_outputs, job_params, self._repo, plan=plan,
                     )
 
                     # Re-fetch state after transitions to avoid stale-snapshot
@@ -554,10 +557,10 @@ class DAGOrchestrator:
                     )
                     fr = expand_fan_outs(
                         run_id, workflow_def, tasks, deps,
-                        predecessor_outputs, job_params, self._repo,
+                        predecessor_outputs, job_params, self._repo, plan=plan,
                     )
                     ar = aggregate_fan_ins(
-                        run_id, workflow_def, tasks, deps, self._repo,
+                        run_id, workflow_def, tasks, deps, self._repo, plan=plan,
                     )
 
                     # 5c: Accumulate counts
@@ -30,6 +30,7 @@ from util_logger import LoggerFactory, ComponentType
 
 if TYPE_CHECKING:
     from core.dag_repository_protocol import DAGRepositoryProtocol
+    from core.dag_workflow_plan import CompiledWorkflowPlan
 
 from core.dag_graph_utils import (
     TaskSummary,
@@ -265,6 +266,7 @@ def evaluate_transitions(
     predecessor_outputs: dict[str, dict],
     job_params: dict,
     repo: DAGRepositoryProtocol,
+    plan: CompiledWorkflowPlan | None = None,
 ) -> TransitionResult:
     """
     Evaluate all PENDING tasks and promote, skip, or fail each as appropriate.
@@ -307,6 +309,10 @@ def evaluate_transitions(
         Top-level job parameters for the run.
     repo:
         DAGRepositoryProtocol implementation for all DB mutations.
+    plan:
+        Optional compiled plan for workflow_def (core.dag_workflow_plan).
+        When given, PENDING tasks are evaluated in topological order and
+        receives paths are not re-parsed.
 
     Returns
     -------
@@ -346,6 +352,9 @@ def evaluate_transitions(
     # Step 3: Filter to PENDING tasks
     # ------------------------------------------------------------------
     pending_tasks = [t for t in tasks if t.status == WorkflowTaskStatus.PENDING]
+    if plan is not None:
+        rank = {name: i for i, name in enumerate(plan.topo_order)}
+        pending_tasks.sort(key=lambda t: rank.get(t.task_name, len(rank)))
 
     logger.debug(
         "evaluate_transitions: run_id=%s total_tasks=%d pending=%d",
@@ -509,7 +518,10 @@ def evaluate_transitions(
         # 4d: Parameter resolution (TaskNode only) — fail on error, set params on success
         if isinstance(node_def, TaskNode):
             try:
-                resolved_params = resolve_task_params(node_def, job_params, predecessor_outputs)
+                resolved_params = resolve_task_params(
+                    node_def, job_params, predecessor_outputs,
+                    receives=plan.receives.get(task.task_name) if plan is not None else None,
+                )
             except ParameterResolutionError as exc:
                 logger.error(
                     "evaluate_transitions: run_id=%s task_name=%r param resolution failed: %s",
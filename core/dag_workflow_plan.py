@@ -0,0 +1,283 @@
+# ============================================================================
+# CLAUDE CONTEXT - COMPILED WORKFLOW PLANS
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Core - Process-wide cache of validated, pre-analysed workflow definitions
+# PURPOSE: Validate a run's stored definition once and precompute everything the
+#          engines derive from it (topological order, receives paths, fan-out
+#          templates, fan-out/fan-in pairing), keyed by definition hash.
+# CREATED: 18 OCT 2026
+# EXPORTS: CompiledWorkflowPlan, FanOutPlan, compile_workflow_plan,
+#          get_workflow_plan, definition_hash, workflow_plan_cache_stats,
+#          clear_workflow_plan_cache
+# DEPENDENCIES: core.models.workflow_definition, core.param_resolver, exceptions
+# ============================================================================
+"""
+Compiled workflow plans.
+
+A run's definition is a JSONB snapshot that never changes for the life of
+the run, yet every orchestrator tick used to re-validate it with Pydantic
+and every fan-out expansion re-compiled the same Jinja2 templates once per
+child. The Brain ticks hundreds of runs per scan, and most of them share a
+handful of definitions, so this work is cached process-wide:
+
+    plan = get_workflow_plan(run.definition)
+    plan.workflow_def          # validated WorkflowDefinition
+    plan.topo_order            # node names, upstream before downstream
+    plan.receives[name]        # ((local_name, path, segments), ...) per TaskNode
+    plan.fan_outs[name]        # FanOutPlan: compiled param templates, fan-in names
+    plan.fan_in_sources[name]  # fan-in node -> fan-out node it gathers
+
+Plans are keyed by a SHA-256 of the canonical definition JSON, so runs
+submitted before and after a YAML change get separate plans. Plans are
+immutable by convention; engines must not mutate anything reachable from one.
+The cache is a bounded LRU (PLAN_CACHE_MAX_ENTRIES).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any
+
+from util_logger import LoggerFactory, ComponentType
+
+from core.models.workflow_definition import (
+    ConditionalNode,
+    FanInNode,
+    FanOutNode,
+    TaskNode,
+    WorkflowDefinition,
+)
+from core.param_resolver import compile_fan_out_templates, split_dotted_path
+from exceptions import ContractViolationError
+
+logger = LoggerFactory.create_logger(ComponentType.CONTROLLER, __name__)
+
+# Distinct definitions held at once. Each workflow YAML version is one entry,
+# so this comfortably covers every workflow with active runs.
+PLAN_CACHE_MAX_ENTRIES = 256
+
+_cache: "OrderedDict[str, CompiledWorkflowPlan]" = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+# ============================================================================
+# PLAN DTOs
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class FanOutPlan:
+    """Precomputed data for one FanOutNode."""
+    node_name: str
+    source: str
+    handler: str
+    max_retries: int
+    templates: dict          # param key -> compiled Jinja2 template (valid templated values only)
+    fan_in_names: tuple      # FanInNodes that depend on this fan-out
+
+
+@dataclass(frozen=True)
+class CompiledWorkflowPlan:
+    """A validated workflow definition plus the structure the engines derive from it."""
+    definition_hash: str
+    workflow_def: WorkflowDefinition
+    topo_order: tuple                 # node names, upstream first
+    receives: dict                    # TaskNode name -> ((local_name, path, segments|None), ...)
+    fan_outs: dict                    # FanOutNode name -> FanOutPlan
+    fan_in_sources: dict              # FanInNode name -> FanOutNode name (None if none)
+
+
+# ============================================================================
+# COMPILATION
+# ============================================================================
+
+
+def _json_default(obj: Any) -> Any:
+    value = getattr(obj, "value", None)  # Enums stored via model_dump()
+    return value if value is not None else str(obj)
+
+
+def definition_hash(definition: dict) -> str:
+    """SHA-256 of the canonical JSON form of a stored definition."""
+    canonical = json.dumps(definition, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _dep_name(dep: str) -> str:
+    return dep[:-1] if dep.endswith("?") else dep
+
+
+def _topological_order(workflow_def: WorkflowDefinition) -> tuple:
+    """Kahn's algorithm over depends_on and conditional branch edges; ties by name."""
+    nodes = workflow_def.nodes
+    successors: dict[str, set[str]] = {name: set() for name in nodes}
+    in_degree: dict[str, int] = {name: 0 for name in nodes}
+
+    def add_edge(upstream: str, downstream: str) -> None:
+        if upstream not in nodes or downstream not in nodes:
+            raise ContractViolationError(
+                f"Workflow '{workflow_def.workflow}': edge {upstream!r} -> {downstream!r} "
+                "references an unknown node."
+            )
+        if downstream not in successors[upstream]:
+            successors[upstream].add(downstream)
+            in_degree[downstream] += 1
+
+    for name, node in nodes.items():
+        for dep in node.depends_on:
+            add_edge(_dep_name(dep), name)
+        if isinstance(node, ConditionalNode):
+            for branch in node.branches:
+                for target in branch.next:
+                    add_edge(name, target)
+
+    queue = deque(sorted(n for n, d in in_degree.items() if d == 0))
+    order: list[str] = []
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        for successor in sorted(successors[current]):
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                queue.append(successor)
+
+    if len(order) < len(nodes):
+        remaining = sorted(n for n, d in in_degree.items() if d > 0)
+        raise ContractViolationError(
+            f"Workflow '{workflow_def.workflow}' has a cycle involving: {', '.join(remaining)}"
+        )
+    return tuple(order)
+
+
+def compile_workflow_plan(definition: dict | WorkflowDefinition) -> CompiledWorkflowPlan:
+    """
+    Validate a definition and precompute engine metadata (uncached).
+
+    Malformed receives paths and fan-out templates are not errors here: they
+    are left uncompiled so the engines fail the affected task at resolution
+    time, exactly as they do without a plan.
+
+    Raises:
+        pydantic.ValidationError: definition does not match WorkflowDefinition.
+        ContractViolationError: unknown node references or a cycle.
+    """
+    if isinstance(definition, WorkflowDefinition):
+        workflow_def = definition
+        definition = workflow_def.model_dump()
+    else:
+        workflow_def = WorkflowDefinition.model_validate(definition)
+
+    topo_order = _topological_order(workflow_def)
+    nodes = workflow_def.nodes
+
+    receives: dict[str, tuple] = {}
+    fan_outs: dict[str, FanOutPlan] = {}
+    fan_in_sources: dict[str, str | None] = {}
+
+    for name in topo_order:
+        node = nodes[name]
+        if isinstance(node, TaskNode):
+            receives[name] = tuple(
+                (local_name, path, split_dotted_path(path))
+                for local_name, path in node.receives.items()
+            )
+        elif isinstance(node, FanOutNode):
+            fan_outs[name] = FanOutPlan(
+                node_name=name,
+                source=node.source,
+                handler=node.task.handler,
+                max_retries=node.task.retry.max_attempts if node.task.retry else 3,
+                templates=compile_fan_out_templates(node.task),
+                fan_in_names=tuple(
+                    other for other in topo_order
+                    if isinstance(nodes[other], FanInNode)
+                    and name in {_dep_name(d) for d in nodes[other].depends_on}
+                ),
+            )
+        elif isinstance(node, FanInNode):
+            fan_in_sources[name] = next(
+                (
+                    _dep_name(dep) for dep in node.depends_on
+                    if isinstance(nodes.get(_dep_name(dep)), FanOutNode)
+                ),
+                None,
+            )
+
+    return CompiledWorkflowPlan(
+        definition_hash=definition_hash(definition),
+        workflow_def=workflow_def,
+        topo_order=topo_order,
+        receives=receives,
+        fan_outs=fan_outs,
+        fan_in_sources=fan_in_sources,
+    )
+
+
+# ============================================================================
+# PROCESS-WIDE CACHE
+# ============================================================================
+
+
+def get_workflow_plan(definition: dict) -> CompiledWorkflowPlan:
+    """
+    Return the compiled plan for a stored definition, compiling it on first use.
+
+    Compilation happens outside the lock; two threads missing on the same
+    definition at once both compile and the first one stored wins.
+    """
+    key = definition_hash(definition)
+    with _cache_lock:
+        plan = _cache.get(key)
+        if plan is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return plan
+        _stats["misses"] += 1
+
+    plan = compile_workflow_plan(definition)
+
+    with _cache_lock:
+        existing = _cache.get(key)
+        if existing is not None:
+            return existing
+        _cache[key] = plan
+        while len(_cache) > PLAN_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+            _stats["evictions"] += 1
+
+    logger.info(
+        "Compiled workflow plan: workflow=%s hash=%s nodes=%d fan_outs=%d",
+        plan.workflow_def.workflow, key[:12], len(plan.topo_order), len(plan.fan_outs),
+    )
+    return plan
+
+
+def workflow_plan_cache_stats() -> dict:
+    """Hit/miss/eviction counters and current size (for health/status output)."""
+    with _cache_lock:
+        return {**_stats, "size": len(_cache), "max_entries": PLAN_CACHE_MAX_ENTRIES}
+
+
+def clear_workflow_plan_cache() -> None:
+    """Drop all cached plans and reset counters."""
+    with _cache_lock:
+        _cache.clear()
+        for key in _stats:
+            _stats[key] = 0
+
+
+__all__ = [
+    'CompiledWorkflowPlan',
+    'FanOutPlan',
+    'compile_workflow_plan',
+    'get_workflow_plan',
+    'definition_hash',
+    'workflow_plan_cache_stats',
+    'clear_workflow_plan_cache',
+]
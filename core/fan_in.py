@@ -90,20 +90,13 @@ def load_fan_in_results(params: dict) -> list[dict]:
         f"stage={source_stage}, expected={expected_count}"
     )
 
-    # Query database for completed tasks from source stage
+    # Query database for completed tasks from source stage (stage/status
+    # filter runs in SQL, rows streamed via server-side cursor - 18 OCT 2026).
+    # Return full result_data (includes "success" field and nested "result")
+    # Handlers expect: {"success": True, "result": {...}}
+    # FIX (13 JAN 2026): Was extracting inner "result", breaking downstream handlers
     task_repo = TaskRepository()
-    tasks = task_repo.get_tasks_for_job(job_id)
-
-    # Filter for completed tasks in the source stage with results
-    results = []
-    for task in tasks:
-        if (task.stage == source_stage
-            and task.status.value == "completed"
-            and task.result_data):
-            # Return full result_data (includes "success" field and nested "result")
-            # Handlers expect: {"success": True, "result": {...}}
-            # FIX (13 JAN 2026): Was extracting inner "result", breaking downstream handlers
-            results.append(task.result_data)
+    results = list(task_repo.iter_stage_results(job_id, source_stage))
 
     logger.info(f"   Retrieved {len(results)} results from database")
 
@@ -65,7 +65,7 @@ from core.models import (
     TaskResult,
     JobExecutionContext
 )
-from core.models.job_event import JobEventType, JobEventStatus  # Job event tracking (23 JAN 2026)
+from core.models.job_event import JobEvent, JobEventType, JobEventStatus  # Job event tracking (23 JAN 2026)
 from core.schema.queue import JobQueueMessage, TaskQueueMessage, StageCompleteMessage
 from core.schema.updates import TaskUpdateModel
 
@@ -1025,6 +1025,13 @@ class CoreMachine:
                 timestamp=datetime.now(timezone.utc)
             )
 
+        # Write the handler's buffered checkpoint before its outcome is recorded
+        try:
+            from infrastructure.progress_buffer import get_progress_buffer
+            get_progress_buffer().flush(task_id=task_message.task_id)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Checkpoint flush failed for task {task_message.task_id[:16]}: {e}")
+
         # Step 3: Complete task and check stage (atomic)
         if result.status == TaskStatus.COMPLETED:
             try:
@@ -1560,52 +1567,65 @@ class CoreMachine:
 
         Previously: routed tasks to Service Bus queues.
         Now: inserts to DB only. Workers poll for READY tasks.
+
+        18 OCT 2026: rows and TASK_QUEUED events are written set-based in one
+        transaction via task_repo.create_tasks_with_events. Tasks that fail to
+        insert are still marked FAILED individually (stage deadlock guard).
         """
         start_time = time.time()
         total_tasks = len(task_defs)
-        tasks_queued = 0
-        tasks_failed = 0
+        failures: Dict[str, str] = {}
 
+        # 18 OCT 2026: set-based creation. All task rows and their TASK_QUEUED
+        # events go in one transaction (multi-row INSERTs, chunked) instead of
+        # two round trips per task. Rows that fail are reported individually.
+        records = []
+        events = []
         for idx, task_def in enumerate(task_defs):
             try:
-                # Create task record as READY (immediately available for worker pickup)
-                task_record = self._task_definition_to_record(task_def, idx)
-                self.repos['task_repo'].create_task(task_record)
+                records.append(self._task_definition_to_record(task_def, idx))
+            except Exception as e:
+                failures[task_def.task_id] = str(e)
+                continue
+            # Event name kept as TASK_QUEUED for backward compat in logs
+            events.append(JobEvent.create_task_event(
+                job_id=job_id,
+                task_id=task_def.task_id,
+                stage=stage_number,
+                event_type=JobEventType.TASK_QUEUED,
+                event_status=JobEventStatus.INFO,
+                event_data={"task_type": task_def.task_type, "method": "db_polling"}
+            ))
 
-                # Record TASK_QUEUED event (name kept for backward compat in logs)
-                try:
-                    self.event_repo.record_task_event(
-                        job_id=job_id,
-                        task_id=task_def.task_id,
-                        stage=stage_number,
-                        event_type=JobEventType.TASK_QUEUED,
-                        event_status=JobEventStatus.INFO,
-                        event_data={"task_type": task_def.task_type, "method": "db_polling"}
-                    )
-                except Exception as event_err:
-                    self.logger.warning(f"Failed to record TASK_QUEUED event: {event_err}")
+        try:
+            outcome = self.repos['task_repo'].create_tasks_with_events(records, events)
+            failures.update(outcome['failed'])
+        except Exception as e:
+            # Transaction never committed - nothing from this stage was written
+            for record in records:
+                failures[record.task_id] = str(e)
 
-                tasks_queued += 1
+        tasks_failed = len(failures)
+        tasks_queued = total_tasks - tasks_failed
 
-            except Exception as e:
-                tasks_failed += 1
-                self.logger.error(f"Failed to create task {task_def.task_id}: {e}")
-                # Mark failed task to prevent stage deadlock
-                try:
-                    self.repos['task_repo'].fail_task(
-                        task_def.task_id,
-                        f"Task DB creation failed: {e}"
-                    )
-                    self.logger.warning(
-                        f"Marked failed task {task_def.task_id} as FAILED",
-                        extra={
-                            'checkpoint': 'TASK_CREATE_FAILED',
-                            'task_id': task_def.task_id,
-                            'error': str(e)
-                        }
-                    )
-                except Exception as cleanup_err:
-                    self.logger.error(f"Failed to cleanup task {task_def.task_id}: {cleanup_err}")
+        for task_id, error in failures.items():
+            self.logger.error(f"Failed to create task {task_id}: {error}")
+            # Mark failed task to prevent stage deadlock
+            try:
+                self.repos['task_repo'].fail_task(
+                    task_id,
+                    f"Task DB creation failed: {error}"
+                )
+                self.logger.warning(
+                    f"Marked failed task {task_id} as FAILED",
+                    extra={
+                        'checkpoint': 'TASK_CREATE_FAILED',
+                        'task_id': task_id,
+                        'error': error
+                    }
+                )
+            except Exception as cleanup_err:
+                self.logger.error(f"Failed to cleanup task {task_id}: {cleanup_err}")
 
         elapsed_ms = (time.time() - start_time) * 1000
 
@@ -2241,28 +2261,25 @@ class CoreMachine:
         Raises:
             RuntimeError: If no completed tasks found for stage
         """
-        # Get all tasks for this job and stage
-        all_tasks = self.repos['task_repo'].get_tasks_for_job(job_id)
-        stage_tasks = [t for t in all_tasks if t.stage == stage and t.status == TaskStatus.COMPLETED]
-
-        if not stage_tasks:
-            raise RuntimeError(
-                f"No completed tasks found for job {job_id} stage {stage}. "
-                f"Cannot generate tasks for next stage."
-            )
-
         # Extract result_data from each task, unwrapping the handler envelope.
         # Handlers return {"success": True, "result": {payload...}}.
         # Jobs need the payload directly — not the envelope.
         # If "result" key is missing, return the full dict as fallback.
-        results = []
-        for task in stage_tasks:
-            if task.result_data:
-                data = task.result_data
-                if isinstance(data, dict) and "result" in data:
-                    results.append(data["result"])
-                else:
-                    results.append(data)
+        # 18 OCT 2026: filter + unwrap run in SQL; only this stage's rows are read.
+        results = list(self.repos['task_repo'].iter_stage_results(
+            job_id, stage, unwrap_envelope=True
+        ))
+
+        # Completed tasks with empty result_data yield nothing; only raise
+        # when the stage has no completed tasks at all (cheap GROUP BY, rare path)
+        if not results and not any(
+            row['stage'] == stage and row['status'] == TaskStatus.COMPLETED.value
+            for row in self.repos['task_repo'].get_task_counts_by_stage(job_id)
+        ):
+            raise RuntimeError(
+                f"No completed tasks found for job {job_id} stage {stage}. "
+                f"Cannot generate tasks for next stage."
+            )
 
         self.logger.debug(f"Retrieved {len(results)} completed task results from stage {stage}")
         return results
@@ -258,6 +258,9 @@ from .release_audit import ReleaseAuditEvent, ReleaseAuditEventType
 # Orchestrator lease model (27 MAR 2026 - DAG Brain)
 from .orchestrator_lease import OrchestratorLease
 
+# Stage task counters (18 OCT 2026 - O(1) stage completion)
+from .stage_task_counter import StageTaskCounter
+
 # Schedule models (21 MAR 2026 - DAG Scheduler)
 from .schedule import Schedule
 from .scheduled_dataset import ScheduledDataset
@@ -266,6 +269,7 @@ from .scheduled_dataset import ScheduledDataset
 from .workflow_run import WorkflowRun
 from .workflow_task import WorkflowTask
 from .workflow_task_dep import WorkflowTaskDep
+from .workflow_run_archive import WorkflowRunArchive
 
 __all__ = [
     # Enums
@@ -455,6 +459,9 @@ __all__ = [
     # Orchestrator lease (27 MAR 2026 - DAG Brain)
     'OrchestratorLease',
 
+    # Stage task counters (18 OCT 2026)
+    'StageTaskCounter',
+
     # Schedule models (21 MAR 2026 - DAG Scheduler)
     'Schedule',
     'ScheduledDataset',
@@ -463,4 +470,5 @@ __all__ = [
     'WorkflowRun',
     'WorkflowTask',
     'WorkflowTaskDep',
+    'WorkflowRunArchive',
 ]
@@ -462,6 +462,12 @@ class COGCreationData(BaseModel):
         description="Processing mode: disk_based or in_memory"
     )
 
+    # GDAL thread budget applied to warp/compression/overviews (disk path)
+    gdal_threading: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="threads, cpu_count, task_slots, source, gdal_options, warp_options"
+    )
+
 
 class COGCreationResult(BaseModel):
     """
@@ -0,0 +1,49 @@
+# ============================================================================
+# CLAUDE CONTEXT - STAGE TASK COUNTER MODEL
+# ============================================================================
+# EPOCH: 4 - ACTIVE
+# STATUS: Core - O(1) stage completion tracking for CoreMachine jobs
+# PURPOSE: Per-(job, stage) count of non-terminal tasks, maintained by triggers
+# CREATED: 18 OCT 2026
+# EXPORTS: StageTaskCounter
+# DEPENDENCIES: pydantic, datetime
+# ============================================================================
+"""
+Stage task counter — one row per (job_id, stage).
+
+Maintained entirely by triggers on app.tasks (see PydanticToSQL
+generate_static_functions / generate_triggers_composed):
+
+    INSERT tasks          → total_tasks += n, remaining_tasks += non-terminal n
+    UPDATE tasks.status   → remaining_tasks ± 1 when crossing terminal/non-terminal
+    DELETE tasks          → both decremented for the deleted rows
+
+complete_task_and_check_stage() reads remaining_tasks after its own
+decrement instead of COUNT(*)-ing the stage under an advisory lock. The
+decrement row-locks the counter until commit, so exactly one completion
+observes remaining_tasks = 0. Application code never writes this table.
+"""
+from datetime import datetime
+from typing import Any, ClassVar, Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class StageTaskCounter(BaseModel):
+    """Non-terminal task count for one stage of a CoreMachine job."""
+
+    job_id: str = Field(..., max_length=64)
+    stage: int
+    total_tasks: int = 0
+    remaining_tasks: int = 0
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    # DDL generation hints (same pattern as WorkflowTaskDep)
+    __sql_table_name: ClassVar[str] = "stage_task_counters"
+    __sql_schema: ClassVar[str] = "app"
+    __sql_primary_key: ClassVar[List[str]] = ["job_id", "stage"]
+    __sql_foreign_keys: ClassVar[Dict[str, str]] = {
+        "job_id": "app.jobs(job_id)"
+    }
+    __sql_unique_constraints: ClassVar[List[Dict[str, Any]]] = []
+    __sql_indexes: ClassVar[List[Dict[str, Any]]] = []
@@ -0,0 +1,84 @@
+# ============================================================================
+# CLAUDE CONTEXT - WORKFLOW RUN ARCHIVE INDEX MODEL
+# ============================================================================
+# EPOCH: 5 - ACTIVE
+# STATUS: Core - Hot/archive split for DAG tables
+# PURPOSE: Pydantic model for workflow_run_archive — compact index of terminal
+#          runs whose rows were moved out of the hot DAG tables into Parquet
+# LAST_REVIEWED: 18 OCT 2026
+# EXPORTS: WorkflowRunArchive
+# DEPENDENCIES: pydantic, datetime
+# ============================================================================
+"""
+WorkflowRunArchive — one row per archived workflow run.
+
+Terminal runs older than the retention window are exported (run, tasks,
+deps) to Parquet in silver storage and deleted from app.workflow_runs,
+app.workflow_tasks and app.workflow_task_deps. This index keeps the fields
+status lookups need without the large JSONB payloads; full rows are read
+back from the Parquet files on demand.
+
+Table: app.workflow_run_archive
+Primary Key: run_id
+"""
+
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, ClassVar
+from pydantic import BaseModel, Field, ConfigDict, field_serializer
+
+from .workflow_enums import WorkflowRunStatus
+
+
+class WorkflowRunArchive(BaseModel):
+    """Index row for a workflow run that lives in the Parquet archive."""
+    model_config = ConfigDict(extra='ignore', str_strip_whitespace=True)
+
+    @field_serializer('created_at', 'started_at', 'completed_at', 'archived_at')
+    @classmethod
+    def serialize_datetime(cls, v: datetime) -> Optional[str]:
+        return v.isoformat() if v else None
+
+    # =========================================================================
+    # DDL GENERATION HINTS (ClassVar = not a model field)
+    # =========================================================================
+    __sql_table_name: ClassVar[str] = "workflow_run_archive"
+    __sql_schema: ClassVar[str] = "app"
+    __sql_primary_key: ClassVar[List[str]] = ["run_id"]
+    __sql_foreign_keys: ClassVar[Dict[str, str]] = {}
+    __sql_unique_constraints: ClassVar[List[Dict[str, Any]]] = []
+    __sql_indexes: ClassVar[List[Dict[str, Any]]] = [
+        {"columns": ["request_id"], "name": "idx_workflow_run_archive_request",
+         "partial_where": "request_id IS NOT NULL"},
+        {"columns": ["completed_at"], "name": "idx_workflow_run_archive_completed", "descending": True},
+    ]
+
+    # =========================================================================
+    # IDENTITY (mirrors workflow_runs)
+    # =========================================================================
+    run_id: str = Field(..., max_length=64, description="Archived run identifier")
+    workflow_name: str = Field(..., max_length=100, description="Workflow identifier from YAML")
+    status: WorkflowRunStatus = Field(..., description="Terminal status at archive time")
+
+    # =========================================================================
+    # TIMESTAMPS
+    # =========================================================================
+    created_at: Optional[datetime] = Field(default=None)
+    started_at: Optional[datetime] = Field(default=None)
+    completed_at: Optional[datetime] = Field(default=None)
+    archived_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    # =========================================================================
+    # PLATFORM INTEGRATION (lookup keys)
+    # =========================================================================
+    request_id: Optional[str] = Field(default=None, max_length=100)
+    asset_id: Optional[str] = Field(default=None, max_length=64)
+    release_id: Optional[str] = Field(default=None, max_length=64)
+    schedule_id: Optional[str] = Field(default=None, max_length=64)
+
+    # =========================================================================
+    # ARCHIVE LOCATION
+    # =========================================================================
+    task_count: int = Field(default=0, ge=0, description="Task rows moved to the archive")
+    archive_container: str = Field(..., max_length=100, description="Silver container holding the Parquet files")
+    runs_blob_path: str = Field(..., max_length=500, description="Parquet file with the workflow_runs row")
+    tasks_blob_path: str = Field(..., max_length=500, description="Parquet file with workflow_tasks + deps rows")
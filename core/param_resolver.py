@@ -7,7 +7,8 @@
 #          node and fan-out item at dispatch time; no DB, no I/O.
 # LAST_REVIEWED: 16 MAR 2026
 # EXPORTS: ParameterResolutionError, resolve_dotted_path, resolve_param_or_predecessor,
-#          resolve_task_params, resolve_fan_out_params
+#          resolve_task_params, resolve_fan_out_params, split_dotted_path,
+#          compile_fan_out_templates
 # DEPENDENCIES: jinja2, core.models.workflow_definition, exceptions
 # ============================================================================
 
@@ -52,7 +53,25 @@ class ParameterResolutionError(BusinessLogicError):
 # ============================================================================
 
 
-def resolve_dotted_path(path: str, predecessor_outputs: dict[str, dict]) -> Any:
+def split_dotted_path(path: str) -> tuple[str, ...] | None:
+    """
+    Pre-split a dotted path for repeated resolution.
+
+    Returns None for a malformed path, so the caller falls back to
+    resolve_dotted_path() and gets the usual ParameterResolutionError at
+    resolution time.
+    """
+    segments = tuple(path.split("."))
+    if len(segments) < 2 or any(s == "" for s in segments):
+        return None
+    return segments
+
+
+def resolve_dotted_path(
+    path: str,
+    predecessor_outputs: dict[str, dict],
+    segments: tuple[str, ...] | None = None,
+) -> Any:
     """
     Navigate predecessor_outputs using a dotted path string.
 
@@ -64,13 +83,17 @@ def resolve_dotted_path(path: str, predecessor_outputs: dict[str, dict]) -> Any:
 
     Returns the resolved value, which MAY be None (stored null is valid).
 
+    segments, when given, is the output of split_dotted_path(path) computed
+    ahead of time (compiled workflow plans); it skips the split/validate step.
+
     Raises:
         ParameterResolutionError — malformed path, unknown node, or missing key
                                    at any traversal step.
     """
     # Step 1 — split and validate structure
-    segments = path.split(".")
-    if len(segments) < 2 or any(s == "" for s in segments):
+    if segments is None:
+        segments = split_dotted_path(path)
+    if segments is None:
         raise ParameterResolutionError(
             f"Dotted path '{path}' is malformed: must have at least two non-empty segments.",
             context={"path": path},
@@ -182,6 +205,7 @@ def resolve_task_params(
     node: TaskNode,
     job_params: dict,
     predecessor_outputs: dict[str, dict],
+    receives: tuple | None = None,
 ) -> dict:
     """
     Build the concrete parameter dict for a TaskNode at dispatch time.
@@ -205,6 +229,9 @@ def resolve_task_params(
 
     Step 3 — return resolved dict.
 
+    receives, when given, is the node's precomputed
+    ((local_name, dotted_path, segments), ...) from a compiled workflow plan.
+
     Raises:
         ParameterResolutionError — missing job_params key or bad dotted path.
     """
@@ -253,8 +280,10 @@ def resolve_task_params(
     # ------------------------------------------------------------------ #
     # Step 2 — receives overlay (always wins on collision)                #
     # ------------------------------------------------------------------ #
-    for local_name, dotted_path in node.receives.items():
-        resolved[local_name] = resolve_dotted_path(dotted_path, predecessor_outputs)
+    if receives is None:
+        receives = tuple((name, path, None) for name, path in node.receives.items())
+    for local_name, dotted_path, segments in receives:
+        resolved[local_name] = resolve_dotted_path(dotted_path, predecessor_outputs, segments)
 
     logger.debug(
         "resolve_task_params: handler='%s' resolved_keys=%s",
@@ -269,12 +298,36 @@ def resolve_task_params(
 # ============================================================================
 
 
+def compile_fan_out_templates(task_template: FanOutTaskDef) -> dict:
+    """
+    Compile the Jinja2-templated values of a fan-out task's params.
+
+    Compiling is by far the dominant cost of rendering, and the templates are
+    identical for every child, so expand_fan_outs compiles them once per
+    definition (via the compiled workflow plan) rather than once per child.
+    Values that fail to compile are left out; resolve_fan_out_params then
+    compiles them itself and raises the usual ParameterResolutionError.
+
+    Returns:
+        {param_key: jinja2.Template} for templated values only.
+    """
+    compiled: dict = {}
+    for key, value in task_template.params.items():
+        if isinstance(value, str) and "{{" in value:
+            try:
+                compiled[key] = _JINJA_ENV.from_string(value)
+            except TemplateSyntaxError:
+                continue
+    return compiled
+
+
 def resolve_fan_out_params(
     task_template: FanOutTaskDef,
     item: Any,
     index: int,
     job_params: dict,
     predecessor_outputs: dict[str, dict],
+    compiled_templates: dict | None = None,
 ) -> dict:
     """
     Build the concrete parameter dict for one fan-out item.
@@ -287,6 +340,9 @@ def resolve_fan_out_params(
     index is zero-based.  item may be any type including None (a WARNING is logged
     when item is None).
 
+    compiled_templates, when given, is compile_fan_out_templates(task_template);
+    keys missing from it are compiled on the spot.
+
     For each (key, value) in task_template.params:
         - If value is str containing '{{': render via _JINJA_ENV; UndefinedError → raise.
         - Otherwise: pass through as-is.
@@ -312,7 +368,8 @@ def resolve_fan_out_params(
     for key, value in task_template.params.items():
         if isinstance(value, str) and "{{" in value:
             try:
-                rendered = _JINJA_ENV.from_string(value).render(**context)
+                template = (compiled_templates or {}).get(key) or _JINJA_ENV.from_string(value)
+                rendered = template.render(**context)
                 # NativeEnvironment returns an Undefined object (not a string)
                 # when a variable is missing; force the UndefinedError here so
                 # the except clause below can catch it uniformly.
@@ -91,7 +91,9 @@ from ..models.schedule import Schedule  # Scheduler (21 MAR 2026 - F-SCHED)
 from ..models.scheduled_dataset import ScheduledDataset  # Scheduled datasets (21 MAR 2026 - F-SCHED)
 from ..models.workflow_task import WorkflowTask  # DAG workflow tasks (16 MAR 2026 - D.2)
 from ..models.workflow_task_dep import WorkflowTaskDep  # DAG workflow deps (16 MAR 2026 - D.2)
+from ..models.workflow_run_archive import WorkflowRunArchive  # Hot/archive split for DAG runs
 from ..models.orchestrator_lease import OrchestratorLease  # DAG Brain lease (28 MAR 2026)
+from ..models.stage_task_counter import StageTaskCounter  # Stage completion counters (18 OCT 2026)
 
 # Geo and ETL schema models (21 JAN 2026 - F7.IaC)
 from ..models.geo import GeoTableCatalog, FeatureCollectionStyles, B2CRoute, B2BRoute  # OGC Styles (22 JAN 2026), Routes (02 MAR 2026)
@@ -1355,20 +1357,29 @@ BEGIN
         RETURN;
     END IF;
     
-    -- Use advisory lock to prevent race conditions without row-level locks
-    -- This avoids deadlocks when many tasks complete simultaneously
-    -- Lock key is hash of job_id and stage to serialize per stage
-    PERFORM pg_advisory_xact_lock(
-        hashtext(v_job_id || ':stage:' || v_stage::text)
-    );
-    
-    -- Count remaining non-completed tasks in the same stage
-    -- Now that we have the lock, this count will be accurate
-    SELECT COUNT(*)::INTEGER INTO v_remaining
-    FROM {schema}.tasks 
-    WHERE parent_job_id = v_job_id 
-      AND stage = v_stage 
-      AND status NOT IN ('completed', 'failed', 'skipped', 'cancelled');
+    -- 18 OCT 2026: O(1) stage completion. The status change above fired
+    -- trg_tasks_stage_counter_update, which decremented this stage's row in
+    -- stage_task_counters and holds its row lock until commit. Concurrent
+    -- completions queue on that single row, each re-reading the latest
+    -- committed value, so exactly one of them observes 0 - no COUNT(*) scan.
+    SELECT c.remaining_tasks INTO v_remaining
+    FROM {schema}.stage_task_counters c
+    WHERE c.job_id = v_job_id AND c.stage = v_stage;
+
+    IF NOT FOUND THEN
+        -- No counter row: the stage predates the counters and the deploy
+        -- backfill (generate_stage_counter_backfill) did not cover it.
+        -- Fall back to advisory lock + COUNT(*)
+        PERFORM pg_advisory_xact_lock(
+            hashtext(v_job_id || ':stage:' || v_stage::text)
+        );
+
+        SELECT COUNT(*)::INTEGER INTO v_remaining
+        FROM {schema}.tasks 
+        WHERE parent_job_id = v_job_id 
+          AND stage = v_stage 
+          AND status NOT IN ('completed', 'failed', 'skipped', 'cancelled');
+    END IF;
     
     RETURN QUERY SELECT 
         TRUE,
@@ -1588,7 +1599,83 @@ $$""").format(
             sql.SQL(body_increment_retry)
         ))
 
-        # 5. update_updated_at_column trigger function
+        # 5. stage_task_counters maintenance trigger functions (18 OCT 2026)
+        # Keep app.stage_task_counters in step with app.tasks so that
+        # complete_task_and_check_stage() is O(1). Terminal statuses match the
+        # list the old COUNT(*) excluded.
+        body_counter_insert = """
+BEGIN
+    INSERT INTO {schema}.stage_task_counters AS c (job_id, stage, total_tasks, remaining_tasks, updated_at)
+    SELECT
+        parent_job_id,
+        stage,
+        COUNT(*)::INTEGER,
+        (COUNT(*) FILTER (WHERE status NOT IN ('completed', 'failed', 'skipped', 'cancelled')))::INTEGER,
+        NOW()
+    FROM new_rows
+    GROUP BY parent_job_id, stage
+    ON CONFLICT (job_id, stage) DO UPDATE SET
+        total_tasks = c.total_tasks + EXCLUDED.total_tasks,
+        remaining_tasks = c.remaining_tasks + EXCLUDED.remaining_tasks,
+        updated_at = NOW();
+    RETURN NULL;
+END;
+""".format(schema=self.schema_name)
+
+        body_counter_update = """
+BEGIN
+    -- Fired only when status crosses the terminal/non-terminal boundary
+    UPDATE {schema}.stage_task_counters
+    SET
+        remaining_tasks = remaining_tasks + CASE
+            WHEN NEW.status IN ('completed', 'failed', 'skipped', 'cancelled') THEN -1
+            ELSE 1
+        END,
+        updated_at = NOW()
+    WHERE job_id = NEW.parent_job_id AND stage = NEW.stage;
+    RETURN NULL;
+END;
+""".format(schema=self.schema_name)
+
+        body_counter_delete = """
+BEGIN
+    UPDATE {schema}.stage_task_counters c
+    SET
+        total_tasks = c.total_tasks - d.total_tasks,
+        remaining_tasks = c.remaining_tasks - d.remaining_tasks,
+        updated_at = NOW()
+    FROM (
+        SELECT
+            parent_job_id,
+            stage,
+            COUNT(*)::INTEGER AS total_tasks,
+            (COUNT(*) FILTER (WHERE status NOT IN ('completed', 'failed', 'skipped', 'cancelled')))::INTEGER AS remaining_tasks
+        FROM old_rows
+        GROUP BY parent_job_id, stage
+    ) d
+    WHERE c.job_id = d.parent_job_id AND c.stage = d.stage;
+    RETURN NULL;
+END;
+""".format(schema=self.schema_name)
+
+        for fn_name, fn_body in (
+            ("stage_counter_on_task_insert", body_counter_insert),
+            ("stage_counter_on_task_update", body_counter_update),
+            ("stage_counter_on_task_delete", body_counter_delete),
+        ):
+            functions.append(sql.SQL("""
+CREATE OR REPLACE FUNCTION {}.{}()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+{}
+$$""").format(
+                sql.Identifier(self.schema_name),
+                sql.Identifier(fn_name),
+                sql.SQL(fn_body)
+            ))
+
+        # 6. update_updated_at_column trigger function
         functions.append(sql.SQL("""
 CREATE OR REPLACE FUNCTION {}.{}()
 RETURNS TRIGGER
@@ -1622,9 +1709,80 @@ $$""").format(
         triggers.extend(TriggerBuilder.updated_at_trigger(self.schema_name, "jobs", "update_jobs_updated_at"))
         triggers.extend(TriggerBuilder.updated_at_trigger(self.schema_name, "tasks", "update_tasks_updated_at"))
 
+        # Stage task counters (18 OCT 2026) - O(1) complete_task_and_check_stage.
+        # INSERT/DELETE are statement-level over transition tables so a bulk
+        # stage insert touches each counter row once. UPDATE is row-level with
+        # a WHEN filter, so heartbeat/checkpoint updates never call the function.
+        terminal = sql.SQL("('completed', 'failed', 'skipped', 'cancelled')")
+        for trig_name, timing in (
+            ("trg_tasks_stage_counter_insert",
+             sql.SQL("AFTER INSERT ON {schema}.tasks REFERENCING NEW TABLE AS new_rows "
+                     "FOR EACH STATEMENT EXECUTE FUNCTION {schema}.stage_counter_on_task_insert()")),
+            ("trg_tasks_stage_counter_update",
+             sql.SQL("AFTER UPDATE OF status ON {schema}.tasks FOR EACH ROW "
+                     "WHEN ((OLD.status IN {terminal}) IS DISTINCT FROM (NEW.status IN {terminal})) "
+                     "EXECUTE FUNCTION {schema}.stage_counter_on_task_update()")),
+            ("trg_tasks_stage_counter_delete",
+             sql.SQL("AFTER DELETE ON {schema}.tasks REFERENCING OLD TABLE AS old_rows "
+                     "FOR EACH STATEMENT EXECUTE FUNCTION {schema}.stage_counter_on_task_delete()")),
+        ):
+            triggers.append(sql.SQL("DROP TRIGGER IF EXISTS {name} ON {schema}.tasks").format(
+                name=sql.Identifier(trig_name),
+                schema=sql.Identifier(self.schema_name)
+            ))
+            triggers.append(sql.SQL("CREATE TRIGGER {name} {timing}").format(
+                name=sql.Identifier(trig_name),
+                timing=timing.format(schema=sql.Identifier(self.schema_name), terminal=terminal)
+            ))
+
         self.logger.debug(f"✅ Generated {len(triggers)} trigger statements")
         return triggers
 
+    def generate_stage_counter_backfill(self) -> List[sql.Composed]:
+        """
+        Recount stage_task_counters for jobs still in flight.
+
+        The counter triggers only see task changes made after they exist.
+        A stage created before the deploy has no counter row, or only a
+        partial one if tasks were added to it afterwards. A partial row
+        would let complete_task_and_check_stage() report the stage done
+        too early. This recomputes every stage of queued/processing jobs from
+        app.tasks. It runs on every deploy, so it is idempotent and also
+        repairs drift.
+
+        The SHARE lock blocks task writes for the duration of the recount,
+        so a concurrent insert cannot be lost between the count and the
+        upsert. Terminal jobs are skipped; they never consult the counters.
+
+        Returns:
+            List with one composed DO statement
+        """
+        self.logger.debug("🔢 Generating stage_task_counters backfill")
+        return [sql.SQL("""
+DO $$
+BEGIN
+    LOCK TABLE {schema}.tasks IN SHARE MODE;
+
+    INSERT INTO {schema}.stage_task_counters AS c (job_id, stage, total_tasks, remaining_tasks, updated_at)
+    SELECT
+        t.parent_job_id,
+        t.stage,
+        COUNT(*)::INTEGER,
+        (COUNT(*) FILTER (WHERE t.status NOT IN ('completed', 'failed', 'skipped', 'cancelled')))::INTEGER,
+        NOW()
+    FROM {schema}.tasks t
+    JOIN {schema}.jobs j ON j.job_id = t.parent_job_id
+    WHERE j.status IN ('queued', 'processing')
+    GROUP BY t.parent_job_id, t.stage
+    ON CONFLICT (job_id, stage) DO UPDATE SET
+        total_tasks = EXCLUDED.total_tasks,
+        remaining_tasks = EXCLUDED.remaining_tasks,
+        updated_at = NOW()
+    WHERE c.total_tasks IS DISTINCT FROM EXCLUDED.total_tasks
+       OR c.remaining_tasks IS DISTINCT FROM EXCLUDED.remaining_tasks;
+END
+$$""").format(schema=sql.Identifier(self.schema_name))]
+
     def generate_seed_data(self) -> List[sql.Composed]:
         """
         Generate seed data INSERT statements.
@@ -1740,6 +1898,7 @@ INSERT INTO {schema}.{table} (
         # NOTE: OrchestrationJob REMOVED (22 NOV 2025) - no job chaining in Platform
         composed.append(self.generate_table_composed(JobRecord, "jobs"))
         composed.append(self.generate_table_composed(TaskRecord, "tasks"))
+        composed.append(self.generate_table_from_model(StageTaskCounter))  # O(1) stage completion (18 OCT 2026)
         composed.append(self.generate_table_composed(ApiRequest, "api_requests"))
         composed.append(self.generate_table_composed(JanitorRun, "janitor_runs"))
         composed.append(self.generate_table_composed(EtlSourceFile, "etl_source_files"))  # ETL tracking (21 DEC 2025 - generalized)
@@ -1763,6 +1922,7 @@ INSERT INTO {schema}.{table} (
         composed.append(self.generate_table_from_model(WorkflowRun))
         composed.append(self.generate_table_from_model(WorkflowTask))
         composed.append(self.generate_table_from_model(WorkflowTaskDep))
+        composed.append(self.generate_table_from_model(WorkflowRunArchive))  # Archived run index (no FK — hot rows are deleted)
         # Scheduler tables (21 MAR 2026 - F-SCHED)
         composed.append(self.generate_table_from_model(Schedule))
         composed.append(self.generate_table_from_model(ScheduledDataset))
@@ -1795,6 +1955,7 @@ INSERT INTO {schema}.{table} (
         composed.extend(self.generate_indexes_from_model(WorkflowRun))  # DAG runs (16 MAR 2026 - D.2)
         composed.extend(self.generate_indexes_from_model(WorkflowTask))  # DAG tasks (16 MAR 2026 - D.2)
         composed.extend(self.generate_indexes_from_model(WorkflowTaskDep))  # DAG deps (16 MAR 2026 - D.2)
+        composed.extend(self.generate_indexes_from_model(WorkflowRunArchive))  # Archived run index
         composed.extend(self.generate_indexes_from_model(Schedule))  # Scheduler (21 MAR 2026 - F-SCHED)
         composed.extend(self.generate_indexes_from_model(ScheduledDataset))  # Scheduled datasets (21 MAR 2026 - F-SCHED)
 
@@ -1804,6 +1965,9 @@ INSERT INTO {schema}.{table} (
         # Triggers - now using composed SQL
         composed.extend(self.generate_triggers_composed())
 
+        # Counters for stages that predate the counter triggers (18 OCT 2026)
+        composed.extend(self.generate_stage_counter_backfill())
+
         # Seed data - Platform Registry (V0.8 - 29 JAN 2026)
         composed.extend(self.generate_seed_data())
 
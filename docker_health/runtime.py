@@ -153,6 +153,9 @@ class RuntimeSubsystem(WorkerSubsystem):
                 "critical_threshold_percent": 90,
             }
 
+            # Logging pipeline counters (async queue depth, dropped, sampled)
+            from util_logger import get_logging_stats
+
             return self.build_component(
                 status="healthy",
                 description="Docker container runtime environment",
@@ -162,6 +165,7 @@ class RuntimeSubsystem(WorkerSubsystem):
                     "process": process_info,
                     "memory": memory_stats,
                     "capacity": capacity,
+                    "logging": get_logging_stats(),
                 }
             )
 
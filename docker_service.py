@@ -306,6 +306,14 @@ class DockerWorkerLifecycle:
         write their final status (COMPLETED/FAILED). Previously destroyed in
         initiate_shutdown(), killing DB access for in-flight tasks.
         """
+        # Buffered progress snapshots/events and checkpoints need the pool too
+        try:
+            from infrastructure.progress_buffer import shutdown_progress_buffer
+            logger.info("  → Flushing progress write buffer...")
+            shutdown_progress_buffer()
+        except Exception as e:
+            logger.warning(f"  → Progress buffer flush error (non-fatal): {e}")
+
         try:
             from infrastructure.connection_pool import ConnectionPoolManager
             logger.info("  → Shutting down connection pool...")
@@ -544,6 +552,7 @@ class BackgroundQueueWorker:
         # Processing settings
         self.poll_interval_seconds = 5   # Seconds between polls when idle
         self.poll_interval_on_error = 5  # Seconds to wait after error
+        self.poll_interval_on_mount_full = 30  # Seconds to wait when mount admission defers
 
     def _ensure_initialized(self):
         """Lazy initialization of config and CoreMachine."""
@@ -838,6 +847,12 @@ class BackgroundQueueWorker:
         self._process_workflow_task(workflow_task)
         return True
 
+    def _mount_admits_claim(self) -> bool:
+        """True unless the ETL mount is below its claim watermark (no mount → True)."""
+        from infrastructure.mount_space import get_mount_space_manager
+        manager = get_mount_space_manager()
+        return manager is None or manager.admit_claim()
+
     def _run_loop(self):
         """Main DB-polling loop — dual-poll for legacy tasks AND DAG workflow tasks (D.6)."""
         self._ensure_initialized()
@@ -853,6 +868,13 @@ class BackgroundQueueWorker:
                 # Alternate poll order each iteration to prevent starvation (COMPETE H2)
                 _poll_dag_first = not _poll_dag_first
 
+                # Mount admission: don't claim work the ETL mount can't hold.
+                # admit_claim() evicts finished runs before saying no.
+                if not self._mount_admits_claim():
+                    self._last_poll_time = datetime.now(timezone.utc)
+                    self._stop_event.wait(self.poll_interval_on_mount_full)
+                    continue
+
                 if _poll_dag_first:
                     claimed = self._try_claim_and_process_dag() or self._try_claim_and_process_legacy()
                 else:
@@ -913,8 +935,21 @@ class BackgroundQueueWorker:
             # Initialization failure tracking (29 JAN 2026)
             "init_failed": self._init_failed,
             "init_error": self._init_error,
+            "mount_space": self._mount_space_stats(),
+            "progress_buffer": self._progress_buffer_stats(),
         }
 
+    @staticmethod
+    def _progress_buffer_stats() -> dict:
+        from infrastructure.progress_buffer import get_progress_buffer
+        return get_progress_buffer().stats()
+
+    @staticmethod
+    def _mount_space_stats() -> Optional[dict]:
+        from infrastructure.mount_space import get_mount_space_manager
+        manager = get_mount_space_manager()
+        return manager.stats() if manager else None
+
     def is_healthy(self) -> bool:
         """
         Check if queue worker is healthy and able to process tasks.
@@ -1190,6 +1225,11 @@ class DAGBrainPrimaryLoop:
 
         logger.info("DAG Brain primary loop started (scan_interval=%.1fs)", self._scan_interval)
 
+        # One orchestrator for every run and scan: it holds no per-run state,
+        # and its lazily-built release repository is reused rather than
+        # rebuilt per run. Compiled workflow plans are cached process-wide.
+        orchestrator = DAGOrchestrator(self._repo)
+
         while not self._stop_event.is_set():
             # Acquire lease — back off if held by another instance
             if not self._lease_repo.try_acquire(self._holder_id):
@@ -1225,7 +1265,6 @@ class DAGBrainPrimaryLoop:
 
                             # Per-run isolation: one run's error must not skip others
                             try:
-                                orchestrator = DAGOrchestrator(self._repo)
                                 result = orchestrator.run(
                                     run_id,
                                     max_cycles=1,
@@ -1275,6 +1314,7 @@ class DAGBrainPrimaryLoop:
                 logger.warning("DAG Brain primary loop did not stop within %.1fs", timeout)
 
     def get_status(self) -> Dict[str, Any]:
+        from core.dag_workflow_plan import workflow_plan_cache_stats
         thread_alive = self._thread is not None and self._thread.is_alive()
         return {
             "running": thread_alive,
@@ -1282,6 +1322,7 @@ class DAGBrainPrimaryLoop:
             "total_cycles": self._total_cycles,
             "last_scan_at": self._last_scan_at.isoformat() if self._last_scan_at else None,
             "scan_interval": self._scan_interval,
+            "workflow_plan_cache": workflow_plan_cache_stats(),
         }
 
 
@@ -25,6 +25,7 @@ Exports:
     TaskExecutionError: Task execution failures
     ResourceNotFoundError: Missing resource errors
     ValidationError: Business validation failures
+    InsufficientMountSpaceError: ETL mount cannot fit a reservation
     ConfigurationError: Fatal system misconfiguration
 """
 
@@ -143,6 +144,22 @@ class ValidationError(BusinessLogicError):
     pass
 
 
+class InsufficientMountSpaceError(TaskExecutionError):
+    """
+    The ETL mount cannot fit a handler's space reservation, even after
+    evicting finished runs' directories.
+
+    Raised before any bytes are written, so retrying later (after other
+    runs finish or are evicted) does not repeat a partial download.
+    Handlers report it as error_type "DiskSpaceError", retryable.
+    """
+
+    def __init__(self, message: str, requested_bytes: int = 0, available_bytes: int = 0):
+        super().__init__(message)
+        self.requested_bytes = requested_bytes
+        self.available_bytes = available_bytes
+
+
 class ConfigurationError(Exception):
     """
     System configuration error.
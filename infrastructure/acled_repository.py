@@ -18,8 +18,10 @@ import pandas as pd
 import requests
 
 from infrastructure.api_repository import APIRepository
+from util_logger import enable_log_sampling
 
-logger = logging.getLogger(__name__)
+# Per-page fetch logs fire hundreds of times per sync — sample them
+logger = enable_log_sampling(logging.getLogger(__name__))
 
 
 class ACLEDRepository(APIRepository):
@@ -87,7 +87,7 @@ import concurrent.futures
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from io import BytesIO
-from typing import List, Dict, Any, Optional, Iterator, BinaryIO, Union
+from typing import List, Dict, Any, Optional, Iterator, BinaryIO, Tuple, Union
 
 # Azure SDK imports - These will fail fast if not installed
 from azure.storage.blob import BlobServiceClient, ContainerClient, BlobClient, generate_blob_sas, BlobSasPermissions, ContentSettings
@@ -934,6 +934,33 @@ class BlobRepository(IBlobRepository):
             logger.error(f"Failed to list blobs in {container}: {e}")
             raise
 
+    def iter_blob_names(
+        self,
+        container: str,
+        prefix: str = "",
+        page_size: int = 5000
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Stream (name, etag) pairs for every blob under a prefix.
+
+        Unlike list_blobs, this does not materialize metadata dicts or
+        aggregate .gdb folders — it is intended for bulk reconciliation where
+        one listing (page_size names per request) replaces a HEAD per blob.
+
+        Args:
+            container: Container name
+            prefix: Optional path prefix filter
+            page_size: Names per list request (service maximum is 5000)
+
+        Yields:
+            (blob_name, etag) tuples in lexicographic order
+        """
+        container_client = self._get_container_client(container)
+        for blob in container_client.list_blobs(
+            name_starts_with=prefix or None, results_per_page=page_size
+        ):
+            yield blob.name, blob.etag
+
     def list_containers(self, prefix: str = None) -> List[Dict[str, Any]]:
         """
         List all containers in the storage account.
@@ -6,7 +6,8 @@
 # PURPOSE: Enable resumable Docker tasks with phase-based checkpointing
 # LAST_REVIEWED: 16 JAN 2026
 # EXPORTS: CheckpointManager, CheckpointValidationError
-# DEPENDENCIES: core.schema.updates.TaskUpdateModel, threading
+# DEPENDENCIES: core.schema.updates.TaskUpdateModel, infrastructure.progress_buffer,
+#               threading
 # F7.18: Added shutdown awareness (is_shutdown_requested, should_stop, etc.)
 # ============================================================================
 """
@@ -50,6 +51,7 @@ from datetime import datetime, timezone
 
 from util_logger import LoggerFactory, ComponentType
 from core.schema.updates import TaskUpdateModel
+from infrastructure.progress_buffer import get_progress_buffer
 
 logger = LoggerFactory.create_logger(ComponentType.REPOSITORY, "checkpoint_manager")
 
@@ -123,6 +125,9 @@ class CheckpointManager:
         Called automatically during __init__. If the task has a prior
         checkpoint, this restores the phase number and accumulated data.
         """
+        # Another manager in this process may still hold a buffered save
+        get_progress_buffer().flush(task_id=self.task_id)
+
         task = self.task_repo.get_task(self.task_id)
 
         if task is None:
@@ -171,14 +176,22 @@ class CheckpointManager:
         self,
         phase: int,
         data: Optional[Dict[str, Any]] = None,
-        validate_artifact: Optional[Callable[[], bool]] = None
+        validate_artifact: Optional[Callable[[], bool]] = None,
+        flush: bool = False
     ) -> None:
         """
         Save checkpoint after completing a phase.
 
-        This persists the phase number and any associated data to the
-        task record in the database. If validate_artifact is provided,
-        it's called first to ensure the phase output actually exists.
+        This records the phase number and any associated data for the
+        task record. If validate_artifact is provided, it's called first
+        to ensure the phase output actually exists.
+
+        The write goes through the progress write buffer
+        (infrastructure.progress_buffer): saves are coalesced to the latest
+        phase per task and written in batches. Local state (should_skip,
+        get_data) updates immediately. The buffer is flushed for this task
+        before CoreMachine records the task's outcome and on worker
+        shutdown; pass flush=True where the row must be durable now.
 
         Args:
             phase: Phase number just completed (1-indexed)
@@ -188,6 +201,7 @@ class CheckpointManager:
                              phase's output artifact exists and is valid.
                              Raises CheckpointValidationError if validation
                              fails.
+            flush: Write this task's checkpoint to the database before returning
 
         Raises:
             CheckpointValidationError: If validate_artifact returns False
@@ -213,27 +227,28 @@ class CheckpointManager:
         # Merge new data into accumulated checkpoint data
         merged_data = {**self.data, **(data or {})}
 
-        # Persist to database
-        update = TaskUpdateModel(
-            checkpoint_phase=phase,
-            checkpoint_data=merged_data,
-            checkpoint_updated_at=datetime.now(timezone.utc)
+        buffer = get_progress_buffer()
+        buffer.record_checkpoint(self.task_id, self.task_repo, phase, merged_data)
+
+        # Update local state
+        self.current_phase = phase
+        self.data = merged_data
+
+        if flush:
+            self.flush()
+
+        logger.info(
+            f"💾 CheckpointManager: Saved phase {phase} for task {self.task_id[:8]}... "
+            f"(keys: {list(merged_data.keys())}{'' if flush else ', buffered'})"
         )
 
-        success = self.task_repo.update_task(self.task_id, update)
+    def flush(self) -> None:
+        """
+        Write this task's buffered checkpoint to the database now.
 
-        if success:
-            # Update local state
-            self.current_phase = phase
-            self.data = merged_data
-            logger.info(
-                f"💾 CheckpointManager: Saved phase {phase} for task {self.task_id[:8]}... "
-                f"(keys: {list(merged_data.keys())})"
-            )
-        else:
-            logger.error(
-                f"❌ CheckpointManager: Failed to save phase {phase} for task {self.task_id[:8]}..."
-            )
+        A failed write stays queued and is retried by the buffer.
+        """
+        get_progress_buffer().flush(task_id=self.task_id)
 
     def get_data(self, key: str, default: Any = None) -> Any:
         """
@@ -278,6 +293,9 @@ class CheckpointManager:
         to re-execute. Use with caution - typically only for testing
         or explicit retry-from-scratch scenarios.
         """
+        # A buffered save must not land after (and undo) the reset
+        get_progress_buffer().discard_checkpoint(self.task_id)
+
         update = TaskUpdateModel(
             checkpoint_phase=0,
             checkpoint_data={},
@@ -392,7 +410,7 @@ class CheckpointManager:
             logger.warning(f"  Data keys: {list(data.keys()) if data else 'none'}")
             logger.warning(f"  Action: Saving checkpoint and signaling handler to stop")
             logger.warning("=" * 50)
-            self.save(phase, data=data)
+            self.save(phase, data=data, flush=True)
             logger.info(f"💾 Checkpoint saved at phase {phase} - handler should return interrupted=True")
             return True
         return False
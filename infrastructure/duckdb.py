@@ -167,6 +167,9 @@ class DuckDBRepository(IDuckDBRepository):
                     self._conn = duckdb.connect(db_path)
                     logger.info(f"✅ STEP 1: Persistent DuckDB connection created - {db_path}")
 
+                # STEP 1b: Parallelism and memory cap (DUCKDB_THREADS / DUCKDB_MEMORY_LIMIT)
+                self._apply_resource_limits()
+
                 # STEP 2: Load extensions
                 self._initialize_extensions()
 
@@ -176,6 +179,36 @@ class DuckDBRepository(IDuckDBRepository):
 
         return self._conn
 
+    def _apply_resource_limits(self) -> None:
+        """
+        Apply thread count and memory limit from the environment.
+
+        Read directly from env (same reasoning as GOLD_STORAGE_ACCOUNT in
+        __init__) with AnalyticsDefaults fallbacks. Non-fatal on failure.
+        """
+        from config.defaults import AnalyticsDefaults
+
+        threads = int(os.getenv("DUCKDB_THREADS", str(AnalyticsDefaults.THREADS)))
+        memory_limit = os.getenv("DUCKDB_MEMORY_LIMIT", AnalyticsDefaults.MEMORY_LIMIT)
+        try:
+            self._conn.execute(f"SET threads = {max(1, threads)}")
+            if re.match(r'^\d+(\.\d+)?\s*[KMGT]i?B$', memory_limit, re.IGNORECASE):
+                self._conn.execute(f"SET memory_limit = '{memory_limit}'")
+            logger.info(f"   ✅ DuckDB threads={threads}, memory_limit={memory_limit}")
+        except Exception as e:
+            logger.warning(f"   ⚠️ DuckDB resource limits not applied: {e}")
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """
+        Per-call cursor on the shared database.
+
+        The shared connection is not thread-safe; a cursor is an independent
+        connection to the same in-memory database (settings, extensions and
+        secrets included) and can be used from a worker thread. Close it when
+        done (it is a context manager).
+        """
+        return self.get_connection().cursor()
+
     def _initialize_extensions(self) -> None:
         """
         Load DuckDB extensions for spatial and Azure operations.
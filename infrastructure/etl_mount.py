@@ -8,7 +8,7 @@
 # LAST_REVIEWED: 27 MAR 2026
 # EXPORTS: resolve_run_dir, ensure_dir, cleanup_run, list_files,
 #          validate_path, download_blob_to_mount, download_prefix_to_mount
-# DEPENDENCIES: config, infrastructure.blob
+# DEPENDENCIES: config, infrastructure.blob, infrastructure.mount_space (lazy)
 # ============================================================================
 """
 ETL Mount Utilities.
@@ -39,7 +39,8 @@ import glob as _glob
 import logging
 import os
 import shutil
-from typing import List
+from contextlib import ExitStack
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -282,6 +283,7 @@ def download_prefix_to_mount(
     container: str,
     prefix: str,
     mount_dir: str,
+    run_id: Optional[str] = None,
 ) -> dict:
     """
     Download all blobs under *prefix* to the local mount.
@@ -295,17 +297,20 @@ def download_prefix_to_mount(
         container: Azure Blob container name.
         prefix: Blob name prefix to enumerate.
         mount_dir: Local mount directory to write into.
+        run_id: Owning run. When given, the listed total size is reserved
+            on the mount before the first byte is written.
 
     Returns:
         Dict summary::
 
             {"mount_path": "...", "file_count": N, "total_bytes": N}
+
+    Raises:
+        InsufficientMountSpaceError: *run_id* given and the prefix does not
+            fit on the mount after evicting finished runs.
     """
     blobs = blob_repo.list_blobs(container, prefix=prefix)
 
-    file_count = 0
-    total_bytes = 0
-
     # Derive the directory portion of the prefix for stripping.
     # For directory prefixes like "data/zarr/" → strip "data/zarr/"
     # For file prefixes like "data/file.nc" → strip "data/" (parent dir)
@@ -330,6 +335,40 @@ def download_prefix_to_mount(
     # as files blocks subsequent makedirs for the real subdirectory tree.
     blob_names = {b["name"] for b in blobs}
 
+    with ExitStack() as stack:
+        if run_id:
+            from infrastructure.mount_space import reserve_mount_space
+            stack.enter_context(reserve_mount_space(
+                run_id, sum(b.get("size", 0) for b in blobs), "download_prefix_to_mount",
+            ))
+        file_count, total_bytes = _download_listed_blobs(
+            blob_repo, container, blobs, blob_names, strip_prefix, mount_dir,
+        )
+
+    logger.info(
+        "download_prefix_to_mount: %s/%s -> %s — %d files, %.1f MB",
+        container, prefix, mount_dir, file_count, total_bytes / (1024 * 1024),
+    )
+
+    return {
+        "mount_path": mount_dir,
+        "file_count": file_count,
+        "total_bytes": total_bytes,
+    }
+
+
+def _download_listed_blobs(
+    blob_repo,
+    container: str,
+    blobs: list,
+    blob_names: set,
+    strip_prefix: str,
+    mount_dir: str,
+) -> tuple:
+    """Stream each listed blob under *mount_dir*; returns (file_count, total_bytes)."""
+    file_count = 0
+    total_bytes = 0
+
     for blob_meta in blobs:
         blob_name = blob_meta["name"]
         blob_size = blob_meta.get("size", 0)
@@ -367,13 +406,4 @@ def download_prefix_to_mount(
             pass
         file_count += 1
 
-    logger.info(
-        "download_prefix_to_mount: %s/%s -> %s — %d files, %.1f MB",
-        container, prefix, mount_dir, file_count, total_bytes / (1024 * 1024),
-    )
-
-    return {
-        "mount_path": mount_dir,
-        "file_count": file_count,
-        "total_bytes": total_bytes,
-    }
+    return file_count, total_bytes
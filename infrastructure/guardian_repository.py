@@ -682,6 +682,33 @@ class GuardianRepository(PostgreSQLRepository):
                 return new_count
             return -1
 
+    def increment_task_retries(self, task_ids: List[str]) -> Dict[str, int]:
+        """
+        Batch increment retry_count for tasks about to be re-sent.
+
+        Args:
+            task_ids: Tasks to increment retry count for.
+
+        Returns:
+            {task_id: new retry_count} for the tasks found.
+        """
+        if not task_ids:
+            return {}
+
+        query = sql.SQL("""
+            UPDATE {schema}.tasks
+            SET
+                retry_count = retry_count + 1,
+                updated_at = NOW()
+            WHERE task_id = ANY(%s)
+            RETURNING task_id, retry_count
+        """).format(schema=sql.Identifier(self.schema_name))
+
+        with self._error_context("increment task retries"):
+            result = self._execute_query(query, (task_ids,), fetch='all') or []
+            logger.info(f"[GUARDIAN] Incremented retry_count for {len(result)} tasks")
+            return {row['task_id']: row['retry_count'] for row in result}
+
     # ====================================================================
     # AUDIT LOGGING (two-phase)
     # ====================================================================
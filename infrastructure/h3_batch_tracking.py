@@ -23,12 +23,21 @@ Workflow:
     3. Handler completes → complete_batch() sets status='completed'
     4. On restart, only incomplete batches get new tasks
 
+Incremental Recompute:
+    When a source is refreshed in regional tiles, most batches would
+    recompute identical numbers. H3Repository.get_changed_batch_indices()
+    maps the changed footprint to batch indices, and get_pending_batches()
+    turns those (instead of range(num_batches)) into the batches still to
+    run. Untouched batches keep their stats; recomputed ones are upserted.
+    Coarser resolutions can then be re-derived with
+    H3Repository.rollup_zonal_stats().
+
 Exports:
     H3BatchTracker: Repository for batch progress tracking
 """
 
 import logging
-from typing import Set, Optional, Dict, Any, List
+from typing import Set, Optional, Dict, Any, Iterable, List, Tuple
 from psycopg import sql
 
 from infrastructure.postgresql import PostgreSQLRepository
@@ -173,6 +182,59 @@ class H3BatchTracker(PostgreSQLRepository):
 
         return completed_ids
 
+    @staticmethod
+    def batch_id_for(job_id: str, stage_number: int, batch_index: int) -> str:
+        """Conventional batch_id: "{job_id[:8]}-s{stage}-batch{index}"."""
+        return f"{job_id[:8]}-s{stage_number}-batch{batch_index}"
+
+    def get_pending_batches(
+        self,
+        job_id: str,
+        stage_number: int,
+        batch_indices: Iterable[int]
+    ) -> List[Tuple[int, str]]:
+        """
+        Resolve which of *batch_indices* still need a task.
+
+        Full runs pass range(num_batches); incremental runs pass the indices
+        from H3Repository.get_changed_batch_indices(). Either way batches
+        already completed for this job (a resumed run) are dropped.
+
+        Parameters:
+        ----------
+        job_id : str
+            CoreMachine job ID (SHA256 hash)
+        stage_number : int
+            Stage number of the fan-out
+        batch_indices : Iterable[int]
+            Candidate batch indices
+
+        Returns:
+        -------
+        List[Tuple[int, str]]
+            (batch_index, batch_id) pairs to create tasks for, in index order
+
+        Example:
+        -------
+        >>> changed = h3_repo.get_changed_batch_indices(6, batch_size, footprint)
+        >>> for idx, batch_id in tracker.get_pending_batches(job_id, 2, changed):
+        ...     tasks.append({"batch_id": batch_id, "batch_start": idx * batch_size, ...})
+        """
+        candidates = sorted(set(batch_indices))
+        completed = self.get_completed_batch_ids(job_id, stage_number)
+
+        pending = []
+        for batch_index in candidates:
+            batch_id = self.batch_id_for(job_id, stage_number, batch_index)
+            if batch_id not in completed:
+                pending.append((batch_index, batch_id))
+
+        logger.info(
+            f"📋 {len(pending)} of {len(candidates)} candidate batches pending for "
+            f"job={job_id[:8]}... stage={stage_number}"
+        )
+        return pending
+
     def start_batch(
         self,
         job_id: str,
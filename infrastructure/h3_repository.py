@@ -18,6 +18,7 @@ Key Features:
     - Spatial attribute updates via PostGIS ST_Intersects
     - Reference filter management for cascading children generation
     - Grid metadata tracking for bootstrap progress monitoring
+    - Parent-cell rollups of zonal stats (one raster pass per resolution pyramid)
     - Idempotency support via grid_exists checks
 
 Schema:
@@ -1868,6 +1869,141 @@ class H3Repository(PostgreSQLRepository):
         logger.info(f"📊 Cell count for aggregation: {count:,} (resolution={resolution}, scope={scope_desc})")
         return count
 
+    @staticmethod
+    def footprint_wkt_from_bboxes(bboxes: List[List[float]]) -> str:
+        """
+        GEOMETRYCOLLECTION WKT of the given [minx, miny, maxx, maxy] boxes.
+
+        A collection (not a MULTIPOLYGON) because refreshed source tiles may
+        overlap or share edges, which would make a multipolygon invalid.
+        """
+        if not bboxes:
+            raise ValueError("bboxes must not be empty")
+        polygons = []
+        for bbox in bboxes:
+            if len(bbox) != 4:
+                raise ValueError(f"bbox must be [minx, miny, maxx, maxy], got: {bbox}")
+            minx, miny, maxx, maxy = bbox
+            polygons.append(
+                f"POLYGON(({minx} {miny}, {maxx} {miny}, {maxx} {maxy}, "
+                f"{minx} {maxy}, {minx} {miny}))"
+            )
+        return f"GEOMETRYCOLLECTION({', '.join(polygons)})"
+
+    def get_changed_batch_indices(
+        self,
+        resolution: int,
+        batch_size: int,
+        footprint_wkt: str,
+        iso3: Optional[str] = None,
+        bbox: Optional[List[float]] = None,
+        polygon_wkt: Optional[str] = None
+    ) -> Dict[int, int]:
+        """
+        Find the aggregation batches whose cells intersect a changed footprint.
+
+        Batches are numbered exactly as get_cells_for_aggregation pages them
+        (scope-filtered cells ORDER BY h3_index, batch_start = index *
+        batch_size), so an incremental run can create tasks for just these
+        indices and leave every other batch's stats untouched.
+        insert_zonal_stats_batch upserts, so recomputed cells overwrite
+        their old values in place.
+
+        Parameters:
+        ----------
+        resolution : int
+            H3 resolution level (0-15)
+        batch_size : int
+            Cells per batch (same value the job uses for batching)
+        footprint_wkt : str
+            Changed extent of the new source version in EPSG:4326, e.g. from
+            footprint_wkt_from_bboxes() over the refreshed tiles
+        iso3, bbox, polygon_wkt :
+            Same scope filters as get_cells_for_aggregation
+
+        Returns:
+        -------
+        Dict[int, int]
+            {batch_index: changed_cell_count}, ordered by batch_index
+
+        Example:
+        -------
+        >>> footprint = repo.footprint_wkt_from_bboxes(refreshed_tile_bboxes)
+        >>> changed = repo.get_changed_batch_indices(6, 5000, footprint)
+        >>> for idx in changed:
+        ...     cells = repo.get_cells_for_aggregation(6, batch_start=idx * 5000, batch_size=5000)
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got: {batch_size}")
+
+        if iso3:
+            scope_join = sql.SQL("JOIN {schema}.cell_admin0 a ON c.h3_index = a.h3_index").format(
+                schema=sql.Identifier('h3'))
+            scope_where = sql.SQL("AND a.iso3 = %s")
+            scope_params = [iso3]
+        elif bbox:
+            if len(bbox) != 4:
+                raise ValueError(f"bbox must be [minx, miny, maxx, maxy], got: {bbox}")
+            scope_join = sql.SQL("")
+            scope_where = sql.SQL("AND ST_Intersects(c.geom, ST_MakeEnvelope(%s, %s, %s, %s, 4326))")
+            scope_params = list(bbox)
+        elif polygon_wkt:
+            scope_join = sql.SQL("")
+            scope_where = sql.SQL("AND ST_Intersects(c.geom, ST_GeomFromText(%s, 4326))")
+            scope_params = [polygon_wkt]
+        else:
+            scope_join = sql.SQL("")
+            scope_where = sql.SQL("")
+            scope_params = []
+
+        # Changed cells are found first, per footprint part, so each probe
+        # is a GiST lookup on cells.geom and overlapping parts need no
+        # union. Batch numbering has to rank every scoped cell, but only by
+        # h3_index; the (few) changed cells are then joined back on
+        # h3_index to read their batch.
+        query = sql.SQL("""
+            WITH parts AS (
+                SELECT (ST_Dump(ST_GeomFromText(%s, 4326))).geom AS geom
+            ),
+            changed AS (
+                SELECT DISTINCT c.h3_index
+                FROM parts p
+                JOIN {schema}.cells c ON ST_Intersects(c.geom, p.geom)
+                WHERE c.resolution = %s
+            ),
+            numbered AS (
+                SELECT c.h3_index,
+                       (ROW_NUMBER() OVER (ORDER BY c.h3_index) - 1) / %s AS batch_index
+                FROM {schema}.cells c
+                {scope_join}
+                WHERE c.resolution = %s
+                  {scope_where}
+            )
+            SELECT n.batch_index, COUNT(*) AS changed_cells
+            FROM numbered n
+            JOIN changed ch ON ch.h3_index = n.h3_index
+            GROUP BY n.batch_index
+            ORDER BY n.batch_index
+        """).format(
+            schema=sql.Identifier('h3'),
+            scope_join=scope_join,
+            scope_where=scope_where
+        )
+        params = [footprint_wkt, resolution, batch_size, resolution] + scope_params
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                results = cur.fetchall()
+
+        changed = {int(row['batch_index']): row['changed_cells'] for row in results}
+        logger.info(
+            f"📊 Changed footprint touches {len(changed):,} batches "
+            f"({sum(changed.values()):,} cells) at resolution={resolution}, "
+            f"batch_size={batch_size}"
+        )
+        return changed
+
     def insert_zonal_stats_batch(
         self,
         stats: List[Dict[str, Any]],
@@ -2028,6 +2164,362 @@ class H3Repository(PostgreSQLRepository):
 
         return rowcount
 
+    # Stat types that compose exactly from child cells (see rollup_zonal_stats)
+    ROLLUP_STAT_TYPES = ['count', 'sum', 'mean', 'min', 'max', 'std']
+
+    # Server-side cursor page size for rollup child rows
+    ROLLUP_FETCH_SIZE = 10000
+
+    @staticmethod
+    def compose_rollup_stats(
+        children: List[Dict[str, Any]],
+        stat_types: List[str]
+    ) -> Dict[str, Optional[float]]:
+        """
+        Compose one parent cell's stats (one band) from its children's.
+
+        - count, sum, min, max compose directly
+        - mean = sum / count (sum taken from mean * count where a child
+          stored only the mean)
+        - std (population) via the pooled E[x^2] - mean^2
+
+        Children with no valid pixels (count 0) do not block sum/min/max/std.
+        A child's count falls back to its pixel_count when no 'count' stat
+        was stored.
+
+        Parameters:
+        ----------
+        children : List[Dict[str, Any]]
+            One dict per child with keys count, sum, mean, min, max, std,
+            pixel_count (None where the child has no such value)
+        stat_types : List[str]
+            Stat types stored at the child level; only these are returned
+
+        Returns:
+        -------
+        Dict[str, Optional[float]]
+            {stat_type: value} for every requested type all children can
+            supply (value None for mean/std/min/max of an all-empty parent)
+        """
+        import math
+
+        has = {'count': True, 'sum': True, 'min': True, 'max': True, 'std': True}
+        count = 0
+        total = 0.0
+        sumsq = 0.0
+        mins: List[float] = []
+        maxs: List[float] = []
+
+        for child in children:
+            cnt = child.get('count')
+            if cnt is None:
+                cnt = child.get('pixel_count')
+            v_sum, v_mean, v_std = child.get('sum'), child.get('mean'), child.get('std')
+            empty = cnt == 0
+
+            if cnt is None:
+                has['count'] = False
+            else:
+                count += cnt
+
+            if empty:
+                tot = 0.0
+            elif v_sum is not None:
+                tot = v_sum
+            elif v_mean is not None and cnt is not None:
+                tot = v_mean * cnt
+            else:
+                tot = None
+            if v_mean is not None:
+                mu = v_mean
+            elif v_sum is not None and cnt:
+                mu = v_sum / cnt
+            else:
+                mu = None
+
+            if tot is None:
+                has['sum'] = False
+            else:
+                total += tot
+
+            for key, values in (('min', mins), ('max', maxs)):
+                if child.get(key) is not None:
+                    values.append(child[key])
+                elif not empty:
+                    has[key] = False
+
+            if not empty:
+                if v_std is None or mu is None:
+                    has['std'] = False
+                elif cnt:
+                    sumsq += cnt * (v_std * v_std + mu * mu)
+
+        composed: Dict[str, Optional[float]] = {}
+        if has['count']:
+            composed['count'] = float(count)
+            if has['sum']:
+                mean = total / count if count else None
+                composed['sum'] = total
+                composed['mean'] = mean
+                if has['std']:
+                    composed['std'] = (
+                        math.sqrt(max(sumsq / count - mean * mean, 0.0)) if count else None
+                    )
+        if has['min']:
+            composed['min'] = min(mins) if mins else None
+        if has['max']:
+            composed['max'] = max(maxs) if maxs else None
+
+        return {k: v for k, v in composed.items() if k in stat_types}
+
+    def rollup_zonal_stats(
+        self,
+        dataset_id: str,
+        theme: str,
+        from_resolution: int,
+        to_resolution: int,
+        source_job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Derive coarser-resolution zonal stats by rolling up finer ones.
+
+        Walks h3.cells.parent_h3_index one level at a time, from
+        *from_resolution* (which must already hold raster-pass stats) down
+        to *to_resolution*, upserting each parent's stats into
+        h3.zonal_stats. One raster pass at the finest resolution plus these
+        rollups replaces a raster pass per resolution.
+
+        A parent's stats are those of the union of its children's pixels,
+        composed by compose_rollup_stats(). Child rows are streamed per
+        (parent, band) from a server-side cursor and the composed rows are
+        COPYed into a staging table and upserted once per level, all in one
+        transaction so each level reads the one below it.
+
+        Anything else present at the finer level (e.g. median) cannot be
+        composed and is reported in 'raster_pass_required'. A parent is
+        only written when every child in h3.cells has stats for the band,
+        so partially covered edge parents (scope-limited passes) are left
+        for a raster pass too and counted in 'incomplete_parents'.
+
+        H3 children only approximate their parent's hexagon, so rolled-up
+        values can differ slightly from a direct raster pass at the parent
+        geometry along its boundary.
+
+        Parameters:
+        ----------
+        dataset_id : str
+            Dataset whose stats are rolled up
+        theme : str
+            Partition key (must match the finer-level rows)
+        from_resolution : int
+            Finest resolution already computed
+        to_resolution : int
+            Coarsest resolution to derive (< from_resolution)
+        source_job_id : Optional[str]
+            Job ID recorded on the derived rows
+
+        Returns:
+        -------
+        Dict[str, Any]
+            {
+                "levels": [{"resolution", "parents_written", "incomplete_parents", "rows"}],
+                "rows_upserted": int,
+                "raster_pass_required": [stat_type, ...]
+            }
+
+        Example:
+        -------
+        >>> repo.insert_zonal_stats_batch(res8_stats, theme='terrain')
+        >>> repo.rollup_zonal_stats('copdem_glo30', 'terrain', from_resolution=8, to_resolution=4)
+        """
+        import time
+        import uuid
+        from itertools import groupby
+
+        if theme not in self.VALID_THEMES:
+            raise ValueError(f"Invalid theme '{theme}'. Must be one of: {self.VALID_THEMES}")
+        if not 0 <= to_resolution < from_resolution <= 15:
+            raise ValueError(
+                f"Need 0 <= to_resolution < from_resolution <= 15, "
+                f"got from={from_resolution}, to={to_resolution}"
+            )
+
+        # Stat types stored at the child level (incl. non-composable ones)
+        present_query = sql.SQL("""
+            SELECT DISTINCT z.stat_type
+            FROM {schema}.{stats} z
+            JOIN {schema}.{cells} c ON c.h3_index = z.h3_index
+            WHERE z.theme = %(theme)s
+              AND z.dataset_id = %(dataset_id)s
+              AND c.resolution = %(child_res)s
+              AND c.parent_h3_index IS NOT NULL
+        """).format(
+            schema=sql.Identifier('h3'),
+            stats=sql.Identifier('zonal_stats'),
+            cells=sql.Identifier('cells')
+        )
+
+        # One row per child and band, pivoted, ordered by parent so each
+        # parent's children arrive together. 'complete' is true when every
+        # child of the parent in h3.cells has stats for the band.
+        children_query = sql.SQL("""
+            WITH child AS (
+                SELECT c.parent_h3_index AS parent, z.h3_index, z.band,
+                       MAX(z.pixel_count) AS pixel_count,
+                       MAX(z.nodata_count) AS nodata_count,
+                       MAX(z.value) FILTER (WHERE z.stat_type = 'count') AS count,
+                       MAX(z.value) FILTER (WHERE z.stat_type = 'sum') AS sum,
+                       MAX(z.value) FILTER (WHERE z.stat_type = 'mean') AS mean,
+                       MAX(z.value) FILTER (WHERE z.stat_type = 'min') AS min,
+                       MAX(z.value) FILTER (WHERE z.stat_type = 'max') AS max,
+                       MAX(z.value) FILTER (WHERE z.stat_type = 'std') AS std
+                FROM {schema}.{stats} z
+                JOIN {schema}.{cells} c ON c.h3_index = z.h3_index
+                WHERE z.theme = %(theme)s
+                  AND z.dataset_id = %(dataset_id)s
+                  AND c.resolution = %(child_res)s
+                  AND c.parent_h3_index IS NOT NULL
+                GROUP BY c.parent_h3_index, z.h3_index, z.band
+            ),
+            coverage AS (
+                SELECT parent_h3_index AS parent, COUNT(*) AS n_children
+                FROM {schema}.{cells}
+                WHERE resolution = %(child_res)s
+                  AND parent_h3_index IN (SELECT parent FROM child)
+                GROUP BY parent_h3_index
+            )
+            SELECT child.*,
+                   COUNT(*) OVER (PARTITION BY child.parent, child.band) = coverage.n_children AS complete
+            FROM child
+            JOIN coverage USING (parent)
+            ORDER BY child.parent, child.band
+        """).format(
+            schema=sql.Identifier('h3'),
+            stats=sql.Identifier('zonal_stats'),
+            cells=sql.Identifier('cells')
+        )
+
+        upsert_query = sql.SQL("""
+            INSERT INTO {schema}.{stats}
+                (theme, h3_index, dataset_id, band, stat_type, value,
+                 pixel_count, nodata_count, source_job_id, computed_at)
+            SELECT %(theme)s, h3_index, %(dataset_id)s, band, stat_type, value,
+                   pixel_count, nodata_count, %(source_job_id)s, NOW()
+            FROM rollup_staging
+            ON CONFLICT (theme, h3_index, dataset_id, band, stat_type) DO UPDATE SET
+                value = EXCLUDED.value,
+                pixel_count = EXCLUDED.pixel_count,
+                nodata_count = EXCLUDED.nodata_count,
+                source_job_id = EXCLUDED.source_job_id,
+                computed_at = NOW()
+        """).format(
+            schema=sql.Identifier('h3'),
+            stats=sql.Identifier('zonal_stats')
+        )
+
+        def total(rows, key):
+            values = [r[key] for r in rows if r[key] is not None]
+            return sum(values) if values else None
+
+        def stage(write_cur, derived):
+            if not derived:
+                return
+            with write_cur.copy(
+                "COPY rollup_staging (h3_index, band, stat_type, value, pixel_count, nodata_count) FROM STDIN"
+            ) as copy:
+                for row in derived:
+                    copy.write_row(row)
+            derived.clear()
+
+        start_time = time.time()
+        levels = []
+        non_decomposable = set()
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    CREATE TEMP TABLE rollup_staging (
+                        h3_index BIGINT,
+                        band VARCHAR(50),
+                        stat_type VARCHAR(20),
+                        value DOUBLE PRECISION,
+                        pixel_count INTEGER,
+                        nodata_count INTEGER
+                    ) ON COMMIT DROP
+                """)
+
+            for child_res in range(from_resolution, to_resolution, -1):
+                params = {
+                    'theme': theme,
+                    'dataset_id': dataset_id,
+                    'child_res': child_res,
+                    'source_job_id': source_job_id,
+                }
+                with conn.cursor() as cur:
+                    cur.execute("TRUNCATE rollup_staging")
+                    cur.execute(present_query, params)
+                    stat_types = [r['stat_type'] for r in cur.fetchall()]
+                non_decomposable.update(t for t in stat_types if t not in self.ROLLUP_STAT_TYPES)
+
+                parents_written = incomplete_parents = 0
+                derived: List[Tuple[Any, ...]] = []
+
+                with conn.cursor(name=f"rollup_{uuid.uuid4().hex[:12]}") as read_cur, \
+                        conn.cursor() as write_cur:
+                    read_cur.itersize = self.ROLLUP_FETCH_SIZE
+                    read_cur.execute(children_query, params)
+                    for parent, parent_rows in groupby(read_cur, key=lambda r: r['parent']):
+                        parent_written = False
+                        for band, band_rows in groupby(parent_rows, key=lambda r: r['band']):
+                            children = list(band_rows)
+                            if not children[0]['complete']:
+                                continue
+                            parent_written = True
+                            pixel_count = total(children, 'pixel_count')
+                            nodata_count = total(children, 'nodata_count')
+                            for stat_type, value in self.compose_rollup_stats(children, stat_types).items():
+                                derived.append((parent, band, stat_type, value, pixel_count, nodata_count))
+                        if parent_written:
+                            parents_written += 1
+                        else:
+                            incomplete_parents += 1
+                        # COPY between cursor pages; the connection is idle then
+                        if len(derived) >= self.ROLLUP_FETCH_SIZE:
+                            stage(write_cur, derived)
+                    stage(write_cur, derived)
+
+                with conn.cursor() as cur:
+                    cur.execute(upsert_query, params)
+                    rows = cur.rowcount
+
+                level = {
+                    'resolution': child_res - 1,
+                    'parents_written': parents_written,
+                    'incomplete_parents': incomplete_parents,
+                    'rows': rows,
+                }
+                levels.append(level)
+                logger.info(
+                    f"🔺 Rolled up {dataset_id} res {child_res} → {child_res - 1}: "
+                    f"{level['parents_written']:,} parents, {rows:,} rows "
+                    f"({level['incomplete_parents']:,} incomplete)"
+                )
+            conn.commit()
+
+        rows_upserted = sum(level['rows'] for level in levels)
+        total_time = time.time() - start_time
+        logger.info(
+            f"✅ Rolled up {dataset_id} res {from_resolution} → {to_resolution}: "
+            f"{rows_upserted:,} rows in {total_time:.2f}s"
+            + (f" (raster pass still required for: {sorted(non_decomposable)})" if non_decomposable else "")
+        )
+
+        return {
+            'levels': levels,
+            'rows_upserted': rows_upserted,
+            'raster_pass_required': sorted(non_decomposable),
+        }
+
     def insert_point_stats_batch(
         self,
         stats: List[Dict[str, Any]],
@@ -19,7 +19,8 @@ Features:
 - Rate calculation (tasks/minute rolling average)
 - ETA estimation based on current rate
 - Debug mode logging (chattery stdout when enabled)
-- Periodic snapshots to PostgreSQL
+- Periodic snapshots to PostgreSQL, batched through the progress write
+  buffer (infrastructure.progress_buffer) and flushed on failure/completion
 
 Architecture:
 -------------
@@ -229,18 +230,14 @@ class JobProgressTracker:
         # Context (set by subclasses)
         self._context: Dict[str, Any] = {}
 
-        # Repository (lazy loaded)
-        self._repo = None
-
         # Emit start event
         self.emit_debug(f"Job {job_id[:8]}... started: {job_type}")
 
-    def _get_repo(self):
-        """Lazy load metrics repository."""
-        if self._repo is None:
-            from infrastructure.metrics_repository import MetricsRepository
-            self._repo = MetricsRepository()
-        return self._repo
+    @staticmethod
+    def _get_buffer():
+        """Process-wide progress write buffer (batches writes to job_metrics)."""
+        from infrastructure.progress_buffer import get_progress_buffer
+        return get_progress_buffer()
 
     # =========================================================================
     # STAGE MANAGEMENT
@@ -387,7 +384,7 @@ class JobProgressTracker:
         self.emit_debug(f"  Task {task_id} FAILED: {error[:100]}", indent=2)
 
         # Always persist on failure
-        self._persist_snapshot()
+        self._persist_snapshot(flush=True)
 
     # =========================================================================
     # RATE CALCULATION
@@ -525,25 +522,28 @@ class JobProgressTracker:
             self._persist_snapshot()
             self._last_snapshot_time = now
 
-    def _persist_snapshot(self):
-        """Write current snapshot to database."""
+    def _persist_snapshot(self, flush: bool = False):
+        """
+        Queue current snapshot in the progress write buffer.
+
+        Snapshots are coalesced per job and written in batches by the
+        buffer's flush thread; flush=True writes this job's pending
+        snapshot and events now.
+        """
         if not self.auto_persist:
             return
 
         try:
-            snapshot = self.get_snapshot()
-            repo = self._get_repo()
-            repo.write_snapshot(
-                job_id=self.job_id,
-                metric_type="snapshot",
-                payload=snapshot.to_dict()
-            )
+            buffer = self._get_buffer()
+            buffer.record_snapshot(self.job_id, self.get_snapshot().to_dict())
+            if flush:
+                buffer.flush(job_id=self.job_id)
         except Exception as e:
             logger.warning(f"Failed to persist metrics snapshot: {e}")
 
     def persist_event(self, event_type: str, payload: Dict[str, Any]):
         """
-        Persist a specific event to database.
+        Persist a specific event to database (buffered, see _persist_snapshot).
 
         Args:
             event_type: Type of event
@@ -553,19 +553,24 @@ class JobProgressTracker:
             return
 
         try:
-            repo = self._get_repo()
-            repo.write_snapshot(
-                job_id=self.job_id,
-                metric_type="event",
-                payload={
-                    "event_type": event_type,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    **payload
-                }
-            )
+            self._get_buffer().record_event(self.job_id, {
+                "event_type": event_type,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                **payload
+            })
         except Exception as e:
             logger.warning(f"Failed to persist event: {e}")
 
+    def flush(self):
+        """Write this job's buffered snapshot and events now."""
+        if not self.auto_persist:
+            return
+
+        try:
+            self._get_buffer().flush(job_id=self.job_id)
+        except Exception as e:
+            logger.warning(f"Failed to flush metrics: {e}")
+
     # =========================================================================
     # DEBUG LOGGING
     # =========================================================================
@@ -645,8 +650,8 @@ class JobProgressTracker:
             f"({self._tasks_failed} failed)"
         )
 
-        # Final snapshot
-        self._persist_snapshot()
+        # Final snapshot, written with any buffered events for this job
+        self._persist_snapshot(flush=True)
 
 
 # Export
@@ -27,15 +27,17 @@ Exports:
 """
 
 # Imports at top for fast failure
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime, timezone
 import logging
+import uuid
 
-from util_logger import LoggerFactory, ComponentType, LogLevel, LogContext
+from util_logger import LoggerFactory, ComponentType, LogLevel, LogContext, enable_log_sampling
 from core.models import (
     JobRecord, TaskRecord, JobStatus, TaskStatus,
     TaskResult, TaskDefinition  # Added for contract enforcement
 )
+from core.models.job_event import JobEvent
 from core.utils import generate_job_id  # ID generation utility
 from core.schema.updates import TaskUpdateModel, JobUpdateModel
 # Task ID generation moved to Controller layer (hierarchically correct)
@@ -50,7 +52,10 @@ from .postgresql import (
 )
 from utils import enforce_contract
 
-logger = LoggerFactory.create_logger(ComponentType.REPOSITORY, "JobsTasksRepository")
+# claim_ready_task and per-task status updates log on every worker poll
+logger = enable_log_sampling(
+    LoggerFactory.create_logger(ComponentType.REPOSITORY, "JobsTasksRepository")
+)
 
 
 # ============================================================================
@@ -954,7 +959,78 @@ class TaskRepository(PostgreSQLTaskRepository):
                 conn.commit()
 
                 return [row['task_id'] for row in failed_tasks]
-    
+
+    def recover_stale_tasks(
+        self,
+        task_ids: List[str],
+        max_retries: int,
+        retry_error_details: str,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Set-based janitor recovery for stale PROCESSING tasks.
+
+        One transaction, two statements instead of a call per task. Tasks
+        under *max_retries* go to PENDING_RETRY with the same backoff as
+        increment_task_retry_count: LEAST(30 * 2^n, 600)s. The rest are
+        marked FAILED with their retry count in error_details. Both
+        statements only touch rows still in 'processing', so a task that
+        finished since it was found stale is left alone.
+
+        Args:
+            task_ids: Stale task IDs found by the janitor
+            max_retries: Retry budget (JanitorConfig.max_retries)
+            retry_error_details: error_details stored on retried tasks
+
+        Returns:
+            {"retried": [{task_id, parent_job_id, new_retry_count, new_execute_after}],
+             "failed":  [{task_id, parent_job_id, retry_count}]}
+        """
+        from psycopg import sql
+
+        if not task_ids:
+            return {"retried": [], "failed": []}
+
+        retry_query = sql.SQL("""
+            UPDATE {schema}.tasks
+            SET retry_count = retry_count + 1,
+                status = 'pending_retry'::{schema}.task_status,
+                execute_after = NOW() + LEAST(30 * POWER(2, retry_count), 600) * INTERVAL '1 second',
+                claimed_by = NULL,
+                error_details = %s,
+                updated_at = NOW()
+            WHERE task_id = ANY(%s)
+              AND status = 'processing'
+              AND retry_count < %s
+            RETURNING task_id, parent_job_id,
+                      retry_count AS new_retry_count, execute_after AS new_execute_after
+        """).format(schema=sql.Identifier(self.schema_name))
+
+        fail_query = sql.SQL("""
+            UPDATE {schema}.tasks
+            SET status = 'failed'::{schema}.task_status,
+                error_details = 'Janitor: max retries exhausted (' || retry_count || '/' || %s || ')',
+                updated_at = NOW()
+            WHERE task_id = ANY(%s)
+              AND status = 'processing'
+              AND retry_count >= %s
+            RETURNING task_id, parent_job_id, retry_count
+        """).format(schema=sql.Identifier(self.schema_name))
+
+        with self._error_context("recover stale tasks"):
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(retry_query, (retry_error_details, task_ids, max_retries))
+                    retried = cur.fetchall()
+                    cur.execute(fail_query, (max_retries, task_ids, max_retries))
+                    failed = cur.fetchall()
+                conn.commit()
+
+        logger.info(
+            f"🔄 Stale task recovery: {len(retried)} retried, {len(failed)} failed "
+            f"(of {len(task_ids)} candidates)"
+        )
+        return {"retried": retried, "failed": failed}
+
     def update_task_with_model(self, task_id: str, update_model: TaskUpdateModel) -> bool:
         """
         Update task using Pydantic model.
@@ -983,7 +1059,44 @@ class TaskRepository(PostgreSQLTaskRepository):
         """
         update = TaskUpdateModel(last_pulse=datetime.now(timezone.utc))
         return self.update_task(task_id, update)
-    
+
+    def save_checkpoints(self, checkpoints: List[Dict[str, Any]]) -> int:
+        """
+        Write several tasks' checkpoints in one transaction.
+
+        Flush target of the progress write buffer, which coalesces
+        CheckpointManager.save() calls to the latest phase per task. Unlike
+        update_task there is no pre-read of each row.
+
+        Args:
+            checkpoints: Dicts with task_id, checkpoint_phase,
+                         checkpoint_data, checkpoint_updated_at
+
+        Returns:
+            Number of task rows updated
+        """
+        if not checkpoints:
+            return 0
+
+        query = sql.SQL("""
+            UPDATE {schema}.tasks
+            SET checkpoint_phase = %(checkpoint_phase)s,
+                checkpoint_data = %(checkpoint_data)s,
+                checkpoint_updated_at = %(checkpoint_updated_at)s,
+                updated_at = NOW()
+            WHERE task_id = %(task_id)s
+        """).format(schema=sql.Identifier(self.schema_name))
+
+        with self._error_context("save checkpoints"):
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.executemany(query, checkpoints)
+                    updated = cur.rowcount
+                conn.commit()
+
+        logger.debug(f"💾 Saved {updated} checkpoints (of {len(checkpoints)} pending)")
+        return updated
+
     def increment_retry_count(self, task_id: str) -> bool:
         """
         Increment task retry count.
@@ -1248,6 +1361,175 @@ class TaskRepository(PostgreSQLTaskRepository):
             logger.error(f"❌ Batch task creation failed: {e}")
             raise RuntimeError(f"Failed to batch create tasks: {e}")
 
+    # Rows per multi-row INSERT in create_tasks_with_events. 18 task columns
+    # x 1000 rows stays well under PostgreSQL's 65535 bind-parameter limit.
+    BULK_CREATE_CHUNK_SIZE = 1000
+
+    _TASK_INSERT_COLUMNS = (
+        'task_id', 'parent_job_id', 'job_type', 'task_type', 'status', 'stage', 'task_index',
+        'parameters', 'result_data', 'metadata', 'error_details', 'retry_count',
+        'last_pulse', 'checkpoint_phase', 'checkpoint_data', 'checkpoint_updated_at',
+        'created_at', 'updated_at',
+    )
+    _EVENT_INSERT_COLUMNS = (
+        'job_id', 'task_id', 'stage', 'event_type', 'event_status',
+        'checkpoint_name', 'event_data', 'error_message', 'duration_ms', 'created_at',
+    )
+
+    def create_tasks_with_events(
+        self,
+        tasks: List[TaskRecord],
+        events: Optional[List[JobEvent]] = None
+    ) -> Dict[str, Any]:
+        """
+        Insert a stage's task rows and their events in one transaction.
+
+        Replaces one create_task + one record_task_event round trip per task
+        with one multi-row INSERT per BULK_CREATE_CHUNK_SIZE tasks (ON CONFLICT
+        DO NOTHING RETURNING task_id) followed by one multi-row INSERT into
+        job_events for the tasks that were actually created. Events are
+        matched to tasks by task_id; tasks that already existed get no event.
+
+        Each chunk runs under a savepoint. If a chunk fails, it is rolled back
+        and retried row by row (each under its own savepoint) so one bad row
+        only fails itself. Everything commits together at the end.
+
+        Args:
+            tasks: TaskRecords to insert
+            events: Optional JobEvents to record for newly created tasks
+
+        Returns:
+            {'created': [task_id], 'existing': [task_id], 'failed': {task_id: error}}
+
+        Raises:
+            RuntimeError: If the transaction itself cannot be opened or committed
+                (nothing was written).
+        """
+        created: List[str] = []
+        existing: List[str] = []
+        failed: Dict[str, str] = {}
+        if not tasks:
+            return {'created': created, 'existing': existing, 'failed': failed}
+
+        events_by_task = {e.task_id: e for e in (events or []) if e.task_id}
+        now = datetime.now(timezone.utc)
+
+        try:
+            with self._get_connection() as conn:
+                with conn.transaction():
+                    for start in range(0, len(tasks), self.BULK_CREATE_CHUNK_SIZE):
+                        chunk = tasks[start:start + self.BULK_CREATE_CHUNK_SIZE]
+                        try:
+                            with conn.transaction():
+                                inserted = self._insert_task_rows(conn, chunk, now)
+                                self._insert_event_rows(
+                                    conn,
+                                    [events_by_task[t] for t in inserted if t in events_by_task],
+                                    now
+                                )
+                        except Exception as chunk_err:
+                            logger.warning(
+                                f"⚠️ Bulk task insert failed for {len(chunk)} rows, "
+                                f"retrying row by row: {chunk_err}"
+                            )
+                            inserted = set()
+                            for task in chunk:
+                                try:
+                                    with conn.transaction():
+                                        if self._insert_task_rows(conn, [task], now):
+                                            inserted.add(task.task_id)
+                                            event = events_by_task.get(task.task_id)
+                                            if event is not None:
+                                                self._insert_event_rows(conn, [event], now)
+                                except Exception as row_err:
+                                    failed[task.task_id] = str(row_err)
+
+                        for task in chunk:
+                            if task.task_id in inserted:
+                                created.append(task.task_id)
+                            elif task.task_id not in failed:
+                                existing.append(task.task_id)
+        except Exception as e:
+            logger.error(f"❌ Bulk task creation transaction failed: {e}")
+            raise RuntimeError(f"Failed to bulk create tasks: {e}")
+
+        logger.info(
+            f"✅ Bulk task creation: {len(created)} created, {len(existing)} existing, "
+            f"{len(failed)} failed"
+        )
+        return {'created': created, 'existing': existing, 'failed': failed}
+
+    def _insert_task_rows(self, conn, tasks: List[TaskRecord], now: datetime) -> set:
+        """Multi-row INSERT into tasks; returns the task_ids actually inserted."""
+        row = sql.SQL('({})').format(
+            sql.SQL(', ').join(sql.Placeholder() * len(self._TASK_INSERT_COLUMNS))
+        )
+        query = sql.SQL("""
+            INSERT INTO {}.{} ({}) VALUES {}
+            ON CONFLICT (task_id) DO NOTHING
+            RETURNING task_id
+        """).format(
+            sql.Identifier(self.schema_name),
+            sql.Identifier('tasks'),
+            sql.SQL(', ').join(map(sql.Identifier, self._TASK_INSERT_COLUMNS)),
+            sql.SQL(', ').join([row] * len(tasks))
+        )
+        params = []
+        for task in tasks:
+            params.extend((
+                task.task_id,
+                task.parent_job_id,
+                task.job_type,
+                task.task_type,
+                task.status.value,
+                task.stage,
+                task.task_index,
+                task.parameters,
+                task.result_data if task.result_data else None,
+                task.metadata if task.metadata else {},
+                task.error_details,
+                task.retry_count,
+                task.last_pulse,
+                task.checkpoint_phase,
+                task.checkpoint_data if task.checkpoint_data else None,
+                task.checkpoint_updated_at,
+                task.created_at or now,
+                task.updated_at or now,
+            ))
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            return {r['task_id'] for r in cur.fetchall()}
+
+    def _insert_event_rows(self, conn, events: List[JobEvent], now: datetime) -> None:
+        """Multi-row INSERT into job_events (same column mapping as record_event)."""
+        if not events:
+            return
+        row = sql.SQL('({})').format(
+            sql.SQL(', ').join(sql.Placeholder() * len(self._EVENT_INSERT_COLUMNS))
+        )
+        query = sql.SQL("INSERT INTO {}.{} ({}) VALUES {}").format(
+            sql.Identifier(self.schema_name),
+            sql.Identifier('job_events'),
+            sql.SQL(', ').join(map(sql.Identifier, self._EVENT_INSERT_COLUMNS)),
+            sql.SQL(', ').join([row] * len(events))
+        )
+        params = []
+        for event in events:
+            params.extend((
+                event.job_id,
+                event.task_id,
+                event.stage,
+                getattr(event.event_type, 'value', event.event_type),
+                getattr(event.event_status, 'value', event.event_status),
+                event.checkpoint_name,
+                event.event_data or {},
+                event.error_message,
+                event.duration_ms,
+                event.created_at or now,
+            ))
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+
     def batch_update_status(
         self,
         task_ids: List[str],
@@ -1370,6 +1652,63 @@ class TaskRepository(PostgreSQLTaskRepository):
 
         return task_records
 
+    # Rows fetched per round trip by iter_stage_results' server-side cursor
+    STAGE_RESULTS_FETCH_SIZE = 500
+
+    def iter_stage_results(
+        self,
+        job_id: str,
+        stage: int,
+        unwrap_envelope: bool = False
+    ) -> Iterator[Any]:
+        """
+        Stream result_data of one stage's COMPLETED tasks (18 OCT 2026).
+
+        Unlike get_tasks_for_job, the stage/status filter runs in SQL (on
+        idx_tasks_job_stage_status) and rows come through a server-side
+        cursor in STAGE_RESULTS_FETCH_SIZE batches, so memory and transfer
+        scale with the target stage only. Tasks with NULL/empty result_data
+        are skipped. Order matches get_tasks_for_job (task_index).
+
+        The connection is held until the generator is exhausted or closed.
+
+        Args:
+            job_id: Parent job ID
+            stage: Stage whose results to read
+            unwrap_envelope: Yield result_data['result'] when result_data is
+                a handler envelope ({"success": ..., "result": {...}}), else
+                the full result_data
+
+        Yields:
+            One result per completed task
+        """
+        payload = (
+            sql.SQL("""CASE
+                    WHEN jsonb_typeof(result_data) = 'object' AND result_data ? 'result'
+                    THEN result_data -> 'result'
+                    ELSE result_data
+                END""")
+            if unwrap_envelope else sql.SQL("result_data")
+        )
+        query = sql.SQL("""
+            SELECT {payload} AS result
+            FROM {schema}.tasks
+            WHERE parent_job_id = %s
+              AND stage = %s
+              AND status = 'completed'
+              AND result_data IS NOT NULL
+              AND result_data NOT IN ('{{}}'::jsonb, 'null'::jsonb)
+            ORDER BY task_index
+        """).format(payload=payload, schema=sql.Identifier(self.schema_name))
+
+        with self._get_connection() as conn:
+            with conn.cursor(name=f"stage_results_{uuid.uuid4().hex[:12]}") as cur:
+                cur.itersize = self.STAGE_RESULTS_FETCH_SIZE
+                cur.execute(query, (job_id, stage))
+                for row in cur:
+                    yield row['result']
+            conn.commit()
+
     def delete_tasks_for_job(self, job_id: str) -> int:
         """
         Delete all tasks for a job (09 DEC 2025).
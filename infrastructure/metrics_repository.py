@@ -165,8 +165,13 @@ class MetricsRepository(PostgreSQLRepository):
         """
         Write multiple snapshots in a single transaction.
 
+        Used by the progress write buffer (infrastructure.progress_buffer),
+        which records when each snapshot was taken: an optional 'timestamp'
+        is stored as-is, otherwise the row gets NOW().
+
         Args:
             snapshots: List of dicts with job_id, metric_type, payload
+                       and optional timestamp
 
         Returns:
             int: Number of rows inserted
@@ -177,19 +182,22 @@ class MetricsRepository(PostgreSQLRepository):
         self._ensure_table()
 
         insert_sql = sql.SQL("""
-            INSERT INTO {schema}.job_metrics (job_id, metric_type, payload)
-            VALUES (%s, %s, %s)
+            INSERT INTO {schema}.job_metrics (job_id, metric_type, payload, timestamp)
+            VALUES (%s, %s, %s, COALESCE(%s::timestamptz, NOW()))
         """).format(schema=sql.Identifier(self.schema_name))
 
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
-                    for snapshot in snapshots:
-                        cur.execute(insert_sql, (
+                    cur.executemany(insert_sql, [
+                        (
                             snapshot['job_id'],
                             snapshot.get('metric_type', 'snapshot'),
-                            snapshot.get('payload', {})
-                        ))
+                            snapshot.get('payload', {}),
+                            snapshot.get('timestamp'),
+                        )
+                        for snapshot in snapshots
+                    ])
                 conn.commit()
             return len(snapshots)
         except Exception as e:
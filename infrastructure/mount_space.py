@@ -0,0 +1,546 @@
+# ============================================================================
+# CLAUDE CONTEXT - ETL MOUNT SPACE MANAGER
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Infrastructure - Capacity-aware ETL mount usage and admission control
+# PURPOSE: Let handlers reserve mount bytes before large downloads/conversions,
+#          let workers defer claims while the mount is short, and evict finished
+#          runs' directories least-recently-used first under pressure.
+# CREATED: 18 OCT 2026
+# EXPORTS: MountSpaceManager, MountReservation, get_mount_space_manager,
+#          reserve_mount_space
+# DEPENDENCIES: config, exceptions, infrastructure.workflow_run_repository (lazy)
+# ============================================================================
+"""
+ETL Mount Space Manager.
+
+The ETL mount is an Azure Files share used by every Docker worker for raster
+downloads, vector GeoParquet intermediates and Zarr staging. Without
+coordination, concurrent large jobs fill the share, and the resulting
+failures turn into retries that write the same bytes again. This module adds
+three things on top of the age-based janitor sweep:
+
+Reservations::
+
+    from infrastructure.mount_space import reserve_mount_space
+
+    with reserve_mount_space(run_id, estimated_bytes, "raster_download"):
+        blob_repo.stream_blob_to_mount(...)
+
+    A reservation is admitted only if free space minus outstanding
+    reservations minus MOUNT_MIN_FREE_GB covers it, after evicting finished
+    runs if needed. Bytes the holder has already written under its run dir
+    are taken off its reservation (free space already reflects them).
+    Otherwise InsufficientMountSpaceError is raised before any
+    byte is written. Reservations are marker files under
+    {mount}/.mount-reservations/ so workers sharing the mount see each
+    other's; markers older than the reservation TTL (crashed workers) are
+    ignored and removed. Check-then-write is not atomic across workers, so
+    admission is best-effort; MOUNT_MIN_FREE_GB absorbs the overlap.
+
+Claim admission::
+
+    BackgroundQueueWorker calls admit_claim() before claiming. Below
+    MOUNT_CLAIM_MIN_FREE_GB (after eviction) the worker waits instead of
+    claiming work it would likely fail.
+
+LRU eviction::
+
+    Top-level mount dirs are named by run_id (DAG) or job_id (legacy).
+    process_raster_complete names its dirs job_id[:8] or
+    {job_id[:8]}_{instance_prefix}, and the raster collection handler
+    collection_{job_id[:8]}; those resolve to the jobs whose id
+    starts with the prefix, and an active job among them keeps the dir.
+    Candidates, in eviction order:
+        1. completed runs/jobs, least recently used first
+        2. failed runs/jobs, then dirs with no known owner idle longer than
+           MOUNT_ORPHAN_GRACE_HOURS, least recently used first
+    Dirs of running/pending/awaiting-approval runs, dirs with a live
+    reservation, dot-dirs and PROTECTED_DIRS are never evicted. "Last used"
+    is the newer of the dir mtime and its .last-used marker, which
+    reserve() touches.
+
+Usage accounting walks the directory trees, so it is only done when
+evicting or when usage_by_run() is called explicitly (status endpoints).
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+from exceptions import InsufficientMountSpaceError
+
+logger = logging.getLogger(__name__)
+
+_GB = 1024 ** 3
+
+RESERVATIONS_DIR = ".mount-reservations"
+LAST_USED_MARKER = ".last-used"
+
+# Shared, non-run directories on the mount (see services/discovery/sidecar_prefetch.py)
+PROTECTED_DIRS = frozenset({"discovery_cache"})
+
+_COMPLETED_STATUSES = frozenset({"completed", "completed_with_errors"})
+_FAILED_STATUSES = frozenset({"failed"})
+
+# admit_claim() evicts at most this often; the tree walk is not free
+_EVICTION_COOLDOWN_SECONDS = 60
+
+# Job-named mount dirs: process_raster_complete uses job_id[:8], optionally
+# _{instance_prefix}; process_raster_collection uses collection_{job_id[:8]}
+_LEGACY_JOB_DIR = re.compile(r"^(?:collection_)?([0-9a-f]{8})(?:_[0-9a-f]{12})?$")
+
+
+@dataclass
+class MountReservation:
+    """An admitted reservation; released when the reserve() block exits."""
+    reservation_id: str
+    run_id: str
+    nbytes: int
+    purpose: str
+    baseline_bytes: int = 0  # Run dir size when reserved; growth counts against nbytes
+    created_at: float = field(default_factory=time.time)
+    marker_path: Optional[str] = None
+
+
+class MountSpaceManager:
+    """
+    Reservation, admission and eviction for one ETL mount root.
+
+    Thread-safe within a process (one lock around admit/evict); cross-worker
+    coordination goes through reservation marker files on the mount itself.
+    """
+
+    def __init__(
+        self,
+        mount_root: str,
+        min_free_bytes: int,
+        claim_min_free_bytes: int,
+        reservation_ttl_seconds: int,
+        orphan_grace_seconds: float,
+        owner_status_fn: Optional[Callable[[List[str]], Dict[str, str]]] = None,
+        job_prefix_status_fn: Optional[Callable[[List[str]], Dict[str, str]]] = None,
+    ) -> None:
+        self.mount_root = os.path.realpath(mount_root)
+        self.min_free_bytes = min_free_bytes
+        self.claim_min_free_bytes = claim_min_free_bytes
+        self.reservation_ttl_seconds = reservation_ttl_seconds
+        self.orphan_grace_seconds = orphan_grace_seconds
+        self._owner_status_fn = owner_status_fn or _default_owner_statuses
+        self._job_prefix_status_fn = job_prefix_status_fn or _default_job_prefix_statuses
+        self._reservations_dir = os.path.join(self.mount_root, RESERVATIONS_DIR)
+        self._lock = threading.Lock()
+        self._last_eviction_at: Optional[float] = None
+        self._stats = {
+            "reservations_admitted": 0,
+            "reservations_rejected": 0,
+            "claims_deferred": 0,
+            "dirs_evicted": 0,
+            "bytes_evicted": 0,
+        }
+
+    # =========================================================================
+    # SPACE ACCOUNTING
+    # =========================================================================
+
+    def free_bytes(self) -> int:
+        """Free bytes on the mount filesystem (statvfs)."""
+        return shutil.disk_usage(self.mount_root).free
+
+    def _live_reservations(self) -> List[dict]:
+        """Unexpired reservation markers from all workers; expired ones are removed."""
+        if not os.path.isdir(self._reservations_dir):
+            return []
+        cutoff = time.time() - self.reservation_ttl_seconds
+        live = []
+        for entry in os.scandir(self._reservations_dir):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    logger.warning("MountSpace: dropped expired reservation marker %s", entry.name)
+                    continue
+                with open(entry.path, "r", encoding="utf-8") as fh:
+                    live.append(json.load(fh))
+            except (OSError, ValueError):
+                continue  # Removed concurrently or half-written — skip
+        return live
+
+    def _run_dir_bytes(self, run_id: str) -> int:
+        return self._dir_bytes(os.path.join(self.mount_root, os.path.basename(run_id)))
+
+    def reserved_bytes(self) -> int:
+        """
+        Bytes still promised to live reservations across all workers.
+
+        What a holder has already written under its run dir is counted by
+        free_bytes(), so each run's reservations count only the part not yet
+        written: max(0, reserved - growth of the run dir since reserving).
+        """
+        by_run: Dict[str, List[dict]] = {}
+        for r in self._live_reservations():
+            by_run.setdefault(r.get("run_id") or "", []).append(r)
+
+        outstanding = 0
+        for run_id, reservations in by_run.items():
+            nbytes = sum(int(r.get("nbytes", 0)) for r in reservations)
+            if not run_id or not nbytes:
+                outstanding += nbytes
+                continue
+            baseline = min(int(r.get("baseline_bytes", 0)) for r in reservations)
+            written = max(0, self._run_dir_bytes(run_id) - baseline)
+            outstanding += max(0, nbytes - written)
+        return outstanding
+
+    def available_bytes(self) -> int:
+        """Free bytes not promised to a reservation and not part of the headroom."""
+        return self.free_bytes() - self.reserved_bytes() - self.min_free_bytes
+
+    # =========================================================================
+    # RESERVATIONS
+    # =========================================================================
+
+    @contextmanager
+    def reserve(self, run_id: str, nbytes: int, purpose: str) -> Iterator[MountReservation]:
+        """
+        Hold *nbytes* of mount space for *run_id* for the duration of the block.
+
+        Evicts finished runs first if the reservation does not fit.
+
+        Raises:
+            InsufficientMountSpaceError: still does not fit after eviction.
+        """
+        nbytes = max(0, int(nbytes))
+        reservation = MountReservation(
+            reservation_id=uuid.uuid4().hex, run_id=run_id, nbytes=nbytes, purpose=purpose,
+            baseline_bytes=self._run_dir_bytes(run_id),
+        )
+
+        with self._lock:
+            available = self.available_bytes()
+            if available < nbytes:
+                self._evict(nbytes - available, exclude={run_id})
+                available = self.available_bytes()
+            if available < nbytes:
+                self._stats["reservations_rejected"] += 1
+                raise InsufficientMountSpaceError(
+                    f"ETL mount cannot fit {nbytes / _GB:.2f} GB for {purpose} "
+                    f"(run {run_id[:16]}): {max(available, 0) / _GB:.2f} GB available "
+                    f"after eviction",
+                    requested_bytes=nbytes,
+                    available_bytes=available,
+                )
+            reservation.marker_path = self._write_marker(reservation)
+            self._stats["reservations_admitted"] += 1
+
+        self.touch_run(run_id)
+        logger.info(
+            "MountSpace: reserved %.2f GB for %s (run %s)", nbytes / _GB, purpose, run_id[:16],
+        )
+        try:
+            yield reservation
+        finally:
+            self._remove_marker(reservation)
+            self.touch_run(run_id)
+
+    def _write_marker(self, reservation: MountReservation) -> str:
+        os.makedirs(self._reservations_dir, exist_ok=True)
+        path = os.path.join(self._reservations_dir, f"{reservation.reservation_id}.json")
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({
+                "run_id": reservation.run_id,
+                "nbytes": reservation.nbytes,
+                "purpose": reservation.purpose,
+                "baseline_bytes": reservation.baseline_bytes,
+                "pid": os.getpid(),
+                "created_at": reservation.created_at,
+            }, fh)
+        os.replace(tmp, path)
+        return path
+
+    @staticmethod
+    def _remove_marker(reservation: MountReservation) -> None:
+        if reservation.marker_path:
+            try:
+                os.remove(reservation.marker_path)
+            except OSError:
+                pass
+
+    def touch_run(self, run_id: str) -> None:
+        """Record use of a run dir for LRU ordering (no-op if the dir does not exist)."""
+        run_dir = os.path.join(self.mount_root, os.path.basename(run_id))
+        if not os.path.isdir(run_dir):
+            return
+        try:
+            with open(os.path.join(run_dir, LAST_USED_MARKER), "a", encoding="utf-8"):
+                pass
+            os.utime(os.path.join(run_dir, LAST_USED_MARKER))
+        except OSError:
+            pass
+
+    # =========================================================================
+    # CLAIM ADMISSION
+    # =========================================================================
+
+    def admit_claim(self) -> bool:
+        """
+        True if there is enough unreserved space to start another task.
+
+        Below claim_min_free_bytes, evicts (at most once per cooldown) and
+        re-checks. Callers should wait and poll again when this returns False.
+        """
+        available = self.available_bytes()
+        if available >= self.claim_min_free_bytes:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            if (self._last_eviction_at is None
+                    or now - self._last_eviction_at >= _EVICTION_COOLDOWN_SECONDS):
+                self._evict(self.claim_min_free_bytes - available)
+                available = self.available_bytes()
+
+        if available >= self.claim_min_free_bytes:
+            return True
+        self._stats["claims_deferred"] += 1
+        logger.warning(
+            "MountSpace: deferring claims — %.2f GB available, %.2f GB required",
+            max(available, 0) / _GB, self.claim_min_free_bytes / _GB,
+        )
+        return False
+
+    # =========================================================================
+    # EVICTION
+    # =========================================================================
+
+    def evict_to_watermark(self) -> dict:
+        """Evict until available space reaches claim_min_free_bytes (janitor entry point)."""
+        with self._lock:
+            shortfall = self.claim_min_free_bytes - self.available_bytes()
+            if shortfall <= 0:
+                return {"dirs_removed": 0, "bytes_freed": 0, "removed": []}
+            return self._evict(shortfall)
+
+    def _run_dirs(self) -> List[os.DirEntry]:
+        if not os.path.isdir(self.mount_root):
+            return []
+        return [
+            entry for entry in os.scandir(self.mount_root)
+            if entry.is_dir(follow_symlinks=False)
+            and not entry.name.startswith(".")
+            and entry.name not in PROTECTED_DIRS
+        ]
+
+    @staticmethod
+    def _last_used(path: str) -> float:
+        times = []
+        for candidate in (path, os.path.join(path, LAST_USED_MARKER)):
+            try:
+                times.append(os.stat(candidate, follow_symlinks=False).st_mtime)
+            except OSError:
+                pass
+        return max(times) if times else 0.0
+
+    @staticmethod
+    def _dir_bytes(path: str) -> int:
+        total = 0
+        for dirpath, _dirnames, filenames in os.walk(path):
+            for fname in filenames:
+                try:
+                    total += os.lstat(os.path.join(dirpath, fname)).st_size
+                except OSError:
+                    pass
+        return total
+
+    def _eviction_candidates(self, exclude: set) -> List[tuple]:
+        """(tier, last_used, name) for evictable dirs, in eviction order."""
+        reserved_runs = {r.get("run_id") for r in self._live_reservations()}
+        entries = [
+            e for e in self._run_dirs()
+            if e.name not in exclude and e.name not in reserved_runs
+        ]
+        if not entries:
+            return []
+
+        try:
+            statuses = self._owner_status_fn([e.name for e in entries])
+            statuses.update(self._legacy_job_dir_statuses(
+                [e.name for e in entries if e.name not in statuses]
+            ))
+            lookup_ok = True
+        except Exception as exc:
+            # Without statuses we cannot tell finished from running: evict nothing
+            logger.warning("MountSpace: owner status lookup failed, skipping eviction: %s", exc)
+            statuses, lookup_ok = {}, False
+
+        now = time.time()
+        candidates = []
+        for entry in entries:
+            path = os.path.join(self.mount_root, os.path.basename(entry.name))
+            last_used = self._last_used(path)
+            status = statuses.get(entry.name)
+            if status in _COMPLETED_STATUSES:
+                tier = 0
+            elif status in _FAILED_STATUSES:
+                tier = 1
+            elif status is None and lookup_ok and now - last_used >= self.orphan_grace_seconds:
+                tier = 1
+            else:
+                continue  # Active run, or unknown owner still within grace
+            candidates.append((tier, last_used, entry.name))
+        candidates.sort()
+        return candidates
+
+    def _legacy_job_dir_statuses(self, names: List[str]) -> Dict[str, str]:
+        """Statuses for job_id[:8]-named dirs, via the jobs sharing the prefix."""
+        prefixes = {}
+        for name in names:
+            match = _LEGACY_JOB_DIR.match(name)
+            if match:
+                prefixes[name] = match.group(1)
+        if not prefixes:
+            return {}
+        by_prefix = self._job_prefix_status_fn(sorted(set(prefixes.values())))
+        return {
+            name: by_prefix[prefix] for name, prefix in prefixes.items() if prefix in by_prefix
+        }
+
+    def _evict(self, bytes_needed: int, exclude: Optional[set] = None) -> dict:
+        """Remove candidate dirs in order until *bytes_needed* are freed. Caller holds _lock."""
+        self._last_eviction_at = time.monotonic()
+        summary = {"dirs_removed": 0, "bytes_freed": 0, "removed": []}
+        if bytes_needed <= 0:
+            return summary
+
+        for _tier, _last_used, name in self._eviction_candidates(exclude or set()):
+            if summary["bytes_freed"] >= bytes_needed:
+                break
+            safe_name = os.path.basename(name)
+            final_path = os.path.realpath(os.path.join(self.mount_root, safe_name))
+            if not final_path.startswith(self.mount_root + os.sep):
+                logger.warning("MountSpace: rejecting path outside mount: %r", safe_name)
+                continue
+            size = self._dir_bytes(final_path)
+            try:
+                shutil.rmtree(final_path)
+            except OSError as exc:
+                logger.warning("MountSpace: failed to evict %r: %s", safe_name, exc)
+                continue
+            summary["dirs_removed"] += 1
+            summary["bytes_freed"] += size
+            summary["removed"].append(safe_name)
+            logger.info("MountSpace: evicted %r (%.2f GB)", safe_name, size / _GB)
+
+        self._stats["dirs_evicted"] += summary["dirs_removed"]
+        self._stats["bytes_evicted"] += summary["bytes_freed"]
+        return summary
+
+    # =========================================================================
+    # OBSERVABILITY
+    # =========================================================================
+
+    def usage_by_run(self) -> Dict[str, dict]:
+        """Bytes and last-used time per top-level mount dir (walks every tree)."""
+        usage = {}
+        for entry in self._run_dirs():
+            path = os.path.join(self.mount_root, os.path.basename(entry.name))
+            usage[entry.name] = {"bytes": self._dir_bytes(path), "last_used": self._last_used(path)}
+        return usage
+
+    def stats(self) -> dict:
+        """Cheap snapshot for status endpoints (walks reserved run dirs only)."""
+        try:
+            free = self.free_bytes()
+            reserved = self.reserved_bytes()
+        except OSError as exc:
+            return {"mount_root": self.mount_root, "error": str(exc), **self._stats}
+        return {
+            "mount_root": self.mount_root,
+            "free_gb": round(free / _GB, 2),
+            "reserved_gb": round(reserved / _GB, 2),
+            "available_gb": round((free - reserved - self.min_free_bytes) / _GB, 2),
+            "min_free_gb": round(self.min_free_bytes / _GB, 2),
+            "claim_min_free_gb": round(self.claim_min_free_bytes / _GB, 2),
+            **self._stats,
+        }
+
+
+# =============================================================================
+# PROCESS-WIDE INSTANCE
+# =============================================================================
+
+_manager: Optional[MountSpaceManager] = None
+_manager_lock = threading.Lock()
+
+
+def _default_owner_statuses(owner_ids: List[str]) -> Dict[str, str]:
+    from infrastructure.workflow_run_repository import WorkflowRunRepository
+    return WorkflowRunRepository().get_mount_owner_statuses(owner_ids)
+
+
+def _default_job_prefix_statuses(prefixes: List[str]) -> Dict[str, str]:
+    from infrastructure.workflow_run_repository import WorkflowRunRepository
+    return WorkflowRunRepository().get_job_prefix_statuses(prefixes)
+
+
+def get_mount_space_manager() -> Optional[MountSpaceManager]:
+    """
+    Process-wide manager for the configured ETL mount, or None when no mount
+    is configured (non-Docker app modes, unit tests).
+    """
+    global _manager
+    if _manager is not None:
+        return _manager
+    with _manager_lock:
+        if _manager is not None:
+            return _manager
+        try:
+            from config import get_config
+            docker = get_config().docker
+        except Exception:
+            return None
+        if not docker or not docker.etl_mount_path or not os.path.isdir(docker.etl_mount_path):
+            return None
+        _manager = MountSpaceManager(
+            mount_root=docker.etl_mount_path,
+            min_free_bytes=int(docker.mount_min_free_gb * _GB),
+            claim_min_free_bytes=int(docker.mount_claim_min_free_gb * _GB),
+            reservation_ttl_seconds=docker.mount_reservation_ttl_seconds,
+            orphan_grace_seconds=docker.mount_orphan_grace_hours * 3600,
+        )
+        return _manager
+
+
+@contextmanager
+def reserve_mount_space(run_id: str, nbytes: int, purpose: str) -> Iterator[Optional[MountReservation]]:
+    """
+    reserve() on the process-wide manager; a no-op block when no mount is configured.
+
+    Raises:
+        InsufficientMountSpaceError: reservation does not fit after eviction.
+    """
+    manager = get_mount_space_manager()
+    if manager is None:
+        yield None
+        return
+    with manager.reserve(run_id, nbytes, purpose) as reservation:
+        yield reservation
+
+
+__all__ = [
+    'MountSpaceManager',
+    'MountReservation',
+    'get_mount_space_manager',
+    'reserve_mount_space',
+    'PROTECTED_DIRS',
+]
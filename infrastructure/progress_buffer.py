@@ -0,0 +1,393 @@
+# ============================================================================
+# PROGRESS WRITE BUFFER
+# ============================================================================
+# STATUS: Infrastructure - Coalesced persistence for progress and checkpoints
+# PURPOSE: Batch JobProgressTracker snapshots/events and CheckpointManager
+#          saves into interval flushes instead of one DB write per call
+# CREATED: 18 OCT 2026
+# EXPORTS: ProgressWriteBuffer, get_progress_buffer, shutdown_progress_buffer
+# DEPENDENCIES: infrastructure.metrics_repository, threading
+# ============================================================================
+"""
+Progress Write Buffer.
+
+Chatty handlers used to turn every progress call into its own database
+write: a JobProgressTracker snapshot or event was an INSERT into
+app.job_metrics, and every CheckpointManager.save() was an UPDATE of the
+task row (preceded by a read in update_task). On a large job that is
+thousands of small writes to app tables, contending with the task-claim
+queries on the same tables.
+
+This buffer sits between those callers and the database:
+
+    - Snapshots are coalesced per job: only the latest is kept.
+    - Checkpoints are coalesced per task: only the latest phase (whose data
+      is already the merged dict) is kept.
+    - Events are appended to a bounded queue; when full, the oldest are
+      dropped and counted.
+
+A daemon thread writes everything pending at most once per flush interval,
+as one metrics batch plus one checkpoint batch per task repository.
+Callers flush explicitly at the points where state must be durable:
+
+    - CheckpointManager.save(..., flush=True) / save_and_stop_if_requested
+    - JobProgressTracker.task_failed() and complete()
+    - CoreMachine before it records a task's completion or failure
+    - Docker worker shutdown (shutdown_progress_buffer)
+
+A failed checkpoint write is re-queued unless a newer checkpoint for the
+same task arrived meanwhile. Metrics stay best-effort as before: a failed
+batch is logged and dropped.
+
+METRICS_FLUSH_INTERVAL=0 disables buffering (every record is written
+immediately), matching the previous behaviour.
+
+Exports:
+    ProgressWriteBuffer: The buffer (one per process via get_progress_buffer)
+    get_progress_buffer: Lazy singleton configured from config.metrics
+    shutdown_progress_buffer: Flush everything and stop the flush thread
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from util_logger import LoggerFactory, ComponentType
+
+logger = LoggerFactory.create_logger(ComponentType.REPOSITORY, "progress_buffer")
+
+
+@dataclass
+class _PendingCheckpoint:
+    """Latest unsaved checkpoint for one task."""
+    task_repo: Any
+    phase: int
+    data: Dict[str, Any]
+    updated_at: datetime
+    seq: int
+
+
+class ProgressWriteBuffer:
+    """
+    Bounded in-process buffer that coalesces progress writes per job/task.
+
+    Thread-safe. The flush thread starts lazily on the first buffered
+    record, so processes that never record anything pay nothing.
+    """
+
+    def __init__(self, flush_interval: float = 5.0, max_events: int = 1000):
+        """
+        Args:
+            flush_interval: Seconds between background flushes (0 = write-through)
+            max_events: Bound on queued metric events before oldest are dropped
+        """
+        self.flush_interval = flush_interval
+        self.max_events = max_events
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._snapshots: Dict[str, Tuple[datetime, Dict[str, Any]]] = {}
+        self._events: Deque[Tuple[str, datetime, Dict[str, Any]]] = deque()
+        self._checkpoints: Dict[str, _PendingCheckpoint] = {}
+        self._seq = 0
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._metrics_repo = None
+
+        # Stats
+        self._records = 0
+        self._flushes = 0
+        self._rows_written = 0
+        self._events_dropped = 0
+        self._write_errors = 0
+
+    # =========================================================================
+    # RECORDING
+    # =========================================================================
+
+    def record_snapshot(self, job_id: str, payload: Dict[str, Any]) -> None:
+        """Queue a job snapshot, replacing any unflushed one for the job."""
+        with self._lock:
+            self._snapshots[job_id] = (datetime.now(timezone.utc), payload)
+            self._records += 1
+        self._after_record()
+
+    def record_event(self, job_id: str, payload: Dict[str, Any]) -> None:
+        """Queue a job event; drops the oldest queued event when full."""
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self._events.popleft()
+                self._events_dropped += 1
+            self._events.append((job_id, datetime.now(timezone.utc), payload))
+            self._records += 1
+            half_full = len(self._events) >= self.max_events // 2
+        if half_full:
+            self._wake.set()
+        self._after_record()
+
+    def record_checkpoint(
+        self,
+        task_id: str,
+        task_repo: Any,
+        phase: int,
+        data: Dict[str, Any],
+    ) -> None:
+        """Queue a task checkpoint, replacing any unflushed one for the task."""
+        with self._lock:
+            self._seq += 1
+            self._checkpoints[task_id] = _PendingCheckpoint(
+                task_repo=task_repo,
+                phase=phase,
+                data=data,
+                updated_at=datetime.now(timezone.utc),
+                seq=self._seq,
+            )
+            self._records += 1
+        self._after_record()
+
+    def discard_checkpoint(self, task_id: str) -> None:
+        """
+        Drop an unflushed checkpoint (e.g. before CheckpointManager.reset).
+
+        Waits for any in-flight flush first: it may already have taken this
+        task's checkpoint, and would otherwise write it (or re-queue it on
+        failure) after the caller's reset.
+        """
+        with self._flush_lock:
+            with self._lock:
+                self._checkpoints.pop(task_id, None)
+
+    def _after_record(self) -> None:
+        # Write-through when buffering is off or the worker is shutting down
+        if self.flush_interval <= 0 or self._stop.is_set():
+            self.flush()
+        else:
+            self._ensure_thread()
+
+    # =========================================================================
+    # FLUSHING
+    # =========================================================================
+
+    def flush(self, job_id: Optional[str] = None, task_id: Optional[str] = None) -> int:
+        """
+        Write pending records now.
+
+        With no arguments everything pending is written. With *job_id* and/or
+        *task_id* only that job's snapshot and events and that task's
+        checkpoint are written; other pending records wait for the interval.
+
+        Returns:
+            Number of rows written
+        """
+        scoped = job_id is not None or task_id is not None
+
+        # Held across take-and-write so two flushes cannot reorder writes
+        # of the same task's checkpoint (an older one landing last).
+        with self._flush_lock:
+            with self._lock:
+                if scoped:
+                    snapshots = {}
+                    if job_id is not None and job_id in self._snapshots:
+                        snapshots[job_id] = self._snapshots.pop(job_id)
+                    events = [e for e in self._events if e[0] == job_id] if job_id is not None else []
+                    if events:
+                        self._events = deque(e for e in self._events if e[0] != job_id)
+                    checkpoints = {}
+                    if task_id is not None and task_id in self._checkpoints:
+                        checkpoints[task_id] = self._checkpoints.pop(task_id)
+                else:
+                    snapshots, self._snapshots = self._snapshots, {}
+                    events, self._events = list(self._events), deque()
+                    checkpoints, self._checkpoints = self._checkpoints, {}
+
+            if not (snapshots or events or checkpoints):
+                return 0
+
+            written = self._write_metrics(snapshots, events)
+            written += self._write_checkpoints(checkpoints)
+
+        with self._lock:
+            self._flushes += 1
+            self._rows_written += written
+        return written
+
+    def _write_metrics(
+        self,
+        snapshots: Dict[str, Tuple[datetime, Dict[str, Any]]],
+        events: List[Tuple[str, datetime, Dict[str, Any]]],
+    ) -> int:
+        rows = [
+            {"job_id": jid, "metric_type": "event", "timestamp": ts, "payload": payload}
+            for jid, ts, payload in events
+        ]
+        rows.extend(
+            {"job_id": jid, "metric_type": "snapshot", "timestamp": ts, "payload": payload}
+            for jid, (ts, payload) in snapshots.items()
+        )
+        if not rows:
+            return 0
+
+        try:
+            if self._metrics_repo is None:
+                from infrastructure.metrics_repository import MetricsRepository
+                self._metrics_repo = MetricsRepository()
+            return self._metrics_repo.write_batch(rows)
+        except Exception as e:
+            with self._lock:
+                self._write_errors += 1
+            logger.warning(f"Failed to flush {len(rows)} metrics rows (dropped): {e}")
+            return 0
+
+    def _write_checkpoints(self, checkpoints: Dict[str, _PendingCheckpoint]) -> int:
+        if not checkpoints:
+            return 0
+
+        # CheckpointManager callers each hold their own task repository;
+        # group by instance so every group is one batch on one connection.
+        groups: Dict[int, List[Tuple[str, _PendingCheckpoint]]] = {}
+        for tid, pending in checkpoints.items():
+            groups.setdefault(id(pending.task_repo), []).append((tid, pending))
+
+        written = 0
+        for items in groups.values():
+            repo = items[0][1].task_repo
+            try:
+                written += self._save_checkpoint_group(repo, items)
+            except Exception as e:
+                with self._lock:
+                    self._write_errors += 1
+                    requeued = 0
+                    for tid, pending in items:
+                        current = self._checkpoints.get(tid)
+                        if current is None or current.seq < pending.seq:
+                            self._checkpoints[tid] = pending
+                            requeued += 1
+                logger.warning(
+                    f"Failed to flush {len(items)} checkpoints ({requeued} re-queued): {e}"
+                )
+        return written
+
+    @staticmethod
+    def _save_checkpoint_group(repo: Any, items: List[Tuple[str, _PendingCheckpoint]]) -> int:
+        if hasattr(repo, "save_checkpoints"):
+            return repo.save_checkpoints([
+                {
+                    "task_id": tid,
+                    "checkpoint_phase": pending.phase,
+                    "checkpoint_data": pending.data,
+                    "checkpoint_updated_at": pending.updated_at,
+                }
+                for tid, pending in items
+            ])
+
+        # Repositories without a batch method (CheckpointManager only
+        # requires get_task/update_task): fall back to per-task updates.
+        from core.schema.updates import TaskUpdateModel
+        written = 0
+        for tid, pending in items:
+            update = TaskUpdateModel(
+                checkpoint_phase=pending.phase,
+                checkpoint_data=pending.data,
+                checkpoint_updated_at=pending.updated_at,
+            )
+            if repo.update_task(tid, update):
+                written += 1
+        return written
+
+    # =========================================================================
+    # FLUSH THREAD
+    # =========================================================================
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._stop.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="progress-buffer-flush", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Progress buffer flush failed: {e}")
+
+    def shutdown(self, timeout: float = 10.0) -> int:
+        """Stop the flush thread and write everything still pending."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        written = self.flush()
+        if written:
+            logger.info(f"Progress buffer flushed {written} rows on shutdown")
+        return written
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "flush_interval_seconds": self.flush_interval,
+                "pending_snapshots": len(self._snapshots),
+                "pending_events": len(self._events),
+                "pending_checkpoints": len(self._checkpoints),
+                "records": self._records,
+                "flushes": self._flushes,
+                "rows_written": self._rows_written,
+                "events_dropped": self._events_dropped,
+                "write_errors": self._write_errors,
+            }
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_buffer: Optional[ProgressWriteBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_progress_buffer() -> ProgressWriteBuffer:
+    """Process-wide buffer, configured from config.metrics on first use."""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                try:
+                    from config import get_config
+                    metrics = get_config().metrics
+                    flush_interval = metrics.flush_interval
+                    max_events = metrics.buffer_max_events
+                except Exception:
+                    flush_interval, max_events = 5.0, 1000
+                _buffer = ProgressWriteBuffer(flush_interval, max_events)
+    return _buffer
+
+
+def shutdown_progress_buffer(timeout: float = 10.0) -> int:
+    """Flush and stop the process buffer if one was created."""
+    if _buffer is None:
+        return 0
+    return _buffer.shutdown(timeout=timeout)
+
+
+# ============================================================================
+# MODULE EXPORTS
+# ============================================================================
+
+__all__ = [
+    'ProgressWriteBuffer',
+    'get_progress_buffer',
+    'shutdown_progress_buffer',
+]
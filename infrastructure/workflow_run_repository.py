@@ -30,13 +30,19 @@ from core.models.workflow_task import WorkflowTask
 from core.models.workflow_task_dep import WorkflowTaskDep
 from exceptions import DatabaseError
 from .postgresql import PostgreSQLRepository
-from util_logger import LoggerFactory, ComponentType
+from util_logger import LoggerFactory, ComponentType, enable_log_sampling
 
-logger = LoggerFactory.create_logger(ComponentType.REPOSITORY, __name__)
+# Hot path: get_tasks_for_run / claim_ready_workflow_task log on every call
+# from every Brain cycle and worker poll — sample INFO/DEBUG per call site.
+logger = enable_log_sampling(LoggerFactory.create_logger(ComponentType.REPOSITORY, __name__))
 
 # Schema that holds the three DAG tables (matches WorkflowRun.__sql_schema)
 _SCHEMA = "app"
 
+# Rows per multi-row INSERT statement in bulk paths. 500 rows x 20 columns stays
+# well below the 65535 bind-parameter limit of the Postgres wire protocol.
+_BULK_CHUNK_ROWS = 500
+
 
 class WorkflowRunRepository(PostgreSQLRepository):
     """
@@ -176,6 +182,124 @@ class WorkflowRunRepository(PostgreSQLRepository):
 
         return True
 
+    def insert_runs_bulk(
+        self,
+        entries: list[tuple[WorkflowRun, list[WorkflowTask], list[WorkflowTaskDep]]],
+        chunk_size: int = _BULK_CHUNK_ROWS,
+    ) -> set[str]:
+        """
+        Insert many WorkflowRuns with their tasks and deps in one transaction.
+
+        Bulk counterpart of insert_run_atomic for manifest-driven submission.
+        Rows are written with multi-row INSERTs (chunk_size rows per statement)
+        instead of one round trip per row:
+
+          1. workflow_runs  — INSERT ... ON CONFLICT (run_id) DO NOTHING RETURNING run_id
+          2. workflow_tasks — only for runs that were actually inserted
+          3. workflow_task_deps — same filter
+
+        Existing runs are the idempotent path: they are left untouched and their
+        run_id is simply absent from the returned set, so the caller can report
+        them as duplicates without a second query per entry.
+
+        Returns:
+          Set of run_ids that were newly created.
+
+        Raises:
+          DatabaseError — any DB failure; the whole batch is rolled back.
+        """
+        if not entries:
+            return set()
+
+        run_cols = (
+            "run_id, workflow_name, parameters, status, definition, "
+            "platform_version, result_data, created_at, started_at, completed_at, "
+            "request_id, asset_id, release_id, legacy_job_id, schedule_id"
+        )
+        task_cols = (
+            "task_instance_id, run_id, task_name, handler, status, "
+            "fan_out_index, fan_out_source, when_clause, parameters, "
+            "result_data, error_details, retry_count, max_retries, "
+            "claimed_by, last_pulse, execute_after, "
+            "started_at, completed_at, created_at, updated_at"
+        )
+        dep_cols = "task_instance_id, depends_on_instance_id, optional"
+
+        run_rows = [_run_to_params(run) for run, _, _ in entries]
+
+        t0 = time.perf_counter()
+        try:
+            with self._get_connection() as conn:
+                try:
+                    with conn.cursor() as cur:
+                        created: set[str] = set()
+                        for chunk in _chunked(run_rows, chunk_size):
+                            cur.execute(
+                                _multi_row_insert(
+                                    "workflow_runs", run_cols, 15, len(chunk),
+                                    suffix="ON CONFLICT (run_id) DO NOTHING RETURNING run_id",
+                                ),
+                                [v for row in chunk for v in row],
+                            )
+                            created.update(r["run_id"] for r in cur.fetchall())
+
+                        task_rows = [
+                            _task_to_params(t)
+                            for run, tasks, _ in entries if run.run_id in created
+                            for t in tasks
+                        ]
+                        dep_rows = [
+                            _dep_to_params(d)
+                            for run, _, deps in entries if run.run_id in created
+                            for d in deps
+                        ]
+
+                        for chunk in _chunked(task_rows, chunk_size):
+                            cur.execute(
+                                _multi_row_insert("workflow_tasks", task_cols, 20, len(chunk)),
+                                [v for row in chunk for v in row],
+                            )
+                        for chunk in _chunked(dep_rows, chunk_size):
+                            cur.execute(
+                                _multi_row_insert("workflow_task_deps", dep_cols, 3, len(chunk)),
+                                [v for row in chunk for v in row],
+                            )
+
+                    conn.commit()
+
+                except psycopg.Error as exc:
+                    try:
+                        conn.rollback()
+                    except Exception as rb_exc:
+                        logger.error(
+                            "insert_runs_bulk: rollback failed: runs=%d rollback_error=%s",
+                            len(entries), rb_exc,
+                        )
+                    logger.error(
+                        "DB error in insert_runs_bulk: runs=%d error=%s", len(entries), exc,
+                    )
+                    raise DatabaseError(
+                        f"Failed to bulk insert workflow runs ({len(entries)} runs): {exc}"
+                    ) from exc
+
+        except DatabaseError:
+            raise
+        except Exception as exc:
+            logger.error(
+                "Non-DB error in insert_runs_bulk: runs=%d error=%s", len(entries), exc,
+            )
+            raise DatabaseError(
+                f"Unexpected error bulk inserting workflow runs: {exc}"
+            ) from exc
+
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        logger.info(
+            "insert_runs_bulk: requested=%d created=%d existing=%d tasks=%d deps=%d elapsed_ms=%.1f",
+            len(entries), len(created), len(entries) - len(created),
+            len(task_rows), len(dep_rows), elapsed_ms,
+        )
+        return created
+
     # =========================================================================
     # LOOKUP
     # =========================================================================
@@ -1389,6 +1513,89 @@ class WorkflowRunRepository(PostgreSQLRepository):
             logger.error("DB error in retry_workflow_task: %s", exc)
             raise DatabaseError(f"Failed to retry workflow task {task_instance_id}: {exc}") from exc
 
+    def recover_stale_workflow_tasks(
+        self,
+        task_instance_ids: list[str],
+        backoff_base: int,
+        backoff_cap: int,
+        stale_threshold_seconds: int,
+    ) -> dict[str, list[dict]]:
+        """
+        Set-based janitor recovery for stale RUNNING workflow tasks.
+
+        One transaction, two statements instead of a round trip per task:
+        tasks with retries left are reset to READY with backoff
+        LEAST(backoff_base * 2^retry_count, backoff_cap) computed per row,
+        and exhausted tasks are marked FAILED. Both statements keep the
+        status='running' guard of retry_workflow_task/fail_task, so a task
+        that completed since it was found stale is left alone and appears
+        in neither list.
+
+        Returns:
+            {"retried": [{task_instance_id, task_name, retry_count,
+                          max_retries, backoff_seconds}],
+             "failed":  [{task_instance_id, task_name, retry_count, max_retries}]}
+            retry_count in "retried" rows is the new (incremented) value.
+        """
+        if not task_instance_ids:
+            return {"retried": [], "failed": []}
+
+        retry_query = sql.SQL(
+            "UPDATE {schema}.workflow_tasks wt "
+            "SET status = 'ready', "
+            "    retry_count = wt.retry_count + 1, "
+            "    execute_after = NOW() + make_interval(secs => b.backoff_seconds), "
+            "    claimed_by = NULL, "
+            "    last_pulse = NULL, "
+            "    started_at = NULL, "
+            "    error_details = 'Janitor: stale task retried (backoff=' || b.backoff_seconds || 's)', "
+            "    updated_at = NOW() "
+            "FROM ( "
+            "    SELECT task_instance_id, "
+            "           LEAST(%s * POWER(2, retry_count), %s)::int AS backoff_seconds "
+            "    FROM {schema}.workflow_tasks "
+            "    WHERE task_instance_id = ANY(%s) "
+            ") b "
+            "WHERE wt.task_instance_id = b.task_instance_id "
+            "AND wt.status = 'running' "
+            "AND wt.retry_count < wt.max_retries "
+            "RETURNING wt.task_instance_id, wt.task_name, wt.retry_count, "
+            "          wt.max_retries, b.backoff_seconds"
+        ).format(schema=sql.Identifier(_SCHEMA))
+
+        fail_query = sql.SQL(
+            "UPDATE {schema}.workflow_tasks "
+            "SET status = 'failed', "
+            "    error_details = 'Janitor: task unresponsive after ' || retry_count "
+            "        || ' retries (stale_threshold=' || %s || 's)', "
+            "    completed_at = NOW(), updated_at = NOW() "
+            "WHERE task_instance_id = ANY(%s) "
+            "AND status = 'running' "
+            "AND retry_count >= max_retries "
+            "RETURNING task_instance_id, task_name, retry_count, max_retries"
+        ).format(schema=sql.Identifier(_SCHEMA))
+
+        t0 = time.perf_counter()
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
+                    cur.execute(retry_query, (backoff_base, backoff_cap, task_instance_ids))
+                    retried = cur.fetchall()
+                    cur.execute(fail_query, (stale_threshold_seconds, task_instance_ids))
+                    failed = cur.fetchall()
+                conn.commit()
+
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            logger.info(
+                "recover_stale_workflow_tasks: candidates=%d retried=%d failed=%d elapsed_ms=%.1f",
+                len(task_instance_ids), len(retried), len(failed), elapsed_ms,
+            )
+            return {"retried": retried, "failed": failed}
+
+        except psycopg.Error as exc:
+            logger.error("DB error in recover_stale_workflow_tasks: %s", exc)
+            raise DatabaseError(f"Failed to recover stale workflow tasks: {exc}") from exc
+
     def get_stale_legacy_tasks(
         self, stale_threshold_seconds: int = 120, limit: int = 50
     ) -> list[dict]:
@@ -1399,7 +1606,7 @@ class WorkflowRunRepository(PostgreSQLRepository):
         the Function App's system_guardian_sweep timer trigger.
         """
         query = sql.SQL(
-            "SELECT task_id, task_type, retry_count, last_pulse, "
+            "SELECT task_id, parent_job_id, task_type, retry_count, last_pulse, "
             "       execution_started_at, "
             "       EXTRACT(EPOCH FROM (NOW() - COALESCE(last_pulse, execution_started_at))) AS seconds_stuck "
             "FROM {schema}.tasks "
@@ -1432,6 +1639,78 @@ class WorkflowRunRepository(PostgreSQLRepository):
             logger.error("DB error in get_stale_legacy_tasks: %s", exc)
             raise DatabaseError(f"Failed to query stale legacy tasks: {exc}") from exc
 
+    def get_mount_owner_statuses(self, owner_ids: list[str]) -> dict[str, str]:
+        """
+        Status of the workflow run or legacy job that owns each ETL mount dir.
+
+        Mount dirs are named by run_id (DAG) or job_id (legacy). Used by the
+        mount space manager to decide which dirs may be evicted. IDs found in
+        neither table (archived runs, non-run dirs) are absent from the result.
+
+        Returns:
+            {owner_id: status} — workflow_runs wins if an ID is in both tables.
+        """
+        if not owner_ids:
+            return {}
+
+        query = sql.SQL(
+            "SELECT run_id AS owner_id, status::text AS status "
+            "FROM {schema}.workflow_runs WHERE run_id = ANY(%s) "
+            "UNION ALL "
+            "SELECT job_id AS owner_id, status::text AS status "
+            "FROM {schema}.jobs WHERE job_id = ANY(%s)"
+        ).format(schema=sql.Identifier(_SCHEMA))
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
+                    cur.execute(query, (owner_ids, owner_ids))
+                    rows = cur.fetchall()
+        except psycopg.Error as exc:
+            logger.error("DB error in get_mount_owner_statuses: %s", exc)
+            raise DatabaseError(f"Failed to query mount owner statuses: {exc}") from exc
+
+        statuses: dict[str, str] = {}
+        for row in reversed(rows):  # workflow_runs rows come first; let them win
+            statuses[row['owner_id']] = row['status']
+        return statuses
+
+    def get_job_prefix_statuses(self, prefixes: list[str]) -> dict[str, str]:
+        """
+        Status of the legacy jobs behind job_id[:8]-named ETL mount dirs.
+
+        process_raster_complete names its mount dirs by an 8-char job_id
+        prefix, which get_mount_owner_statuses cannot match. When several
+        jobs share a prefix the least evictable status is returned: any
+        active job first, then failed, then completed.
+
+        Returns:
+            {prefix: status} — prefixes matching no job are absent.
+        """
+        if not prefixes:
+            return {}
+
+        query = sql.SQL(
+            "SELECT DISTINCT ON (prefix) prefix, status FROM ("
+            "  SELECT left(job_id, 8) AS prefix, status::text AS status "
+            "  FROM {schema}.jobs WHERE left(job_id, 8) = ANY(%s)"
+            ") j "
+            "ORDER BY prefix, CASE "
+            "  WHEN status IN ('completed', 'completed_with_errors') THEN 2 "
+            "  WHEN status = 'failed' THEN 1 ELSE 0 END"
+        ).format(schema=sql.Identifier(_SCHEMA))
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
+                    cur.execute(query, (prefixes,))
+                    rows = cur.fetchall()
+        except psycopg.Error as exc:
+            logger.error("DB error in get_job_prefix_statuses: %s", exc)
+            raise DatabaseError(f"Failed to query job prefix statuses: {exc}") from exc
+
+        return {row['prefix']: row['status'] for row in rows}
+
     def complete_gate_node(
         self,
         run_id: str,
@@ -1785,6 +2064,181 @@ class WorkflowRunRepository(PostgreSQLRepository):
                 f"Failed to update run status (run_id={run_id}, status={status.value}): {exc}"
             ) from exc
 
+    # =========================================================================
+    # ARCHIVAL — HOT/ARCHIVE SPLIT
+    # =========================================================================
+    # Terminal runs past the retention window are exported to Parquet by
+    # services.workflow_archive and then removed from the hot tables here.
+    # The hot tables keep only live and recent history, so claim/stale/active
+    # queries and autovacuum no longer scale with total history.
+
+    def list_archivable_run_ids(self, retention_days: int, limit: int = 200) -> list[str]:
+        """
+        Return terminal run_ids whose completed_at is older than retention_days.
+
+        Oldest first, so a backlog drains in completion order.
+        """
+        query = sql.SQL(
+            "SELECT run_id FROM {schema}.workflow_runs "
+            "WHERE status IN ('completed', 'failed') "
+            "  AND completed_at IS NOT NULL "
+            "  AND completed_at < NOW() - make_interval(days => %s) "
+            "ORDER BY completed_at ASC "
+            "LIMIT %s"
+        ).format(schema=sql.Identifier(_SCHEMA))
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, (retention_days, limit))
+                    return [row["run_id"] for row in cur.fetchall()]
+        except psycopg.Error as exc:
+            logger.error("DB error in list_archivable_run_ids: %s", exc)
+            raise DatabaseError(f"Failed to list archivable runs: {exc}") from exc
+
+    def fetch_runs_for_archive(
+        self, run_ids: list[str]
+    ) -> tuple[list[dict], list[dict], list[dict]]:
+        """
+        Fetch full workflow_runs, workflow_tasks and workflow_task_deps rows
+        for a batch of runs (one query per table, ANY(%s) on run_id).
+
+        Returns:
+            (run_rows, task_rows, dep_rows) as dicts; dep rows carry run_id.
+        """
+        runs_q = sql.SQL(
+            "SELECT * FROM {schema}.workflow_runs WHERE run_id = ANY(%s)"
+        ).format(schema=sql.Identifier(_SCHEMA))
+        tasks_q = sql.SQL(
+            "SELECT * FROM {schema}.workflow_tasks WHERE run_id = ANY(%s)"
+        ).format(schema=sql.Identifier(_SCHEMA))
+        deps_q = sql.SQL(
+            "SELECT d.task_instance_id, d.depends_on_instance_id, d.optional, t.run_id "
+            "FROM {schema}.workflow_task_deps d "
+            "JOIN {schema}.workflow_tasks t ON t.task_instance_id = d.task_instance_id "
+            "WHERE t.run_id = ANY(%s)"
+        ).format(schema=sql.Identifier(_SCHEMA))
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
+                    cur.execute(runs_q, (run_ids,))
+                    runs = cur.fetchall()
+                    cur.execute(tasks_q, (run_ids,))
+                    tasks = cur.fetchall()
+                    cur.execute(deps_q, (run_ids,))
+                    deps = cur.fetchall()
+            return runs, tasks, deps
+        except psycopg.Error as exc:
+            logger.error("DB error in fetch_runs_for_archive: %s", exc)
+            raise DatabaseError(f"Failed to fetch runs for archive: {exc}") from exc
+
+    def move_runs_to_archive(self, index_rows: list[dict]) -> int:
+        """
+        Insert archive index rows and delete the hot rows in one transaction.
+
+        Called only after the Parquet export has been written. The DELETE is
+        guarded on terminal status so a run that was somehow revived between
+        export and delete is left in place (and its index row rolled back).
+
+        Args:
+            index_rows: Dicts matching WorkflowRunArchive fields.
+
+        Returns:
+            Number of runs removed from the hot tables.
+        """
+        if not index_rows:
+            return 0
+
+        cols = (
+            "run_id, workflow_name, status, created_at, started_at, completed_at, "
+            "archived_at, request_id, asset_id, release_id, schedule_id, task_count, "
+            "archive_container, runs_blob_path, tasks_blob_path"
+        )
+        col_names = [c.strip() for c in cols.split(",")]
+        run_ids = [r["run_id"] for r in index_rows]
+        # A run already in the index (e.g. an earlier archive pass whose
+        # delete rolled back) must point at the export just written, not the
+        # earlier one, before its hot rows go.
+        upsert = "ON CONFLICT (run_id) DO UPDATE SET " + ", ".join(
+            f"{c} = EXCLUDED.{c}" for c in col_names if c != "run_id"
+        )
+
+        lock_q = sql.SQL(
+            "SELECT run_id FROM {schema}.workflow_runs "
+            "WHERE run_id = ANY(%s) AND status IN ('completed', 'failed') "
+            "FOR UPDATE"
+        ).format(schema=sql.Identifier(_SCHEMA))
+        del_deps_q = sql.SQL(
+            "DELETE FROM {schema}.workflow_task_deps d "
+            "USING {schema}.workflow_tasks t "
+            "WHERE t.task_instance_id = d.task_instance_id AND t.run_id = ANY(%s)"
+        ).format(schema=sql.Identifier(_SCHEMA))
+        del_tasks_q = sql.SQL(
+            "DELETE FROM {schema}.workflow_tasks WHERE run_id = ANY(%s)"
+        ).format(schema=sql.Identifier(_SCHEMA))
+        del_runs_q = sql.SQL(
+            "DELETE FROM {schema}.workflow_runs WHERE run_id = ANY(%s)"
+        ).format(schema=sql.Identifier(_SCHEMA))
+
+        t0 = time.perf_counter()
+        try:
+            with self._get_connection() as conn:
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute(lock_q, (run_ids,))
+                        locked = {row["run_id"] for row in cur.fetchall()}
+                        rows = [r for r in index_rows if r["run_id"] in locked]
+                        if not rows:
+                            conn.rollback()
+                            return 0
+                        locked_ids = [r["run_id"] for r in rows]
+
+                        for chunk in _chunked(rows, _BULK_CHUNK_ROWS):
+                            cur.execute(
+                                _multi_row_insert(
+                                    "workflow_run_archive", cols, len(col_names), len(chunk),
+                                    suffix=upsert,
+                                ),
+                                [r.get(c) for r in chunk for c in col_names],
+                            )
+                        cur.execute(del_deps_q, (locked_ids,))
+                        cur.execute(del_tasks_q, (locked_ids,))
+                        cur.execute(del_runs_q, (locked_ids,))
+                        moved = cur.rowcount
+                    conn.commit()
+                except psycopg.Error:
+                    conn.rollback()
+                    raise
+
+            logger.info(
+                "move_runs_to_archive: requested=%d moved=%d elapsed_ms=%.1f",
+                len(index_rows), moved, (time.perf_counter() - t0) * 1000,
+            )
+            return moved
+
+        except psycopg.Error as exc:
+            logger.error("DB error in move_runs_to_archive: %s", exc)
+            raise DatabaseError(f"Failed to move runs to archive: {exc}") from exc
+
+    def get_archived_run(self, run_id: str) -> Optional[dict]:
+        """Return the workflow_run_archive index row for run_id, or None."""
+        query = sql.SQL(
+            "SELECT * FROM {schema}.workflow_run_archive WHERE run_id = %s"
+        ).format(schema=sql.Identifier(_SCHEMA))
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
+                    cur.execute(query, (run_id,))
+                    return cur.fetchone()
+        except psycopg.errors.UndefinedTable:
+            # Archive table not deployed yet — nothing has been archived
+            return None
+        except psycopg.Error as exc:
+            logger.error("DB error in get_archived_run: run_id=%s error=%s", run_id, exc)
+            raise DatabaseError(f"Failed to fetch archived run {run_id}: {exc}") from exc
+
 
 # ============================================================================
 # PRIVATE PARAMETER BUILDERS
@@ -1866,6 +2320,31 @@ def _dep_to_params(dep: WorkflowTaskDep) -> tuple:
     )
 
 
+def _chunked(rows: list, size: int):
+    """Yield successive slices of at most size rows."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _multi_row_insert(
+    table: str, columns: str, n_cols: int, n_rows: int, suffix: str = "",
+) -> sql.Composed:
+    """
+    Build a parameterized multi-row INSERT for n_rows rows of n_cols values.
+
+    Column lists are module constants (never user input); values are always
+    bound as %s placeholders.
+    """
+    row = sql.SQL("({})").format(sql.SQL(", ").join([sql.Placeholder()] * n_cols))
+    return sql.SQL("INSERT INTO {schema}.{table} ({columns}) VALUES {rows} {suffix}").format(
+        schema=sql.Identifier(_SCHEMA),
+        table=sql.Identifier(table),
+        columns=sql.SQL(columns),
+        rows=sql.SQL(", ").join([row] * n_rows),
+        suffix=sql.SQL(suffix),
+    )
+
+
 # ============================================================================
 # D.6 — WORKER CLAIM / COMPLETE / RELEASE FOR WORKFLOW TASKS
 # ============================================================================
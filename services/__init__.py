@@ -132,6 +132,7 @@ from .vector.handler_create_and_load_tables import vector_create_and_load_tables
 from .vector.handler_finalize import vector_finalize
 from .vector.handler_link_release_tables import release_link_tables
 from .vector.handler_build_stac_item import vector_build_stac_item
+from .vector.handler_build_tile_archive import vector_build_tile_archive
 
 # ACLED sync handlers (API-driven scheduled workflow)
 from .handler_acled_fetch_and_diff import acled_fetch_and_diff
@@ -237,6 +238,7 @@ ALL_HANDLERS = {
     "vector_finalize": vector_finalize,
     "release_link_tables": release_link_tables,
     "vector_build_stac_item": vector_build_stac_item,
+    "vector_build_tile_archive": vector_build_tile_archive,
 
     # Unpublish handlers
     "unpublish_inventory_raster": inventory_raster_item,
@@ -0,0 +1,220 @@
+# ============================================================================
+# BLOB RECONCILIATION SERVICE
+# ============================================================================
+# STATUS: Service - Listing-based blob ↔ database reconciliation
+# PURPOSE: Replace per-row HEAD requests with one streamed listing per
+#          container/prefix and bulk set differences against DB rows
+# CREATED: 18 OCT 2026
+# EXPORTS: BlobListingSnapshot, BlobReconciler, get_blob_reconciler
+# DEPENDENCIES: infrastructure.blob.BlobRepository
+# ============================================================================
+"""
+Blob Reconciliation Service.
+
+Consistency timers used to verify storage one object at a time (HEAD per
+app.cog_metadata row). With hundreds of thousands of COGs that is hundreds of
+thousands of storage calls per run. This service lists each container/prefix
+once — 5,000 names per request — holds the names and ETags in a set, and
+answers existence questions with in-memory set differences.
+
+Snapshots are cached per (zone, container, prefix) for SNAPSHOT_TTL_SECONDS so
+the next timer run on a warm instance reuses the listing instead of walking
+the container again. A snapshot is only a point-in-time view: blobs written
+after the listing started may be reported missing, so callers should treat
+"missing" rows newer than snapshot.listed_at as inconclusive.
+
+Usage:
+    from services.blob_reconciliation import get_blob_reconciler
+
+    reconciler = get_blob_reconciler()
+    diff = reconciler.reconcile("silver", "silver-cogs", expected_paths)
+    diff["missing"]    # in DB, not in storage
+    diff["unexpected"] # in storage, not in DB
+
+Exports:
+    BlobListingSnapshot: Point-in-time set of blob names + ETags
+    BlobReconciler: Listing cache and set-difference engine
+    get_blob_reconciler: Singleton factory
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import AbstractSet, Dict, Iterable, Optional, Tuple
+
+from util_logger import LoggerFactory, ComponentType
+
+logger = LoggerFactory.create_logger(ComponentType.SERVICE, "BlobReconciliation")
+
+# Listings are reused by the next timer run if younger than this
+SNAPSHOT_TTL_SECONDS = 6 * 3600
+
+
+@dataclass
+class BlobListingSnapshot:
+    """Point-in-time listing of one container/prefix."""
+
+    zone: str
+    container: str
+    prefix: str
+    etags: Dict[str, Optional[str]] = field(default_factory=dict)
+    listed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    duration_seconds: float = 0.0
+
+    @property
+    def names(self) -> AbstractSet[str]:
+        """Blob names as a set view (dict keys)."""
+        return self.etags.keys()
+
+    @property
+    def age_seconds(self) -> float:
+        return (datetime.now(timezone.utc) - self.listed_at).total_seconds()
+
+    def __len__(self) -> int:
+        return len(self.etags)
+
+
+class BlobReconciler:
+    """
+    Listing cache and bulk set-difference engine.
+
+    Thread-safe: concurrent callers for the same key share one listing.
+    """
+
+    def __init__(self, ttl_seconds: int = SNAPSHOT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._snapshots: Dict[Tuple[str, str, str], BlobListingSnapshot] = {}
+        self._locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, key: Tuple[str, str, str]) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def snapshot(
+        self,
+        zone: str,
+        container: str,
+        prefix: str = "",
+        refresh: bool = False
+    ) -> BlobListingSnapshot:
+        """
+        Return a cached listing, or stream a fresh one from storage.
+
+        Args:
+            zone: Trust zone passed to BlobRepository.for_zone
+            container: Container name
+            prefix: Optional prefix to restrict the listing
+            refresh: Ignore the cache and re-list
+
+        Returns:
+            BlobListingSnapshot
+        """
+        key = (zone, container, prefix)
+        with self._lock_for(key):
+            cached = self._snapshots.get(key)
+            if cached is not None and not refresh and cached.age_seconds < self.ttl_seconds:
+                logger.debug(
+                    f"Reusing listing {zone}/{container}/{prefix} "
+                    f"({len(cached)} blobs, age {cached.age_seconds:.0f}s)"
+                )
+                return cached
+
+            from infrastructure.blob import BlobRepository
+
+            start = time.monotonic()
+            repo = BlobRepository.for_zone(zone)
+            snap = BlobListingSnapshot(zone=zone, container=container, prefix=prefix)
+            for name, etag in repo.iter_blob_names(container, prefix):
+                snap.etags[name] = etag
+            snap.duration_seconds = round(time.monotonic() - start, 2)
+
+            self._snapshots[key] = snap
+            logger.info(
+                f"Listed {zone}/{container}/{prefix or '*'}: "
+                f"{len(snap)} blobs in {snap.duration_seconds}s"
+            )
+            return snap
+
+    def reconcile(
+        self,
+        zone: str,
+        container: str,
+        expected: Iterable[str],
+        prefix: str = "",
+        refresh: bool = False
+    ) -> Dict[str, object]:
+        """
+        Set-difference expected blob paths against one listing.
+
+        Args:
+            zone: Trust zone
+            container: Container name
+            expected: Blob paths the database says should exist
+            prefix: Listing prefix (expected paths outside it are reported missing)
+            refresh: Force a fresh listing
+
+        Returns:
+            Dict with missing (expected, not listed), unexpected (listed, not
+            expected), counts, and listing provenance
+        """
+        snap = self.snapshot(zone, container, prefix, refresh=refresh)
+        expected_set = set(expected)
+        listed = snap.names
+
+        missing = expected_set - listed
+        unexpected = listed - expected_set
+
+        return {
+            "container": container,
+            "prefix": prefix,
+            "expected_count": len(expected_set),
+            "listed_count": len(snap),
+            "missing": sorted(missing),
+            "unexpected": sorted(unexpected),
+            "listed_at": snap.listed_at.isoformat(),
+            "listing_seconds": snap.duration_seconds,
+        }
+
+    def invalidate(self, zone: Optional[str] = None, container: Optional[str] = None) -> int:
+        """
+        Drop cached listings (all, or those matching zone/container).
+
+        Returns:
+            Number of snapshots dropped
+        """
+        with self._locks_guard:
+            keys = [
+                k for k in self._snapshots
+                if (zone is None or k[0] == zone) and (container is None or k[1] == container)
+            ]
+            for k in keys:
+                self._snapshots.pop(k, None)
+        return len(keys)
+
+
+# =============================================================================
+# SINGLETON FACTORY
+# =============================================================================
+
+_instance: Optional[BlobReconciler] = None
+
+
+def get_blob_reconciler() -> BlobReconciler:
+    """Get singleton BlobReconciler (listing cache survives across timer runs)."""
+    global _instance
+    if _instance is None:
+        _instance = BlobReconciler()
+    return _instance
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+__all__ = [
+    'BlobListingSnapshot',
+    'BlobReconciler',
+    'get_blob_reconciler',
+]
@@ -0,0 +1,231 @@
+# ============================================================================
+# CLAUDE CONTEXT - ARCHIVE MEMBER ACCESS (NO FULL EXTRACTION)
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION (v0.11.0 discovery automation)
+# STATUS: Shared utility - Read ZIP deliveries member-by-member
+# PURPOSE: List and classify ZIP members from the central directory, address
+#          them in place via GDAL /vsizip/, and extract or upload only the
+#          members a workflow needs, in parallel.
+# CREATED: 18 OCT 2026
+# EXPORTS: list_archive_members, check_archive_safety, vsizip_path,
+#          extract_members, upload_members_to_blob
+# DEPENDENCIES: zipfile, concurrent.futures, infrastructure.blob (upload only)
+# ============================================================================
+"""
+Archive Member Access -- discovery without extractall.
+
+Bulk deliveries are ZIPs of tens of GB of which discovery usually needs a
+handful of members. Classification only needs names and sizes, which the
+ZIP central directory provides without inflating anything. GDAL can open a
+member in place as /vsizip/{zip_path}/{member} when a header probe is needed.
+Only the members the chosen workflow consumes are then inflated -- to the
+mount (extract_members) or straight into blob storage
+(upload_members_to_blob) -- on a small thread pool, one ZipFile handle per
+worker because ZipFile objects are not safe to share across threads.
+
+Listing entries match the shape unzip_to_mount has always returned
+(relative_path, size_bytes, extension) plus compressed_size_bytes, so
+classify_raster_contents works unchanged.
+"""
+
+import logging
+import os
+import shutil
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXTRACT_WORKERS = 4
+
+# 8 MiB copy buffer: large members are inflated in a bounded amount of memory
+_COPY_BUFFER = 8 * 1024 * 1024
+
+
+def list_archive_members(zf: zipfile.ZipFile) -> List[Dict[str, Any]]:
+    """
+    File members of an open archive, read from the central directory only.
+
+    Directory entries are skipped. Paths keep the archive's '/' separators.
+    """
+    contents = []
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        contents.append({
+            "relative_path": info.filename,
+            "size_bytes": info.file_size,
+            "compressed_size_bytes": info.compress_size,
+            "extension": PurePosixPath(info.filename).suffix.lower(),
+        })
+    return contents
+
+
+def check_archive_safety(
+    members: List[zipfile.ZipInfo],
+    selected: Iterable[str],
+    extract_dir: str,
+    max_extract_bytes: int,
+    max_file_count: int,
+    zip_bomb_ratio: float,
+) -> Optional[Dict[str, Any]]:
+    """
+    Safety checks before inflating `selected` members.
+
+    File count and Zip Slip are checked for the whole archive; size and
+    compression ratio only for the members that will actually be inflated.
+
+    Returns:
+        Handler failure dict, or None when safe
+    """
+    if len(members) > max_file_count:
+        return {
+            "success": False,
+            "error": f"ZIP contains {len(members)} files, exceeds limit of {max_file_count}",
+            "error_type": "SafetyLimitExceeded", "retryable": False,
+        }
+
+    # Zip Slip prevention -- reject paths that escape extract_dir
+    root = os.path.realpath(extract_dir)
+    for member in members:
+        resolved = os.path.realpath(os.path.join(extract_dir, member.filename))
+        if not resolved.startswith(root):
+            return {
+                "success": False,
+                "error": f"Zip Slip detected: {member.filename} escapes extract directory",
+                "error_type": "ZipSlipDetected", "retryable": False,
+            }
+
+    wanted = set(selected)
+    chosen = [m for m in members if m.filename in wanted]
+    total_uncompressed = sum(m.file_size for m in chosen)
+    total_compressed = sum(m.compress_size for m in chosen)
+
+    if total_uncompressed > max_extract_bytes:
+        return {
+            "success": False,
+            "error": (
+                f"Extracted size {total_uncompressed / (1024*1024):.0f} MB "
+                f"exceeds limit of {max_extract_bytes / (1024*1024):.0f} MB"
+            ),
+            "error_type": "SafetyLimitExceeded", "retryable": False,
+        }
+
+    if total_compressed > 0 and total_uncompressed > total_compressed * zip_bomb_ratio:
+        return {
+            "success": False,
+            "error": (
+                f"ZIP bomb detected: {total_uncompressed / (1024*1024):.0f} MB extracted "
+                f"from {total_compressed / (1024*1024):.0f} MB compressed "
+                f"(ratio {total_uncompressed / total_compressed:.1f}x, limit {zip_bomb_ratio}x)"
+            ),
+            "error_type": "ZipBombDetected", "retryable": False,
+        }
+    return None
+
+
+def vsizip_path(zip_path: str, member: str) -> str:
+    """GDAL path that opens an archive member in place (no extraction)."""
+    return f"/vsizip/{zip_path}/{member}"
+
+
+def _parallel_members(zip_path: str, members: List[str], max_workers: int, work) -> Dict[str, Any]:
+    """
+    Run work(zf, member) for each member on a pool; one ZipFile per thread.
+
+    Returns:
+        {"done": {member: result}, "failed": {member: error}}
+    """
+    local = threading.local()
+    handles: List[zipfile.ZipFile] = []
+    handles_lock = threading.Lock()
+
+    def run(member: str):
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = zipfile.ZipFile(zip_path, "r")
+            with handles_lock:
+                handles.append(zf)
+        return work(zf, member)
+
+    done: Dict[str, Any] = {}
+    failed: Dict[str, str] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(members) or 1))) as executor:
+            futures = {executor.submit(run, m): m for m in members}
+            for future in as_completed(futures):
+                member = futures[future]
+                try:
+                    done[member] = future.result()
+                except Exception as exc:
+                    logger.warning("archive member %s failed: %s", member, exc)
+                    failed[member] = str(exc)
+    finally:
+        for zf in handles:
+            zf.close()
+    return {"done": done, "failed": failed}
+
+
+def extract_members(
+    zip_path: str,
+    members: List[str],
+    extract_dir: str,
+    max_workers: int = DEFAULT_EXTRACT_WORKERS,
+) -> Dict[str, Any]:
+    """
+    Inflate selected members onto the mount in parallel.
+
+    Callers must run check_archive_safety first (Zip Slip in particular).
+
+    Returns:
+        {"done": {member: local_path}, "failed": {member: error}}
+    """
+    def work(zf: zipfile.ZipFile, member: str) -> str:
+        dest = os.path.join(extract_dir, member)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        with zf.open(member) as src, open(dest, "wb") as out:
+            shutil.copyfileobj(src, out, length=_COPY_BUFFER)
+        return dest
+
+    return _parallel_members(zip_path, members, max_workers, work)
+
+
+def upload_members_to_blob(
+    zip_path: str,
+    members: List[str],
+    blob_repo,
+    container_name: str,
+    blob_prefix: str,
+    max_workers: int = DEFAULT_EXTRACT_WORKERS,
+) -> Dict[str, Any]:
+    """
+    Stream selected members from the archive straight into blob storage.
+
+    Each member is inflated into the upload stream; nothing is written to
+    the mount.
+
+    Callers must run check_archive_safety first: the members are inflated
+    even though they never touch the mount.
+
+    Returns:
+        {"done": {member: blob_path}, "failed": {member: error}}
+    """
+    def work(zf: zipfile.ZipFile, member: str) -> str:
+        blob_path = f"{blob_prefix}/{member}"
+        with zf.open(member) as src:
+            blob_repo.write_blob(container_name, blob_path, src)
+        return blob_path
+
+    return _parallel_members(zip_path, members, max_workers, work)
+
+
+__all__ = [
+    'list_archive_members',
+    'check_archive_safety',
+    'vsizip_path',
+    'extract_members',
+    'upload_members_to_blob',
+]
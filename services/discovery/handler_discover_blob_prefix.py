@@ -81,6 +81,7 @@ def discover_blob_prefix(
             "size_bytes": size,
             "extension": ext,
             "stem": stem,
+            "etag": blob.get("etag"),
         }
         blobs.append(entry)
 
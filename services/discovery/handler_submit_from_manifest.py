@@ -7,7 +7,7 @@
 #          record results per entry. dry_run=true by default.
 # CREATED: 03 APR 2026
 # EXPORTS: submit_from_manifest
-# DEPENDENCIES: services.platform_job_submit.create_and_submit_dag_run
+# DEPENDENCIES: services.platform_job_submit.create_and_submit_dag_runs_bulk
 # ============================================================================
 """
 Submit From Manifest -- translate manifest entries into workflow submissions.
@@ -16,8 +16,9 @@ Reads a manifest produced by build_discovery_manifest, submits processing
 workflows for entries with a recommended_workflow, skips entries without one.
 
 dry_run=true by default (project convention). Caller must explicitly set
-dry_run=false to actually submit. Submissions are sequential — the Brain
-picks up runs asynchronously so there is no benefit to batching.
+dry_run=false to actually submit. Submissions go through the bulk path
+(create_and_submit_dag_runs_bulk): validators run concurrently, then all
+runs, tasks and deps are inserted in one transaction with per-entry outcomes.
 """
 
 import logging
@@ -55,6 +56,7 @@ def submit_from_manifest(
     submitted = []
     rejected = []
     skipped = []
+    pending = []  # (entry_index, source_blob, workflow, params) awaiting bulk submit
 
     for entry in entries:
         idx = entry.get("entry_index", 0)
@@ -90,29 +92,41 @@ def submit_from_manifest(
             })
             continue
 
-        # Actually submit
-        try:
-            from services.platform_job_submit import create_and_submit_dag_run
+        pending.append((idx, source_blob, workflow, entry_params))
 
-            request_id = f"discovery-{spawned_by[:16]}-{idx}"
-            run_id = create_and_submit_dag_run(
-                job_type=workflow,
-                parameters=entry_params,
-                platform_request_id=request_id,
-            )
-            submitted.append({
-                "entry_index": idx,
-                "source_blob": source_blob,
-                "workflow": workflow,
-                "run_id": run_id,
-                "status": "accepted",
-            })
-            logger.info(
-                "submit_from_manifest: submitted %s for %s -> run_id=%s",
-                workflow, source_blob, run_id[:16],
-            )
+    # Actual submission: validate concurrently, insert all runs in one batch
+    if pending:
+        from services.platform_job_submit import create_and_submit_dag_runs_bulk
+
+        submissions = [
+            {
+                "job_type": workflow,
+                "parameters": entry_params,
+                "platform_request_id": f"discovery-{spawned_by[:16]}-{idx}",
+            }
+            for idx, _, workflow, entry_params in pending
+        ]
+        try:
+            outcomes = create_and_submit_dag_runs_bulk(submissions)
         except Exception as exc:
-            error_msg = str(exc)
+            # Whole batch rolled back — report every pending entry as rejected
+            outcomes = [{"run_id": None, "status": "rejected", "error": str(exc)}] * len(pending)
+
+        for (idx, source_blob, workflow, _), outcome in zip(pending, outcomes):
+            if outcome["status"] in ("created", "duplicate"):
+                # Duplicates are idempotent returns of an existing run, exactly
+                # as the single-submit path behaves.
+                submitted.append({
+                    "entry_index": idx,
+                    "source_blob": source_blob,
+                    "workflow": workflow,
+                    "run_id": outcome["run_id"],
+                    "status": "accepted",
+                    "existing": outcome["status"] == "duplicate",
+                })
+                continue
+
+            error_msg = outcome.get("error", "unknown error")
             is_duplicate = "duplicate" in error_msg.lower()
             rejected.append({
                 "entry_index": idx,
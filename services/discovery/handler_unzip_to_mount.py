@@ -6,13 +6,23 @@
 # PURPOSE: Download a ZIP archive from blob storage, extract to the ETL mount,
 #          return a content listing for downstream classification.
 # CREATED: 03 APR 2026
-# EXPORTS: unzip_to_mount
-# DEPENDENCIES: infrastructure.blob.BlobRepository, infrastructure.etl_mount
+# EXPORTS: unzip_to_mount, archive_safety_limits
+# DEPENDENCIES: infrastructure.blob.BlobRepository, infrastructure.etl_mount,
+#               services.discovery.archive_members
 # ============================================================================
 """
 Unzip To Mount -- download ZIP from blob storage and extract to ETL mount.
 
-Safety limits enforced:
+Members are listed from the ZIP central directory; the `extract` param
+decides what is inflated:
+  - "all" (default): every member, in parallel
+  - "none": nothing -- the ZIP stays on the mount and the listing carries
+    archive_path plus per-member vsi_path (/vsizip/) for in-place GDAL reads;
+    callers extract or upload only what their workflow needs
+    (services.discovery.archive_members)
+  - [member, ...]: only the named members
+
+Safety limits enforced (size and ratio apply to the members inflated):
   - Max extracted size (DISCOVERY_MAX_EXTRACT_SIZE_MB env var)
   - Max file count inside ZIP (default 100)
   - ZIP bomb detection (extracted > 10x compressed size)
@@ -24,6 +34,14 @@ import zipfile
 from pathlib import PurePosixPath
 from typing import Any, Dict, Optional
 
+from services.discovery.archive_members import (
+    DEFAULT_EXTRACT_WORKERS,
+    check_archive_safety,
+    extract_members,
+    list_archive_members,
+    vsizip_path,
+)
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_EXTRACT_SIZE_MB = 2048
@@ -31,6 +49,21 @@ DEFAULT_MAX_FILE_COUNT = 100
 ZIP_BOMB_RATIO = 10
 
 
+def archive_safety_limits() -> Dict[str, Any]:
+    """check_archive_safety limit kwargs, read from env with the defaults above."""
+    max_extract_mb = int(os.environ.get(
+        "DISCOVERY_MAX_EXTRACT_SIZE_MB", DEFAULT_MAX_EXTRACT_SIZE_MB
+    ))
+    max_file_count = int(os.environ.get(
+        "DISCOVERY_MAX_FILE_COUNT", DEFAULT_MAX_FILE_COUNT
+    ))
+    return {
+        "max_extract_bytes": max_extract_mb * 1024 * 1024,
+        "max_file_count": max_file_count,
+        "zip_bomb_ratio": ZIP_BOMB_RATIO,
+    }
+
+
 def unzip_to_mount(
     params: Dict[str, Any], context: Optional[Any] = None
 ) -> Dict[str, Any]:
@@ -41,6 +74,7 @@ def unzip_to_mount(
         container_name (str, required): Target container (for BlobRepository zone).
         blob_name (str, required): ZIP blob path.
         source_container (str, optional): Container to download from. Defaults to container_name.
+        extract (str | list, optional): "all" (default), "none", or member paths.
         _run_id (str, system-injected): DAG run ID for mount path scoping.
 
     Returns:
@@ -49,6 +83,7 @@ def unzip_to_mount(
     container_name = params.get("container_name")
     blob_name = params.get("blob_name")
     source_container = params.get("source_container") or container_name
+    extract = params.get("extract", "all")
     run_id = params.get("_run_id", "unknown")
 
     if not container_name:
@@ -57,6 +92,9 @@ def unzip_to_mount(
     if not blob_name:
         return {"success": False, "error": "blob_name is required",
                 "error_type": "ValidationError", "retryable": False}
+    if not (extract in ("all", "none") or isinstance(extract, list)):
+        return {"success": False, "error": "extract must be 'all', 'none' or a list of members",
+                "error_type": "ValidationError", "retryable": False}
 
     stem = PurePosixPath(blob_name).stem
 
@@ -66,12 +104,8 @@ def unzip_to_mount(
     extract_dir = ensure_dir(run_dir, stem)
     zip_path = os.path.join(run_dir, f"{stem}.zip")
 
-    # Read safety limits from env
-    max_extract_mb = int(os.environ.get(
-        "DISCOVERY_MAX_EXTRACT_SIZE_MB", DEFAULT_MAX_EXTRACT_SIZE_MB
-    ))
-    max_file_count = int(os.environ.get(
-        "DISCOVERY_MAX_FILE_COUNT", DEFAULT_MAX_FILE_COUNT
+    extract_workers = int(os.environ.get(
+        "DISCOVERY_EXTRACT_WORKERS", DEFAULT_EXTRACT_WORKERS
     ))
 
     # Download ZIP from blob
@@ -86,98 +120,73 @@ def unzip_to_mount(
 
     compressed_size = os.path.getsize(zip_path)
 
-    # Extract and validate
+    # List from the central directory, validate, extract the selection
     try:
         with zipfile.ZipFile(zip_path, "r") as zf:
             members = zf.infolist()
-
-            # Safety: file count limit
-            if len(members) > max_file_count:
-                return {
-                    "success": False,
-                    "error": f"ZIP contains {len(members)} files, exceeds limit of {max_file_count}",
-                    "error_type": "SafetyLimitExceeded", "retryable": False,
-                }
-
-            # Safety: total extracted size
-            total_uncompressed = sum(m.file_size for m in members)
-            max_extract_bytes = max_extract_mb * 1024 * 1024
-
-            if total_uncompressed > max_extract_bytes:
-                return {
-                    "success": False,
-                    "error": (
-                        f"Extracted size {total_uncompressed / (1024*1024):.0f} MB "
-                        f"exceeds limit of {max_extract_mb} MB"
-                    ),
-                    "error_type": "SafetyLimitExceeded", "retryable": False,
-                }
-
-            # Safety: ZIP bomb detection
-            if compressed_size > 0 and total_uncompressed > compressed_size * ZIP_BOMB_RATIO:
-                return {
-                    "success": False,
-                    "error": (
-                        f"ZIP bomb detected: {total_uncompressed / (1024*1024):.0f} MB extracted "
-                        f"from {compressed_size / (1024*1024):.0f} MB compressed "
-                        f"(ratio {total_uncompressed / compressed_size:.1f}x, limit {ZIP_BOMB_RATIO}x)"
-                    ),
-                    "error_type": "ZipBombDetected", "retryable": False,
-                }
-
-            # Safety: Zip Slip prevention — reject paths that escape extract_dir
-            for member in members:
-                resolved = os.path.realpath(os.path.join(extract_dir, member.filename))
-                if not resolved.startswith(os.path.realpath(extract_dir)):
-                    return {
-                        "success": False,
-                        "error": f"Zip Slip detected: {member.filename} escapes extract directory",
-                        "error_type": "ZipSlipDetected", "retryable": False,
-                    }
-
-            # Extract all
-            zf.extractall(extract_dir)
-
+            contents = list_archive_members(zf)
     except zipfile.BadZipFile as exc:
         return {"success": False, "error": f"Corrupt ZIP file: {exc}",
                 "error_type": "CorruptArchive", "retryable": False}
 
-    # Build content listing from extracted files
-    contents = []
+    listed = {item["relative_path"] for item in contents}
+    if extract == "all":
+        selected = sorted(listed)
+    elif extract == "none":
+        selected = []
+    else:
+        unknown = [m for m in extract if m not in listed]
+        if unknown:
+            return {"success": False, "error": f"Members not in archive: {unknown[:10]}",
+                    "error_type": "ValidationError", "retryable": False}
+        selected = list(extract)
+
+    failure = check_archive_safety(members, selected, extract_dir, **archive_safety_limits())
+    if failure:
+        return failure
+
+    extracted = extract_members(zip_path, selected, extract_dir, max_workers=extract_workers)
+    if extracted["failed"]:
+        return {
+            "success": False,
+            "error": f"Failed to extract {len(extracted['failed'])} member(s): "
+                     f"{list(extracted['failed'].items())[:3]}",
+            "error_type": "CorruptArchive", "retryable": False,
+        }
+
+    extracted_set = set(extracted["done"])
     total_extracted = 0
-
-    for root, _dirs, files in os.walk(extract_dir):
-        for fname in files:
-            full_path = os.path.join(root, fname)
-            rel_path = os.path.relpath(full_path, extract_dir)
-            size = os.path.getsize(full_path)
-            ext = PurePosixPath(fname).suffix.lower()
-
-            contents.append({
-                "relative_path": rel_path,
-                "size_bytes": size,
-                "extension": ext,
-            })
-            total_extracted += size
-
-    # Clean up the ZIP file (keep extracted contents)
-    try:
-        os.remove(zip_path)
-    except OSError:
-        pass
+    for item in contents:
+        item["extracted"] = item["relative_path"] in extracted_set
+        if item["extracted"]:
+            total_extracted += item["size_bytes"]
+        else:
+            item["vsi_path"] = vsizip_path(zip_path, item["relative_path"])
+
+    # Keep the ZIP only while some members are still addressed inside it
+    keep_archive = len(extracted_set) < len(contents)
+    if not keep_archive:
+        try:
+            os.remove(zip_path)
+        except OSError:
+            pass
 
     logger.info(
-        "unzip_to_mount: %s — %d files extracted to %s (%.1f MB)",
-        blob_name, len(contents), extract_dir, total_extracted / (1024 * 1024),
+        "unzip_to_mount: %s — %d/%d members extracted to %s (%.1f MB)",
+        blob_name, len(extracted_set), len(contents), extract_dir,
+        total_extracted / (1024 * 1024),
     )
 
     return {
         "success": True,
         "result": {
             "extract_path": extract_dir,
+            "archive_path": zip_path if keep_archive else None,
             "contents": contents,
             "total_extracted_size_bytes": total_extracted,
+            "total_uncompressed_size_bytes": sum(i["size_bytes"] for i in contents),
             "compressed_size_bytes": compressed_size,
             "file_count": len(contents),
+            "extracted_count": len(extracted_set),
         },
     }
@@ -7,20 +7,30 @@
 #          archives by shared filename stem. Read JSON sidecars for metadata.
 # CREATED: 03 APR 2026
 # EXPORTS: wbg_match_json_zip_pairs
-# DEPENDENCIES: infrastructure.blob.BlobRepository (JSON sidecar download)
+# DEPENDENCIES: infrastructure.blob.BlobRepository (JSON sidecar download),
+#               services.discovery.sidecar_prefetch
 # ============================================================================
 """
 WBG Match JSON+ZIP Pairs -- match WBG image repository JSON+ZIP files by stem.
 
 WBG naming convention: {ISO3}_{geohash}_{bands}_{resolution}_{YYYYMMDD}.{ext}
 Each image has a JSON (metadata) and ZIP (imagery) sharing the same stem.
+
+Sidecars of matched pairs are read in parallel through
+services.discovery.sidecar_prefetch, which also skips sidecars whose ETag
+is unchanged since a previous run.
 """
 
-import json
 import logging
+import os
 from pathlib import PurePosixPath
 from typing import Any, Dict, Optional
 
+from services.discovery.sidecar_prefetch import (
+    DEFAULT_SIDECAR_WORKERS,
+    prefetch_json_sidecars,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +43,8 @@ def wbg_match_json_zip_pairs(
     Params:
         inventory (dict, required): From discover_blob_prefix result.
         source_container (str, required): Container to read JSON sidecars from.
+        use_sidecar_cache (bool, optional): Reuse sidecars cached on the mount
+            by ETag (default True).
 
     Returns:
         Success: {"success": True, "result": {"pairs": [...], "orphan_jsons": [...], ...}}
@@ -52,11 +64,13 @@ def wbg_match_json_zip_pairs(
     archive_files = inventory.get("archive_files", [])
 
     json_by_stem = {}
+    etag_by_json = {}
     for f in metadata_files:
         name = f.get("name", "")
         if name.lower().endswith(".json"):
             stem = PurePosixPath(name).stem
             json_by_stem[stem] = name
+            etag_by_json[name] = f.get("etag")
 
     zip_by_stem = {}
     for f in archive_files:
@@ -71,23 +85,32 @@ def wbg_match_json_zip_pairs(
     orphan_zips = []
 
     all_stems = set(json_by_stem.keys()) | set(zip_by_stem.keys())
+    paired_stems = sorted(json_by_stem.keys() & zip_by_stem.keys())
 
+    # Read JSON sidecars of matched pairs (lightweight, ~670 bytes each) in
+    # parallel; unchanged ones come from the mount cache
     from infrastructure.blob import BlobRepository
     blob_repo = BlobRepository.for_zone("bronze")
 
+    prefetch = prefetch_json_sidecars(
+        blob_repo,
+        source_container,
+        [(json_by_stem[stem], etag_by_json.get(json_by_stem[stem])) for stem in paired_stems],
+        max_workers=int(os.environ.get("DISCOVERY_SIDECAR_WORKERS", DEFAULT_SIDECAR_WORKERS)),
+        use_cache=params.get("use_sidecar_cache", True),
+    )
+    sidecars = prefetch["metadata"]
+
     for stem in sorted(all_stems):
         has_json = stem in json_by_stem
         has_zip = stem in zip_by_stem
 
         if has_json and has_zip:
-            # Read JSON sidecar for metadata (lightweight, ~670 bytes)
-            metadata = _read_json_sidecar(blob_repo, source_container, json_by_stem[stem])
-
             pairs.append({
                 "stem": stem,
                 "json_blob": json_by_stem[stem],
                 "zip_blob": zip_by_stem[stem],
-                "metadata": metadata,
+                "metadata": sidecars.get(json_by_stem[stem]),
             })
         elif has_json:
             orphan_jsons.append(json_by_stem[stem])
@@ -95,8 +118,10 @@ def wbg_match_json_zip_pairs(
             orphan_zips.append(zip_by_stem[stem])
 
     logger.info(
-        "wbg_match_json_zip_pairs: %d pairs, %d orphan JSONs, %d orphan ZIPs",
+        "wbg_match_json_zip_pairs: %d pairs, %d orphan JSONs, %d orphan ZIPs "
+        "(sidecars: %d cached, %d fetched)",
         len(pairs), len(orphan_jsons), len(orphan_zips),
+        prefetch["cache_hits"], prefetch["fetched"],
     )
 
     return {
@@ -106,16 +131,9 @@ def wbg_match_json_zip_pairs(
             "orphan_jsons": orphan_jsons,
             "orphan_zips": orphan_zips,
             "total_pairs": len(pairs),
+            "sidecar_cache_hits": prefetch["cache_hits"],
+            "sidecars_fetched": prefetch["fetched"],
+            "sidecars_failed": prefetch["failed"],
         },
     }
 
-
-def _read_json_sidecar(blob_repo, container: str, blob_path: str) -> Optional[Dict]:
-    """Download and parse a WBG JSON sidecar file."""
-    try:
-        content = blob_repo.read_blob(container, blob_path)
-        text = content.decode("utf-8", errors="replace")
-        return json.loads(text)
-    except Exception as exc:
-        logger.warning("wbg_match_pairs: failed to read JSON %s: %s", blob_path, exc)
-        return None
@@ -3,29 +3,43 @@
 # ============================================================================
 # EPOCH: 5 - DAG ORCHESTRATION (v0.11.0 discovery automation)
 # STATUS: Composite handler - Copy ZIP to bronze, unzip, classify, upload rasters
-# PURPOSE: For a single WBG JSON+ZIP pair: copy from cold to bronze, extract,
-#          classify contents, upload extracted rasters back to bronze.
+# PURPOSE: For a single WBG JSON+ZIP pair: copy from cold to bronze, list
+#          and classify members from the archive, stream only the rasters the
+#          recommended workflow needs back to bronze.
 # CREATED: 03 APR 2026
 # EXPORTS: wbg_process_single_pair
 # DEPENDENCIES: infrastructure.blob, infrastructure.etl_mount,
 #               services.discovery.handler_classify_raster_contents,
-#               services.discovery.handler_unzip_to_mount
+#               services.discovery.handler_unzip_to_mount,
+#               services.discovery.archive_members
 # ============================================================================
 """
 WBG Process Single Pair -- composite handler for one JSON+ZIP pair.
 
-Orchestrates: copy to bronze → unzip to mount → classify → upload rasters to bronze.
+Orchestrates: copy to bronze → download ZIP to mount (no extraction) →
+classify from the central directory → stream raster members from the ZIP
+to bronze in parallel. Sidecars and other members are never inflated.
 Returns classification result with bronze blob paths for downstream workflow submission.
 """
 
 import logging
 import os
+import zipfile
 from pathlib import PurePosixPath
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 
+def _remove_archive(archive_path: Optional[str]) -> None:
+    """Delete the downloaded ZIP from the mount once members are consumed."""
+    if archive_path:
+        try:
+            os.remove(archive_path)
+        except OSError:
+            pass
+
+
 def wbg_process_single_pair(
     params: Dict[str, Any], context: Optional[Any] = None
 ) -> Dict[str, Any]:
@@ -75,12 +89,13 @@ def wbg_process_single_pair(
         return {"success": False, "error": f"Failed to copy ZIP to bronze: {exc}",
                 "error_type": "CopyError", "retryable": True}
 
-    # Step 2: Unzip to mount
+    # Step 2: Download ZIP to mount and list members (nothing extracted)
     from services.discovery.handler_unzip_to_mount import unzip_to_mount
 
     unzip_result = unzip_to_mount({
         "container_name": container_name,
         "blob_name": bronze_zip_path,
+        "extract": "none",
         "_run_id": run_id,
     })
 
@@ -89,6 +104,7 @@ def wbg_process_single_pair(
 
     extract_result = unzip_result["result"]
     extract_path = extract_result["extract_path"]
+    archive_path = extract_result["archive_path"]
     contents = extract_result["contents"]
 
     # Step 3: Classify contents
@@ -101,28 +117,48 @@ def wbg_process_single_pair(
     })
 
     if not classify_result.get("success"):
+        _remove_archive(archive_path)
         return classify_result
 
     classification = classify_result["result"]
     raster_files = classification.get("raster_files", [])
 
-    # Step 4: Upload extracted rasters to bronze
-    bronze_raster_paths = []
-    for rel_path in raster_files:
-        local_path = os.path.join(extract_path, rel_path)
-        bronze_blob_path = f"{bronze_prefix}/{rel_path}"
-
-        if not os.path.exists(local_path):
-            logger.warning("wbg_process_pair: raster file not found on mount: %s", local_path)
-            continue
+    # Step 4: Stream raster members from the ZIP to bronze (no mount writes).
+    # unzip_to_mount only checked the archive as a whole ("extract": "none"),
+    # so size and bomb ratio must be checked for the members inflated here.
+    from services.discovery.archive_members import check_archive_safety, upload_members_to_blob
+    from services.discovery.handler_unzip_to_mount import archive_safety_limits
 
+    uploaded = {"done": {}, "failed": {}}
+    if archive_path and raster_files:
         try:
-            blob_repo.stream_mount_to_blob(container_name, bronze_blob_path, local_path)
-            bronze_raster_paths.append(bronze_blob_path)
-            logger.info("wbg_process_pair: uploaded %s -> %s/%s",
-                        rel_path, container_name, bronze_blob_path)
-        except Exception as exc:
-            logger.warning("wbg_process_pair: failed to upload %s: %s", rel_path, exc)
+            with zipfile.ZipFile(archive_path, "r") as zf:
+                members = zf.infolist()
+        except zipfile.BadZipFile as exc:
+            _remove_archive(archive_path)
+            return {"success": False, "error": f"Corrupt ZIP file: {exc}",
+                    "error_type": "CorruptArchive", "retryable": False}
+
+        failure = check_archive_safety(
+            members, raster_files, extract_path, **archive_safety_limits()
+        )
+        if failure:
+            _remove_archive(archive_path)
+            return failure
+
+        uploaded = upload_members_to_blob(
+            archive_path, raster_files, blob_repo, container_name, bronze_prefix,
+            max_workers=int(os.environ.get("DISCOVERY_EXTRACT_WORKERS", 4)),
+        )
+    _remove_archive(archive_path)
+
+    for rel_path, error in uploaded["failed"].items():
+        logger.warning("wbg_process_pair: failed to upload %s: %s", rel_path, error)
+
+    # Preserve classification order (uploads complete in any order)
+    bronze_raster_paths = [
+        uploaded["done"][rel_path] for rel_path in raster_files if rel_path in uploaded["done"]
+    ]
 
     # Build recommended_params with bronze paths
     recommended_params = classification.get("recommended_params", {})
@@ -0,0 +1,164 @@
+# ============================================================================
+# CLAUDE CONTEXT - SIDECAR PREFETCH (PARALLEL READS + ETAG MOUNT CACHE)
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION (v0.11.0 discovery automation)
+# STATUS: Shared utility - Fetch and parse small JSON sidecars in bulk
+# PURPOSE: Download JSON sidecars on a bounded thread pool and keep the parsed
+#          result on the ETL mount keyed by blob ETag, so re-running discovery
+#          over an unchanged container issues no sidecar reads at all.
+# CREATED: 18 OCT 2026
+# EXPORTS: prefetch_json_sidecars, sidecar_cache_dir, DEFAULT_SIDECAR_WORKERS
+# DEPENDENCIES: concurrent.futures, infrastructure.etl_mount
+# ============================================================================
+"""
+Sidecar Prefetch -- parallel JSON sidecar reads with an ETag-keyed cache.
+
+Sidecars are a few hundred bytes each, so reading them one at a time is
+dominated by per-request latency. prefetch_json_sidecars() issues the reads
+on a small thread pool (BlobRepository clients are thread-safe) and returns
+{blob_path: parsed_json_or_None}.
+
+Cache layout (shared across runs, outside any run directory)::
+
+    {etl_mount_path}/discovery_cache/sidecars/{container}/{sha1(blob_path)}.json
+        {"blob_path": ..., "etag": ..., "metadata": {...}}
+
+An entry is used only when its etag equals the ETag from the blob listing,
+so an overwritten sidecar is always re-read. Blobs listed without an ETag
+are fetched and not cached. The janitor's mount sweep expires the cache
+directory along with stale run directories, which is harmless -- the next
+run simply repopulates it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIDECAR_WORKERS = 16
+
+_CACHE_NAMESPACE = ("discovery_cache", "sidecars")
+
+
+def sidecar_cache_dir(container: str) -> Optional[str]:
+    """Cache directory for one container's sidecars, or None if the mount is unusable."""
+    from infrastructure.etl_mount import resolve_run_dir, ensure_dir
+
+    try:
+        return ensure_dir(resolve_run_dir(_CACHE_NAMESPACE[0]), _CACHE_NAMESPACE[1], container)
+    except OSError as exc:
+        logger.warning("sidecar cache disabled (mount not writable): %s", exc)
+        return None
+
+
+def _cache_file(cache_dir: str, blob_path: str) -> str:
+    digest = hashlib.sha1(blob_path.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def _read_cached(cache_dir: str, blob_path: str, etag: str) -> Tuple[bool, Optional[Dict]]:
+    """(hit, metadata) for a cache entry matching blob_path and etag."""
+    try:
+        with open(_cache_file(cache_dir, blob_path), "r", encoding="utf-8") as fh:
+            entry = json.load(fh)
+    except (OSError, ValueError):
+        return False, None
+    if entry.get("etag") != etag or entry.get("blob_path") != blob_path:
+        return False, None
+    return True, entry.get("metadata")
+
+
+def _write_cached(cache_dir: str, blob_path: str, etag: str, metadata: Dict) -> None:
+    """Write a cache entry atomically (temp file + rename); failures are ignored."""
+    path = _cache_file(cache_dir, blob_path)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"blob_path": blob_path, "etag": etag, "metadata": metadata}, fh)
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("sidecar cache write failed for %s: %s", blob_path, exc)
+
+
+def _fetch(blob_repo, container: str, blob_path: str) -> Optional[Dict]:
+    """Download and parse one JSON sidecar; None on any failure."""
+    try:
+        content = blob_repo.read_blob(container, blob_path)
+        return json.loads(content.decode("utf-8", errors="replace"))
+    except Exception as exc:
+        logger.warning("sidecar prefetch: failed to read JSON %s: %s", blob_path, exc)
+        return None
+
+
+def prefetch_json_sidecars(
+    blob_repo,
+    container: str,
+    blobs: Iterable[Tuple[str, Optional[str]]],
+    max_workers: int = DEFAULT_SIDECAR_WORKERS,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Fetch and parse JSON sidecars in parallel, reusing cached results.
+
+    Args:
+        blob_repo: BlobRepository for the zone holding `container`.
+        container: Source container.
+        blobs: (blob_path, etag) pairs; etag may be None (never cached).
+        max_workers: Upper bound on concurrent blob reads.
+        use_cache: Read and write the on-mount ETag cache.
+
+    Returns:
+        {"metadata": {blob_path: dict_or_None}, "cache_hits": int,
+         "fetched": int, "failed": int}
+    """
+    cache_dir = sidecar_cache_dir(container) if use_cache else None
+
+    metadata: Dict[str, Optional[Dict]] = {}
+    to_fetch: Dict[str, Optional[str]] = {}
+    for blob_path, etag in blobs:
+        if cache_dir and etag:
+            hit, cached = _read_cached(cache_dir, blob_path, etag)
+            if hit:
+                metadata[blob_path] = cached
+                continue
+        to_fetch[blob_path] = etag
+    cache_hits = len(metadata)
+
+    failed = 0
+    if to_fetch:
+        workers = max(1, min(max_workers, len(to_fetch)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sidecar") as executor:
+            futures = {
+                executor.submit(_fetch, blob_repo, container, blob_path): blob_path
+                for blob_path in to_fetch
+            }
+            for future in as_completed(futures):
+                blob_path = futures[future]
+                parsed = future.result()
+                metadata[blob_path] = parsed
+                if parsed is None:
+                    failed += 1
+                elif cache_dir and to_fetch[blob_path]:
+                    _write_cached(cache_dir, blob_path, to_fetch[blob_path], parsed)
+
+    logger.info(
+        "sidecar prefetch: %d sidecars from %s (%d cached, %d fetched, %d failed)",
+        len(metadata), container, cache_hits, len(to_fetch), failed,
+    )
+    return {
+        "metadata": metadata,
+        "cache_hits": cache_hits,
+        "fetched": len(to_fetch),
+        "failed": failed,
+    }
+
+
+__all__ = [
+    'prefetch_json_sidecars',
+    'sidecar_cache_dir',
+    'DEFAULT_SIDECAR_WORKERS',
+]
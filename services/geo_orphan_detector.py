@@ -4,9 +4,9 @@
 # EPOCH: 4 - ACTIVE
 # STATUS: Service - Geo schema orphan detection
 # PURPOSE: Detect orphaned tables and metadata in geo schema
-# LAST_REVIEWED: 14 MAR 2026
+# LAST_REVIEWED: 18 OCT 2026
 # EXPORTS: GeoOrphanDetector, geo_orphan_detector
-# DEPENDENCIES: infrastructure.factory
+# DEPENDENCIES: infrastructure.factory, services.table_maintenance
 # ============================================================================
 """
 Geo Orphan Detector.
@@ -21,12 +21,15 @@ Exports:
 
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from psycopg import sql
 
 logger = logging.getLogger(__name__)
 
+# geo schema tables that are infrastructure, not published datasets
+_SYSTEM_TABLES = frozenset({'table_catalog', 'table_metadata', 'feature_collection_styles'})
+
 
 class GeoOrphanDetector:
     """
@@ -59,13 +62,25 @@ class GeoOrphanDetector:
             self._db_repo = repos['job_repo']
         return self._db_repo
 
-    def run(self) -> Dict[str, Any]:
+    def run(self, exact_counts: bool = False) -> Dict[str, Any]:
         """
         Run orphan detection and return report.
 
+        Tables, sizes, row estimates, dead-tuple ratios and catalog linkage
+        come from one catalog-statistics query (query_table_inventory); no
+        geo table is scanned. Row counts are the planner's estimates unless
+        *exact_counts* is set, which runs COUNT(*) on the orphaned tables
+        only.
+
+        Args:
+            exact_counts: Replace orphaned tables' estimated row counts with
+                exact COUNT(*) results.
+
         Returns:
             Dict with orphaned tables, orphaned metadata, and summary.
         """
+        from services.table_maintenance import query_table_inventory
+
         start_time = datetime.now(timezone.utc)
 
         result = {
@@ -74,48 +89,40 @@ class GeoOrphanDetector:
             "orphaned_tables": [],
             "orphaned_metadata": [],
             "tracked_tables": [],
+            "tables_needing_vacuum": [],
+            "row_counts": "exact" if exact_counts else "estimated",
             "summary": {}
         }
 
         try:
             with self.db_repo._get_connection() as conn:
                 with conn.cursor() as cur:
-                    # Step 1: Get all tables in geo schema (excluding system tables)
-                    cur.execute("""
-                        SELECT table_name
-                        FROM information_schema.tables
-                        WHERE table_schema = 'geo'
-                        AND table_type = 'BASE TABLE'
-                        AND table_name NOT IN ('table_catalog', 'table_metadata', 'feature_collection_styles')
-                        ORDER BY table_name
-                    """)
-                    geo_tables = set(row['table_name'] for row in cur.fetchall())
-
-                    # Step 2: Check if table_catalog exists
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT 1 FROM information_schema.tables
-                            WHERE table_schema = 'geo' AND table_name = 'table_catalog'
-                        )
-                    """)
+                    # Step 1: Does geo.table_catalog exist?
+                    cur.execute("SELECT to_regclass('geo.table_catalog') IS NOT NULL AS exists")
                     catalog_table_exists = cur.fetchone()['exists']
 
+                    # Step 2: One inventory query — relations FULL JOIN catalog
+                    inventory = query_table_inventory(
+                        cur, ['geo'],
+                        catalog_table='geo.table_catalog' if catalog_table_exists else None,
+                    )
+                    geo_entries = [
+                        t for t in inventory
+                        if t["exists"] and t["table"] not in _SYSTEM_TABLES
+                    ]
+                    geo_tables = {t["table"] for t in geo_entries}
+
                     if not catalog_table_exists:
                         logger.warning("GeoOrphanDetector: geo.table_catalog does not exist!")
-                        for table_name in sorted(geo_tables):
-                            try:
-                                cur.execute(sql.SQL('SELECT COUNT(*) FROM {}.{}').format(
-                                    sql.Identifier('geo'), sql.Identifier(table_name)
-                                ))
-                                row_count = cur.fetchone()['count']
-                            except Exception:
-                                row_count = None
-
-                            result["orphaned_tables"].append({
-                                "table_name": table_name,
-                                "row_count": row_count,
-                                "reason": "Table exists but geo.table_catalog does not exist"
-                            })
+                        result["orphaned_tables"] = [
+                            self._orphan_entry(
+                                t, "Table exists but geo.table_catalog does not exist"
+                            )
+                            for t in geo_entries
+                        ]
+                        if exact_counts:
+                            self._apply_exact_counts(cur, result["orphaned_tables"])
+                        result["tables_needing_vacuum"] = self._needing_vacuum(geo_entries)
 
                         result["summary"] = {
                             "total_geo_tables": len(geo_tables),
@@ -123,6 +130,8 @@ class GeoOrphanDetector:
                             "tracked": 0,
                             "orphaned_tables": len(geo_tables),
                             "orphaned_catalog": 0,
+                            "total_bytes": sum(t["total_bytes"] or 0 for t in geo_entries),
+                            "orphaned_bytes": sum(t["total_bytes"] or 0 for t in geo_entries),
                             "health_status": "ORPHANS_DETECTED" if geo_tables else "HEALTHY",
                             "catalog_table_missing": True
                         }
@@ -132,56 +141,42 @@ class GeoOrphanDetector:
                         )
                         return result
 
-                    # Step 3: Get all table names in catalog
-                    cur.execute("""
-                        SELECT table_name, created_at
-                        FROM geo.table_catalog
-                        ORDER BY table_name
-                    """)
-                    catalog_tables = {}
-                    for row in cur.fetchall():
-                        catalog_tables[row['table_name']] = {
-                            'created_at': row['created_at'].isoformat() if row.get('created_at') else None
-                        }
+                    # Step 3: Identify orphans from the joined inventory
+                    catalog_count = sum(1 for t in inventory if t["in_catalog"])
 
-                    catalog_names = set(catalog_tables.keys())
-
-                    # Step 4: Identify orphans
-                    orphaned_tables = geo_tables - catalog_names
-                    for table_name in sorted(orphaned_tables):
-                        try:
-                            cur.execute(sql.SQL('SELECT COUNT(*) FROM {}.{}').format(
-                                sql.Identifier('geo'), sql.Identifier(table_name)
-                            ))
-                            row_count = cur.fetchone()['count']
-                        except Exception:
-                            row_count = None
-
-                        result["orphaned_tables"].append({
-                            "table_name": table_name,
-                            "row_count": row_count,
-                            "reason": "Table exists in geo schema but has no catalog record"
-                        })
-
-                    orphaned_catalog = catalog_names - geo_tables
-                    for table_name in sorted(orphaned_catalog):
-                        cat = catalog_tables[table_name]
-                        result["orphaned_metadata"].append({
-                            "table_name": table_name,
-                            "created_at": cat['created_at'],
+                    result["orphaned_tables"] = [
+                        self._orphan_entry(
+                            t, "Table exists in geo schema but has no catalog record"
+                        )
+                        for t in geo_entries if not t["in_catalog"]
+                    ]
+                    if exact_counts:
+                        self._apply_exact_counts(cur, result["orphaned_tables"])
+
+                    result["orphaned_metadata"] = [
+                        {
+                            "table_name": t["table"],
+                            "created_at": t["catalog_created_at"],
                             "reason": "Catalog entry exists but table was dropped"
-                        })
+                        }
+                        for t in inventory if t["in_catalog"] and not t["exists"]
+                    ]
 
-                    tracked = geo_tables & catalog_names
-                    result["tracked_tables"] = sorted(tracked)
+                    result["tracked_tables"] = sorted(
+                        t["table"] for t in geo_entries if t["in_catalog"]
+                    )
+                    result["tables_needing_vacuum"] = self._needing_vacuum(geo_entries)
 
             # Build summary
             result["summary"] = {
                 "total_geo_tables": len(geo_tables),
-                "total_catalog_records": len(catalog_tables),
+                "total_catalog_records": catalog_count,
                 "tracked": len(result["tracked_tables"]),
                 "orphaned_tables": len(result["orphaned_tables"]),
                 "orphaned_catalog": len(result["orphaned_metadata"]),
+                "total_bytes": sum(t["total_bytes"] or 0 for t in geo_entries),
+                "orphaned_bytes": sum(t["total_bytes"] or 0 for t in result["orphaned_tables"]),
+                "tables_needing_vacuum": len(result["tables_needing_vacuum"]),
                 "health_status": "HEALTHY" if not result["orphaned_tables"] and not result["orphaned_metadata"] else "ORPHANS_DETECTED"
             }
 
@@ -214,6 +209,46 @@ class GeoOrphanDetector:
             )
             return result
 
+    @staticmethod
+    def _orphan_entry(table: Dict[str, Any], reason: str) -> Dict[str, Any]:
+        """Orphaned-table report entry from an inventory row (estimated row count)."""
+        return {
+            "table_name": table["table"],
+            "row_count": table["estimated_rows"],
+            "row_count_estimated": True,
+            "total_bytes": table["total_bytes"],
+            "dead_pct": table["dead_pct"],
+            "reason": reason
+        }
+
+    @staticmethod
+    def _apply_exact_counts(cur, orphaned_tables: List[Dict[str, Any]]) -> None:
+        """Replace estimated row counts with COUNT(*) — scans each orphaned table."""
+        for entry in orphaned_tables:
+            try:
+                cur.execute(sql.SQL('SELECT COUNT(*) FROM {}.{}').format(
+                    sql.Identifier('geo'), sql.Identifier(entry["table_name"])
+                ))
+                entry["row_count"] = cur.fetchone()['count']
+                entry["row_count_estimated"] = False
+            except Exception:
+                entry["row_count"] = None
+
+    @staticmethod
+    def _needing_vacuum(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Bloat summary for tables over the table_maintenance vacuum thresholds."""
+        return [
+            {
+                "table_name": t["table"],
+                "dead_tuples": t["dead_tuples"],
+                "dead_pct": t["dead_pct"],
+                "total_bytes": t["total_bytes"],
+                "last_autovacuum": t["last_autovacuum"],
+            }
+            for t in sorted(entries, key=lambda t: t["dead_tuples"], reverse=True)
+            if t["needs_vacuum"]
+        ]
+
 
 # Singleton instance for easy import
 geo_orphan_detector = GeoOrphanDetector()
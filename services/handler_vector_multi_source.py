@@ -16,6 +16,10 @@ Processes multi-source vector collections into PostGIS:
     P1 (multi-file): N files -> N PostGIS tables
     P3 (multi-layer): 1 GPKG with N layers -> N PostGIS tables
 
+Sources are processed concurrently on a bounded thread pool
+(VECTOR_MULTI_SOURCE_WORKERS). A failing source is recorded in
+failed_sources without aborting the others.
+
 Each source produces one table named:
     {base_table_name}_{slugified_source_suffix}_ord{version_ordinal}
 
@@ -33,7 +37,9 @@ Exports:
 import os
 import re
 import time
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -262,11 +268,13 @@ def vector_multi_source_complete(
     # Checkpoints for progress tracking
     checkpoints = []
     checkpoint_data = {}
+    checkpoint_lock = threading.Lock()
 
     def checkpoint(name: str, data: Dict[str, Any]):
-        """Record a checkpoint."""
-        checkpoints.append(name)
-        checkpoint_data[name] = data
+        """Record a checkpoint (called from source worker threads)."""
+        with checkpoint_lock:
+            checkpoints.append(name)
+            checkpoint_data[name] = data
         logger.info(f"[{job_id[:8]}] Checkpoint: {name}")
 
     try:
@@ -320,11 +328,8 @@ def vector_multi_source_complete(
             _refresh_tipg,
         )
 
-        table_results = []
-        total_features = 0
-        failed_sources = []
-
-        for idx, source in enumerate(sources):
+        def process_source(idx: int, source: Dict[str, Any]) -> Dict[str, Any]:
+            """Load, prepare, upload and register one source. Raises on failure."""
             source_id = source['source_identifier']
             source_suffix = _derive_source_suffix(source_id)
             current_table = _compute_table_name(
@@ -336,124 +341,157 @@ def vector_multi_source_complete(
                 f"{source_id} -> {schema}.{current_table}"
             )
 
-            try:
-                # ---------------------------------------------------------
-                # Step A: Load source file/layer
-                # ---------------------------------------------------------
-                converter_params = {}
-                if source['layer_name']:
-                    converter_params['layer_name'] = source['layer_name']
-
-                gdf, load_info = load_vector_source(
-                    blob_name=parameters.get('blob_name', source_id),
-                    container_name=parameters.get('container_name', config.storage.bronze.vectors),
-                    file_extension=source['file_extension'],
-                    converter_params=converter_params,
-                    job_id=job_id,
-                    mount_source_path=source['source_path'],
-                )
+            # ---------------------------------------------------------
+            # Step A: Load source file/layer
+            # ---------------------------------------------------------
+            converter_params = {}
+            if source['layer_name']:
+                converter_params['layer_name'] = source['layer_name']
+
+            gdf, load_info = load_vector_source(
+                blob_name=parameters.get('blob_name', source_id),
+                container_name=parameters.get('container_name', config.storage.bronze.vectors),
+                file_extension=source['file_extension'],
+                converter_params=converter_params,
+                job_id=job_id,
+                mount_source_path=source['source_path'],
+            )
 
-                logger.info(
-                    f"[{job_id[:8]}] Loaded {len(gdf):,} features from {source_id} "
-                    f"(CRS: {load_info.get('original_crs', 'unknown')})"
-                )
+            logger.info(
+                f"[{job_id[:8]}] Loaded {len(gdf):,} features from {source_id} "
+                f"(CRS: {load_info.get('original_crs', 'unknown')})"
+            )
+
+            # ---------------------------------------------------------
+            # Step B: Validate and prepare geometry
+            # ---------------------------------------------------------
+            geometry_params = parameters.get('geometry_params', {})
+            prepared_groups, validation_info, warnings = validate_and_prepare(
+                gdf=gdf,
+                geometry_params=geometry_params,
+                job_id=job_id,
+            )
 
-                # ---------------------------------------------------------
-                # Step B: Validate and prepare geometry
-                # ---------------------------------------------------------
-                geometry_params = parameters.get('geometry_params', {})
-                prepared_groups, validation_info, warnings = validate_and_prepare(
-                    gdf=gdf,
-                    geometry_params=geometry_params,
-                    job_id=job_id,
+            # For multi-source, each source produces one table.
+            # If geometry split occurs within a source, use primary group.
+            if len(prepared_groups) > 1:
+                logger.warning(
+                    f"[{job_id[:8]}] Source '{source_id}' has mixed geometry types "
+                    f"({list(prepared_groups.keys())}). Using largest group."
                 )
+                # Pick the group with the most features
+                primary_suffix = max(prepared_groups, key=lambda k: len(prepared_groups[k]))
+                prepared_gdf = prepared_groups[primary_suffix]
+            else:
+                primary_suffix = list(prepared_groups.keys())[0]
+                prepared_gdf = prepared_groups[primary_suffix]
+
+            # ---------------------------------------------------------
+            # Step C: Process into PostGIS table
+            # ---------------------------------------------------------
+            table_result = _process_single_table(
+                gdf=prepared_gdf,
+                table_name=current_table,
+                schema=schema,
+                overwrite=overwrite,
+                parameters=parameters,
+                load_info=load_info,
+                job_id=job_id,
+                chunk_size=chunk_size,
+                checkpoint_fn=checkpoint,
+            )
 
-                # For multi-source, each source produces one table.
-                # If geometry split occurs within a source, use primary group.
-                if len(prepared_groups) > 1:
+            feature_count = table_result['total_rows']
+            geometry_type = table_result['geometry_type']
+
+            # ---------------------------------------------------------
+            # Step D: Register in release_tables junction
+            # ---------------------------------------------------------
+            if release_id:
+                try:
+                    from infrastructure import ReleaseTableRepository
+                    release_table_repo = ReleaseTableRepository()
+                    release_table_repo.create(
+                        release_id=release_id,
+                        table_name=current_table,
+                        geometry_type=geometry_type,
+                        feature_count=feature_count,
+                        table_role='multi_source',
+                        table_suffix=source_suffix,
+                    )
+                    logger.info(
+                        f"[{job_id[:8]}] Registered {current_table} in release_tables "
+                        f"(role=multi_source, suffix={source_suffix})"
+                    )
+                except Exception as rt_err:
                     logger.warning(
-                        f"[{job_id[:8]}] Source '{source_id}' has mixed geometry types "
-                        f"({list(prepared_groups.keys())}). Using largest group."
+                        f"[{job_id[:8]}] Failed to write release_tables for "
+                        f"{current_table} (non-fatal): {rt_err}"
                     )
-                    # Pick the group with the most features
-                    primary_suffix = max(prepared_groups, key=lambda k: len(prepared_groups[k]))
-                    prepared_gdf = prepared_groups[primary_suffix]
-                else:
-                    primary_suffix = list(prepared_groups.keys())[0]
-                    prepared_gdf = prepared_groups[primary_suffix]
-
-                # ---------------------------------------------------------
-                # Step C: Process into PostGIS table
-                # ---------------------------------------------------------
-                table_result = _process_single_table(
-                    gdf=prepared_gdf,
-                    table_name=current_table,
-                    schema=schema,
-                    overwrite=overwrite,
-                    parameters=parameters,
-                    load_info=load_info,
-                    job_id=job_id,
-                    chunk_size=chunk_size,
-                    checkpoint_fn=checkpoint,
-                )
 
-                feature_count = table_result['total_rows']
-                geometry_type = table_result['geometry_type']
-
-                # ---------------------------------------------------------
-                # Step D: Register in release_tables junction
-                # ---------------------------------------------------------
-                if release_id:
-                    try:
-                        from infrastructure import ReleaseTableRepository
-                        release_table_repo = ReleaseTableRepository()
-                        release_table_repo.create(
-                            release_id=release_id,
-                            table_name=current_table,
-                            geometry_type=geometry_type,
-                            feature_count=feature_count,
-                            table_role='multi_source',
-                            table_suffix=source_suffix,
-                        )
-                        logger.info(
-                            f"[{job_id[:8]}] Registered {current_table} in release_tables "
-                            f"(role=multi_source, suffix={source_suffix})"
-                        )
-                    except Exception as rt_err:
-                        logger.warning(
-                            f"[{job_id[:8]}] Failed to write release_tables for "
-                            f"{current_table} (non-fatal): {rt_err}"
-                        )
-
-                # Track result
-                crs_str = load_info.get('original_crs', 'EPSG:4326')
-                table_results.append({
-                    "table_name": current_table,
-                    "source": source_id,
-                    "feature_count": feature_count,
-                    "geometry_type": geometry_type,
-                    "crs": crs_str,
-                })
-                total_features += feature_count
-
-                checkpoint(f"source_complete_{idx}", {
-                    "source": source_id,
-                    "table_name": current_table,
-                    "feature_count": feature_count,
-                    "geometry_type": geometry_type,
-                })
-
-            except Exception as source_err:
-                logger.error(
-                    f"[{job_id[:8]}] Failed to process source '{source_id}': "
-                    f"{type(source_err).__name__}: {source_err}\n"
-                    f"{traceback.format_exc()}"
+            crs_str = load_info.get('original_crs', 'EPSG:4326')
+            checkpoint(f"source_complete_{idx}", {
+                "source": source_id,
+                "table_name": current_table,
+                "feature_count": feature_count,
+                "geometry_type": geometry_type,
+            })
+            return {
+                "table_name": current_table,
+                "source": source_id,
+                "feature_count": feature_count,
+                "geometry_type": geometry_type,
+                "crs": crs_str,
+            }
+
+        # Sources are independent (own table, own connection), so they run on
+        # a bounded pool: wall time tracks the largest source rather than the
+        # sum. Pool size caps concurrent GeoDataFrames in memory and
+        # concurrent PostGIS connections.
+        max_workers = min(config.vector.multi_source_workers, source_count)
+        logger.info(
+            f"[{job_id[:8]}] Processing {source_count} source(s) with "
+            f"{max_workers} worker(s)"
+        )
+
+        results_by_idx: Dict[int, Dict[str, Any]] = {}
+        failures_by_idx: Dict[int, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="multi-source"
+        ) as executor:
+            futures = {
+                executor.submit(process_source, idx, source): (idx, source)
+                for idx, source in enumerate(sources)
+            }
+            for future in as_completed(futures):
+                idx, source = futures[future]
+                source_id = source['source_identifier']
+                try:
+                    results_by_idx[idx] = future.result()
+                except Exception as source_err:
+                    # Failure isolation: record and let the other sources finish
+                    tb = traceback.format_exception(
+                        type(source_err), source_err, source_err.__traceback__
+                    )
+                    logger.error(
+                        f"[{job_id[:8]}] Failed to process source '{source_id}': "
+                        f"{type(source_err).__name__}: {source_err}\n{''.join(tb)}"
+                    )
+                    failures_by_idx[idx] = {
+                        "source": source_id,
+                        "error": str(source_err),
+                        "error_type": type(source_err).__name__,
+                    }
+                done = len(results_by_idx) + len(failures_by_idx)
+                logger.info(
+                    f"[{job_id[:8]}] Sources finished: {done}/{source_count} "
+                    f"({len(failures_by_idx)} failed)"
                 )
-                failed_sources.append({
-                    "source": source_id,
-                    "error": str(source_err),
-                    "error_type": type(source_err).__name__,
-                })
+
+        # Report tables and failures in source order regardless of completion order
+        table_results = [results_by_idx[i] for i in sorted(results_by_idx)]
+        failed_sources = [failures_by_idx[i] for i in sorted(failures_by_idx)]
+        total_features = sum(t['feature_count'] for t in table_results)
 
         # =================================================================
         # PHASE 3: TiPG refresh (ONCE for all tables)
@@ -508,6 +546,7 @@ def vector_multi_source_complete(
             "tables_created": len(table_results),
             "failed_sources": failed_sources if failed_sources else None,
             "mode": mode,
+            "source_workers": max_workers,
             "schema": schema,
             "base_table_name": base_table_name,
             "version_ordinal": version_ordinal,
@@ -3,7 +3,7 @@
 # ============================================================================
 # STATUS: Services - Geographic country attribution for STAC items
 # PURPOSE: Query PostGIS admin0 boundaries to determine country intersection
-# LAST_REVIEWED: 04 JAN 2026
+# LAST_REVIEWED: 18 OCT 2026
 # REVIEW_STATUS: Checks 1-7 Applied (Check 8 N/A - no infrastructure config)
 # ============================================================================
 """
@@ -17,20 +17,54 @@ Features:
     - Fallback to first intersecting country
     - Graceful degradation when admin0 table unavailable
     - Support for both bbox and GeoJSON geometry inputs
+    - Batch attribution: many bboxes resolved by one set-based spatial join
+    - Admin0 table resolution (promoted table + column probe) cached per
+      process for STACDefaults.ISO3_ADMIN0_CACHE_TTL_SECONDS
 
 Exports:
     ISO3Attribution: Result dataclass
     ISO3AttributionService: Attribution query service
+    get_geo_properties_for_bbox(es): GeoProperties for STAC builders
+    invalidate_admin0_cache: Drop the cached admin0 table resolution
 """
 
 import logging
+import threading
+import time
 import traceback
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
+
+from config.defaults import STACDefaults
+
+if TYPE_CHECKING:
+    from core.models.stac import GeoProperties
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _Admin0Layout:
+    """Resolved admin0 table and the columns attribution reads."""
+    schema: str
+    table: str
+    geom_col: str
+    name_col: Optional[str]
+
+
+# Per-process cache: table override (or None for the promoted table) ->
+# (expires_at, layout). A None layout records "attribution unavailable" so a
+# missing table is not re-probed for every item either.
+_layout_cache: Dict[Optional[str], Tuple[float, Optional[_Admin0Layout]]] = {}
+_layout_lock = threading.Lock()
+
+
+def invalidate_admin0_cache() -> None:
+    """Forget cached admin0 resolutions (e.g. after promoting a new admin0 table)."""
+    with _layout_lock:
+        _layout_cache.clear()
+
+
 @dataclass
 class ISO3Attribution:
     """
@@ -161,6 +195,176 @@ class ISO3AttributionService:
             available=available
         )
 
+    def _resolve_layout(self, cur) -> Optional[_Admin0Layout]:
+        """
+        Probe information_schema for the admin0 table and its columns.
+
+        Returns:
+            _Admin0Layout, or None if the table or a required column is missing
+        """
+        admin0_table = self.admin0_table
+        schema, table = self._parse_table_path(admin0_table)
+
+        cur.execute("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s
+            AND column_name IN ('iso3', 'name_en', 'name', 'geom', 'geometry')
+        """, (schema, table))
+        columns = [row['column_name'] for row in cur.fetchall()]
+
+        if not columns:
+            logger.debug(f"   Admin0 table {admin0_table} not found - skipping country attribution")
+            return None
+
+        if 'iso3' not in columns:
+            logger.warning("   Admin0 table missing 'iso3' column - skipping country attribution")
+            return None
+
+        # Determine geometry column name
+        geom_col = 'geom' if 'geom' in columns else 'geometry' if 'geometry' in columns else None
+        if not geom_col:
+            logger.warning("   Admin0 table missing geometry column - skipping country attribution")
+            return None
+
+        # Determine name column
+        name_col = 'name_en' if 'name_en' in columns else 'name' if 'name' in columns else None
+
+        return _Admin0Layout(schema=schema, table=table, geom_col=geom_col, name_col=name_col)
+
+    def _get_layout(self, cur) -> Optional[_Admin0Layout]:
+        """Cached _resolve_layout (per process, TTL-bounded)."""
+        key = self._admin0_table
+        now = time.monotonic()
+        with _layout_lock:
+            cached = _layout_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        try:
+            layout = self._resolve_layout(cur)
+        except ValueError as e:
+            # No promoted admin0 dataset - cache the miss like a missing table
+            logger.warning(f"   ⚠️  Country attribution unavailable: {e}")
+            layout = None
+
+        with _layout_lock:
+            _layout_cache[key] = (now + STACDefaults.ISO3_ADMIN0_CACHE_TTL_SECONDS, layout)
+        return layout
+
+    def _attribution_query(self, layout: _Admin0Layout):
+        """Set-based intersect + centroid query over an unnest()ed bbox list."""
+        from psycopg import sql
+
+        name_expr = (
+            sql.SQL("a.{}").format(sql.Identifier(layout.name_col)) if layout.name_col else sql.SQL("NULL")
+        )
+        return sql.SQL("""
+            SELECT b.idx,
+                   a.iso3,
+                   {name_expr} AS country_name,
+                   ST_Contains(
+                       a.{geom},
+                       ST_SetSRID(ST_MakePoint((b.minx + b.maxx) / 2, (b.miny + b.maxy) / 2), 4326)
+                   ) AS contains_centroid
+            FROM unnest(%s::int[], %s::float8[], %s::float8[], %s::float8[], %s::float8[])
+                 AS b(idx, minx, miny, maxx, maxy)
+            JOIN {schema}.{table} a
+              ON ST_Intersects(a.{geom}, ST_MakeEnvelope(b.minx, b.miny, b.maxx, b.maxy, 4326))
+            ORDER BY b.idx, a.iso3
+        """).format(
+            name_expr=name_expr,
+            geom=sql.Identifier(layout.geom_col),
+            schema=sql.Identifier(layout.schema),
+            table=sql.Identifier(layout.table),
+        )
+
+    @staticmethod
+    def _build_attribution(rows: List[Dict[str, Any]]) -> ISO3Attribution:
+        """Fold the joined rows of one bbox into an ISO3Attribution."""
+        if not rows:
+            # Table exists, just no intersections (e.g., ocean)
+            return ISO3Attribution(available=True)
+
+        iso3_codes = [row['iso3'] for row in rows if row['iso3']]
+        countries = [row['country_name'] for row in rows if row['country_name']]
+
+        primary_iso3 = None
+        attribution_method = None
+
+        centroid_iso3 = next((row['iso3'] for row in rows if row['contains_centroid'] and row['iso3']), None)
+        if centroid_iso3:
+            primary_iso3 = centroid_iso3
+            attribution_method = 'centroid'
+        elif iso3_codes:
+            # Fallback: Use first intersecting country
+            primary_iso3 = iso3_codes[0]
+            attribution_method = 'first_intersect'
+
+        return ISO3Attribution(
+            iso3_codes=iso3_codes,
+            primary_iso3=primary_iso3,
+            countries=countries,
+            attribution_method=attribution_method,
+            available=True
+        )
+
+    def get_attribution_for_bboxes(self, bboxes: List[List[float]]) -> List[ISO3Attribution]:
+        """
+        Get ISO3 attribution for many bounding boxes in one round trip.
+
+        All bboxes are joined against admin0 in a single set-based query
+        (chunked at STACDefaults.ISO3_BATCH_SIZE), so bulk STAC builds pay
+        one database round trip per chunk instead of several per item.
+
+        Args:
+            bboxes: List of [minx, miny, maxx, maxy] in EPSG:4326
+
+        Returns:
+            ISO3Attribution per input bbox, in input order. Invalid bboxes
+            (and every bbox, when admin0 is unavailable) get available=False.
+        """
+        results = [self._empty_result(available=False) for _ in bboxes]
+        valid = []
+        for idx, bbox in enumerate(bboxes):
+            if bbox and len(bbox) == 4:
+                valid.append(idx)
+            else:
+                logger.warning(f"   ⚠️  Invalid bbox for country attribution: {bbox}")
+        if not valid:
+            return results
+
+        try:
+            with self.repo._get_connection() as conn:
+                with conn.cursor() as cur:
+                    layout = self._get_layout(cur)
+                    if layout is None:
+                        return results
+
+                    query = self._attribution_query(layout)
+                    batch_size = STACDefaults.ISO3_BATCH_SIZE
+                    for start in range(0, len(valid), batch_size):
+                        chunk = valid[start:start + batch_size]
+                        cur.execute(query, (
+                            chunk,
+                            [float(bboxes[i][0]) for i in chunk],
+                            [float(bboxes[i][1]) for i in chunk],
+                            [float(bboxes[i][2]) for i in chunk],
+                            [float(bboxes[i][3]) for i in chunk],
+                        ))
+                        rows_by_idx: Dict[int, List[Dict[str, Any]]] = {i: [] for i in chunk}
+                        for row in cur.fetchall():
+                            rows_by_idx[row['idx']].append(row)
+                        for idx, rows in rows_by_idx.items():
+                            results[idx] = self._build_attribution(rows)
+
+            logger.debug(f"   Country attribution: {len(valid)} bboxes resolved in batch")
+            return results
+
+        except Exception as e:
+            logger.warning(f"   ⚠️  Country attribution failed (non-fatal): {e}")
+            logger.debug(f"   Traceback:\n{traceback.format_exc()}")
+            return [self._empty_result(available=False) for _ in bboxes]
+
     def get_attribution_for_bbox(self, bbox: List[float]) -> ISO3Attribution:
         """
         Get ISO3 country codes for geometries intersecting the bounding box.
@@ -187,123 +391,7 @@ class ISO3AttributionService:
             Returns available=False if admin0 table is not populated or query fails.
             This is graceful degradation - STAC items can be created without country codes.
         """
-        if not bbox or len(bbox) != 4:
-            logger.warning(f"   ⚠️  Invalid bbox for country attribution: {bbox}")
-            return self._empty_result(available=False)
-
-        try:
-            admin0_table = self.admin0_table
-            schema, table = self._parse_table_path(admin0_table)
-
-            with self.repo._get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Check if table exists
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT 1 FROM information_schema.tables
-                            WHERE table_schema = %s AND table_name = %s
-                        ) as table_exists
-                    """, (schema, table))
-                    if not cur.fetchone()['table_exists']:
-                        logger.debug(f"   Admin0 table {admin0_table} not found - skipping country attribution")
-                        return self._empty_result(available=False)
-
-                    # Check for required columns
-                    cur.execute("""
-                        SELECT column_name FROM information_schema.columns
-                        WHERE table_schema = %s AND table_name = %s
-                        AND column_name IN ('iso3', 'name_en', 'name', 'geom', 'geometry')
-                    """, (schema, table))
-                    columns = [row['column_name'] for row in cur.fetchall()]
-
-                    if 'iso3' not in columns:
-                        logger.warning(f"   Admin0 table missing 'iso3' column - skipping country attribution")
-                        return self._empty_result(available=False)
-
-                    # Determine geometry column name
-                    geom_col = 'geom' if 'geom' in columns else 'geometry' if 'geometry' in columns else None
-                    if not geom_col:
-                        logger.warning(f"   Admin0 table missing geometry column - skipping country attribution")
-                        return self._empty_result(available=False)
-
-                    # Determine name column
-                    name_col = 'name_en' if 'name_en' in columns else 'name' if 'name' in columns else None
-
-                    minx, miny, maxx, maxy = bbox
-
-                    # Query 1: Get all intersecting countries
-                    name_select = f", {name_col}" if name_col else ""
-                    intersect_query = f"""
-                        SELECT iso3{name_select}
-                        FROM {schema}.{table}
-                        WHERE ST_Intersects(
-                            {geom_col},
-                            ST_MakeEnvelope(%s, %s, %s, %s, 4326)
-                        )
-                        ORDER BY iso3
-                    """
-                    cur.execute(intersect_query, (minx, miny, maxx, maxy))
-                    results = cur.fetchall()
-
-                    if not results:
-                        logger.debug(f"   No countries found for bbox {bbox} - may be in ocean")
-                        return ISO3Attribution(
-                            iso3_codes=[],
-                            primary_iso3=None,
-                            countries=[],
-                            attribution_method=None,
-                            available=True  # Table exists, just no intersections (e.g., ocean)
-                        )
-
-                    iso3_codes = [row['iso3'] for row in results if row['iso3']]
-                    countries = []
-                    if name_col:
-                        countries = [row.get(name_col, '') for row in results if row.get(name_col)]
-
-                    # Query 2: Get primary country (centroid method)
-                    centroid_x = (minx + maxx) / 2
-                    centroid_y = (miny + maxy) / 2
-
-                    centroid_query = f"""
-                        SELECT iso3
-                        FROM {schema}.{table}
-                        WHERE ST_Contains(
-                            {geom_col},
-                            ST_SetSRID(ST_MakePoint(%s, %s), 4326)
-                        )
-                        LIMIT 1
-                    """
-                    cur.execute(centroid_query, (centroid_x, centroid_y))
-                    centroid_result = cur.fetchone()
-
-                    primary_iso3 = None
-                    attribution_method = None
-
-                    if centroid_result and centroid_result['iso3']:
-                        primary_iso3 = centroid_result['iso3']
-                        attribution_method = 'centroid'
-                    elif iso3_codes:
-                        # Fallback: Use first intersecting country
-                        primary_iso3 = iso3_codes[0]
-                        attribution_method = 'first_intersect'
-
-                    logger.debug(
-                        f"   Country attribution: {len(iso3_codes)} countries found, "
-                        f"primary={primary_iso3} ({attribution_method})"
-                    )
-
-                    return ISO3Attribution(
-                        iso3_codes=iso3_codes,
-                        primary_iso3=primary_iso3,
-                        countries=countries,
-                        attribution_method=attribution_method,
-                        available=True
-                    )
-
-        except Exception as e:
-            logger.warning(f"   ⚠️  Country attribution failed (non-fatal): {e}")
-            logger.debug(f"   Traceback:\n{traceback.format_exc()}")
-            return self._empty_result(available=False)
+        return self.get_attribution_for_bboxes([bbox])[0]
 
     def get_attribution_for_geometry(self, geometry: Dict[str, Any]) -> ISO3Attribution:
         """
@@ -341,6 +429,26 @@ class ISO3AttributionService:
             logger.debug(f"   Traceback:\n{traceback.format_exc()}")
             return self._empty_result(available=False)
 
+    def get_attribution_for_geometries(self, geometries: List[Dict[str, Any]]) -> List[ISO3Attribution]:
+        """
+        Get ISO3 attribution for many GeoJSON geometries in one round trip.
+
+        Each geometry is reduced to its bbox, then resolved via
+        get_attribution_for_bboxes.
+
+        Returns:
+            ISO3Attribution per input geometry, in input order
+        """
+        bboxes = []
+        for geometry in geometries:
+            try:
+                bbox = self._geometry_to_bbox(geometry) if geometry else None
+            except Exception as e:
+                logger.warning(f"   ⚠️  Geometry attribution failed (non-fatal): {e}")
+                bbox = None
+            bboxes.append(bbox)
+        return self.get_attribution_for_bboxes(bboxes)
+
     def _geometry_to_bbox(self, geometry: Dict[str, Any]) -> Optional[List[float]]:
         """
         Extract bounding box from GeoJSON geometry.
@@ -394,21 +502,43 @@ def get_geo_properties_for_bbox(bbox: List[float]) -> Optional['GeoProperties']:
     Returns:
         GeoProperties if attribution succeeded, None otherwise
     """
+    return get_geo_properties_for_bboxes([bbox])[0]
+
+
+def get_geo_properties_for_bboxes(bboxes: List[List[float]]) -> List[Optional['GeoProperties']]:
+    """
+    Batch form of get_geo_properties_for_bbox: one attribution round trip
+    for a whole list of bboxes (e.g. every tile of a collection).
+
+    Returns:
+        GeoProperties or None per input bbox, in input order
+    """
+    results: List[Optional['GeoProperties']] = [None] * len(bboxes)
     try:
         from core.models.stac import GeoProperties
-        service = ISO3AttributionService()
-        if bbox and len(bbox) >= 4:
-            attribution = service.get_attribution_for_bbox(bbox)
+        valid = [i for i, bbox in enumerate(bboxes) if bbox and len(bbox) >= 4]
+        if not valid:
+            return results
+        attributions = ISO3AttributionService().get_attribution_for_bboxes(
+            [list(bboxes[i][:4]) for i in valid]
+        )
+        for idx, attribution in zip(valid, attributions):
             if attribution and attribution.available:
-                return GeoProperties(
+                results[idx] = GeoProperties(
                     iso3=attribution.iso3_codes or [],
                     primary_iso3=attribution.primary_iso3,
                     countries=attribution.countries or [],
                 )
     except Exception as e:
         logger.warning(f"ISO3 attribution failed (non-fatal): {e}")
-    return None
+    return results
 
 
 # Export the service class and result dataclass
-__all__ = ['ISO3Attribution', 'ISO3AttributionService', 'get_geo_properties_for_bbox']
+__all__ = [
+    'ISO3Attribution',
+    'ISO3AttributionService',
+    'get_geo_properties_for_bbox',
+    'get_geo_properties_for_bboxes',
+    'invalidate_admin0_cache',
+]
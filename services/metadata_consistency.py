@@ -17,7 +17,7 @@ Enforces unified metadata architecture integrity across:
 
 Tier 1 Checks (this service - frequent, lightweight):
 - Database cross-reference integrity
-- Blob existence via HEAD request
+- Blob existence via listing-based reconciliation (services.blob_reconciliation)
 - STAC ↔ Metadata bidirectional linkage
 
 Tier 2 Checks (CoreMachine job - infrequent, thorough):
@@ -51,6 +51,9 @@ from util_logger import LoggerFactory, ComponentType
 
 logger = LoggerFactory.create_logger(ComponentType.SERVICE, "MetadataConsistency")
 
+# Cap per-check issue detail; totals are always reported in full
+MAX_ISSUES_PER_CHECK = 500
+
 
 class MetadataConsistencyChecker:
     """
@@ -525,9 +528,16 @@ class MetadataConsistencyChecker:
         """
         Verify COGs in app.cog_metadata actually exist in blob storage.
 
-        Uses HEAD request only (cheap operation).
-        Checks most recent 100 COGs to catch recent issues.
+        Listing-based reconciliation: each silver container referenced by
+        app.cog_metadata is listed once (cached across timer runs by
+        BlobReconciler) and set-differenced against all rows, instead of one
+        HEAD request per COG. Also reports .tif blobs with no metadata row.
+
+        Rows created after the listing started are skipped (inconclusive),
+        and per-issue detail is capped at MAX_ISSUES_PER_CHECK.
         """
+        from services.blob_reconciliation import get_blob_reconciler
+
         check = {
             "name": "raster_blob_exists",
             "description": "COG metadata with missing blob files",
@@ -542,34 +552,78 @@ class MetadataConsistencyChecker:
         try:
             with self.db_repo._get_connection() as conn:
                 with conn.cursor() as cur:
-                    # Get recent COG records
                     cur.execute("""
-                        SELECT cog_id, container, blob_path
+                        SELECT cog_id, container, blob_path, created_at
                         FROM app.cog_metadata
-                        ORDER BY created_at DESC
-                        LIMIT 100
                     """)
                     cogs = cur.fetchall()
 
             check["scanned"] = len(cogs)
 
-            # Check each blob exists (HEAD only)
+            by_container: Dict[str, Dict[str, Dict[str, Any]]] = {}
             for cog in cogs:
+                by_container.setdefault(cog["container"], {})[cog["blob_path"]] = cog
+
+            reconciler = get_blob_reconciler()
+            missing_total = 0
+            orphaned_total = 0
+            check["containers"] = {}
+
+            for container, rows in by_container.items():
                 try:
-                    exists = self._blob_exists(cog["container"], cog["blob_path"])
-                    if not exists:
-                        check["issues"].append({
-                            "type": "raster_blob_missing",
-                            "cog_id": cog["cog_id"],
-                            "container": cog["container"],
-                            "blob_path": cog["blob_path"],
-                            "message": "COG metadata exists but blob not found in storage"
-                        })
+                    diff = reconciler.reconcile("silver", container, rows.keys())
                 except Exception as e:
                     # Log but don't fail entire check
-                    logger.warning(
-                        f"Could not verify blob {cog['container']}/{cog['blob_path']}: {e}"
-                    )
+                    logger.warning(f"Could not list container {container}: {e}")
+                    check["containers"][container] = {"error": str(e)}
+                    continue
+
+                listed_at = datetime.fromisoformat(diff["listed_at"])
+                missing = []
+                for path in diff["missing"]:
+                    created_at = rows[path].get("created_at")
+                    if created_at is not None and created_at.tzinfo is None:
+                        created_at = created_at.replace(tzinfo=timezone.utc)
+                    if created_at is None or created_at < listed_at:
+                        missing.append(rows[path])
+                orphaned = [
+                    name for name in diff["unexpected"]
+                    if name.lower().endswith((".tif", ".tiff"))
+                ]
+                missing_total += len(missing)
+                orphaned_total += len(orphaned)
+                check["containers"][container] = {
+                    "expected": diff["expected_count"],
+                    "listed": diff["listed_count"],
+                    "missing": len(missing),
+                    "orphaned_blobs": len(orphaned),
+                    "listed_at": diff["listed_at"],
+                }
+
+                for cog in missing:
+                    if len(check["issues"]) >= MAX_ISSUES_PER_CHECK:
+                        break
+                    check["issues"].append({
+                        "type": "raster_blob_missing",
+                        "cog_id": cog["cog_id"],
+                        "container": container,
+                        "blob_path": cog["blob_path"],
+                        "message": "COG metadata exists but blob not found in storage"
+                    })
+                for name in orphaned:
+                    if len(check["issues"]) >= MAX_ISSUES_PER_CHECK:
+                        break
+                    check["issues"].append({
+                        "type": "raster_blob_orphaned",
+                        "container": container,
+                        "blob_path": name,
+                        "message": "COG blob exists in storage but has no app.cog_metadata row"
+                    })
+
+            check["missing_count"] = missing_total
+            check["orphaned_blob_count"] = orphaned_total
+            if missing_total + orphaned_total > len(check["issues"]):
+                check["issues_truncated"] = True
 
         except Exception as e:
             check["error"] = str(e)
@@ -577,25 +631,6 @@ class MetadataConsistencyChecker:
 
         return check
 
-    def _blob_exists(self, container: str, blob_path: str) -> bool:
-        """
-        Check if blob exists using HEAD request (cheap operation).
-
-        Args:
-            container: Azure storage container name
-            blob_path: Path within container
-
-        Returns:
-            True if blob exists, False otherwise
-        """
-        try:
-            from infrastructure.blob_storage import BlobStorageRepository
-            repo = BlobStorageRepository(container)
-            return repo.blob_exists(blob_path)
-        except Exception as e:
-            logger.debug(f"Blob existence check failed for {container}/{blob_path}: {e}")
-            return False  # Assume missing on error
-
     # =========================================================================
     # HELPER METHODS
     # =========================================================================
@@ -39,7 +39,7 @@ Dependencies:
     infrastructure.PgStacRepository: STAC catalog queries
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from urllib.parse import quote_plus
 import logging
 
@@ -605,6 +605,7 @@ class PlatformCatalogService:
 
         # Generate TiPG URLs
         tile_urls = self._config.generate_vector_tile_urls(table_name, schema="geo") if table_name else {}
+        generalized, overview = self._generalized_tile_levels(table_name) if table_name else ([], None)
 
         return {
             "found": True,
@@ -628,12 +629,18 @@ class PlatformCatalogService:
                 "schema": "geo",
                 "endpoints": {
                     "features": f"/api/features/collections/{table_name}/items" if table_name else None,
-                    "collection": f"/api/features/collections/{table_name}" if table_name else None
+                    "collection": f"/api/features/collections/{table_name}" if table_name else None,
+                    # Generalized collection sized for a whole-extent request;
+                    # None means query the table itself
+                    "overview_features": overview
                 },
                 "tiles": {
                     "mvt": tile_urls.get('mvt'),
                     "tilejson": tile_urls.get('tilejson'),
-                    "viewer": f"/api/interface/vector-tiles?collection=geo.{table_name}" if table_name else None
+                    "viewer": f"/api/interface/vector-tiles?collection=geo.{table_name}" if table_name else None,
+                    # Simplified collections for low zooms; clients use the
+                    # entry whose zoom range covers the view, else the table
+                    "generalized": generalized
                 }
             },
 
@@ -653,6 +660,61 @@ class PlatformCatalogService:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
+    def _generalized_tile_levels(
+        self, table_name: str, schema: str = "geo"
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        TiPG URLs for a table's generalized {table}_z{N} levels.
+
+        Returns:
+            (levels, overview_features): one entry per level with tile and
+            features URLs, and the features URL of the level chosen for the
+            table's catalog bbox (None when no level fits, the bbox is
+            unknown, or the lookup fails)
+        """
+        try:
+            from infrastructure.postgresql import PostgreSQLRepository
+            from services.vector.generalization import list_generalized_levels
+
+            with PostgreSQLRepository()._get_connection() as conn:
+                levels = list_generalized_levels(conn, table_name, schema)
+                bbox = self._table_catalog_bbox(conn, table_name) if levels else None
+        except Exception as e:
+            logger.warning(f"Generalized level lookup failed for {schema}.{table_name}: {e}")
+            return [], None
+
+        from services.vector.generalization import select_generalized_level
+
+        def features_url(view_name: str) -> str:
+            # Same form as the table's own "features" endpoint
+            return f"/api/features/collections/{view_name}/items"
+
+        overview = select_generalized_level(levels, bbox=bbox) if bbox else None
+        return [
+            {
+                "collection": f"{schema}.{level['view_name']}",
+                "min_zoom": level["min_zoom"],
+                "max_zoom": level["max_zoom"],
+                "mvt": self._config.generate_vector_tile_urls(level["view_name"], schema=schema).get("tiles"),
+                "features": features_url(level["view_name"]),
+            }
+            for level in levels
+        ], (features_url(overview["view_name"]) if overview else None)
+
+    @staticmethod
+    def _table_catalog_bbox(conn, table_name: str) -> Optional[List[float]]:
+        """[minx, miny, maxx, maxy] from geo.table_catalog, or None if unset."""
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT bbox_minx, bbox_miny, bbox_maxx, bbox_maxy "
+                "FROM geo.table_catalog WHERE table_name = %s",
+                (table_name,)
+            )
+            row = cur.fetchone()
+        if not row or any(row[k] is None for k in ("bbox_minx", "bbox_miny", "bbox_maxx", "bbox_maxy")):
+            return None
+        return [row["bbox_minx"], row["bbox_miny"], row["bbox_maxx"], row["bbox_maxy"]]
+
     def _build_raster_response(self, asset: Dict[str, Any], release: Dict[str, Any]) -> Dict[str, Any]:
         """
         Build raster-specific response with TiTiler URLs.
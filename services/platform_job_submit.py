@@ -4,7 +4,9 @@
 # STATUS: Service layer - Job creation and Service Bus submission
 # PURPOSE: Create CoreMachine jobs and submit to processing queue
 # CREATED: 27 JAN 2026 (extracted from trigger_platform.py)
-# EXPORTS: create_and_submit_job, generate_unpublish_request_id, RASTER_JOB_FALLBACKS
+# EXPORTS: create_and_submit_job, create_and_submit_dag_run,
+#          create_and_submit_dag_runs_bulk, generate_unpublish_request_id,
+#          RASTER_JOB_FALLBACKS
 # DEPENDENCIES: infrastructure.JobRepository, infrastructure.ServiceBusRepository
 # ============================================================================
 """
@@ -15,6 +17,8 @@ Includes size-based fallback routing for raster jobs.
 
 Exports:
     create_and_submit_job: Create job record and submit to queue
+    create_and_submit_dag_run: Create one DAG workflow run
+    create_and_submit_dag_runs_bulk: Validate concurrently, create many DAG runs in one transaction
     generate_unpublish_request_id: Generate deterministic ID for unpublish operations
     RASTER_JOB_FALLBACKS: Mapping of job types to fallback alternatives
 """
@@ -23,7 +27,7 @@ import hashlib
 import json
 import logging
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from util_logger import LoggerFactory, ComponentType
 logger = LoggerFactory.create_logger(ComponentType.SERVICE, "platform_job_submit")
@@ -51,6 +55,10 @@ RASTER_JOB_FALLBACKS = {
     # 'process_raster_docker': None,
 }
 
+# Concurrent pre-flight validation threads for bulk DAG submission.
+# Validators are I/O bound (blob HEADs, DB lookups), so this can exceed CPU count.
+BULK_VALIDATION_WORKERS = 16
+
 
 def generate_unpublish_request_id(data_type: str, internal_id: str) -> str:
     """
@@ -293,6 +301,51 @@ def create_and_submit_dag_run(
             "Submit without workflow_engine=dag to use legacy CoreMachine."
         )
 
+    _prepare_dag_parameters(job_type, workflow_def, parameters, submission_ordinal)
+
+    # Create the run atomically
+    repo = WorkflowRunRepository()
+    initializer = DAGInitializer(repo)
+
+    try:
+        run = initializer.create_run(
+            workflow_def=workflow_def,
+            parameters=parameters,
+            platform_version=platform_version or __version__,
+            request_id=platform_request_id,
+            asset_id=asset_id,
+            release_id=release_id,
+        )
+        logger.info(
+            f"DAG run created: run_id={run.run_id[:16]}... "
+            f"workflow={job_type} request_id={platform_request_id}"
+        )
+
+        # Run is now PENDING in workflow_runs. DAG Brain's primary loop
+        # will discover it and drive orchestration. Function App does NOT
+        # spawn orchestrator threads — it only writes to the database.
+        return run.run_id
+
+    except Exception as e:
+        logger.error(f"Failed to create DAG run: {e}", exc_info=True)
+        raise RuntimeError(f"DAG run creation failed: {e}") from e
+
+
+def _prepare_dag_parameters(
+    job_type: str,
+    workflow_def,
+    parameters: Dict[str, Any],
+    submission_ordinal: int,
+) -> None:
+    """
+    Apply YAML defaults, inject the submission ordinal and run pre-flight validators.
+
+    Shared by create_and_submit_dag_run and create_and_submit_dag_runs_bulk.
+    Mutates parameters in place.
+
+    Raises:
+        ValueError: If a required parameter is missing or a validator fails
+    """
     # Apply ParameterDef defaults for any keys missing from job params.
     # The YAML workflow defines defaults (e.g., processing_options: {default: {}}).
     # If the caller omits them, the param resolver would fail with "key absent".
@@ -325,32 +378,98 @@ def create_and_submit_dag_run(
         if not result['valid']:
             raise ValueError(f"Pre-flight validation failed: {result['message']}")
 
-    # Create the run atomically
-    repo = WorkflowRunRepository()
-    initializer = DAGInitializer(repo)
 
-    try:
-        run = initializer.create_run(
-            workflow_def=workflow_def,
-            parameters=parameters,
-            platform_version=platform_version or __version__,
-            request_id=platform_request_id,
-            asset_id=asset_id,
-            release_id=release_id,
-        )
-        logger.info(
-            f"DAG run created: run_id={run.run_id[:16]}... "
-            f"workflow={job_type} request_id={platform_request_id}"
+def create_and_submit_dag_runs_bulk(
+    submissions: List[Dict[str, Any]],
+    max_workers: int = BULK_VALIDATION_WORKERS,
+) -> List[Dict[str, Any]]:
+    """
+    Create many DAG workflow runs with concurrent validation and one bulk insert.
+
+    Bulk counterpart of create_and_submit_dag_run for discovery manifests.
+    Pre-flight validators (blob HEADs, container checks) run concurrently in a
+    bounded thread pool; every entry that passes is then written through
+    DAGInitializer.create_runs_bulk in a single transaction of multi-row
+    INSERTs rather than one transaction per run.
+
+    Args:
+        submissions: One dict per run with keys job_type, parameters,
+            platform_request_id and optionally platform_version, asset_id,
+            release_id, submission_ordinal (same meaning as the single path)
+        max_workers: Upper bound on concurrent validator threads
+
+    Returns:
+        One outcome dict per submission, in input order:
+            {"run_id": str | None,
+             "status": "created" | "duplicate" | "rejected",
+             "error": str (rejected only)}
+
+    Raises:
+        RuntimeError: If the bulk insert fails (no runs are created)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from core.workflow_registry import get_workflow_registry
+    from core.dag_initializer import DAGInitializer
+    from infrastructure.workflow_run_repository import WorkflowRunRepository
+    from config import __version__
+
+    if not submissions:
+        return []
+
+    registry = get_workflow_registry()
+
+    def _prepare(sub: Dict[str, Any]) -> Dict[str, Any]:
+        job_type = sub["job_type"]
+        workflow_def = registry.get(job_type)
+        if workflow_def is None:
+            raise ValueError(f"No DAG workflow YAML found for '{job_type}'.")
+        parameters = sub["parameters"]
+        _prepare_dag_parameters(
+            job_type, workflow_def, parameters, sub.get("submission_ordinal", 0)
         )
+        return {
+            "workflow_def": workflow_def,
+            "parameters": parameters,
+            "platform_version": sub.get("platform_version") or __version__,
+            "request_id": sub.get("platform_request_id"),
+            "asset_id": sub.get("asset_id"),
+            "release_id": sub.get("release_id"),
+        }
 
-        # Run is now PENDING in workflow_runs. DAG Brain's primary loop
-        # will discover it and drive orchestration. Function App does NOT
-        # spawn orchestrator threads — it only writes to the database.
-        return run.run_id
+    outcomes: List[Optional[Dict[str, Any]]] = [None] * len(submissions)
+    prepared: List[Dict[str, Any]] = []
+    prepared_index: List[int] = []
 
-    except Exception as e:
-        logger.error(f"Failed to create DAG run: {e}", exc_info=True)
-        raise RuntimeError(f"DAG run creation failed: {e}") from e
+    workers = max(1, min(max_workers, len(submissions)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_prepare, sub) for sub in submissions]
+        for idx, future in enumerate(futures):
+            try:
+                prepared.append(future.result())
+                prepared_index.append(idx)
+            except Exception as exc:
+                outcomes[idx] = {"run_id": None, "status": "rejected", "error": str(exc)}
+
+    if prepared:
+        initializer = DAGInitializer(WorkflowRunRepository())
+        try:
+            created = initializer.create_runs_bulk(prepared)
+        except Exception as e:
+            logger.error(f"Bulk DAG run creation failed: {e}", exc_info=True)
+            raise RuntimeError(f"Bulk DAG run creation failed: {e}") from e
+
+        for idx, outcome in zip(prepared_index, created):
+            if outcome["status"] == "invalid":
+                outcome = {**outcome, "status": "rejected"}
+            outcomes[idx] = outcome
+
+    logger.info(
+        f"Bulk DAG submission: {len(submissions)} entries, "
+        f"{sum(1 for o in outcomes if o['status'] == 'created')} created, "
+        f"{sum(1 for o in outcomes if o['status'] == 'duplicate')} duplicate, "
+        f"{sum(1 for o in outcomes if o['status'] == 'rejected')} rejected"
+    )
+    return outcomes
 
 
 def _get_workflows_dir():
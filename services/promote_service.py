@@ -387,6 +387,7 @@ class PromoteService:
         try:
             created = self._repo.create(dataset)
             logger.info(f"Created promoted dataset: {promoted_id}")
+            self._invalidate_system_role_caches(created.system_role)
 
             # Check STAC health and include warnings (22 DEC 2025)
             stac_warnings = self.get_stac_warnings_for_promote(
@@ -415,6 +416,19 @@ class PromoteService:
                 "error": str(e)
             }
 
+    @staticmethod
+    def _invalidate_system_role_caches(system_role: Optional[str]) -> None:
+        """
+        Drop this process's cached resolution of a system-role table.
+
+        Other processes pick up the change when their cache TTL expires
+        (STACDefaults.ISO3_ADMIN0_CACHE_TTL_SECONDS).
+        """
+        if system_role == SystemRole.ADMIN0_BOUNDARIES.value:
+            from services.iso3_attribution import invalidate_admin0_cache
+            invalidate_admin0_cache()
+            logger.info("Invalidated cached admin0 table resolution")
+
     # =========================================================================
     # DEMOTE OPERATIONS
     # =========================================================================
@@ -437,7 +451,9 @@ class PromoteService:
         logger.info(f"Demoting dataset: {promoted_id}")
 
         try:
+            existing = self._repo.get_by_id(promoted_id)
             if self._repo.delete(promoted_id, confirm_system=confirm_system):
+                self._invalidate_system_role_caches(existing.system_role if existing else None)
                 return {
                     "success": True,
                     "promoted_id": promoted_id,
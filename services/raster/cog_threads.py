@@ -0,0 +1,135 @@
+# ============================================================================
+# CLAUDE CONTEXT - COG ENCODING THREAD BUDGET
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Shared utility - GDAL threading for COG creation
+# PURPOSE: Size GDAL's worker threads for warping, compression and overview
+#          building from the CPUs available to this container and the number
+#          of COG tasks it may run at once.
+# CREATED: 18 OCT 2026
+# EXPORTS: available_cpus, compute_thread_budget, cog_gdal_options,
+#          warp_thread_options
+# DEPENDENCIES: config
+# ============================================================================
+"""
+COG encoding thread budget.
+
+GDAL's defaults are single-threaded: cog_translate compresses one tile at a
+time and a WarpedVRT warps on one core, so an 8-vCPU worker converting a
+large DEFLATE/ZSTD raster leaves seven cores idle. The budget is
+
+    threads = available_cpus // cog_task_slots      (at least 1)
+
+unless RASTER_COG_NUM_THREADS pins it. It is applied as:
+    - GDAL_NUM_THREADS   -> GTiff block compression and overview building
+    - NUM_THREADS        -> warp option for the reprojection WarpedVRT
+
+available_cpus() honours the cgroup CPU quota (Docker --cpus / Container
+Apps vCPU allocation) and the process affinity mask, not just the host's
+core count.
+"""
+
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+_CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+_CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _cgroup_cpu_limit() -> Optional[float]:
+    """CPU quota in cores from cgroup v2/v1, or None when unlimited/unknown."""
+    try:
+        with open(_CGROUP_V2_CPU_MAX) as fh:
+            quota, period = fh.read().split()[:2]
+        if quota != "max":
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(_CGROUP_V1_QUOTA) as fh:
+            quota = int(fh.read().strip())
+        with open(_CGROUP_V1_PERIOD) as fh:
+            period = int(fh.read().strip())
+        if quota > 0 and period > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may actually use (affinity and cgroup quota aware)."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cpus = os.cpu_count() or 1
+
+    limit = _cgroup_cpu_limit()
+    if limit:
+        cpus = min(cpus, max(1, int(limit)))
+    return max(1, cpus)
+
+
+def compute_thread_budget(
+    cpu_count: Optional[int] = None,
+    task_slots: Optional[int] = None,
+    num_threads: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Threads one COG task may use.
+
+    Args:
+        cpu_count: Override detected CPUs (default: available_cpus()).
+        task_slots: Concurrent COG tasks per worker (default: config).
+        num_threads: Fixed thread count; 0/None derives it (default: config).
+
+    Returns:
+        {"threads": int, "cpu_count": int, "task_slots": int, "source": "auto"|"config"}
+    """
+    if task_slots is None or num_threads is None:
+        from config import get_config
+        raster = get_config().raster
+        if task_slots is None:
+            task_slots = raster.cog_task_slots
+        if num_threads is None:
+            num_threads = raster.cog_num_threads
+
+    cpu_count = cpu_count or available_cpus()
+    task_slots = max(1, int(task_slots))
+
+    if num_threads and num_threads > 0:
+        threads, source = int(num_threads), "config"
+    else:
+        threads, source = max(1, cpu_count // task_slots), "auto"
+
+    return {
+        "threads": threads,
+        "cpu_count": cpu_count,
+        "task_slots": task_slots,
+        "source": source,
+    }
+
+
+def cog_gdal_options(budget: Dict[str, Any]) -> Dict[str, Any]:
+    """GDAL config options for cog_translate(config=...): compression + overviews."""
+    return {"GDAL_NUM_THREADS": budget["threads"]}
+
+
+def warp_thread_options(budget: Dict[str, Any]) -> Dict[str, Any]:
+    """WarpedVRT keyword arguments for a multithreaded warp."""
+    if budget["threads"] <= 1:
+        return {}
+    return {"num_threads": budget["threads"]}
+
+
+__all__ = [
+    'available_cpus',
+    'compute_thread_budget',
+    'cog_gdal_options',
+    'warp_thread_options',
+]
@@ -206,7 +206,7 @@ def raster_create_cog(params: Dict[str, Any], context: Optional[Any] = None) ->
     Atomic DAG handler: transform a local raster into a COG.
 
     Params (injected by DAG Brain via YAML receives + job params):
-        source_path          str   local path on ETL mount (from download handler)
+        source_path          str   ETL mount path or /vsiaz/ path (from download handler)
         raster_type          dict  full raster_type dict from validate handler
         source_crs           str   detected CRS string (e.g. "EPSG:32637")
         target_crs           str   reprojection target (default "EPSG:4326")
@@ -296,10 +296,12 @@ def raster_create_cog(params: Dict[str, Any], context: Optional[Any] = None) ->
         # ------------------------------------------------------------------
         # 3. Source file existence guard (fail-fast, never retry same input)
         # ------------------------------------------------------------------
-        if not os.path.exists(source_path):
+        from services.raster.source_access import source_exists, source_read_env
+
+        if not source_exists(source_path):
             return {
                 "success": False,
-                "error": f"Source file not found on ETL mount: {source_path}",
+                "error": f"Source file not found: {source_path}",
                 "error_type": "FileNotFoundError",
                 "retryable": False,
             }
@@ -391,7 +393,9 @@ def raster_create_cog(params: Dict[str, Any], context: Optional[Any] = None) ->
             source_path, output_tier, target_crs,
         )
 
-        cog_response = create_cog(cog_params)
+        # /vsiaz/ sources are read in place with tuned range-request settings
+        with source_read_env(source_path):
+            cog_response = create_cog(cog_params)
 
         # ------------------------------------------------------------------
         # 7. Handle create_cog failure (C-B5)
@@ -541,6 +545,8 @@ def raster_create_cog(params: Dict[str, Any], context: Optional[Any] = None) ->
             "resampling": overview_resampling,
             # COG_REFINE stamp result (colorinterp + nodata stamped on header)
             "stamp_result": stamp_result,
+            # GDAL thread budget used for warp/compression/overviews
+            "gdal_threading": cog_result.get("gdal_threading"),
         }
 
         logger.info(
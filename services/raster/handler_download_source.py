@@ -28,6 +28,16 @@ Implemented behaviours (from build spec 2026-03-20):
   D-N1  Path traversal guard: reject blob_name containing '..' or starting '/'
   D-N2  ETL mount existence check before write (writability probe)
   D-N3  Idempotent directory creation via os.makedirs(exist_ok=True)
+
+Source access modes (processing_options.source_access, default from
+RASTER_SOURCE_ACCESS_MODE):
+  auto    Probe the blob header via /vsiaz/; internally tiled GeoTIFFs are
+          left in place and source_path is returned as /vsiaz/{container}/{blob}.
+          Everything else (striped TIFFs, other formats, probe failures) is
+          staged on the mount as before.
+  mount   Always stage on the mount.
+  stream  Always return the /vsiaz/ path.
+Downstream handlers read either form via services.raster.source_access.
 """
 
 import logging
@@ -55,6 +65,8 @@ def raster_download_source(params: Dict[str, Any], context: Optional[Any] = None
         _node_name (str, required): System-injected DAG node name (for log prefix).
         etl_mount_path (str, optional): Override for the ETL mount root. Defaults
             to config.docker.etl_mount_path. Not normally supplied by callers.
+        processing_options (dict, optional): ``source_access`` selects
+            auto / mount / stream (see module docstring).
 
     Returns:
         Success::
@@ -62,10 +74,13 @@ def raster_download_source(params: Dict[str, Any], context: Optional[Any] = None
             {
                 "success": True,
                 "result": {
-                    "source_path": "/mnt/etl/{_run_id}/{blob_name}",
+                    "source_path": "/mnt/etl/{_run_id}/{blob_name}"
+                                   | "/vsiaz/{container_name}/{blob_name}",
                     "file_size_bytes": int,
                     "transfer_duration_seconds": float,
-                    "content_type": str | None
+                    "content_type": str | None,
+                    "access_mode": "mount" | "stream",
+                    "access_reason": str
                 }
             }
 
@@ -137,6 +152,37 @@ def raster_download_source(params: Dict[str, Any], context: Optional[Any] = None
     logger.info(f"{log_prefix} raster_download_source starting: {container_name}/{blob_name}")
 
     try:
+        # ---------------------------------------------------------------------
+        # Source access: read in place via /vsiaz/ when the layout allows it
+        # ---------------------------------------------------------------------
+        from services.raster.source_access import SOURCE_ACCESS_MODES
+
+        processing_options = params.get('processing_options') or {}
+        access_mode = processing_options.get('source_access')
+        if not access_mode:
+            from config import get_config
+            access_mode = get_config().raster.source_access_mode
+        if access_mode not in SOURCE_ACCESS_MODES:
+            return {
+                "success": False,
+                "error": (
+                    f"processing_options.source_access must be one of "
+                    f"{', '.join(SOURCE_ACCESS_MODES)}: '{access_mode}'"
+                ),
+                "error_type": "InvalidParameterError",
+                "retryable": False,
+            }
+
+        access_reason = "mount staging requested"
+        if access_mode != "mount":
+            stream_result = _try_stream_source(
+                container_name, blob_name, force=(access_mode == "stream"),
+                log_prefix=log_prefix,
+            )
+            if stream_result.get("success") is not None:
+                return stream_result
+            access_reason = stream_result["reason"]
+
         # ---------------------------------------------------------------------
         # Resolve ETL mount root
         # Callers may pass etl_mount_path for testing; otherwise read from config.
@@ -197,14 +243,28 @@ def raster_download_source(params: Dict[str, Any], context: Optional[Any] = None
 
         logger.info(f"{log_prefix} Streaming {blob_name} -> {dest_path}")
 
+        from exceptions import InsufficientMountSpaceError
+        from infrastructure.mount_space import reserve_mount_space
+
         transfer_start = time.monotonic()
         try:
-            transfer_result = blob_repo.stream_blob_to_mount(
-                container_name,
-                blob_name,
-                dest_path,
-                chunk_size_mb=32,
-            )
+            # Reserve the blob's size up front so a full mount fails fast
+            # (and evicts finished runs) instead of mid-stream
+            blob_size = blob_repo.get_blob_properties(container_name, blob_name).get('size') or 0
+            with reserve_mount_space(_run_id, blob_size, "raster_download_source"):
+                transfer_result = blob_repo.stream_blob_to_mount(
+                    container_name,
+                    blob_name,
+                    dest_path,
+                    chunk_size_mb=32,
+                )
+        except InsufficientMountSpaceError as space_err:
+            return {
+                "success": False,
+                "error": str(space_err),
+                "error_type": "DiskSpaceError",
+                "retryable": True,
+            }
         except ResourceNotFoundError:
             return {
                 "success": False,
@@ -255,6 +315,8 @@ def raster_download_source(params: Dict[str, Any], context: Optional[Any] = None
                 "file_size_bytes": file_size_bytes,
                 "transfer_duration_seconds": round(transfer_duration, 3),
                 "content_type": content_type,
+                "access_mode": "mount",
+                "access_reason": access_reason,
             },
         }
 
@@ -268,3 +330,68 @@ def raster_download_source(params: Dict[str, Any], context: Optional[Any] = None
             "error_type": "HandlerError",
             "retryable": False,
         }
+
+
+# =============================================================================
+# /vsiaz/ STREAMING
+# =============================================================================
+
+def _try_stream_source(
+    container_name: str,
+    blob_name: str,
+    force: bool,
+    log_prefix: str,
+) -> Dict[str, Any]:
+    """
+    Return a handler result pointing at /vsiaz/ if the source can be streamed.
+
+    Returns ``{"reason": str}`` (no ``success`` key) when the caller should
+    fall back to mount staging. Missing blobs are reported as handler failures
+    here so they are not retried through the mount path.
+    """
+    from services.raster.source_access import assess_stream_access, vsiaz_path
+    from infrastructure.blob import BlobRepository
+    from azure.core.exceptions import ResourceNotFoundError
+
+    try:
+        props = BlobRepository.for_zone("bronze").get_blob_properties(container_name, blob_name)
+    except ResourceNotFoundError:
+        return {
+            "success": False,
+            "error": f"Blob not found: {container_name}/{blob_name}",
+            "error_type": "BlobNotFoundError",
+            "retryable": False,
+        }
+    except Exception as exc:
+        return {"reason": f"blob properties unavailable: {exc}"}
+
+    if force:
+        reason = "stream requested"
+    else:
+        try:
+            assessment = assess_stream_access(container_name, blob_name)
+        except Exception as exc:
+            logger.warning(f"{log_prefix} /vsiaz/ probe failed, staging on mount: {exc}")
+            return {"reason": f"probe failed: {exc}"}
+        reason = assessment["reason"]
+        if not assessment["streamable"]:
+            logger.info(f"{log_prefix} Staging on mount: {reason}")
+            return {"reason": reason}
+
+    source_path = vsiaz_path(container_name, blob_name)
+    file_size_bytes = props.get("size") or 0
+    logger.info(
+        f"{log_prefix} raster_download_source: streaming in place "
+        f"({file_size_bytes / (1024 * 1024):.1f} MB, {reason}) -> {source_path}"
+    )
+    return {
+        "success": True,
+        "result": {
+            "source_path": source_path,
+            "file_size_bytes": file_size_bytes,
+            "transfer_duration_seconds": 0.0,
+            "content_type": props.get("content_type"),
+            "access_mode": "stream",
+            "access_reason": reason,
+        },
+    }
@@ -21,7 +21,6 @@ already supports local file paths via rasterio.open().
 """
 
 import logging
-import os
 import time
 from typing import Any, Dict, Optional
 
@@ -35,7 +34,7 @@ def raster_generate_tiling_scheme_atomic(
     Compute tiling scheme from source raster on ETL mount.
 
     Params:
-        source_path (str, required): Local path to source raster on mount
+        source_path (str, required): Local path on mount, or /vsiaz/ path
         processing_options (dict, optional): Contains tile_size, overlap overrides
         _run_id (str, required): System-injected
         _node_name (str, required): System-injected
@@ -67,10 +66,12 @@ def raster_generate_tiling_scheme_atomic(
     log_prefix = f"[{run_id[:8]}][{node_name}]"
 
     try:
-        if not os.path.exists(source_path):
+        from services.raster.source_access import source_exists, source_read_env
+
+        if not source_exists(source_path):
             return {
                 "success": False,
-                "error": f"Source raster not found on mount: {source_path}",
+                "error": f"Source raster not found: {source_path}",
                 "error_type": "FileNotFoundError",
                 "retryable": False,
             }
@@ -88,12 +89,13 @@ def raster_generate_tiling_scheme_atomic(
 
         from services.tiling_scheme import generate_tiling_scheme_from_raster
 
-        geojson = generate_tiling_scheme_from_raster(
-            raster_path=source_path,
-            tile_size=tile_size,
-            overlap=overlap,
-            target_crs=target_crs,
-        )
+        with source_read_env(source_path):
+            geojson = generate_tiling_scheme_from_raster(
+                raster_path=source_path,
+                tile_size=tile_size,
+                overlap=overlap,
+                target_crs=target_crs,
+            )
 
         elapsed = time.monotonic() - start
 
@@ -41,7 +41,7 @@ def raster_process_single_tile(
     Process a single tile: extract → COG → stamp → upload.
 
     Params (from fan-out template):
-        source_path (str): Path to source raster on mount
+        source_path (str): Path to source raster on mount, or /vsiaz/ path
         tile_spec (dict): {tile_index, row, col, window: {col_off, row_off, width, height}, bounds_4326}
         collection_id (str): STAC collection for silver path
         source_crs (str): Source CRS from validation
@@ -114,9 +114,11 @@ def raster_process_single_tile(
         from rasterio.windows import Window
         import numpy as np
 
+        from services.raster.source_access import source_exists, source_read_env
+
         start = time.monotonic()
 
-        if not os.path.exists(source_path):
+        if not source_exists(source_path):
             return {
                 "success": False,
                 "error": f"Source raster not found: {source_path}",
@@ -157,7 +159,7 @@ def raster_process_single_tile(
         # windowed read() — only tile pixels are loaded, not the full raster.
         from rasterio.vrt import WarpedVRT
 
-        with rasterio.open(source_path) as src:
+        with source_read_env(source_path), rasterio.open(source_path) as src:
             with WarpedVRT(src, crs=target_crs) as vrt:
                 tile_data = vrt.read(window=win)
                 tile_profile = vrt.profile.copy()
@@ -313,10 +313,13 @@ def raster_upload_cog(params: Dict[str, Any], context: Optional[Any] = None) ->
         source_deleted = False
         cog_deleted = False
 
+        from services.raster.source_access import is_remote_source
+
         try:
-            os.remove(source_path)
-            source_deleted = True
-            logger.info("raster_upload_cog: removed source file from mount: %s", source_path)
+            if not is_remote_source(source_path):  # /vsiaz/ sources were never staged
+                os.remove(source_path)
+                source_deleted = True
+                logger.info("raster_upload_cog: removed source file from mount: %s", source_path)
         except Exception as cleanup_err:
             logger.warning(
                 "raster_upload_cog: could not remove source file %s (non-fatal): %s",
@@ -147,14 +147,20 @@ def raster_validate(params: Dict[str, Any], context: Optional[Any] = None) -> Di
     log_prefix = f"[{run_id[:8]}][{node_name}]"
 
     try:  # Outer try/except — guarantees handler contract on unexpected errors.
+        from services.raster.source_access import (
+            is_remote_source, source_exists, source_read_env,
+        )
 
         # ------------------------------------------------------------------
         # 2. SECURITY: PATH TRAVERSAL CHECK (V-N3 + Docker-specific guard)
         # ------------------------------------------------------------------
         # Resolve to an absolute, canonical path before any open().
         # Rejects symlink escapes or "../" sequences targeting outside the mount.
+        # /vsiaz/ sources (read in place, see raster_download_source) have no
+        # local path to resolve; they only need the traversal check.
+        remote_source = is_remote_source(source_path)
         try:
-            resolved = os.path.realpath(source_path)
+            resolved = source_path if remote_source else os.path.realpath(source_path)
         except Exception as exc:
             return {
                 "success": False,
@@ -164,7 +170,15 @@ def raster_validate(params: Dict[str, Any], context: Optional[Any] = None) -> Di
             }
 
         etl_mount_root = _ETL_MOUNT_DEFAULT
-        if not resolved.startswith(etl_mount_root + os.sep) and not resolved.startswith(etl_mount_root):
+        if remote_source:
+            if '..' in source_path.split('/'):
+                return {
+                    "success": False,
+                    "error": f"source_path '{source_path}' contains path traversal sequences.",
+                    "error_type": "SecurityError",
+                    "retryable": False,
+                }
+        elif not resolved.startswith(etl_mount_root + os.sep) and not resolved.startswith(etl_mount_root):
             # Allow /tmp and test paths in non-Docker environments, but only when
             # the path is absolute and clearly not a traversal attempt.
             # For production (Docker), the ETL mount is always /mnt/etl.
@@ -189,7 +203,7 @@ def raster_validate(params: Dict[str, Any], context: Optional[Any] = None) -> Di
         # ------------------------------------------------------------------
         # 3. FILE EXISTENCE CHECK (V-N3)
         # ------------------------------------------------------------------
-        if not os.path.exists(resolved):
+        if not source_exists(resolved):
             return {
                 "success": False,
                 "error": (
@@ -219,7 +233,8 @@ def raster_validate(params: Dict[str, Any], context: Optional[Any] = None) -> Di
         }
 
         logger.info(f"{log_prefix} Stage A: header validation — {source_path}")
-        header_response = validate_raster_header(header_params)
+        with source_read_env(source_path):
+            header_response = validate_raster_header(header_params)
 
         if not header_response.get('success'):
             error_code = header_response.get('error_code', 'UNKNOWN')
@@ -292,7 +307,8 @@ def raster_validate(params: Dict[str, Any], context: Optional[Any] = None) -> Di
         }
 
         logger.info(f"{log_prefix} Stage B: data validation — raster_type={raster_type_param}")
-        validation_response = validate_raster_data(data_params, header_result)
+        with source_read_env(source_path):
+            validation_response = validate_raster_data(data_params, header_result)
 
         if not validation_response.get('success'):
             error_code = validation_response.get('error_code', 'UNKNOWN')
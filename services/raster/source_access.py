@@ -0,0 +1,195 @@
+# ============================================================================
+# CLAUDE CONTEXT - RASTER SOURCE ACCESS (MOUNT vs /vsiaz/ STREAMING)
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Shared utility - Source path resolution for DAG raster handlers
+# PURPOSE: Decide whether a bronze raster is read in place through GDAL's
+#          /vsiaz/ driver or staged on the ETL mount, and provide the tuned
+#          GDAL environment for remote reads.
+# CREATED: 18 OCT 2026
+# EXPORTS: SOURCE_ACCESS_MODES, vsiaz_path, is_remote_source, source_exists,
+#          source_size_bytes, source_read_env, assess_stream_access
+# DEPENDENCIES: rasterio, config
+# ============================================================================
+"""
+Raster source access.
+
+process_raster used to copy every source blob onto the ETL mount before
+validation and COG creation read it (blob → mount → GDAL: two full passes).
+Internally tiled GeoTIFFs support efficient range reads, so for those the
+download node can hand downstream handlers a /vsiaz/ path instead and GDAL
+fetches only the blocks it needs, with multi-range requests and a block
+cache. Striped or non-TIFF sources still go through the mount, where random
+access is cheap.
+
+Downstream handlers treat source_path uniformly:
+    - source_exists(path)        instead of os.path.exists
+    - source_size_bytes(path)    instead of os.path.getsize
+    - with source_read_env(path) around rasterio / rio-cogeo calls
+
+source_read_env is a no-op for local paths.
+"""
+
+import contextlib
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+VSIAZ_PREFIX = "/vsiaz/"
+
+SOURCE_ACCESS_MODES = ("auto", "mount", "stream")
+
+# Only these are probed in auto mode; other formats are staged on the mount
+_STREAMABLE_EXTENSIONS = (".tif", ".tiff", ".geotiff")
+
+# Full-width blocks on rasters narrower than this are a single cheap range
+_STRIPED_MIN_WIDTH = 1024
+
+
+def vsiaz_path(container_name: str, blob_name: str) -> str:
+    """Build the GDAL /vsiaz/ path for a blob."""
+    return f"{VSIAZ_PREFIX}{container_name}/{blob_name}"
+
+
+def is_remote_source(source_path: Optional[str]) -> bool:
+    """True when source_path is a /vsiaz/ path rather than a mount file."""
+    return bool(source_path) and source_path.startswith(VSIAZ_PREFIX)
+
+
+def _gdal_read_options() -> Dict[str, Any]:
+    """GDAL config options tuned for ranged reads of bronze blobs."""
+    from config import get_config
+
+    config = get_config()
+    cache_bytes = config.raster.vsi_cache_mb * 1024 * 1024
+
+    options = {
+        # Don't LIST the container looking for sidecars on every open. That
+        # already stops sidecar probes, so CPL_VSIL_CURL_ALLOWED_EXTENSIONS
+        # is not set: "stream" mode also serves non-TIFF sources.
+        "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+        # Header + IFDs usually fit in the first request
+        "GDAL_INGESTED_BYTES_AT_OPEN": 32768,
+        # Coalesce block reads into fewer, larger requests
+        "GDAL_HTTP_MULTIRANGE": "YES",
+        "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+        "GDAL_HTTP_MULTIPLEX": "YES",
+        "GDAL_HTTP_VERSION": 2,
+        "VSI_CACHE": "TRUE" if cache_bytes else "FALSE",
+        "VSI_CACHE_SIZE": cache_bytes,
+        "GDAL_HTTP_MAX_RETRY": 3,
+        "GDAL_HTTP_RETRY_DELAY": 1,
+    }
+    # Bronze may live in a different account than the process-wide default
+    # set by initialize_storage_auth(); the OAuth token is account-agnostic.
+    account_name = config.storage.bronze.account_name
+    if account_name:
+        options["AZURE_STORAGE_ACCOUNT"] = account_name
+    return options
+
+
+def source_read_env(source_path: Optional[str]):
+    """
+    Context manager with the GDAL environment for reading source_path.
+
+    Returns rasterio.Env(...) for /vsiaz/ paths and a null context otherwise,
+    so callers can wrap reads unconditionally.
+    """
+    if not is_remote_source(source_path):
+        return contextlib.nullcontext()
+    import rasterio
+    return rasterio.Env(**_gdal_read_options())
+
+
+def source_exists(source_path: Optional[str]) -> bool:
+    """
+    Existence check that works for both mount files and /vsiaz/ paths.
+
+    Remote paths are checked with one blob properties (HEAD) request.
+    """
+    if not source_path:
+        return False
+    if not is_remote_source(source_path):
+        return os.path.exists(source_path)
+    return source_size_bytes(source_path) is not None
+
+
+def source_size_bytes(source_path: str) -> Optional[int]:
+    """File size for a mount file or /vsiaz/ path; None if it cannot be read."""
+    if not is_remote_source(source_path):
+        try:
+            return os.path.getsize(source_path)
+        except OSError:
+            return None
+
+    container_name, _, blob_name = source_path[len(VSIAZ_PREFIX):].partition("/")
+    try:
+        from infrastructure.blob import BlobRepository
+        props = BlobRepository.for_zone("bronze").get_blob_properties(container_name, blob_name)
+        return props.get("size")
+    except Exception as exc:
+        logger.warning(f"Could not stat remote source {source_path}: {exc}")
+        return None
+
+
+def assess_stream_access(container_name: str, blob_name: str) -> Dict[str, Any]:
+    """
+    Decide whether a bronze raster can be read in place via /vsiaz/.
+
+    Streaming pays off when the file is a GeoTIFF with internal tiling: block
+    reads map to a small number of byte ranges. Striped TIFFs (one block row
+    spanning the full width) and other formats force GDAL to pull large or
+    scattered ranges and are staged on the mount instead.
+
+    Only the header is read (GDAL_INGESTED_BYTES_AT_OPEN covers it for
+    typical files), so the probe costs one or two range requests.
+
+    Returns:
+        {"streamable": bool, "reason": str, "source_path": str,
+         "driver": str|None, "block_shape": [h, w]|None, "overview_count": int|None}
+    """
+    path = vsiaz_path(container_name, blob_name)
+    assessment: Dict[str, Any] = {
+        "streamable": False,
+        "reason": "",
+        "source_path": path,
+        "driver": None,
+        "block_shape": None,
+        "overview_count": None,
+    }
+
+    if not blob_name.lower().endswith(_STREAMABLE_EXTENSIONS):
+        assessment["reason"] = "not a GeoTIFF extension"
+        return assessment
+
+    import rasterio
+
+    with source_read_env(path):
+        with rasterio.open(path) as src:
+            block_h, block_w = src.block_shapes[0]
+            assessment["driver"] = src.driver
+            assessment["block_shape"] = [block_h, block_w]
+            assessment["overview_count"] = len(src.overviews(1)) if src.count else 0
+
+            if src.driver != "GTiff":
+                assessment["reason"] = f"driver {src.driver} is not GTiff"
+            elif block_w >= src.width and src.width > _STRIPED_MIN_WIDTH:
+                assessment["reason"] = f"striped layout ({block_h}x{block_w} blocks)"
+            else:
+                assessment["streamable"] = True
+                assessment["reason"] = f"tiled GeoTIFF ({block_h}x{block_w} blocks)"
+
+    return assessment
+
+
+__all__ = [
+    'SOURCE_ACCESS_MODES',
+    'vsiaz_path',
+    'is_remote_source',
+    'source_exists',
+    'source_size_bytes',
+    'source_read_env',
+    'assess_stream_access',
+]
@@ -393,7 +393,9 @@ def _process_cog_disk_based(
             logger.info(f"🔄 DISK STEP A: Using local source file (no download)")
             logger.info(f"   Source: {local_source_path}")
             temp_input_path = local_source_path  # Use directly, no copy
-            input_size_bytes = os.path.getsize(local_source_path)
+            # May be a /vsiaz/ path when the DAG read the source in place
+            from services.raster.source_access import source_size_bytes
+            input_size_bytes = source_size_bytes(local_source_path) or 0
             input_size_mb = input_size_bytes / (1024 * 1024)
             logger.info(f"   File size: {input_size_mb:.2f}MB")
             download_result = None  # No download performed
@@ -450,6 +452,21 @@ def _process_cog_disk_based(
         logger.info(f"   in_memory={in_memory} (should be False)")
         logger.info(f"   Overview resampling: {overview_resampling}")
 
+        # Thread budget (18 OCT 2026): GDAL defaults to one core for compression,
+        # overviews and warping; size it from the CPUs this worker may use.
+        from services.raster.cog_threads import (
+            compute_thread_budget,
+            cog_gdal_options,
+            warp_thread_options,
+        )
+        thread_budget = compute_thread_budget()
+        translate_config = {**cog_config, **cog_gdal_options(thread_budget)}
+        logger.info(
+            f"   Thread budget: {thread_budget['threads']} threads "
+            f"({thread_budget['cpu_count']} CPUs / {thread_budget['task_slots']} task slots, "
+            f"{thread_budget['source']})"
+        )
+
         cog_start = time.time()
 
         if needs_reprojection:
@@ -460,13 +477,14 @@ def _process_cog_disk_based(
                 vrt_options = {
                     'crs': target_crs,
                     'resampling': getattr(Resampling, reproject_resampling),
+                    **warp_thread_options(thread_budget),
                 }
                 with WarpedVRT(src, **vrt_options) as vrt:
                     cog_translate(
                         vrt,
                         temp_output_path,
                         cog_profile,
-                        config=cog_config,
+                        config=translate_config,
                         overview_level=None,
                         overview_resampling=overview_resampling,
                         in_memory=in_memory,
@@ -478,7 +496,7 @@ def _process_cog_disk_based(
                 temp_input_path,
                 temp_output_path,
                 cog_profile,
-                config=cog_config,
+                config=translate_config,
                 overview_level=None,
                 overview_resampling=overview_resampling,
                 in_memory=in_memory,
@@ -553,6 +571,11 @@ def _process_cog_disk_based(
             'cog_duration_seconds': cog_duration,
             'reprojection_performed': reprojection_performed,
             'target_crs': target_crs,
+            'gdal_threading': {
+                **thread_budget,
+                'gdal_options': cog_gdal_options(thread_budget),
+                'warp_options': warp_thread_options(thread_budget) if reprojection_performed else {},
+            },
         }
 
     except Exception as e:
@@ -975,7 +998,8 @@ def create_cog(params: dict) -> dict:
             file_checksum=file_checksum,
             file_size=output_size_bytes,
             blob_version_id=None,  # Not captured in stream upload
-            processing_mode="disk_based"
+            processing_mode="disk_based",
+            gdal_threading=disk_result.get('gdal_threading'),
         )
 
         result = COGCreationResult(success=True, result=cog_data)
@@ -1691,7 +1691,12 @@ def _estimate_memory_footprint(width: int, height: int, band_count: int, dtype:
     if estimated_peak_gb <= safe_threshold_gb:
         processing_strategy = "single_pass"
         gdal_cachemax = 1024  # 1GB cache
-        gdal_num_threads = min(2, cpu_count)
+        # Same budget create_cog applies: CPUs // concurrent COG task slots
+        try:
+            from services.raster.cog_threads import compute_thread_budget
+            gdal_num_threads = compute_thread_budget(cpu_count=cpu_count)["threads"]
+        except Exception:
+            gdal_num_threads = min(2, cpu_count)
         gdal_swath_size = 134217728  # 128MB
     elif estimated_peak_gb <= system_ram_gb * 0.8:
         processing_strategy = "single_pass_conservative"
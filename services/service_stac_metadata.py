@@ -109,6 +109,7 @@ class StacMetadataService:
         file_checksum: Optional[str] = None,  # STAC file extension (21 JAN 2026)
         file_size: Optional[int] = None,  # STAC file extension (21 JAN 2026)
         skip_stats: bool = False,  # V0.9 P2.2: Override to skip statistics extraction
+        include_iso3: bool = True,
     ) -> Dict[str, Any]:
         """
         Extract STAC Item from raster blob using rio-stac.
@@ -122,6 +123,9 @@ class StacMetadataService:
             platform_meta: Optional PlatformProperties for DDH identifiers (V0.9: ddh:*)
             provenance_props: Optional ProvenanceProperties for job linkage (V0.9: geoetl:*)
             raster_meta: DEPRECATED V0.9 — raster_type now read from provenance_props.raster_type
+            include_iso3: Look up geo:* attribution per item (default True). Bulk
+                callers pass False and attribute all items in one batch
+                (iso3_attribution.get_geo_properties_for_bboxes).
 
         Returns:
             Validated stac-pydantic Item
@@ -569,7 +573,7 @@ class StacMetadataService:
 
             # geo:* attribution (from ISO3 service)
             from services.iso3_attribution import get_geo_properties_for_bbox
-            geo_props = get_geo_properties_for_bbox(bbox) if bbox else None
+            geo_props = get_geo_properties_for_bbox(bbox) if bbox and include_iso3 else None
 
             logger.debug(f"   ✅ Step N.4: Namespace props built")
         except Exception as e:
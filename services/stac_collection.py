@@ -353,16 +353,6 @@ def _create_stac_collection_impl(
             }
         )
 
-        # Add ISO3 country attribution to collection extra_fields
-        from services.iso3_attribution import get_geo_properties_for_bbox
-        geo_props = get_geo_properties_for_bbox(spatial_extent)
-        if geo_props:
-            collection.extra_fields['geo:iso3'] = geo_props.iso3
-            collection.extra_fields['geo:primary_iso3'] = geo_props.primary_iso3
-            if geo_props.countries:
-                collection.extra_fields['geo:countries'] = geo_props.countries
-            logger.debug(f"   Added ISO3 attribution to collection: {geo_props.primary_iso3}")
-
         # =========================================================================
         # 19 FEB 2026: STAC as B2C materialized view
         # Collection + items are NOT inserted into pgSTAC during processing.
@@ -396,6 +386,7 @@ def _create_stac_collection_impl(
 
         created_items = []
         failed_items = []
+        extracted = []
 
         for i, tile_blob in enumerate(tile_blobs):
             try:
@@ -411,6 +402,7 @@ def _create_stac_collection_impl(
                     collection_id=collection_id,
                     item_id=item_id,
                     provenance_props=provenance,
+                    include_iso3=False,  # Attributed below in one batch
                 )
 
                 # Convert to dict for caching
@@ -421,6 +413,37 @@ def _create_stac_collection_impl(
                 else:
                     item_dict = item
 
+                extracted.append((i, tile_blob, item_id, item_dict))
+
+            except Exception as e:
+                logger.error(f"   ❌ Failed to extract STAC Item for {tile_blob}: {e}")
+                logger.error(f"      Traceback: {traceback.format_exc()}")
+                failed_items.append(tile_blob)
+                raise RuntimeError(
+                    f"STAC Item extraction failed for tile {i+1}/{len(tile_blobs)}: {tile_blob} "
+                    f"in container {cog_container}. "
+                    f"Error: {e}"
+                )
+
+        # ISO3 attribution for the collection extent and every item in one
+        # batched spatial join instead of one admin0 lookup per tile
+        from services.iso3_attribution import get_geo_properties_for_bboxes
+        geo_list = get_geo_properties_for_bboxes(
+            [spatial_extent] + [item_dict.get('bbox') for _, _, _, item_dict in extracted]
+        )
+        geo_props = geo_list[0]
+        if geo_props:
+            collection.extra_fields['geo:iso3'] = geo_props.iso3
+            collection.extra_fields['geo:primary_iso3'] = geo_props.primary_iso3
+            if geo_props.countries:
+                collection.extra_fields['geo:countries'] = geo_props.countries
+            logger.debug(f"   Added ISO3 attribution to collection: {geo_props.primary_iso3}")
+
+        for (i, tile_blob, item_id, item_dict), item_geo in zip(extracted, geo_list[1:]):
+            try:
+                if item_geo:
+                    item_dict.setdefault('properties', {}).update(item_geo.to_flat_dict())
+
                 # Cache STAC item dict in cog_metadata (upsert creates record if needed)
                 cog_repo.upsert(
                     cog_id=item_id,
@@ -439,11 +462,11 @@ def _create_stac_collection_impl(
                 logger.debug(f"   ✅ STAC Item cached: {item_id}")
 
             except Exception as e:
-                logger.error(f"   ❌ Failed to extract/cache STAC Item for {tile_blob}: {e}")
+                logger.error(f"   ❌ Failed to cache STAC Item for {tile_blob}: {e}")
                 logger.error(f"      Traceback: {traceback.format_exc()}")
                 failed_items.append(tile_blob)
                 raise RuntimeError(
-                    f"STAC Item extraction failed for tile {i+1}/{len(tile_blobs)}: {tile_blob} "
+                    f"STAC Item caching failed for tile {i+1}/{len(tile_blobs)}: {tile_blob} "
                     f"in container {cog_container}. "
                     f"Created {len(created_items)} items before failure. "
                     f"Error: {e}"
@@ -410,6 +410,34 @@ class STACMetadataHelper:
 
         return item_dict
 
+    def augment_items(
+        self,
+        item_dicts: List[Dict[str, Any]],
+        include_iso3: bool = True,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Augment many STAC items; ISO3 attribution for all of them is one batch.
+
+        Each item's own bbox is used for attribution. Remaining keyword
+        arguments are passed to augment_item() for every item.
+
+        Returns:
+            The augmented item dicts, in input order
+        """
+        if include_iso3 and not kwargs.get('geo'):
+            geo_props = self._build_geographic_properties_batch(
+                [item_dict.get('bbox') for item_dict in item_dicts]
+            )
+            for item_dict, props in zip(item_dicts, geo_props):
+                if props:
+                    item_dict.setdefault('properties', {}).update(props)
+
+        return [
+            self.augment_item(item_dict, include_iso3=False, **kwargs)
+            for item_dict in item_dicts
+        ]
+
     def augment_collection(
         self,
         collection_dict: Dict[str, Any],
@@ -511,13 +539,21 @@ class STACMetadataHelper:
             Dict of geo:* prefixed properties
         """
         if bbox:
-            attribution = self.iso3_service.get_attribution_for_bbox(bbox)
-        elif geometry:
-            attribution = self.iso3_service.get_attribution_for_geometry(geometry)
-        else:
-            return {}
+            return self._build_geographic_properties_batch([bbox])[0]
+        if geometry:
+            attribution = self.iso3_service.get_attribution_for_geometries([geometry])[0]
+            return attribution.to_stac_properties()
+        return {}
 
-        return attribution.to_stac_properties()
+    def _build_geographic_properties_batch(
+        self,
+        bboxes: List[Optional[List[float]]],
+    ) -> List[Dict[str, Any]]:
+        """geo:* properties per bbox via one batched ISO3 attribution query."""
+        return [
+            attribution.to_stac_properties()
+            for attribution in self.iso3_service.get_attribution_for_bboxes(bboxes)
+        ]
 
     @staticmethod
     def _add_file_extension(
@@ -35,7 +35,7 @@ import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from config.defaults import TaskRoutingDefaults, QueueDefaults
 from core.schema.queue import TaskQueueMessage, StageCompleteMessage
@@ -137,6 +137,26 @@ class PhaseResult:
     error: Optional[str] = None
 
 
+@dataclass
+class _RecoveryPlan:
+    """
+    Task recovery decisions collected during phase 1, applied set-based.
+
+    failures groups task IDs by error message so each distinct message is
+    one mark_tasks_failed call; resends are re-queued, then the ones that
+    were sent get one batched retry_count increment.
+    """
+
+    failures: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
+    resends: List[Tuple[Dict[str, Any], str]] = field(default_factory=list)
+
+    def fail(self, task_id: str, error: str, action: str) -> None:
+        self.failures.setdefault(error, []).append((task_id, action))
+
+    def resend(self, task: Dict[str, Any], action: str) -> None:
+        self.resends.append((task, action))
+
+
 @dataclass
 class SweepResult:
     """
@@ -318,8 +338,14 @@ class SystemGuardian:
             1b: Orphaned QUEUED tasks (message lost from queue)
             1c: Stale PROCESSING tasks (Function App, excludes Docker)
             1d: Stale Docker tasks (long-running, mark FAILED directly)
+
+        Sub-phases only decide each task's fate into a _RecoveryPlan; the
+        plan is then applied set-based (one UPDATE per distinct failure
+        message, one retry_count UPDATE for all re-sends) so recovering
+        from a dead worker does not issue hundreds of single-row updates.
         """
         phase = PhaseResult(phase='task_recovery')
+        plan = _RecoveryPlan()
 
         # 1a: Orphaned PENDING tasks
         pending_tasks = self._repo.get_orphaned_pending_tasks(
@@ -327,7 +353,7 @@ class SystemGuardian:
         )
         phase.scanned += len(pending_tasks)
         for task in pending_tasks:
-            self._recover_orphaned_task(task, phase)
+            self._recover_orphaned_task(task, plan)
 
         # 1b: Orphaned QUEUED tasks
         queued_tasks = self._repo.get_orphaned_queued_tasks(
@@ -335,7 +361,7 @@ class SystemGuardian:
         )
         phase.scanned += len(queued_tasks)
         for task in queued_tasks:
-            self._recover_queued_task(task, phase)
+            self._recover_queued_task(task, plan)
 
         # 1c: Stale PROCESSING tasks (exclude Docker types)
         stale_tasks = self._repo.get_stale_processing_tasks(
@@ -344,7 +370,7 @@ class SystemGuardian:
         )
         phase.scanned += len(stale_tasks)
         for task in stale_tasks:
-            self._recover_stale_processing_task(task, phase)
+            self._recover_stale_processing_task(task, plan)
 
         # 1d: Stale Docker tasks
         docker_tasks = self._repo.get_stale_docker_tasks(
@@ -358,16 +384,41 @@ class SystemGuardian:
                 f"[GUARDIAN] Docker task {task_id[:16]}... stale "
                 f"(>{self._config.docker_task_timeout_minutes}min), marking FAILED"
             )
-            self._repo.mark_tasks_failed(
-                [task_id],
-                f"guardian_docker_timeout: stale >{self._config.docker_task_timeout_minutes}min"
+            plan.fail(
+                task_id,
+                f"guardian_docker_timeout: stale >{self._config.docker_task_timeout_minutes}min",
+                f"docker_task_failed:{task_id[:16]}",
             )
-            phase.fixed += 1
-            phase.actions.append(f"docker_task_failed:{task_id[:16]}")
 
+        self._apply_task_recovery(plan, phase)
         return phase
 
-    def _recover_orphaned_task(self, task: Dict[str, Any], phase: PhaseResult) -> None:
+    def _apply_task_recovery(self, plan: '_RecoveryPlan', phase: PhaseResult) -> None:
+        """Apply collected task recovery decisions set-based."""
+        for error, entries in plan.failures.items():
+            self._repo.mark_tasks_failed([task_id for task_id, _ in entries], error)
+            phase.fixed += len(entries)
+            phase.actions.extend(action for _, action in entries)
+
+        if plan.resends:
+            # Send first and count a retry only for tasks actually re-queued,
+            # so a queue failure mid-batch burns no retry budget for the rest
+            sent = []
+            for task, action in plan.resends:
+                try:
+                    self._send_task_message(task)
+                except Exception as e:
+                    logger.warning(
+                        f"[GUARDIAN] Re-send of task {task['task_id'][:16]}... failed, "
+                        f"retry not counted: {e}"
+                    )
+                    continue
+                sent.append(task['task_id'])
+                phase.fixed += 1
+                phase.actions.append(action)
+            self._repo.increment_task_retries(sent)
+
+    def _recover_orphaned_task(self, task: Dict[str, Any], plan: '_RecoveryPlan') -> None:
         """
         Recover an orphaned PENDING task by re-sending its queue message.
 
@@ -381,12 +432,11 @@ class SystemGuardian:
                 f"[GUARDIAN] Orphaned PENDING task {task_id[:16]}... "
                 f"max retries ({retry_count}), marking FAILED"
             )
-            self._repo.mark_tasks_failed(
-                [task_id],
-                f"guardian_max_retries: {retry_count} retries exhausted"
+            plan.fail(
+                task_id,
+                f"guardian_max_retries: {retry_count} retries exhausted",
+                f"pending_task_failed_max_retries:{task_id[:16]}",
             )
-            phase.fixed += 1
-            phase.actions.append(f"pending_task_failed_max_retries:{task_id[:16]}")
             return
 
         # Re-send message
@@ -394,12 +444,9 @@ class SystemGuardian:
             f"[GUARDIAN] Re-sending orphaned PENDING task {task_id[:16]}... "
             f"(retry {retry_count + 1})"
         )
-        self._repo.increment_task_retry(task_id)
-        self._send_task_message(task)
-        phase.fixed += 1
-        phase.actions.append(f"pending_task_resent:{task_id[:16]}")
+        plan.resend(task, f"pending_task_resent:{task_id[:16]}")
 
-    def _recover_queued_task(self, task: Dict[str, Any], phase: PhaseResult) -> None:
+    def _recover_queued_task(self, task: Dict[str, Any], plan: '_RecoveryPlan') -> None:
         """
         Recover an orphaned QUEUED task.
 
@@ -426,12 +473,11 @@ class SystemGuardian:
                 f"[GUARDIAN] Orphaned QUEUED task {task_id[:16]}... "
                 f"max retries ({retry_count}), marking FAILED"
             )
-            self._repo.mark_tasks_failed(
-                [task_id],
-                f"guardian_max_retries: {retry_count} retries exhausted (queued)"
+            plan.fail(
+                task_id,
+                f"guardian_max_retries: {retry_count} retries exhausted (queued)",
+                f"queued_task_failed_max_retries:{task_id[:16]}",
             )
-            phase.fixed += 1
-            phase.actions.append(f"queued_task_failed_max_retries:{task_id[:16]}")
             return
 
         # Re-send
@@ -439,13 +485,10 @@ class SystemGuardian:
             f"[GUARDIAN] Re-sending orphaned QUEUED task {task_id[:16]}... "
             f"(retry {retry_count + 1})"
         )
-        self._repo.increment_task_retry(task_id)
-        self._send_task_message(task)
-        phase.fixed += 1
-        phase.actions.append(f"queued_task_resent:{task_id[:16]}")
+        plan.resend(task, f"queued_task_resent:{task_id[:16]}")
 
     def _recover_stale_processing_task(
-        self, task: Dict[str, Any], phase: PhaseResult
+        self, task: Dict[str, Any], plan: '_RecoveryPlan'
     ) -> None:
         """
         Recover a stale PROCESSING task.
@@ -464,10 +507,7 @@ class SystemGuardian:
                 f"[GUARDIAN] Stale PROCESSING task {task_id[:16]}... "
                 f"(no pulse, retry {retry_count + 1}), re-queuing"
             )
-            self._repo.increment_task_retry(task_id)
-            self._send_task_message(task)
-            phase.fixed += 1
-            phase.actions.append(f"stale_task_requeued:{task_id[:16]}")
+            plan.resend(task, f"stale_task_requeued:{task_id[:16]}")
         else:
             # Task ran and died, or max retries exceeded
             reason = "task_ran_and_died" if last_pulse else "max_retries"
@@ -475,13 +515,12 @@ class SystemGuardian:
                 f"[GUARDIAN] Stale PROCESSING task {task_id[:16]}... "
                 f"({reason}), marking FAILED"
             )
-            self._repo.mark_tasks_failed(
-                [task_id],
+            plan.fail(
+                task_id,
                 f"guardian_stale_processing: {reason} "
-                f"(pulse={'yes' if last_pulse else 'no'}, retries={retry_count})"
+                f"(pulse={'yes' if last_pulse else 'no'}, retries={retry_count})",
+                f"stale_task_failed:{task_id[:16]}",
             )
-            phase.fixed += 1
-            phase.actions.append(f"stale_task_failed:{task_id[:16]}")
 
     # ================================================================
     # PHASE 2: STAGE RECOVERY (Risk H fix)
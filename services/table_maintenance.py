@@ -25,6 +25,8 @@ Exports:
     schedule_vacuum_async: Schedule one-time VACUUM via pg_cron
     check_vacuum_status: Check pg_cron job history
     get_table_bloat_stats: Get dead tuple statistics
+    query_table_inventory: Sizes, estimated rows, dead tuples and catalog
+        linkage for every table in a set of schemas, from catalog statistics
 """
 
 from typing import Dict, Any, List, Optional
@@ -32,6 +34,8 @@ from datetime import datetime, timezone
 import time
 import logging
 
+from psycopg import sql
+
 from util_logger import LoggerFactory, ComponentType
 
 logger = LoggerFactory.create_logger(ComponentType.SERVICE, "table_maintenance")
@@ -269,6 +273,9 @@ def get_table_bloat_stats(
     """
     Get dead tuple statistics for tables (indicates need for vacuum).
 
+    Built on query_table_inventory, so each entry also carries table size
+    and the planner's row estimate. No table is scanned.
+
     Args:
         schemas: List of schemas to check (default: h3, geo, pgstac, app)
         connection_provider: Object with _get_connection() method
@@ -286,35 +293,13 @@ def get_table_bloat_stats(
     try:
         with connection_provider._get_connection() as conn:
             with conn.cursor() as cur:
-                # Get vacuum stats for specified schemas
-                cur.execute("""
-                    SELECT schemaname, relname,
-                           last_vacuum, last_autovacuum,
-                           last_analyze, last_autoanalyze,
-                           n_dead_tup, n_live_tup,
-                           ROUND(100.0 * n_dead_tup / NULLIF(n_live_tup + n_dead_tup, 0), 2) as dead_pct
-                    FROM pg_stat_user_tables
-                    WHERE schemaname = ANY(%s)
-                    ORDER BY n_dead_tup DESC
-                """, (schemas,))
-
-                tables = []
-                for row in cur.fetchall():
-                    # psycopg3 returns dict_row - use column names
-                    dead_tuples = row['n_dead_tup']
-                    dead_pct = row['dead_pct']
-                    tables.append({
-                        "schema": row['schemaname'],
-                        "table": row['relname'],
-                        "last_vacuum": row['last_vacuum'].isoformat() if row['last_vacuum'] else None,
-                        "last_autovacuum": row['last_autovacuum'].isoformat() if row['last_autovacuum'] else None,
-                        "last_analyze": row['last_analyze'].isoformat() if row['last_analyze'] else None,
-                        "last_autoanalyze": row['last_autoanalyze'].isoformat() if row['last_autoanalyze'] else None,
-                        "dead_tuples": dead_tuples,
-                        "live_tuples": row['n_live_tup'],
-                        "dead_pct": float(dead_pct) if dead_pct else 0.0,
-                        "needs_vacuum": dead_tuples > 10000 or (dead_pct and float(dead_pct) > 5)
-                    })
+                inventory = query_table_inventory(cur, schemas)
+
+        tables = sorted(
+            (t for t in inventory if t["live_tuples"] is not None),
+            key=lambda t: t["dead_tuples"],
+            reverse=True,
+        )
 
         return {
             "status": "ok",
@@ -329,6 +314,127 @@ def get_table_bloat_stats(
         return {"status": "error", "error": str(e)}
 
 
+# ============================================================================
+# TABLE INVENTORY (catalog statistics — no table scans)
+# ============================================================================
+
+# needs_vacuum thresholds (dead tuples, dead percentage)
+VACUUM_DEAD_TUPLES_THRESHOLD = 10000
+VACUUM_DEAD_PCT_THRESHOLD = 5.0
+
+
+def query_table_inventory(
+    cur,
+    schemas: List[str],
+    catalog_table: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Inventory every ordinary/partitioned table in *schemas* in one statement.
+
+    Sizes come from pg_total_relation_size / pg_relation_size, row counts
+    from pg_class.reltuples (the ANALYZE estimate, falling back to
+    pg_stat_user_tables.n_live_tup for never-analyzed tables), and dead
+    tuples from pg_stat_user_tables. Only the system catalogs are read, so
+    the cost does not depend on table sizes.
+
+    With *catalog_table* ('schema.table' with a table_name and created_at
+    column, e.g. 'geo.table_catalog'), the relations are FULL OUTER JOINed
+    to it on table_name, with catalog rows taken to live in schemas[0]. Each entry then gets in_catalog,
+    and catalog rows with no table come back as entries with
+    exists=False.
+
+    Args:
+        cur: Open dict_row cursor
+        schemas: Schemas to inventory
+        catalog_table: Optional catalog to link relations against
+
+    Returns:
+        One dict per table (and per dangling catalog row), ordered by
+        schema and table name.
+    """
+    relations = sql.SQL("""
+        SELECT n.nspname AS schema_name,
+               c.relname AS table_name,
+               pg_total_relation_size(c.oid) AS total_bytes,
+               pg_relation_size(c.oid) AS table_bytes,
+               CASE WHEN c.reltuples >= 0 THEN c.reltuples::bigint
+                    ELSE s.n_live_tup END AS estimated_rows,
+               s.n_live_tup, s.n_dead_tup,
+               ROUND(100.0 * s.n_dead_tup / NULLIF(s.n_live_tup + s.n_dead_tup, 0), 2) AS dead_pct,
+               s.last_vacuum, s.last_autovacuum,
+               s.last_analyze, s.last_autoanalyze
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+        WHERE c.relkind IN ('r', 'p')
+          AND n.nspname = ANY(%s)
+    """)
+
+    if catalog_table:
+        catalog_schema, catalog_name = catalog_table.split('.', 1)
+        query = sql.SQL("""
+            WITH rel AS ({relations}),
+                 cat AS (SELECT %s::text AS schema_name, table_name::text AS table_name,
+                                created_at
+                         FROM {catalog})
+            SELECT COALESCE(rel.schema_name::text, cat.schema_name) AS schema_name,
+                   COALESCE(rel.table_name::text, cat.table_name) AS table_name,
+                   rel.total_bytes, rel.table_bytes, rel.estimated_rows,
+                   rel.n_live_tup, rel.n_dead_tup, rel.dead_pct,
+                   rel.last_vacuum, rel.last_autovacuum,
+                   rel.last_analyze, rel.last_autoanalyze,
+                   rel.table_name IS NOT NULL AS exists,
+                   cat.table_name IS NOT NULL AS in_catalog,
+                   cat.created_at AS catalog_created_at
+            FROM rel
+            FULL OUTER JOIN cat
+              ON rel.schema_name::text = cat.schema_name
+             AND rel.table_name::text = cat.table_name
+            ORDER BY 1, 2
+        """).format(
+            relations=relations,
+            catalog=sql.Identifier(catalog_schema, catalog_name),
+        )
+        params = (schemas, schemas[0])
+    else:
+        query = sql.SQL("""
+            SELECT rel.*, TRUE AS exists, NULL::boolean AS in_catalog,
+                   NULL::timestamptz AS catalog_created_at
+            FROM ({relations}) rel
+            ORDER BY 1, 2
+        """).format(relations=relations)
+        params = (schemas,)
+
+    cur.execute(query, params)
+
+    inventory = []
+    for row in cur.fetchall():
+        dead_tuples = row['n_dead_tup'] or 0
+        dead_pct = float(row['dead_pct']) if row['dead_pct'] is not None else 0.0
+        inventory.append({
+            "schema": row['schema_name'],
+            "table": row['table_name'],
+            "exists": row['exists'],
+            "in_catalog": row['in_catalog'],
+            "catalog_created_at": row['catalog_created_at'].isoformat() if row['catalog_created_at'] else None,
+            "total_bytes": row['total_bytes'],
+            "table_bytes": row['table_bytes'],
+            "estimated_rows": row['estimated_rows'],
+            "live_tuples": row['n_live_tup'],
+            "dead_tuples": dead_tuples,
+            "dead_pct": dead_pct,
+            "last_vacuum": row['last_vacuum'].isoformat() if row['last_vacuum'] else None,
+            "last_autovacuum": row['last_autovacuum'].isoformat() if row['last_autovacuum'] else None,
+            "last_analyze": row['last_analyze'].isoformat() if row['last_analyze'] else None,
+            "last_autoanalyze": row['last_autoanalyze'].isoformat() if row['last_autoanalyze'] else None,
+            "needs_vacuum": (
+                dead_tuples > VACUUM_DEAD_TUPLES_THRESHOLD
+                or dead_pct > VACUUM_DEAD_PCT_THRESHOLD
+            ),
+        })
+    return inventory
+
+
 # ============================================================================
 # MODULE EXPORTS
 # ============================================================================
@@ -336,5 +442,6 @@ def get_table_bloat_stats(
 __all__ = [
     'schedule_vacuum_async',
     'check_vacuum_status',
-    'get_table_bloat_stats'
+    'get_table_bloat_stats',
+    'query_table_inventory'
 ]
@@ -1092,10 +1092,25 @@ def drop_postgis_table(params: Dict[str, Any], context: Optional[Dict[str, Any]]
 
                 conn.commit()
 
+        # Pre-rendered tile archive would otherwise keep serving dropped data
+        tile_archive_deleted = False
+        if table_dropped:
+            try:
+                from config import get_config
+                from infrastructure.blob import BlobRepository
+                from services.vector.tile_archive import archive_blob_path
+                tile_archive_deleted = BlobRepository.for_zone("silver").delete_blob(
+                    get_config().storage.silver.get_container("misc"),
+                    archive_blob_path(schema_name, table_name),
+                )
+            except Exception as tile_err:
+                logger.warning(f"Tile archive cleanup failed (non-fatal): {tile_err}")
+
         return {
             "success": True,
             "table_dropped": table_dropped,
             "metadata_deleted": metadata_deleted,
+            "tile_archive_deleted": tile_archive_deleted,
             "release_revoked": release_revoked,
             "already_gone": not exists,
             "table_name": table_name,
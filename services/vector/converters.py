@@ -2,11 +2,13 @@
 # FORMAT-SPECIFIC VECTOR CONVERTERS
 # ============================================================================
 # STATUS: Service layer - File format conversion functions
-# PURPOSE: Convert CSV, GeoJSON, GPKG, KML, KMZ, Shapefile to GeoDataFrame
-# LAST_REVIEWED: 26 FEB 2026
+# PURPOSE: Convert CSV, GeoJSON, GPKG, KML, KMZ, Shapefile to GeoDataFrame,
+#          or stream them batch-wise to GeoParquet
+# LAST_REVIEWED: 18 OCT 2026
 # REVIEW_STATUS: Checks 1-7 Applied (Check 8 N/A - no infrastructure config)
-# EXPORTS: _convert_csv, _convert_geojson, _convert_geopackage, _convert_kml, _convert_kmz, _convert_shapefile
-# DEPENDENCIES: geopandas, pandas
+# EXPORTS: _convert_csv, _convert_geojson, _convert_geopackage, _convert_kml, _convert_kmz, _convert_shapefile,
+#          stream_to_geoparquet, STREAMABLE_FORMATS
+# DEPENDENCIES: geopandas, pandas, pyarrow, pyogrio (streaming path)
 # ============================================================================
 """
 Format-Specific Vector Converters.
@@ -21,6 +23,9 @@ Exports:
     _convert_kml: Convert KML files
     _convert_kmz: Convert KMZ (zipped KML) files
     _convert_shapefile: Convert Shapefile (zipped)
+    stream_to_geoparquet: Stream CSV/GeoJSON/GPKG/Shapefile to GeoParquet in
+        bounded-memory record batches (Arrow path)
+    STREAMABLE_FORMATS: Extensions stream_to_geoparquet accepts
 """
 
 import csv
@@ -234,6 +239,69 @@ def _convert_csv(
         ValueError: If specified columns don't exist in CSV
         ValueError: If all rows are empty after filtering
     """
+    encoding, delimiter, lat_name, lon_name, wkt_column = _validate_csv_sample(
+        data, lat_name, lon_name, wkt_column
+    )
+
+    # ── Phase 2: Full file load ─────────────────────────────────────────
+    if _is_file_path(data):
+        data_size = Path(data).stat().st_size
+    else:
+        data_size = data.seek(0, 2)  # seek to end to get size
+        data.seek(0)
+    logger.info(f"Sample validation passed (100 rows), loading full file ({data_size:,} bytes)")
+
+    df = pd.read_csv(
+        data,
+        encoding=encoding,
+        sep=delimiter,
+        na_values=COMMON_NA_VALUES,
+    )
+
+    # ── Phase 3: Empty row filtering ────────────────────────────────────
+    total_rows = len(df)
+    df = df.dropna(how='all')
+    dropped = total_rows - len(df)
+
+    if dropped > 0:
+        pct = (dropped / total_rows * 100) if total_rows > 0 else 0
+        logger.warning(f"Removed {dropped} empty rows ({pct:.1f}%) from CSV")
+
+    if len(df) == 0:
+        raise ValueError(
+            f"CSV file contains no data rows after filtering. "
+            f"Original row count: {total_rows}, all rows were empty/null."
+        )
+
+    logger.info(f"CSV loaded: {len(df)} rows, {len(df.columns)} columns")
+
+    # Convert based on provided parameters
+    if wkt_column:
+        return wkt_df_to_gdf(df, wkt_column)
+    else:
+        return xy_df_to_gdf(df, lat_name, lon_name)
+
+
+def _validate_csv_sample(
+    data: ConverterInput,
+    lat_name: Optional[str],
+    lon_name: Optional[str],
+    wkt_column: Optional[str],
+) -> Tuple[str, str, Optional[str], Optional[str], Optional[str]]:
+    """
+    Sample-first CSV validation shared by the in-memory and streaming paths.
+
+    Reads 100 rows, checks the header, resolves column names
+    case-insensitively and validates coordinate / WKT columns.
+
+    Returns:
+        Tuple of (encoding, delimiter, lat_name, lon_name, wkt_column) with
+        column names resolved to the actual CSV header spelling
+
+    Raises:
+        ValueError: If neither lat/lon nor wkt_column provided, columns are
+            missing, or the sample fails validation
+    """
     if not (wkt_column or (lat_name and lon_name)):
         raise ValueError(
             "CSV conversion requires either 'wkt_column' or both 'lat_name' and 'lon_name'"
@@ -314,43 +382,9 @@ def _convert_csv(
                 + "\n".join(parse_errors)
             )
 
-    # ── Phase 2: Full file load ─────────────────────────────────────────
-    if _is_file_path(data):
-        data_size = Path(data).stat().st_size
-    else:
-        data_size = data.seek(0, 2)  # seek to end to get size
+    if not _is_file_path(data):
         data.seek(0)
-    logger.info(f"Sample validation passed (100 rows), loading full file ({data_size:,} bytes)")
-
-    df = pd.read_csv(
-        data,
-        encoding=encoding,
-        sep=delimiter,
-        na_values=COMMON_NA_VALUES,
-    )
-
-    # ── Phase 3: Empty row filtering ────────────────────────────────────
-    total_rows = len(df)
-    df = df.dropna(how='all')
-    dropped = total_rows - len(df)
-
-    if dropped > 0:
-        pct = (dropped / total_rows * 100) if total_rows > 0 else 0
-        logger.warning(f"Removed {dropped} empty rows ({pct:.1f}%) from CSV")
-
-    if len(df) == 0:
-        raise ValueError(
-            f"CSV file contains no data rows after filtering. "
-            f"Original row count: {total_rows}, all rows were empty/null."
-        )
-
-    logger.info(f"CSV loaded: {len(df)} rows, {len(df.columns)} columns")
-
-    # Convert based on provided parameters
-    if wkt_column:
-        return wkt_df_to_gdf(df, wkt_column)
-    else:
-        return xy_df_to_gdf(df, lat_name, lon_name)
+    return encoding, delimiter, lat_name, lon_name, wkt_column
 
 
 def _convert_geojson(data: ConverterInput, **kwargs) -> gpd.GeoDataFrame:
@@ -688,11 +722,72 @@ def _convert_shapefile(data: ConverterInput, shp_name: Optional[str] = None, **k
                     missing companion files, missing .prj, no geometry column,
                     or all geometries are NULL
     """
+    shp_path = _extract_checked_shapefile(data, shp_name, kwargs.get('extract_dir'))
+
+    # 3. Read shapefile
+    gdf = gpd.read_file(shp_path)
+
+    # 4. Geometry column check
+    if 'geometry' not in gdf.columns:
+        raise ValueError(
+            f"Shapefile has no geometry column. Available columns: "
+            f"{list(gdf.columns)}. This may indicate a corrupted .shp file "
+            f"or a non-spatial DBF-only table."
+        )
+
+    # 5. Diagnostics logging
+    logger.info(f"Shapefile loaded: {len(gdf)} features, CRS: {gdf.crs}")
+
+    if len(gdf) > 0:
+        null_count = gdf.geometry.isna().sum()
+
+        # 6. All-NULL geometry check (FAIL — not warn)
+        if gdf.geometry.isna().all():
+            raise ValueError(_all_null_shapefile_message(len(gdf), null_count))
+
+        if null_count > 0:
+            logger.warning(
+                f"{null_count} of {len(gdf)} features have NULL geometries "
+                f"({null_count/len(gdf)*100:.1f}%) — these will be removed during validation"
+            )
+
+        # Log geometry types for diagnostics
+        valid_geoms = gdf[~gdf.geometry.isna()]
+        if len(valid_geoms) > 0:
+            geom_types = valid_geoms.geometry.geom_type.value_counts().to_dict()
+            logger.info(f"   Geometry types: {geom_types}")
+
+    return gdf
+
+
+def _all_null_shapefile_message(feature_count: int, null_count: int) -> str:
+    return (
+        f"Shapefile contains {feature_count} features but ALL geometries "
+        f"are NULL ({null_count} of {feature_count}). This typically means "
+        f"the .shp file is corrupted or the geometry column is empty. "
+        f"Re-export from your source GIS application."
+    )
+
+
+def _extract_checked_shapefile(
+    data: ConverterInput,
+    shp_name: Optional[str],
+    extract_dir: Optional[str],
+) -> str:
+    """
+    Extract the single .shp from a ZIP and verify its companion files.
+
+    Steps 0-2 of _convert_shapefile, shared with the streaming path.
+
+    Returns:
+        Path to the extracted .shp file
+
+    Raises:
+        ValueError: Invalid ZIP, zero/multiple .shp, missing .shx/.dbf/.prj
+    """
     import os
     import zipfile as zipfile_module
 
-    extract_dir = kwargs.get('extract_dir')
-
     # 0. ZIP integrity + .shp presence (KMZ pattern)
     try:
         # Pre-scan: check for multiple .shp files before extracting
@@ -773,42 +868,374 @@ def _convert_shapefile(data: ConverterInput, shp_name: Optional[str] = None, **k
             f"the CRS/projection defined, or add the .prj file to the ZIP."
         )
 
-    # 3. Read shapefile
-    gdf = gpd.read_file(shp_path)
+    return shp_path
 
-    # 4. Geometry column check
-    if 'geometry' not in gdf.columns:
-        raise ValueError(
-            f"Shapefile has no geometry column. Available columns: "
-            f"{list(gdf.columns)}. This may indicate a corrupted .shp file "
-            f"or a non-spatial DBF-only table."
-        )
 
-    # 5. Diagnostics logging
-    logger.info(f"Shapefile loaded: {len(gdf)} features, CRS: {gdf.crs}")
+# =============================================================================
+# ARROW STREAMING → GEOPARQUET (18 OCT 2026)
+# =============================================================================
+# The converters above materialise the whole source as a GeoDataFrame. For
+# multi-GB GeoPackages and CSVs that is the Docker worker's peak memory. The
+# streaming path decodes record batches (pyogrio Arrow stream / pyarrow CSV
+# reader) and appends each batch to the GeoParquet intermediate, so peak
+# memory is bounded by the batch, not the file.
+#
+# KML/KMZ keep the in-memory converters: their structural validation parses
+# the whole XML document anyway and sources are small.
+# =============================================================================
 
-    if len(gdf) > 0:
-        null_count = gdf.geometry.isna().sum()
+# Formats stream_to_geoparquet decodes batch-wise
+STREAMABLE_FORMATS = frozenset({'csv', 'geojson', 'json', 'gpkg', 'shp', 'zip'})
 
-        # 6. All-NULL geometry check (FAIL — not warn)
-        if gdf.geometry.isna().all():
+# Features per OGR record batch
+STREAM_BATCH_ROWS = 65_536
+
+# Bytes per pyarrow CSV block (types are inferred from the first block)
+CSV_BLOCK_BYTES = 16 * 1024 * 1024
+
+
+class _StreamFallback(Exception):
+    """Raised when a source can't be streamed and the in-memory path should run."""
+
+
+class _GeoParquetBatchWriter:
+    """
+    Incremental GeoParquet writer (WKB geometry column named 'geometry').
+
+    The schema is fixed by the first batch; later batches are cast to it.
+    geometry_types is written as [] ("unknown") since types are only known
+    after the last batch — downstream validate_and_clean derives them anyway.
+    """
+
+    def __init__(self, output_path: str, crs: Optional[str]):
+        self.output_path = output_path
+        self.crs = crs
+        self.row_count = 0
+        self.null_geometry_count = 0
+        self.batches = 0
+        self._writer = None
+        self._schema = None
+
+    def _geo_metadata(self) -> bytes:
+        import json
+        crs_json = None
+        if self.crs:
+            from pyproj import CRS
+            crs_json = CRS.from_user_input(self.crs).to_json_dict()
+        return json.dumps({
+            "version": "1.0.0",
+            "primary_column": "geometry",
+            "columns": {
+                "geometry": {
+                    "encoding": "WKB",
+                    "geometry_types": [],
+                    "crs": crs_json,
+                }
+            },
+        }).encode()
+
+    def write(self, table) -> None:
+        import pyarrow.parquet as pq
+
+        if table.num_rows == 0:
+            return
+        if self._writer is None:
+            self._schema = table.schema.with_metadata({b"geo": self._geo_metadata()})
+            self._writer = pq.ParquetWriter(self.output_path, self._schema)
+        table = table.cast(self._schema)
+        self._writer.write_table(table)
+
+        self.row_count += table.num_rows
+        self.null_geometry_count += table.column("geometry").null_count
+        self.batches += 1
+        if self.batches % 20 == 0:
+            logger.info(f"   Streamed {self.row_count:,} rows ({self.batches} batches)")
+
+    @property
+    def columns(self) -> list:
+        if self._schema is None:
+            return []
+        return [n for n in self._schema.names if n != "geometry"]
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def _stream_ogr(path: str, writer_path: str, layer: Optional[str], batch_rows: int) -> _GeoParquetBatchWriter:
+    """Stream an OGR-readable source through pyogrio's Arrow interface."""
+    import pyarrow as pa
+    from pyogrio.raw import open_arrow
+
+    with open_arrow(path, layer=layer, batch_size=batch_rows, use_pyarrow=True) as source:
+        meta, reader = source
+        if meta.get("geometry_type") is None:
             raise ValueError(
-                f"Shapefile contains {len(gdf)} features but ALL geometries "
-                f"are NULL ({null_count} of {len(gdf)}). This typically means "
-                f"the .shp file is corrupted or the geometry column is empty. "
-                f"Re-export from your source GIS application."
+                f"Source has no geometry column. Available columns: "
+                f"{list(meta.get('fields', []))}."
             )
+        geom_name = meta.get("geometry_name") or "wkb_geometry"
+        writer = _GeoParquetBatchWriter(writer_path, meta.get("crs"))
+        try:
+            for batch in reader:
+                table = pa.Table.from_batches([batch])
+                names = [("geometry" if n == geom_name else n) for n in table.schema.names]
+                writer.write(table.rename_columns(names))
+        finally:
+            writer.close()
+    return writer
+
+
+def _stream_csv(
+    path: str,
+    writer_path: str,
+    lat_name: Optional[str],
+    lon_name: Optional[str],
+    wkt_column: Optional[str],
+) -> _GeoParquetBatchWriter:
+    """
+    Stream a CSV through pyarrow's block reader, building WKB points/geometries
+    per block. Sample validation (_validate_csv_sample) runs first.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import shapely
+
+    encoding, delimiter, lat_name, lon_name, wkt_column = _validate_csv_sample(
+        path, lat_name, lon_name, wkt_column
+    )
+    logger.info(
+        f"Sample validation passed (100 rows), streaming full file "
+        f"({Path(path).stat().st_size:,} bytes)"
+    )
 
-        if null_count > 0:
-            logger.warning(
-                f"{null_count} of {len(gdf)} features have NULL geometries "
-                f"({null_count/len(gdf)*100:.1f}%) — these will be removed during validation"
+    read_options = pacsv.ReadOptions(
+        encoding='utf8' if encoding.startswith('utf-8') else encoding,
+        block_size=CSV_BLOCK_BYTES,
+    )
+    parse_options = pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True)
+    convert_options = pacsv.ConvertOptions(
+        null_values=list(pacsv.ConvertOptions().null_values) + COMMON_NA_VALUES,
+        strings_can_be_null=True,
+    )
+    if not wkt_column:
+        convert_options.column_types = {lat_name: pa.float64(), lon_name: pa.float64()}
+
+    writer = _GeoParquetBatchWriter(writer_path, DEFAULT_CRS)
+    total_rows = 0
+    dropped_empty = 0
+    dropped_wkt = 0
+    dropped_coords = 0
+    try:
+        reader = pacsv.open_csv(path, read_options, parse_options, convert_options)
+        while True:
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                break
+            except pa.ArrowInvalid as exc:
+                # Later block disagrees with types inferred from the first block
+                raise _StreamFallback(f"CSV type inference failed mid-file: {exc}") from exc
+
+            table = pa.Table.from_batches([batch])
+            total_rows += table.num_rows
+
+            # Phase 3 equivalent: drop rows where every column is null
+            all_null = None
+            for col in table.columns:
+                col_null = pc.is_null(col)
+                all_null = col_null if all_null is None else pc.and_(all_null, col_null)
+            if all_null is not None:
+                keep = pc.invert(all_null)
+                before = table.num_rows
+                table = table.filter(keep)
+                dropped_empty += before - table.num_rows
+            if table.num_rows == 0:
+                continue
+
+            if wkt_column:
+                geoms = shapely.from_wkt(
+                    np.asarray(table.column(wkt_column).cast(pa.string()).to_pylist(), dtype=object),
+                    on_invalid="ignore",
+                )
+                valid = ~shapely.is_missing(geoms)
+                dropped_wkt += int((~valid).sum())
+            else:
+                lon = table.column(lon_name).to_numpy(zero_copy_only=False)
+                lat = table.column(lat_name).to_numpy(zero_copy_only=False)
+                valid = ~(np.isnan(lon) | np.isnan(lat))
+                dropped_coords += int((~valid).sum())
+                lon, lat = lon[valid], lat[valid]
+                if lon.size and (lon.min() < -180 or lon.max() > 180):
+                    raise ValueError(
+                        f"Longitude values out of range: min={lon.min()}, "
+                        f"max={lon.max()}. Valid range: -180 to 180"
+                    )
+                if lat.size and (lat.min() < -90 or lat.max() > 90):
+                    raise ValueError(
+                        f"Latitude values out of range: min={lat.min()}, "
+                        f"max={lat.max()}. Valid range: -90 to 90"
+                    )
+                geoms = shapely.points(lon, lat)
+
+            table = table.filter(pa.array(valid))
+            if wkt_column:
+                geoms = geoms[valid]
+
+            # The parsed geometry replaces any source 'geometry' column,
+            # including the WKT column itself when it is named 'geometry'
+            if "geometry" in table.schema.names:
+                table = table.drop_columns(["geometry"])
+
+            if table.num_rows == 0:
+                continue
+
+            table = table.append_column("geometry", pa.array(shapely.to_wkb(geoms), type=pa.binary()))
+            writer.write(table)
+    finally:
+        writer.close()
+
+    if dropped_empty:
+        pct = dropped_empty / total_rows * 100 if total_rows else 0
+        logger.warning(f"Removed {dropped_empty} empty rows ({pct:.1f}%) from CSV")
+    if dropped_wkt:
+        logger.warning(f"Dropped {dropped_wkt} rows with invalid WKT in column '{wkt_column}'")
+    if dropped_coords:
+        logger.warning(
+            f"Dropped {dropped_coords} rows with null/NaN coordinates in "
+            f"'{lat_name}'/'{lon_name}'"
+        )
+    if writer.row_count == 0:
+        if wkt_column and dropped_wkt:
+            raise ValueError(
+                f"All {dropped_wkt} rows have invalid or empty WKT in column "
+                f"'{wkt_column}'. No valid geometries to process."
+            )
+        if dropped_coords:
+            raise ValueError(
+                f"All {dropped_coords} rows have null or NaN coordinates in "
+                f"'{lat_name}'/'{lon_name}'. No valid points to process."
             )
+        raise ValueError(
+            f"CSV file contains no data rows after filtering. "
+            f"Original row count: {total_rows}, all rows were empty/null."
+        )
+    return writer
 
-        # Log geometry types for diagnostics
-        valid_geoms = gdf[~gdf.geometry.isna()]
-        if len(valid_geoms) > 0:
-            geom_types = valid_geoms.geometry.geom_type.value_counts().to_dict()
-            logger.info(f"   Geometry types: {geom_types}")
 
-    return gdf
+def stream_to_geoparquet(
+    path: str,
+    file_extension: str,
+    output_path: str,
+    batch_rows: int = STREAM_BATCH_ROWS,
+    **params
+) -> dict:
+    """
+    Convert a mount-resident source to a GeoParquet file batch by batch.
+
+    Applies the same validation as the in-memory converters (CSV sample
+    checks, shapefile companion/.prj checks, non-empty result). CSVs whose
+    later blocks contradict the types inferred from the first block, and
+    GeoJSON that OGR's GeoJSON driver refuses, fall back to the in-memory
+    converter (which raises its usual validation errors).
+
+    Args:
+        path: Source file path on the ETL mount
+        file_extension: One of STREAMABLE_FORMATS
+        output_path: GeoParquet path to write
+        batch_rows: Features per OGR record batch
+        **params: Converter params (lat_name, lon_name, wkt_column,
+            layer_name, shp_name, extract_dir)
+
+    Returns:
+        Dict with row_count, columns, geometry_column, crs_raw,
+        null_geometry_count, batches, mode ('stream' or 'fallback')
+
+    Raises:
+        ValueError: On validation failures (same messages as the converters)
+    """
+    file_extension = file_extension.lower().lstrip('.')
+    if file_extension not in STREAMABLE_FORMATS:
+        raise ValueError(f"Format '{file_extension}' is not streamable")
+
+    try:
+        if file_extension == 'csv':
+            writer = _stream_csv(
+                path, output_path,
+                params.get('lat_name'), params.get('lon_name'), params.get('wkt_column'),
+            )
+        elif file_extension in ('shp', 'zip'):
+            shp_path = _extract_checked_shapefile(path, params.get('shp_name'), params.get('extract_dir'))
+            writer = _stream_ogr(shp_path, output_path, None, batch_rows)
+            if writer.row_count and writer.null_geometry_count == writer.row_count:
+                raise ValueError(
+                    _all_null_shapefile_message(writer.row_count, writer.null_geometry_count)
+                )
+        elif file_extension == 'gpkg':
+            try:
+                writer = _stream_ogr(path, output_path, params.get('layer_name'), batch_rows)
+            except Exception as e:
+                layer_name = params.get('layer_name')
+                if layer_name and ('layer' in str(e).lower() or 'not found' in str(e).lower()):
+                    raise ValueError(
+                        f"Layer '{layer_name}' not found in GeoPackage. "
+                        f"Original error: {type(e).__name__}: {e}"
+                    ) from e
+                raise
+        else:  # geojson / json
+            # Forcing the GeoJSON driver rejects what _convert_geojson's
+            # structural checks reject (non-JSON, non-GeoJSON 'type',
+            # TopoJSON/ESRI JSON, GeoJSONSeq). Anything OGR refuses is
+            # re-run through the in-memory converter so the caller gets
+            # its exact validation message.
+            try:
+                writer = _stream_ogr(f"GeoJSON:{path}", output_path, None, batch_rows)
+            except ValueError:
+                raise
+            except Exception as e:
+                raise _StreamFallback(f"OGR could not read GeoJSON: {type(e).__name__}: {e}") from e
+            if writer.row_count == 0:
+                raise ValueError(
+                    "GeoJSON FeatureCollection contains 0 features. "
+                    "The file structure is valid but has no data."
+                )
+    except _StreamFallback as fallback:
+        logger.warning(f"Streaming conversion unavailable ({fallback}); loading in memory")
+        converter = {
+            'csv': _convert_csv,
+            'geojson': _convert_geojson,
+            'json': _convert_geojson,
+        }[file_extension]
+        gdf = converter(path, **params)
+        gdf.to_parquet(output_path, index=False)
+        return {
+            "row_count": len(gdf),
+            "columns": [c for c in gdf.columns if c != gdf.geometry.name],
+            "geometry_column": gdf.geometry.name,
+            "crs_raw": str(gdf.crs) if gdf.crs else None,
+            "null_geometry_count": int(gdf.geometry.isna().sum()),
+            "batches": 1,
+            "mode": "fallback",
+        }
+
+    crs_raw = None
+    if writer.crs:
+        from pyproj import CRS
+        crs_raw = str(CRS.from_user_input(writer.crs))
+
+    logger.info(
+        f"Streamed {file_extension} to GeoParquet: {writer.row_count:,} rows "
+        f"in {writer.batches} batches (CRS: {crs_raw})"
+    )
+    return {
+        "row_count": writer.row_count,
+        "columns": writer.columns,
+        "geometry_column": "geometry",
+        "crs_raw": crs_raw,
+        "null_geometry_count": writer.null_geometry_count,
+        "batches": writer.batches,
+        "mode": "stream",
+    }
@@ -0,0 +1,381 @@
+# ============================================================================
+# CLAUDE CONTEXT - MULTI-RESOLUTION GENERALIZED GEOMETRY
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Service - Simplified companion views for low-zoom serving
+# PURPOSE: Build topology-preserving simplified materialized views of a
+#          published table at zoom-derived tolerances, and pick the right
+#          level for a zoom or bbox at serving time
+# CREATED: 18 OCT 2026
+# EXPORTS: tolerance_for_zoom, metres_per_unit_from_wkt, zoom_for_bbox,
+#          generalized_view_name, is_generalizable, create_generalized_views,
+#          refresh_generalized_views, list_generalized_levels,
+#          select_generalized_level
+# DEPENDENCIES: psycopg
+# ============================================================================
+"""
+Multi-resolution generalized geometry.
+
+Published tables hold full-resolution geometry. A country-scale coverage
+layer requested at zoom 3 still makes PostGIS clip and encode every vertex
+(tiles) or ship every vertex (OGC Features), though most collapse into the
+same pixel. This module adds a small pyramid of simplified companions:
+
+    geo.{table}_z{max_zoom}   materialized view, one per level
+
+Each level serves zooms <= max_zoom and is simplified with
+ST_SimplifyPreserveTopology at one pixel of a 256 px tile at that zoom
+(360 / (256 * 2^z) degrees for geographic CRSs; the Web Mercator pixel
+size in metres, converted to the CRS's linear unit, for projected ones),
+so the simplification is not visible at the zooms it serves. Levels are built finest-first and each
+coarser level is derived from the previous one, so every pass reads fewer
+vertices than the last.
+
+Each view carries a JSON comment ({"generalization_of", "max_zoom",
+"tolerance"}) which is how list_generalized_levels() discovers them; no
+extra catalog table is needed. The views depend on the base table, so
+DROP TABLE ... CASCADE (overwrite, unpublish) removes them too.
+
+Serving:
+    select_generalized_level(levels, zoom=z)        -> tiles, TileJSON
+    select_generalized_level(levels, bbox=[...])    -> OGC Features queries
+    None means "use the base table".
+
+Exports:
+    tolerance_for_zoom: Simplification tolerance for a zoom, in CRS units
+    metres_per_unit_from_wkt: Linear unit of a projected CRS
+    zoom_for_bbox: Approximate display zoom for a bbox request
+    generalized_view_name: Companion view name for a table/level
+    is_generalizable: Whether a geometry type benefits from simplification
+    create_generalized_views: Build the level views for a table
+    refresh_generalized_views: Refresh levels in dependency order
+    list_generalized_levels: Discover levels for a table
+    select_generalized_level: Pick the level for a zoom or bbox
+"""
+
+import json
+import math
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from psycopg import sql
+
+from util_logger import LoggerFactory, ComponentType
+
+logger = LoggerFactory.create_logger(ComponentType.SERVICE, "VectorGeneralization")
+
+# PostgreSQL truncates identifiers beyond this many bytes
+_MAX_IDENTIFIER_LENGTH = 63
+
+# Viewport width assumed when a request carries a bbox but no zoom
+_DEFAULT_VIEWPORT_PX = 1024
+
+# Columns not copied into generalized views
+_SKIP_COLUMNS = {"geom", "etl_batch_id"}
+
+# Simplification only changes polygons and lines
+_GENERALIZABLE_TYPES = {"polygon", "line", "multipolygon", "multilinestring"}
+
+# Web Mercator equator length (metres); 256 px tiles divide it by 2^z
+_EARTH_CIRCUMFERENCE_M = 2 * math.pi * 6378137
+
+# UNIT["name", factor] in OGC WKT; the last one in a projected CRS is its
+# linear unit (the GEOGCS unit comes earlier)
+_WKT_UNIT = re.compile(r'UNIT\[\s*"[^"]*"\s*,\s*([0-9.eE+-]+)')
+
+
+def tolerance_for_zoom(zoom: int, metres_per_unit: Optional[float] = None) -> float:
+    """
+    One 256 px tile pixel at `zoom`, in CRS units.
+
+    Degrees when metres_per_unit is None (geographic CRS); otherwise the
+    pixel size in metres divided by the projected CRS's metres per unit.
+    """
+    if metres_per_unit is None:
+        return 360.0 / (256 * (1 << zoom))
+    return _EARTH_CIRCUMFERENCE_M / (256 * (1 << zoom)) / metres_per_unit
+
+
+def metres_per_unit_from_wkt(srtext: Optional[str]) -> Optional[float]:
+    """
+    Linear unit of a projected CRS from its spatial_ref_sys WKT.
+
+    Returns None for geographic CRSs and for WKT without a usable unit, so
+    tolerance_for_zoom falls back to degrees.
+    """
+    text = (srtext or "").lstrip().upper()
+    if not text.startswith(("PROJCS", "PROJCRS")):
+        return None
+    factors = _WKT_UNIT.findall(text)
+    try:
+        factor = float(factors[-1])
+    except (IndexError, ValueError):
+        return None
+    return factor if factor > 0 else None
+
+
+def zoom_for_bbox(bbox: Sequence[float], viewport_px: int = _DEFAULT_VIEWPORT_PX) -> int:
+    """
+    Zoom at which bbox spans roughly viewport_px pixels horizontally.
+
+    Used for OGC Features requests, which carry a bbox but no zoom.
+    """
+    width = max(abs(bbox[2] - bbox[0]), abs(bbox[3] - bbox[1]), 1e-9)
+    return max(0, int(math.floor(math.log2(viewport_px * 360.0 / (256 * width)))))
+
+
+def generalized_view_name(table_name: str, max_zoom: int) -> str:
+    """Companion view name; raises ValueError if PostgreSQL would truncate it."""
+    name = f"{table_name}_z{max_zoom}"
+    if len(name.encode("utf-8")) > _MAX_IDENTIFIER_LENGTH:
+        raise ValueError(
+            f"Generalized view name '{name}' exceeds {_MAX_IDENTIFIER_LENGTH} bytes"
+        )
+    return name
+
+
+def is_generalizable(geometry_type: Optional[str]) -> bool:
+    """True for polygon and line tables."""
+    return (geometry_type or "").lower() in _GENERALIZABLE_TYPES
+
+
+def _attribute_columns(conn, table_name: str, schema: str) -> List[str]:
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s
+            ORDER BY ordinal_position
+        """, (schema, table_name))
+        return [r["column_name"] for r in cur.fetchall() if r["column_name"] not in _SKIP_COLUMNS]
+
+
+def _geometry_spec(conn, table_name: str, schema: str) -> Dict[str, Any]:
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT type, srid FROM geometry_columns
+            WHERE f_table_schema = %s AND f_table_name = %s AND f_geometry_column = 'geom'
+        """, (schema, table_name))
+        row = cur.fetchone()
+    if row is None:
+        raise ValueError(f"{schema}.{table_name} has no 'geom' geometry column")
+    return {"type": row["type"], "srid": row["srid"] or 4326}
+
+
+def _metres_per_unit(conn, srid: int) -> Optional[float]:
+    """Linear unit of `srid` from spatial_ref_sys; None for geographic CRSs."""
+    if srid == 4326:
+        return None
+    with conn.cursor() as cur:
+        cur.execute("SELECT srtext FROM spatial_ref_sys WHERE srid = %s", (srid,))
+        row = cur.fetchone()
+    return metres_per_unit_from_wkt(row["srtext"] if row else None)
+
+
+def _vertex_count(cur, schema: str, relation: str) -> int:
+    cur.execute(sql.SQL("SELECT COALESCE(SUM(ST_NPoints(geom)), 0) AS n FROM {}.{}").format(
+        sql.Identifier(schema), sql.Identifier(relation)
+    ))
+    return int(cur.fetchone()["n"])
+
+
+def create_generalized_views(
+    conn,
+    table_name: str,
+    schema: str,
+    zooms: Sequence[int],
+) -> List[Dict[str, Any]]:
+    """
+    Create one simplified materialized view per zoom level.
+
+    Existing level views for the table are replaced. Commits on success.
+
+    Args:
+        conn: psycopg connection (dict rows)
+        table_name: Published base table
+        schema: Base table schema
+        zooms: Max zoom served by each level, e.g. [4, 7, 10]
+
+    Returns:
+        One dict per level (coarsest first): view_name, max_zoom, min_zoom,
+        tolerance, row_count, vertex_count, vertex_ratio
+    """
+    if not zooms:
+        return []
+
+    geom = _geometry_spec(conn, table_name, schema)
+    metres_per_unit = _metres_per_unit(conn, geom["srid"])
+    columns = _attribute_columns(conn, table_name, schema)
+    column_sql = sql.SQL("").join(sql.SQL(", {}").format(sql.Identifier(c)) for c in columns)
+    geom_type = sql.SQL(geom["type"])
+    srid = sql.Literal(geom["srid"])
+    has_id = "id" in columns
+
+    levels: List[Dict[str, Any]] = []
+    with conn.cursor() as cur:
+        base_vertices = _vertex_count(cur, schema, table_name)
+        source = table_name
+
+        # Finest level first; each coarser level simplifies the previous one
+        for max_zoom in sorted(set(zooms), reverse=True):
+            start = time.monotonic()
+            view_name = generalized_view_name(table_name, max_zoom)
+            tolerance = tolerance_for_zoom(max_zoom, metres_per_unit)
+            view = sql.Identifier(schema, view_name)
+
+            cur.execute(sql.SQL("DROP MATERIALIZED VIEW IF EXISTS {} CASCADE").format(view))
+            cur.execute(sql.SQL("""
+                CREATE MATERIALIZED VIEW {view} AS
+                SELECT g.* FROM (
+                    SELECT ST_Multi(ST_SimplifyPreserveTopology(geom, {tol}))::geometry({gtype}, {srid}) AS geom
+                           {columns}
+                    FROM {source}
+                ) g
+                WHERE NOT ST_IsEmpty(g.geom)
+            """).format(
+                view=view,
+                tol=sql.Literal(tolerance),
+                gtype=geom_type,
+                srid=srid,
+                columns=column_sql,
+                source=sql.Identifier(schema, source),
+            ))
+
+            if has_id:
+                # Unique index enables REFRESH ... CONCURRENTLY
+                cur.execute(sql.SQL("CREATE UNIQUE INDEX {} ON {} (id)").format(
+                    sql.Identifier(f"{view_name}_id_uq"), view
+                ))
+            cur.execute(sql.SQL("CREATE INDEX {} ON {} USING GIST (geom)").format(
+                sql.Identifier(f"{view_name}_geom_gist"), view
+            ))
+            cur.execute(sql.SQL("COMMENT ON MATERIALIZED VIEW {} IS {}").format(
+                view,
+                sql.Literal(json.dumps({
+                    "generalization_of": f"{schema}.{table_name}",
+                    "max_zoom": max_zoom,
+                    "tolerance": tolerance,
+                    "srid": geom["srid"],
+                })),
+            ))
+            cur.execute(sql.SQL("ANALYZE {}").format(view))
+
+            cur.execute(sql.SQL("SELECT COUNT(*) AS n FROM {}").format(view))
+            row_count = cur.fetchone()["n"]
+            vertices = _vertex_count(cur, schema, view_name)
+
+            levels.append({
+                "view_name": view_name,
+                "max_zoom": max_zoom,
+                "tolerance": tolerance,
+                "row_count": row_count,
+                "vertex_count": vertices,
+                "vertex_ratio": round(vertices / base_vertices, 4) if base_vertices else None,
+            })
+            logger.info(
+                f"Generalized {schema}.{table_name} -> {view_name} "
+                f"(tol={tolerance:.6g}, {vertices:,}/{base_vertices:,} vertices) "
+                f"in {time.monotonic() - start:.1f}s"
+            )
+            source = view_name
+
+    conn.commit()
+    return _with_min_zooms(sorted(levels, key=lambda lvl: lvl["max_zoom"]))
+
+
+def _with_min_zooms(levels: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fill min_zoom so consecutive levels tile the zoom range without gaps."""
+    previous = -1
+    for level in levels:
+        level["min_zoom"] = previous + 1
+        previous = level["max_zoom"]
+    return levels
+
+
+def list_generalized_levels(conn, table_name: str, schema: str = "geo") -> List[Dict[str, Any]]:
+    """
+    Discover generalized levels of a table from their view comments.
+
+    Returns:
+        Levels sorted coarsest first, each with view_name, min_zoom,
+        max_zoom, tolerance. Empty list when the table has none.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT m.matviewname AS view_name,
+                   obj_description(format('%%I.%%I', m.schemaname, m.matviewname)::regclass, 'pg_class') AS comment
+            FROM pg_matviews m
+            WHERE m.schemaname = %s AND m.matviewname LIKE %s
+        """, (schema, f"{table_name}\\_z%"))
+        rows = cur.fetchall()
+
+    levels = []
+    for row in rows:
+        try:
+            meta = json.loads(row["comment"] or "")
+        except ValueError:
+            continue
+        if meta.get("generalization_of") != f"{schema}.{table_name}":
+            continue
+        levels.append({
+            "view_name": row["view_name"],
+            "max_zoom": int(meta["max_zoom"]),
+            "tolerance": meta.get("tolerance"),
+        })
+    return _with_min_zooms(sorted(levels, key=lambda lvl: lvl["max_zoom"]))
+
+
+def refresh_generalized_views(conn, table_name: str, schema: str = "geo") -> int:
+    """
+    Refresh a table's levels after the base table changed.
+
+    Levels are chained (each built from the next finer one), so they are
+    refreshed finest first. Returns the number of views refreshed.
+    """
+    levels = list_generalized_levels(conn, table_name, schema)
+    with conn.cursor() as cur:
+        for level in reversed(levels):
+            cur.execute(sql.SQL("REFRESH MATERIALIZED VIEW {}").format(
+                sql.Identifier(schema, level["view_name"])
+            ))
+    conn.commit()
+    return len(levels)
+
+
+def select_generalized_level(
+    levels: List[Dict[str, Any]],
+    zoom: Optional[int] = None,
+    bbox: Optional[Sequence[float]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Pick the coarsest level that still looks exact at the requested scale.
+
+    Args:
+        levels: From list_generalized_levels / create_generalized_views
+        zoom: Tile or display zoom
+        bbox: Request bbox (lon/lat) when no zoom is known
+
+    Returns:
+        The level dict, or None to use the full-resolution base table
+    """
+    if zoom is None:
+        if bbox is None:
+            return None
+        zoom = zoom_for_bbox(bbox)
+    for level in sorted(levels, key=lambda lvl: lvl["max_zoom"]):
+        if zoom <= level["max_zoom"]:
+            return level
+    return None
+
+
+__all__ = [
+    'tolerance_for_zoom',
+    'metres_per_unit_from_wkt',
+    'zoom_for_bbox',
+    'generalized_view_name',
+    'is_generalizable',
+    'create_generalized_views',
+    'refresh_generalized_views',
+    'list_generalized_levels',
+    'select_generalized_level',
+]
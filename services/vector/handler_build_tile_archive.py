@@ -0,0 +1,183 @@
+# ============================================================================
+# CLAUDE CONTEXT - VECTOR BUILD TILE ARCHIVE ATOMIC HANDLER
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Atomic handler - Optional publish step: static MVT archive per table
+# PURPOSE: Render a zoom-bounded PMTiles archive for each published table and
+#          upload it to silver, skipping tables whose etl_batch_id fingerprint
+#          matches the existing archive
+# CREATED: 18 OCT 2026
+# EXPORTS: vector_build_tile_archive
+# DEPENDENCIES: services.vector.tile_archive, infrastructure.postgresql,
+#               infrastructure.blob
+# ============================================================================
+"""
+Vector Build Tile Archive — atomic handler for DAG workflows.
+
+Opt-in via processing_options.tile_archive:
+    true                                   -> default zoom range
+    {"min_zoom": 0, "max_zoom": 7}         -> explicit zoom range
+    {"force": true}                        -> rebuild even if fingerprint matches
+
+The archive is written to the run's ETL mount directory, then streamed to
+silver at vector_tiles/{schema}/{table}.pmtiles with the table fingerprint
+in blob metadata (etl_fingerprint). TiPG keeps serving zooms above the
+archive's max_zoom and all feature queries.
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+from config.defaults import VectorDefaults
+from util_logger import LoggerFactory, ComponentType
+
+logger = LoggerFactory.create_logger(ComponentType.SERVICE, "handler_vector_build_tile_archive")
+
+
+def _archive_options(processing_options: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize processing_options.tile_archive into zoom/force settings."""
+    raw = processing_options.get('tile_archive')
+    opts = raw if isinstance(raw, dict) else {}
+    min_zoom = int(opts.get('min_zoom', VectorDefaults.TILE_ARCHIVE_MIN_ZOOM))
+    max_zoom = int(opts.get('max_zoom', VectorDefaults.TILE_ARCHIVE_MAX_ZOOM))
+    if not 0 <= min_zoom <= max_zoom <= VectorDefaults.TILE_ARCHIVE_ZOOM_LIMIT:
+        raise ValueError(
+            f"tile_archive zoom range {min_zoom}-{max_zoom} is invalid "
+            f"(0 <= min_zoom <= max_zoom <= {VectorDefaults.TILE_ARCHIVE_ZOOM_LIMIT})"
+        )
+    return {
+        "min_zoom": min_zoom,
+        "max_zoom": max_zoom,
+        "force": bool(opts.get('force', False)),
+    }
+
+
+def _stored_fingerprint(blob_repo, container: str, blob_path: str) -> Optional[str]:
+    """etl_fingerprint metadata of an existing archive, or None."""
+    try:
+        if not blob_repo.blob_exists(container, blob_path):
+            return None
+        props = blob_repo.get_blob_properties(container, blob_path)
+        return (props.get('metadata') or {}).get('etl_fingerprint')
+    except Exception as e:
+        logger.warning(f"Could not read archive metadata for {blob_path}: {e}")
+        return None
+
+
+def vector_build_tile_archive(params: Dict[str, Any], context: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    Build (or confirm up to date) the tile archive for each published table.
+
+    Params:
+        table_name: Base PostGIS table name
+        schema_name: PostGIS schema (default: "geo")
+        processing_options: Must contain tile_archive (see module docstring)
+        tables_info: Optional list from create_and_load_tables (geometry splits)
+        _run_id: DAG run ID (system-injected) — mount working directory
+
+    Returns:
+        {"success": True, "result": {"archives": [...], "built": int, "skipped": int}}
+    """
+    table_name = params.get('table_name')
+    schema_name = params.get('schema_name', 'geo')
+    processing_options = params.get('processing_options') or {}
+    run_id = params.get('_run_id') or params.get('_job_id', 'adhoc')
+
+    if not table_name:
+        return {"success": False, "error": "table_name is required", "error_type": "ValidationError"}
+
+    try:
+        options = _archive_options(processing_options)
+    except (TypeError, ValueError) as e:
+        return {"success": False, "error": str(e), "error_type": "ValidationError", "retryable": False}
+
+    tables: List[str] = [
+        t['table_name'] for t in (params.get('tables_info') or []) if t.get('table_name')
+    ] or [table_name]
+
+    try:
+        from config import get_config
+        from infrastructure.blob import BlobRepository
+        from infrastructure.postgresql import PostgreSQLRepository
+        from services.vector.tile_archive import (
+            archive_blob_path,
+            build_tile_archive,
+            table_fingerprint,
+        )
+
+        config = get_config()
+        etl_mount_root = config.docker.etl_mount_path if config.docker and config.docker.etl_mount_path else "/mnt/etl"
+        work_dir = os.path.join(etl_mount_root, run_id, "tiles")
+        os.makedirs(work_dir, exist_ok=True)
+
+        blob_repo = BlobRepository.for_zone("silver")
+        container = config.storage.silver.get_container("misc")
+        pg_repo = PostgreSQLRepository()
+
+        archives = []
+        for t_name in tables:
+            blob_path = archive_blob_path(schema_name, t_name)
+            with pg_repo._get_connection() as conn:
+                fingerprint = table_fingerprint(conn, t_name, schema_name)
+
+                stored = _stored_fingerprint(blob_repo, container, blob_path)
+                if fingerprint and stored == fingerprint and not options['force']:
+                    logger.info(f"Tile archive for {schema_name}.{t_name} is current ({fingerprint[:8]})")
+                    archives.append({
+                        "table_name": t_name,
+                        "blob_path": blob_path,
+                        "fingerprint": fingerprint,
+                        "status": "current",
+                    })
+                    continue
+
+                local_path = os.path.join(work_dir, f"{t_name}.pmtiles")
+                stats = build_tile_archive(
+                    conn,
+                    table_name=t_name,
+                    schema=schema_name,
+                    output_path=local_path,
+                    min_zoom=options['min_zoom'],
+                    max_zoom=options['max_zoom'],
+                    max_tiles=VectorDefaults.TILE_ARCHIVE_MAX_TILES,
+                    fingerprint=fingerprint,
+                )
+
+            blob_repo.stream_mount_to_blob(
+                container,
+                blob_path,
+                local_path,
+                content_type="application/vnd.pmtiles",
+                metadata={
+                    "etl_fingerprint": fingerprint or "",
+                    "source_table": f"{schema_name}.{t_name}",
+                    "min_zoom": str(stats['min_zoom']),
+                    "max_zoom": str(stats['max_zoom']),
+                },
+            )
+            os.remove(local_path)
+
+            archives.append({
+                "table_name": t_name,
+                "blob_path": blob_path,
+                "container": container,
+                "fingerprint": fingerprint,
+                "status": "built",
+                **stats,
+            })
+
+        built = sum(1 for a in archives if a['status'] == 'built')
+        return {
+            "success": True,
+            "result": {
+                "archives": archives,
+                "built": built,
+                "skipped": len(archives) - built,
+            },
+        }
+
+    except ValueError as e:
+        return {"success": False, "error": str(e), "error_type": "ValueError", "retryable": False}
+    except Exception as e:
+        logger.error(f"vector_build_tile_archive failed for {schema_name}.{table_name}: {e}", exc_info=True)
+        return {"success": False, "error": str(e), "error_type": type(e).__name__, "retryable": True}
@@ -191,7 +191,7 @@ def _process_one_table(
       5. Deferred indexes (GIST, BTREE, temporal)
       6. ANALYZE
       7. Zero-row check + SELECT COUNT(*) cross-check
-      8. Compute bbox from GeoDataFrame
+      8. bbox from the group (GeoParquet footer) or the GeoDataFrame
 
     Returns a table result dict on success. Raises on failure.
     """
@@ -227,9 +227,13 @@ def _process_one_table(
     ]
     column_count = len(attr_cols) + 1  # +1 for geom
 
-    # Compute bbox from GDF (used in result; ANALYZE updates planner stats separately)
-    bounds = gdf.total_bounds  # [minx, miny, maxx, maxy]
-    bbox = [float(bounds[0]), float(bounds[1]), float(bounds[2]), float(bounds[3])]
+    # bbox: validate_and_clean read it from the GeoParquet footer; fall back
+    # to the GDF for intermediates written before that (ANALYZE updates
+    # planner stats separately)
+    bbox = group.get("bbox")
+    if not bbox:
+        bounds = gdf.total_bounds  # [minx, miny, maxx, maxy]
+        bbox = [float(bounds[0]), float(bounds[1]), float(bounds[2]), float(bounds[3])]
 
     # --- 2-3. Table existence check, overwrite, CREATE TABLE ---
     handler = VectorToPostGISHandler()
@@ -580,6 +584,37 @@ def _process_one_table(
     }
 
 
+def _build_generalized_levels(
+    table_name: str,
+    schema_name: str,
+    geometry_type: str,
+    zooms: List[int],
+    job_id: str,
+    warnings: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    Create simplified low-zoom views for a loaded table.
+
+    Non-fatal: the base table is complete at this point, so a failure is
+    recorded as a warning and the table is served at full resolution.
+    """
+    from services.vector.generalization import create_generalized_views, is_generalizable
+    from services.vector.postgis_handler import VectorToPostGISHandler
+
+    if not is_generalizable(geometry_type):
+        return []
+
+    try:
+        handler = VectorToPostGISHandler()
+        with handler._pg_repo._get_connection() as conn:
+            return create_generalized_views(conn, table_name, schema_name, zooms)
+    except Exception as e:
+        warn_msg = f"Generalized views for {schema_name}.{table_name} not created: {e}"
+        logger.warning(f"[{job_id[:8]}] {warn_msg}")
+        warnings.append(warn_msg)
+        return []
+
+
 # ---------------------------------------------------------------------------
 # Sentinel exception types (used for error_type classification)
 # ---------------------------------------------------------------------------
@@ -616,6 +651,10 @@ def vector_create_and_load_tables(
         processing_options (dict, optional):
             overwrite    (bool, default false): Drop existing table before create.
             chunk_size   (int, default 100000): Rows per INSERT chunk.
+            generalize   (bool | list[int], default false): Build simplified
+                         {table}_z{N} views for low-zoom serving. true uses
+                         VectorDefaults.GENERALIZATION_ZOOMS; a list sets the
+                         max zoom of each level.
         _run_id          (str, system-injected): DAG run ID.
         _node_name       (str, system-injected): DAG node name.
 
@@ -651,6 +690,15 @@ def vector_create_and_load_tables(
         "temporal": list(index_config.get("temporal", [])),
     }
 
+    generalize = processing_options.get("generalize", False)
+    if generalize is True:
+        from config.defaults import VectorDefaults
+        generalize_zooms: List[int] = list(VectorDefaults.GENERALIZATION_ZOOMS)
+    elif isinstance(generalize, list):
+        generalize_zooms = [int(z) for z in generalize]
+    else:
+        generalize_zooms = []
+
     is_split: bool = len(geometry_groups) > 1
     warnings: List[str] = []
     tables_created: List[Dict[str, Any]] = []
@@ -700,6 +748,12 @@ def vector_create_and_load_tables(
                 warnings=warnings,
             )
 
+            if generalize_zooms:
+                table_result["generalized_levels"] = _build_generalized_levels(
+                    actual_table_name, schema_name, geometry_type,
+                    generalize_zooms, job_id, warnings,
+                )
+
             tables_created.append(table_result)
             total_rows_loaded += table_result["row_count"]
 
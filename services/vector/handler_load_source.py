@@ -17,6 +17,11 @@ Streams a source file from Azure Blob Storage (bronze zone) to the ETL mount,
 detects and validates the file format, converts to a GeoDataFrame, and writes
 a GeoParquet intermediate file for downstream handlers.
 
+CSV, GeoJSON, GeoPackage and Shapefile sources are streamed straight to the
+GeoParquet file in Arrow record batches (converters.stream_to_geoparquet), so
+peak memory is bounded by the batch size rather than the file size. KML/KMZ
+still load through the in-memory GeoDataFrame converters.
+
 Extracted from: handler_vector_docker_complete (Phase 0 mount setup L162-207,
                 Phase 1 _load_and_validate_source L421-602)
 
@@ -26,6 +31,7 @@ Supported formats: csv, geojson, json, gpkg, kml, kmz, shp, zip
 import logging
 import os
 import traceback
+from contextlib import ExitStack
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
@@ -36,6 +42,9 @@ SUPPORTED_FORMATS = frozenset({'csv', 'geojson', 'json', 'gpkg', 'kml', 'kmz', '
 # ZIP-like formats that need an on-mount extraction directory
 _ZIP_FORMATS = frozenset({'shp', 'zip', 'kmz'})
 
+# Mount space admitted per source byte: source + extract dir + GeoParquet
+_MOUNT_FOOTPRINT_FACTOR = 3
+
 # QGIS metadata layer detection — overlap >= 2 triggers rejection (H1-B9)
 _QGIS_SIGNATURE_COLUMNS = frozenset({
     'geometry_generator',
@@ -107,15 +116,15 @@ def _validate_gpkg_layer(
     return selected_layer, spatial_layers
 
 
-def _check_qgis_metadata_layer(gdf, blob_name: str, spatial_layers: list) -> None:
+def _check_qgis_metadata_layer(columns, blob_name: str, spatial_layers: list) -> None:
     """
     Detect QGIS project metadata layers masquerading as spatial data (H1-B9).
 
     spatial_layers MUST be passed explicitly — do not rely on closure scope (S-2).
 
-    Raises ValueError if the loaded GeoDataFrame looks like QGIS metadata.
+    Raises ValueError if the loaded columns look like QGIS metadata.
     """
-    gdf_cols_lower = {c.lower() for c in gdf.columns if c != 'geometry'}
+    gdf_cols_lower = {c.lower() for c in columns if c != 'geometry'}
     qgis_overlap = gdf_cols_lower & _QGIS_SIGNATURE_COLUMNS
     if len(qgis_overlap) >= 2:
         spatial_hint = ""
@@ -253,6 +262,10 @@ def vector_load_source(params: Dict[str, Any], context: Optional[Any] = None) ->
     log_prefix = f"[{job_id[:8]}][{_node_name}]"
     logger.info(f"{log_prefix} vector_load_source starting: {blob_name} ({file_extension})")
 
+    # Holds the mount reservation from download until conversion has
+    # written the GeoParquet intermediate (released on every return path)
+    mount_hold = ExitStack()
+
     try:
         # ---------------------------------------------------------------------
         # H1-B1: Create mount directories
@@ -298,11 +311,27 @@ def vector_load_source(params: Dict[str, Any], context: Optional[Any] = None) ->
         blob_repo = BlobRepository.for_zone("bronze")
         dest_path = os.path.join(source_dir, os.path.basename(blob_name))
 
+        from exceptions import InsufficientMountSpaceError
+        from infrastructure.mount_space import reserve_mount_space
+
         logger.info(f"{log_prefix} Streaming {blob_name} to mount: {dest_path}")
         try:
+            # Admit only if the mount can hold the source plus extraction and
+            # the GeoParquet intermediate (_MOUNT_FOOTPRINT_FACTOR x source)
+            blob_size = blob_repo.get_blob_properties(container_name, blob_name).get('size') or 0
+            mount_hold.enter_context(reserve_mount_space(
+                _run_id, blob_size * _MOUNT_FOOTPRINT_FACTOR, "vector_load_source"
+            ))
             blob_repo.stream_blob_to_mount(
                 container_name, blob_name, dest_path, chunk_size_mb=32
             )
+        except InsufficientMountSpaceError as space_err:
+            return {
+                "success": False,
+                "error": str(space_err),
+                "error_type": "DiskSpaceError",
+                "retryable": True,
+            }
         except ResourceNotFoundError:
             return {
                 "success": False,
@@ -410,33 +439,77 @@ def vector_load_source(params: Dict[str, Any], context: Optional[Any] = None) ->
                     "retryable": False,
                 }
 
-        # ---------------------------------------------------------------------
-        # Load via shared core function (mount path — no RAM copy)
-        # ---------------------------------------------------------------------
-        from services.vector.core import load_vector_source
+        intermediate_path = os.path.join(source_dir, f"{_run_id}.parquet")
 
-        logger.info(f"{log_prefix} Loading {file_extension} from mount path")
-        try:
-            gdf, _load_info = load_vector_source(
-                blob_name=blob_name,
-                container_name=container_name,
-                file_extension=file_extension,
-                converter_params=converter_params,
-                job_id=job_id,
-                mount_source_path=dest_path,
+        from services.vector.converters import STREAMABLE_FORMATS
+
+        if file_extension in STREAMABLE_FORMATS:
+            # -----------------------------------------------------------------
+            # Arrow streaming: source → GeoParquet in bounded-memory batches
+            # -----------------------------------------------------------------
+            from services.vector.converters import stream_to_geoparquet
+
+            logger.info(f"{log_prefix} Streaming {file_extension} to GeoParquet: {intermediate_path}")
+            try:
+                summary = stream_to_geoparquet(
+                    dest_path, file_extension, intermediate_path, **converter_params
+                )
+            except Exception as conv_err:
+                return {
+                    "success": False,
+                    "error": f"Format conversion failed for '{blob_name}': {conv_err}",
+                    "error_type": "FormatConversionError",
+                    "retryable": False,
+                }
+            row_count = summary["row_count"]
+            geometry_column = summary["geometry_column"]
+            attribute_columns = summary["columns"]
+            crs_raw = summary["crs_raw"]
+            logger.info(
+                f"{log_prefix} Streamed {row_count:,} rows in {summary['batches']} "
+                f"batches (mode={summary['mode']})"
             )
-        except Exception as conv_err:
-            return {
-                "success": False,
-                "error": f"Format conversion failed for '{blob_name}': {conv_err}",
-                "error_type": "FormatConversionError",
-                "retryable": False,
-            }
+        else:
+            # -----------------------------------------------------------------
+            # Load via shared core function (mount path — no RAM copy)
+            # -----------------------------------------------------------------
+            from services.vector.core import load_vector_source
+
+            logger.info(f"{log_prefix} Loading {file_extension} from mount path")
+            try:
+                gdf, _load_info = load_vector_source(
+                    blob_name=blob_name,
+                    container_name=container_name,
+                    file_extension=file_extension,
+                    converter_params=converter_params,
+                    job_id=job_id,
+                    mount_source_path=dest_path,
+                )
+            except Exception as conv_err:
+                return {
+                    "success": False,
+                    "error": f"Format conversion failed for '{blob_name}': {conv_err}",
+                    "error_type": "FormatConversionError",
+                    "retryable": False,
+                }
+
+            row_count = len(gdf)
+            geometry_column = gdf.geometry.name
+            attribute_columns = [c for c in gdf.columns if c != geometry_column]
+            crs_raw = str(gdf.crs) if gdf.crs else None
+
+            if row_count > 0:
+                logger.info(f"{log_prefix} Writing GeoParquet to {intermediate_path}")
+                gdf.to_parquet(intermediate_path, index=False)
+            del gdf
+
+        # Source, extraction and intermediate are all on the mount now
+        mount_hold.close()
 
         # H1-B9: QGIS metadata layer detection (spatial_layers passed explicitly — S-2)
         if file_extension == 'gpkg':
             try:
-                _check_qgis_metadata_layer(gdf, blob_name, spatial_layers)
+                _check_qgis_metadata_layer(attribute_columns, blob_name, spatial_layers)
             except ValueError as qgis_err:
                 return {
                     "success": False,
@@ -446,7 +519,7 @@ def vector_load_source(params: Dict[str, Any], context: Optional[Any] = None) ->
                 }
 
         # H1-B11: Zero-feature guard
-        if len(gdf) == 0:
+        if row_count == 0:
             return {
                 "success": False,
                 "error": "Source file contains zero features.",
@@ -454,21 +527,10 @@ def vector_load_source(params: Dict[str, Any], context: Optional[Any] = None) ->
                 "retryable": False,
             }
 
-        # ---------------------------------------------------------------------
-        # Write GeoParquet intermediate file
-        # ---------------------------------------------------------------------
-        intermediate_path = os.path.join(source_dir, f"{_run_id}.parquet")
-        logger.info(f"{log_prefix} Writing GeoParquet to {intermediate_path}")
-        gdf.to_parquet(intermediate_path, index=False)
-
         # H1-B12: Build result dict
-        geometry_column = gdf.geometry.name
-        attribute_columns = [c for c in gdf.columns if c != geometry_column]
-        crs_raw = str(gdf.crs) if gdf.crs else None
-
         result = {
             "intermediate_path": intermediate_path,
-            "row_count": len(gdf),
+            "row_count": row_count,
             "file_extension": file_extension,
             "source_size_bytes": source_size_bytes,
             "column_count": len(attribute_columns),
@@ -496,3 +558,5 @@ def vector_load_source(params: Dict[str, Any], context: Optional[Any] = None) ->
             "error_type": "HandlerError",
             "retryable": False,
         }
+    finally:
+        mount_hold.close()
@@ -8,7 +8,8 @@
 # LAST_REVIEWED: 19 MAR 2026
 # EXPORTS: vector_validate_and_clean
 # DEPENDENCIES: geopandas, shapely, services.vector.postgis_handler,
-#               services.vector.column_sanitizer, services.vector.core
+#               services.vector.column_sanitizer, services.vector.core,
+#               services.vector.parquet_analytics (DuckDB)
 # ============================================================================
 """
 Vector Validate and Clean — atomic handler for DAG workflows.
@@ -525,8 +526,31 @@ def vector_validate_and_clean(params: Dict[str, Any], context: Optional[Any] = N
 
         rows_removed = original_row_count - total_row_count
 
+        # The validated GeoParquet is on the mount — release the in-memory
+        # frames; the remaining analytics run in DuckDB over those files.
+        # The loop variables hold the last group (the whole dataset for
+        # single-type files), so they go too.
+        del first_group, groups, gdf, sub_gdf, group_gdf
+
+        from services.vector.parquet_analytics import (
+            count_distinct_values, distinct_values, geoparquet_bounds,
+            parquet_column_types,
+        )
+
+        validated_paths = [g["parquet_path"] for g in geometry_groups]
+
+        # Per-group bbox from the GeoParquet footer (no data pages read)
+        for group in geometry_groups:
+            try:
+                group["bbox"] = geoparquet_bounds(group["parquet_path"])
+            except Exception as exc:
+                logger.warning(f"{log_prefix} bbox from GeoParquet metadata failed: {exc}")
+                group["bbox"] = None
+
         # ------------------------------------------------------------------
         # SC-1/SC-2/SC-3/SC-4: SPLIT COLUMN PRE-VALIDATION
+        # DuckDB over the validated files: projection pushdown reads only the
+        # split column's chunks.
         # ------------------------------------------------------------------
         split_column_validated = False
         split_column_values: Optional[List[str]] = None
@@ -546,35 +570,28 @@ def vector_validate_and_clean(params: Dict[str, Any], context: Optional[Any] = N
                 }
 
             # SC-2: Check split_column is not a geometry or binary type
-            # Use the full gdf (pre-split) to check dtypes
-            if split_column in gdf.columns:
-                col_dtype = gdf[split_column].dtype
-                if hasattr(col_dtype, 'name') and col_dtype.name in ('geometry', 'bytes', 'object'):
-                    # For 'object', check if values are bytes/geometry
-                    if col_dtype.name == 'object':
-                        sample = gdf[split_column].dropna().head(10)
-                        if len(sample) > 0 and all(isinstance(v, (bytes, bytearray)) for v in sample):
-                            return {
-                                "success": False,
-                                "error": (
-                                    f"split_column '{split_column}' appears to contain binary data "
-                                    f"and cannot be used as a split column."
-                                ),
-                                "error_type": "SplitColumnTypeError",
-                            }
-                    elif col_dtype.name == 'geometry':
-                        return {
-                            "success": False,
-                            "error": (
-                                f"split_column '{split_column}' is a geometry column "
-                                f"and cannot be used as a split column."
-                            ),
-                            "error_type": "SplitColumnTypeError",
-                        }
+            col_type = parquet_column_types(validated_paths).get(split_column, '').upper()
+            if col_type.startswith('GEOMETRY'):
+                return {
+                    "success": False,
+                    "error": (
+                        f"split_column '{split_column}' is a geometry column "
+                        f"and cannot be used as a split column."
+                    ),
+                    "error_type": "SplitColumnTypeError",
+                }
+            if col_type == 'BLOB':
+                return {
+                    "success": False,
+                    "error": (
+                        f"split_column '{split_column}' appears to contain binary data "
+                        f"and cannot be used as a split column."
+                    ),
+                    "error_type": "SplitColumnTypeError",
+                }
 
             # SC-3: Check cardinality <= MAX_SPLIT_CARDINALITY (N-1: prevent creation of thousands of views)
-            distinct_values = gdf[split_column].dropna().unique().tolist()
-            cardinality = len(distinct_values)
+            cardinality = count_distinct_values(validated_paths, split_column)
             if cardinality > MAX_SPLIT_CARDINALITY:
                 return {
                     "success": False,
@@ -584,10 +601,11 @@ def vector_validate_and_clean(params: Dict[str, Any], context: Optional[Any] = N
                     ),
                     "error_type": "SplitColumnCardinalityError",
                 }
+            distinct = distinct_values(validated_paths, split_column) if cardinality else []
 
             # SC-4: ADVISORY values — Node 4 re-discovers from PostGIS via SELECT DISTINCT
             split_column_validated = True
-            split_column_values = [str(v) for v in distinct_values]
+            split_column_values = [str(v) for v in distinct]
             split_column_cardinality = cardinality
             logger.info(
                 f"{log_prefix} split_column '{split_column}' validated: "
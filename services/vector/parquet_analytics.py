@@ -0,0 +1,157 @@
+# ============================================================================
+# VECTOR PARQUET ANALYTICS
+# ============================================================================
+# STATUS: Service utility - DuckDB queries over GeoParquet intermediates
+# PURPOSE: Column types, split-value discovery and bounds for the vector
+#          pipeline's mount-resident GeoParquet, without GeoPandas loads
+# CREATED: 18 OCT 2026
+# EXPORTS: parquet_column_types, count_distinct_values, distinct_values,
+#          geoparquet_bounds
+# DEPENDENCIES: infrastructure.duckdb
+# ============================================================================
+"""
+Vector Parquet Analytics.
+
+Analytical questions about a GeoParquet intermediate ("how many distinct
+values does this column have?", "what are the bounds?") do not need the
+file in a GeoDataFrame. This module answers them with DuckDB directly over
+the files on the ETL mount:
+
+    - Footer-only: column types and GeoParquet bbox (the 'geo' key-value
+      metadata). No data pages are read.
+    - Projection pushdown: split-value discovery reads one column chunk per
+      row group; the geometry and every other column are never decoded.
+    - Parallel: DuckDB scans row groups on DUCKDB_THREADS threads.
+
+Each call runs on its own DuckDB cursor (DuckDBRepository.cursor), so
+concurrent handlers do not share the non-thread-safe singleton connection.
+
+All functions accept one path or a list of paths (e.g. the per-geometry-type
+files written by vector_validate_and_clean) and treat them as one dataset.
+
+Exports:
+    parquet_column_types: {column: DuckDB type} from the Parquet schema
+    count_distinct_values: COUNT(DISTINCT col) over non-NULL values
+    distinct_values: Sorted DISTINCT non-NULL values of one column
+    geoparquet_bounds: [minx, miny, maxx, maxy] from GeoParquet metadata
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from util_logger import LoggerFactory, ComponentType
+
+logger = LoggerFactory.create_logger(ComponentType.SERVICE, "parquet_analytics")
+
+PathsLike = Union[str, Sequence[str]]
+
+
+# ============================================================================
+# INTERNAL HELPERS
+# ============================================================================
+
+def _paths(paths: PathsLike) -> List[str]:
+    return [paths] if isinstance(paths, str) else list(paths)
+
+
+def _quote_ident(name: str) -> str:
+    """DuckDB identifier quoting (double quotes, embedded quotes doubled)."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _cursor():
+    from infrastructure.duckdb import DuckDBRepository
+    return DuckDBRepository.instance().cursor()
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def parquet_column_types(paths: PathsLike) -> Dict[str, str]:
+    """{column_name: DuckDB type} from the Parquet schema (no data read)."""
+    with _cursor() as cur:
+        rows = cur.execute(
+            "DESCRIBE SELECT * FROM read_parquet(?, union_by_name = true)",
+            [_paths(paths)],
+        ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def count_distinct_values(paths: PathsLike, column: str) -> int:
+    """COUNT(DISTINCT column) over non-NULL values; reads only that column."""
+    col = _quote_ident(column)
+    with _cursor() as cur:
+        row = cur.execute(
+            f"SELECT COUNT(DISTINCT {col}) FROM read_parquet(?, union_by_name = true) "
+            f"WHERE {col} IS NOT NULL",
+            [_paths(paths)],
+        ).fetchone()
+    return int(row[0])
+
+
+def distinct_values(paths: PathsLike, column: str) -> List[Any]:
+    """Sorted distinct non-NULL values of *column* (unbounded — check the count first)."""
+    col = _quote_ident(column)
+    with _cursor() as cur:
+        rows = cur.execute(
+            f"SELECT DISTINCT {col} FROM read_parquet(?, union_by_name = true) "
+            f"WHERE {col} IS NOT NULL ORDER BY 1",
+            [_paths(paths)],
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def geoparquet_bounds(
+    paths: PathsLike,
+    geometry_column: str = "geometry",
+) -> Optional[List[float]]:
+    """
+    [minx, miny, maxx, maxy] across *paths* from the GeoParquet 'geo' footer
+    metadata (written by GeoPandas and by converters.stream_to_geoparquet).
+
+    Returns None if any file lacks a bbox for *geometry_column*; callers then
+    fall back to whatever geometry they already hold.
+    """
+    with _cursor() as cur:
+        rows = cur.execute(
+            "SELECT file_name, value FROM parquet_kv_metadata(?) WHERE key = 'geo'",
+            [_paths(paths)],
+        ).fetchall()
+
+    if len(rows) != len(_paths(paths)):
+        return None
+
+    boxes = []
+    for _file_name, value in rows:
+        try:
+            meta = json.loads(value.decode("utf-8") if isinstance(value, (bytes, bytearray)) else value)
+            bbox = meta["columns"][geometry_column]["bbox"]
+        except (ValueError, KeyError, TypeError):
+            return None
+        if len(bbox) < 4:
+            return None
+        # 3D bboxes are [minx, miny, minz, maxx, maxy, maxz]
+        half = len(bbox) // 2
+        boxes.append((bbox[0], bbox[1], bbox[half], bbox[half + 1]))
+
+    if not boxes:
+        return None
+    return [
+        float(min(b[0] for b in boxes)),
+        float(min(b[1] for b in boxes)),
+        float(max(b[2] for b in boxes)),
+        float(max(b[3] for b in boxes)),
+    ]
+
+
+# ============================================================================
+# MODULE EXPORTS
+# ============================================================================
+
+__all__ = [
+    'parquet_column_types',
+    'count_distinct_values',
+    'distinct_values',
+    'geoparquet_bounds',
+]
@@ -2180,6 +2180,7 @@ class VectorToPostGISHandler:
                 'original_count': int,      # Rows in original table
                 'tile_count': int,          # Rows in tile view/modified table
                 'polygons_split': int,      # Number of complex polygons that were split
+                'generalized_views_refreshed': int,  # in_place only: {table}_z{N} views refreshed
                 'execution_time_ms': float  # Time taken
             }
 
@@ -2507,6 +2508,15 @@ class VectorToPostGISHandler:
 
                     conn.commit()
 
+                    # Generalized {table}_z{N} views still hold the pre-split rows
+                    generalized_refreshed = 0
+                    try:
+                        from services.vector.generalization import refresh_generalized_views
+                        generalized_refreshed = refresh_generalized_views(conn, table_name, schema)
+                    except Exception as e:
+                        conn.rollback()
+                        logger.warning(f"   Generalized view refresh for {schema}.{table_name} failed: {e}")
+
                     execution_time = (time.time() - start_time) * 1000
 
                     logger.info(f"✅ In-place subdivision complete: {original_count} → {tile_count} rows ({execution_time:.1f}ms)")
@@ -2519,6 +2529,7 @@ class VectorToPostGISHandler:
                         'original_count': original_count,
                         'tile_count': tile_count,
                         'polygons_split': complex_count,
+                        'generalized_views_refreshed': generalized_refreshed,
                         'execution_time_ms': execution_time
                     }
 
@@ -0,0 +1,541 @@
+# ============================================================================
+# CLAUDE CONTEXT - VECTOR TILE ARCHIVE (PMTILES)
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Service - Pre-rendered MVT pyramid for published PostGIS tables
+# PURPOSE: Render a zoom-bounded tile pyramid with ST_AsMVT into a single-file
+#          PMTiles v3 archive so low-zoom map traffic is served statically
+#          instead of by TiPG against Postgres.
+# CREATED: 18 OCT 2026
+# EXPORTS: PMTilesWriter, zxy_to_tileid, tile_range, table_fingerprint,
+#          build_tile_archive, archive_blob_path
+# DEPENDENCIES: psycopg, infrastructure.postgresql
+# ============================================================================
+"""
+Vector Tile Archive.
+
+TiPG renders every vector tile on demand with ST_AsMVT. For national layers
+the low zooms are both the most requested and the most expensive: a z0-z6
+tile touches most of the table. This module pre-renders zooms
+min_zoom..max_zoom once per table version into a PMTiles v3 archive (one
+file, HTTP range-addressable) that a CDN or static host can serve directly.
+
+Versioning:
+    Each table is fingerprinted from its distinct etl_batch_id values and row
+    count. The fingerprint is stored in the archive metadata and as blob
+    metadata; build_tile_archive skips rendering when the stored fingerprint
+    matches, and rebuilds when a reload changed the batches.
+
+Archive layout (PMTiles v3, clustered):
+    header (127 B) | root directory | JSON metadata | leaf directories | tiles
+
+Tiles are gzip-compressed MVT, written in tile-id (Hilbert) order. Identical
+tiles are stored once; empty tiles are omitted.
+
+Exports:
+    PMTilesWriter: Streaming PMTiles v3 writer
+    zxy_to_tileid: Tile coordinate -> PMTiles tile id
+    tile_range: Tile x/y bounds covering a lon/lat bbox at a zoom
+    table_fingerprint: etl_batch_id-based version fingerprint
+    build_tile_archive: Render a table into an archive file
+    archive_blob_path: Silver blob path for a table's archive
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import math
+import os
+import shutil
+import struct
+import tempfile
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from psycopg import sql
+
+from util_logger import LoggerFactory, ComponentType
+
+logger = LoggerFactory.create_logger(ComponentType.SERVICE, "TileArchive")
+
+TILE_ARCHIVE_PREFIX = "vector_tiles"
+
+# PMTiles v3 constants
+_HEADER_SIZE = 127
+_ROOT_MAX_BYTES = 16384 - _HEADER_SIZE
+_COMPRESSION_GZIP = 2
+_TILE_TYPE_MVT = 1
+
+# Web Mercator latitude limit
+_MAX_LAT = 85.0511287798
+
+# ST_AsMVT extent and clip buffer (MVT defaults used by TiPG)
+_MVT_EXTENT = 4096
+_MVT_BUFFER = 64
+
+# Columns never emitted as tile attributes
+_SKIP_COLUMNS = {"geom", "geometry", "etl_batch_id"}
+
+
+# =============================================================================
+# TILE ADDRESSING
+# =============================================================================
+
+def _rotate(n: int, x: int, y: int, rx: int, ry: int) -> Tuple[int, int]:
+    if ry == 0:
+        if rx != 0:
+            x = n - 1 - x
+            y = n - 1 - y
+        return y, x
+    return x, y
+
+
+def zxy_to_tileid(z: int, x: int, y: int) -> int:
+    """PMTiles tile id: tiles of lower zooms first, Hilbert order within a zoom."""
+    acc = ((1 << (z * 2)) - 1) // 3
+    a = z - 1
+    while a >= 0:
+        s = 1 << a
+        rx = s & x
+        ry = s & y
+        acc += ((3 * rx) ^ ry) << a
+        x, y = _rotate(s, x, y, rx, ry)
+        a -= 1
+    return acc
+
+
+def tile_range(bbox: List[float], z: int) -> Tuple[int, int, int, int]:
+    """
+    XYZ tile bounds covering a lon/lat bbox.
+
+    Returns:
+        (min_x, min_y, max_x, max_y), inclusive
+    """
+    n = 1 << z
+
+    def to_tile(lon: float, lat: float) -> Tuple[int, int]:
+        lat = max(-_MAX_LAT, min(_MAX_LAT, lat))
+        x = int((lon + 180.0) / 360.0 * n)
+        lat_rad = math.radians(lat)
+        y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+        return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+    min_x, max_y = to_tile(bbox[0], bbox[1])
+    max_x, min_y = to_tile(bbox[2], bbox[3])
+    return min_x, min_y, max_x, max_y
+
+
+def _count_tiles(bbox: List[float], min_zoom: int, max_zoom: int) -> int:
+    total = 0
+    for z in range(min_zoom, max_zoom + 1):
+        x0, y0, x1, y1 = tile_range(bbox, z)
+        total += (x1 - x0 + 1) * (y1 - y0 + 1)
+    return total
+
+
+# =============================================================================
+# PMTILES WRITER
+# =============================================================================
+
+def _write_varint(buf: io.BytesIO, value: int) -> None:
+    while value >= 0x80:
+        buf.write(bytes([(value & 0x7F) | 0x80]))
+        value >>= 7
+    buf.write(bytes([value]))
+
+
+def _serialize_directory(entries: List[Tuple[int, int, int, int]]) -> bytes:
+    """Encode (tile_id, offset, length, run_length) entries, gzip-compressed."""
+    buf = io.BytesIO()
+    _write_varint(buf, len(entries))
+    last_id = 0
+    for tile_id, _, _, _ in entries:
+        _write_varint(buf, tile_id - last_id)
+        last_id = tile_id
+    for _, _, _, run_length in entries:
+        _write_varint(buf, run_length)
+    for _, _, length, _ in entries:
+        _write_varint(buf, length)
+    for i, (_, offset, _, _) in enumerate(entries):
+        prev = entries[i - 1] if i > 0 else None
+        if prev is not None and offset == prev[1] + prev[2]:
+            _write_varint(buf, 0)
+        else:
+            _write_varint(buf, offset + 1)
+    return gzip.compress(buf.getvalue(), compresslevel=6, mtime=0)
+
+
+def _build_directories(entries: List[Tuple[int, int, int, int]]) -> Tuple[bytes, bytes]:
+    """
+    Root directory plus (if needed) leaf directories.
+
+    The root must fit in the first 16 KiB together with the header; when it
+    does not, entries are split into leaves and the root points at them.
+    """
+    root = _serialize_directory(entries)
+    if len(root) <= _ROOT_MAX_BYTES:
+        return root, b""
+
+    leaf_size = 4096
+    while True:
+        leaves = io.BytesIO()
+        root_entries = []
+        for i in range(0, len(entries), leaf_size):
+            chunk = entries[i:i + leaf_size]
+            leaf = _serialize_directory(chunk)
+            root_entries.append((chunk[0][0], leaves.tell(), len(leaf), 0))
+            leaves.write(leaf)
+        root = _serialize_directory(root_entries)
+        if len(root) <= _ROOT_MAX_BYTES:
+            return root, leaves.getvalue()
+        leaf_size *= 2
+
+
+class PMTilesWriter:
+    """
+    Streaming PMTiles v3 writer.
+
+    Tiles must be added in ascending tile-id order. Tile bytes are spooled to
+    a temporary file next to the output so large pyramids never sit in memory.
+
+    Usage:
+        with PMTilesWriter(path) as writer:
+            for z, x, y, data in tiles:
+                writer.add_tile(z, x, y, data)
+            writer.finish(bbox, min_zoom, max_zoom, metadata)
+    """
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self._spool = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(output_path) or ".", suffix=".tiles", delete=False
+        )
+        self._entries: List[Tuple[int, int, int, int]] = []
+        self._offsets_by_hash: Dict[bytes, Tuple[int, int]] = {}
+        self._last_tile_id = -1
+        self.addressed_tiles = 0
+
+    def __enter__(self) -> "PMTilesWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if not self._spool.closed:
+            self._spool.close()
+        if os.path.exists(self._spool.name):
+            os.remove(self._spool.name)
+
+    def add_tile(self, z: int, x: int, y: int, data: bytes) -> None:
+        """Add one compressed tile; identical contents are stored once."""
+        tile_id = zxy_to_tileid(z, x, y)
+        if tile_id <= self._last_tile_id:
+            raise ValueError(f"Tiles must be added in tile-id order ({z}/{x}/{y})")
+        self._last_tile_id = tile_id
+        self.addressed_tiles += 1
+
+        digest = hashlib.sha256(data).digest()
+        known = self._offsets_by_hash.get(digest)
+        if known is not None:
+            offset, length = known
+            last = self._entries[-1] if self._entries else None
+            # Extend a run when consecutive ids share the same contents
+            if last and last[1] == offset and last[0] + last[3] == tile_id:
+                self._entries[-1] = (last[0], last[1], last[2], last[3] + 1)
+                return
+            self._entries.append((tile_id, offset, length, 1))
+            return
+
+        offset = self._spool.tell()
+        self._spool.write(data)
+        self._offsets_by_hash[digest] = (offset, len(data))
+        self._entries.append((tile_id, offset, len(data), 1))
+
+    def finish(
+        self,
+        bbox: List[float],
+        min_zoom: int,
+        max_zoom: int,
+        metadata: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Assemble header, directories, metadata and tile data into output_path."""
+        self._spool.flush()
+        tile_data_length = self._spool.tell()
+        self._spool.close()
+
+        root, leaves = _build_directories(self._entries)
+        meta = gzip.compress(json.dumps(metadata).encode("utf-8"), mtime=0)
+
+        root_offset = _HEADER_SIZE
+        meta_offset = root_offset + len(root)
+        leaves_offset = meta_offset + len(meta)
+        data_offset = leaves_offset + len(leaves)
+
+        def e7(value: float) -> int:
+            return int(round(value * 10_000_000))
+
+        center_zoom = min_zoom
+        header = b"PMTiles" + struct.pack(
+            "<BQQQQQQQQQQQBBBBBBiiiiBii",
+            3,
+            root_offset, len(root),
+            meta_offset, len(meta),
+            leaves_offset, len(leaves),
+            data_offset, tile_data_length,
+            self.addressed_tiles, len(self._entries), len(self._offsets_by_hash),
+            1,                      # clustered
+            _COMPRESSION_GZIP,      # internal compression
+            _COMPRESSION_GZIP,      # tile compression
+            _TILE_TYPE_MVT,
+            min_zoom, max_zoom,
+            e7(bbox[0]), e7(bbox[1]), e7(bbox[2]), e7(bbox[3]),
+            center_zoom, e7((bbox[0] + bbox[2]) / 2), e7((bbox[1] + bbox[3]) / 2),
+        )
+        assert len(header) == _HEADER_SIZE
+
+        with open(self.output_path, "wb") as out:
+            out.write(header)
+            out.write(root)
+            out.write(meta)
+            out.write(leaves)
+            with open(self._spool.name, "rb") as spool:
+                shutil.copyfileobj(spool, out, length=8 * 1024 * 1024)
+
+        self.close()
+        return {
+            "addressed_tiles": self.addressed_tiles,
+            "tile_entries": len(self._entries),
+            "tile_contents": len(self._offsets_by_hash),
+            "archive_bytes": data_offset + tile_data_length,
+        }
+
+
+# =============================================================================
+# POSTGIS RENDERING
+# =============================================================================
+
+def archive_blob_path(schema: str, table_name: str) -> str:
+    """Silver blob path for a table's tile archive."""
+    return f"{TILE_ARCHIVE_PREFIX}/{schema}/{table_name}.pmtiles"
+
+
+def table_fingerprint(conn, table_name: str, schema: str = "geo") -> Optional[str]:
+    """
+    Version fingerprint for a table: md5 over its distinct etl_batch_id values
+    and row count. Any reload or chunk rewrite changes it.
+
+    Returns None for tables without an etl_batch_id column (always rebuilt).
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s AND column_name = 'etl_batch_id'
+        """, (schema, table_name))
+        if cur.fetchone() is None:
+            return None
+
+        cur.execute(sql.SQL("""
+            SELECT md5(
+                coalesce(string_agg(DISTINCT etl_batch_id, ',' ORDER BY etl_batch_id), '')
+                || '|' || count(*)::text
+            ) AS fingerprint
+            FROM {schema}.{table}
+        """).format(schema=sql.Identifier(schema), table=sql.Identifier(table_name)))
+        return cur.fetchone()["fingerprint"]
+
+
+def _table_layout(conn, table_name: str, schema: str) -> Tuple[int, List[str], Optional[List[float]]]:
+    """Geometry SRID, attribute columns and lon/lat extent of a table."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT srid FROM geometry_columns
+            WHERE f_table_schema = %s AND f_table_name = %s AND f_geometry_column = 'geom'
+        """, (schema, table_name))
+        row = cur.fetchone()
+        if row is None:
+            raise ValueError(f"{schema}.{table_name} has no 'geom' geometry column")
+        srid = row["srid"] or 4326
+
+        cur.execute("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s
+            ORDER BY ordinal_position
+        """, (schema, table_name))
+        columns = [r["column_name"] for r in cur.fetchall() if r["column_name"] not in _SKIP_COLUMNS]
+
+        cur.execute(sql.SQL("""
+            SELECT ST_XMin(e) AS xmin, ST_YMin(e) AS ymin, ST_XMax(e) AS xmax, ST_YMax(e) AS ymax
+            FROM (
+                SELECT ST_Transform(ST_SetSRID(ST_Extent(geom)::geometry, %s), 4326) AS e
+                FROM {schema}.{table}
+            ) s
+        """).format(schema=sql.Identifier(schema), table=sql.Identifier(table_name)), (srid,))
+        ext = cur.fetchone()
+        bbox = None
+        if ext and ext["xmin"] is not None:
+            bbox = [ext["xmin"], ext["ymin"], ext["xmax"], ext["ymax"]]
+    return srid, columns, bbox
+
+
+def _iter_tiles(bbox: List[float], min_zoom: int, max_zoom: int) -> Iterator[Tuple[int, int, int]]:
+    """All (z, x, y) covering bbox, in PMTiles tile-id order."""
+    coords = []
+    for z in range(min_zoom, max_zoom + 1):
+        x0, y0, x1, y1 = tile_range(bbox, z)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                coords.append((zxy_to_tileid(z, x, y), z, x, y))
+    coords.sort()
+    for _, z, x, y in coords:
+        yield z, x, y
+
+
+def build_tile_archive(
+    conn,
+    table_name: str,
+    schema: str,
+    output_path: str,
+    min_zoom: int,
+    max_zoom: int,
+    max_tiles: int,
+    fingerprint: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Render min_zoom..max_zoom of a PostGIS table into a PMTiles archive.
+
+    max_zoom is lowered until the pyramid over the table extent has at most
+    max_tiles tiles, so a mis-configured request cannot render millions of
+    tiles. Each zoom reads from the coarsest generalized level that covers
+    it (services.vector.generalization), falling back to the subdivided
+    '{table}_tiles' view when subdivide_complex_polygons() created one, and
+    otherwise the table itself.
+
+    Args:
+        conn: psycopg connection (dict rows)
+        table_name: Source table
+        schema: Source schema
+        output_path: Local file to write (mount path)
+        min_zoom: First zoom level
+        max_zoom: Requested last zoom level
+        max_tiles: Upper bound on tiles rendered
+        fingerprint: Table fingerprint recorded in the archive metadata
+
+    Returns:
+        Summary dict: zooms, tile counts, archive size, bbox, elapsed
+    """
+    start = time.monotonic()
+    srid, columns, bbox = _table_layout(conn, table_name, schema)
+    if bbox is None:
+        raise ValueError(f"{schema}.{table_name} is empty; nothing to render")
+
+    effective_max = max_zoom
+    while effective_max > min_zoom and _count_tiles(bbox, min_zoom, effective_max) > max_tiles:
+        effective_max -= 1
+    if effective_max < max_zoom:
+        logger.warning(
+            f"{schema}.{table_name}: max_zoom lowered {max_zoom} -> {effective_max} "
+            f"to stay within {max_tiles:,} tiles"
+        )
+
+    from services.vector.generalization import list_generalized_levels, select_generalized_level
+
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT EXISTS (
+                SELECT 1 FROM pg_matviews WHERE schemaname = %s AND matviewname = %s
+            ) AS has_view
+        """, (schema, f"{table_name}_tiles"))
+        full_res_rel = f"{table_name}_tiles" if cur.fetchone()["has_view"] else table_name
+
+    levels = list_generalized_levels(conn, table_name, schema)
+    source_by_zoom: Dict[int, str] = {}
+    for z in range(min_zoom, effective_max + 1):
+        level = select_generalized_level(levels, zoom=z)
+        source_by_zoom[z] = level["view_name"] if level else full_res_rel
+
+    tile_query_template = sql.SQL("""
+        SELECT ST_AsMVT(q, %(layer)s, {extent}, 'geom') AS mvt
+        FROM (
+            SELECT ST_AsMVTGeom(
+                       ST_Transform(t.geom, 3857),
+                       ST_TileEnvelope(%(z)s, %(x)s, %(y)s),
+                       {extent}, {buffer}, true
+                   ) AS geom{columns}
+            FROM {schema}.{rel} t
+            WHERE t.geom && ST_Transform(
+                ST_TileEnvelope(%(z)s, %(x)s, %(y)s, margin => %(margin)s), {srid}
+            )
+        ) q
+        WHERE q.geom IS NOT NULL
+    """)
+    tile_queries = {
+        rel: tile_query_template.format(
+            extent=sql.Literal(_MVT_EXTENT),
+            buffer=sql.Literal(_MVT_BUFFER),
+            columns=sql.SQL("").join(
+                sql.SQL(", t.{}").format(sql.Identifier(c)) for c in columns
+            ),
+            schema=sql.Identifier(schema),
+            rel=sql.Identifier(rel),
+            srid=sql.Literal(srid),
+        )
+        for rel in set(source_by_zoom.values())
+    }
+
+    empty = 0
+    with PMTilesWriter(output_path) as writer:
+        with conn.cursor() as cur:
+            for z, x, y in _iter_tiles(bbox, min_zoom, effective_max):
+                cur.execute(tile_queries[source_by_zoom[z]], {
+                    "layer": table_name, "z": z, "x": x, "y": y,
+                    "margin": _MVT_BUFFER / _MVT_EXTENT,
+                })
+                mvt = cur.fetchone()["mvt"]
+                if not mvt:
+                    empty += 1
+                    continue
+                writer.add_tile(z, x, y, gzip.compress(bytes(mvt), mtime=0))
+
+        metadata = {
+            "name": f"{schema}.{table_name}",
+            "format": "pbf",
+            "source_relations": {str(z): f"{schema}.{rel}" for z, rel in source_by_zoom.items()},
+            "etl_fingerprint": fingerprint,
+            "vector_layers": [{
+                "id": table_name,
+                "minzoom": min_zoom,
+                "maxzoom": effective_max,
+                "fields": {c: "String" for c in columns},
+            }],
+        }
+        stats = writer.finish(bbox, min_zoom, effective_max, metadata)
+
+    stats.update({
+        "min_zoom": min_zoom,
+        "max_zoom": effective_max,
+        "requested_max_zoom": max_zoom,
+        "empty_tiles": empty,
+        "bbox": bbox,
+        "source_relations": {str(z): f"{schema}.{rel}" for z, rel in source_by_zoom.items()},
+        "elapsed_seconds": round(time.monotonic() - start, 2),
+    })
+    logger.info(
+        f"Rendered {schema}.{table_name} z{min_zoom}-{effective_max}: "
+        f"{stats['addressed_tiles']:,} tiles ({stats['tile_contents']:,} unique, "
+        f"{empty:,} empty), {stats['archive_bytes'] / 1024 / 1024:.1f} MB "
+        f"in {stats['elapsed_seconds']}s"
+    )
+    return stats
+
+
+__all__ = [
+    'TILE_ARCHIVE_PREFIX',
+    'PMTilesWriter',
+    'zxy_to_tileid',
+    'tile_range',
+    'table_fingerprint',
+    'build_tile_archive',
+    'archive_blob_path',
+]
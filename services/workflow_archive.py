@@ -0,0 +1,279 @@
+# ============================================================================
+# CLAUDE CONTEXT - WORKFLOW RUN ARCHIVE SERVICE
+# ============================================================================
+# EPOCH: 5 - DAG ORCHESTRATION
+# STATUS: Service - Hot/archive split for DAG workflow tables
+# PURPOSE: Export terminal workflow runs past retention to Parquet in silver
+#          storage, remove them from the hot tables, and read them back for
+#          status lookups.
+# CREATED: 18 OCT 2026
+# EXPORTS: WorkflowArchiveService, get_run_with_archive
+# DEPENDENCIES: pyarrow, infrastructure.workflow_run_repository,
+#               infrastructure.blob.BlobRepository
+# ============================================================================
+"""
+Workflow Run Archive Service.
+
+app.workflow_runs / app.workflow_tasks otherwise grow forever, and every hot
+query (claim, stale scan, active-run listing) pays for completed history and
+its result_data JSONB. This service implements the maintenance half of a
+hot/archive split:
+
+    1. Select terminal runs with completed_at older than the retention window
+    2. Export runs, tasks and deps for the batch to two Parquet files
+       (JSONB columns stored as JSON strings, ZSTD compressed)
+    3. Insert compact app.workflow_run_archive index rows and delete the hot
+       rows in one transaction (WorkflowRunRepository.move_runs_to_archive)
+
+Read-through: get_run_with_archive() returns the hot row when present and
+otherwise rebuilds the WorkflowRun from the archived Parquet file, so status
+endpoints keep working for archived runs.
+
+Declarative range partitioning was not used: workflow_runs is keyed and
+referenced by run_id alone, and a partitioned table's primary key must
+include the partition column.
+
+Blob layout (silver misc container):
+    workflow_archive/{YYYY}/{MM}/{batch_id}_runs.parquet
+    workflow_archive/{YYYY}/{MM}/{batch_id}_tasks.parquet
+
+Exports:
+    WorkflowArchiveService: Archive batches and read archived runs back
+    get_run_with_archive: Hot-then-archive run lookup
+"""
+
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from util_logger import LoggerFactory, ComponentType
+
+logger = LoggerFactory.create_logger(ComponentType.SERVICE, "WorkflowArchive")
+
+_ARCHIVE_PREFIX = "workflow_archive"
+
+# Columns stored as JSON text in Parquet (JSONB in Postgres)
+_RUN_JSON_COLUMNS = ("parameters", "definition", "result_data")
+_TASK_JSON_COLUMNS = ("parameters", "result_data", "checkpoint_data", "deps")
+
+
+def _encode_rows(rows: List[Dict[str, Any]], json_columns: tuple) -> List[Dict[str, Any]]:
+    """Copy rows, JSON-encoding dict/list columns so Parquet gets a flat schema."""
+    encoded = []
+    for row in rows:
+        out = dict(row)
+        for col in json_columns:
+            if col in out and out[col] is not None:
+                out[col] = json.dumps(out[col], default=str)
+        encoded.append(out)
+    return encoded
+
+
+def _decode_row(row: Dict[str, Any], json_columns: tuple) -> Dict[str, Any]:
+    """Inverse of _encode_rows for a single row."""
+    for col in json_columns:
+        if isinstance(row.get(col), str):
+            row[col] = json.loads(row[col])
+    return row
+
+
+class WorkflowArchiveService:
+    """
+    Move terminal workflow runs from the hot tables to Parquet in silver.
+
+    Usage:
+        service = WorkflowArchiveService()
+        summary = service.archive_terminal_runs(retention_days=90)
+    """
+
+    def __init__(self, repo=None, blob_repo=None, container: Optional[str] = None):
+        self._repo = repo
+        self._blob_repo = blob_repo
+        self._container = container
+
+    @property
+    def repo(self):
+        if self._repo is None:
+            from infrastructure.workflow_run_repository import WorkflowRunRepository
+            self._repo = WorkflowRunRepository()
+        return self._repo
+
+    @property
+    def blob_repo(self):
+        if self._blob_repo is None:
+            from infrastructure.blob import BlobRepository
+            self._blob_repo = BlobRepository.for_zone("silver")
+        return self._blob_repo
+
+    @property
+    def container(self) -> str:
+        if self._container is None:
+            from config import get_config
+            self._container = get_config().storage.silver.get_container("misc")
+        return self._container
+
+    # =========================================================================
+    # ARCHIVE (write path)
+    # =========================================================================
+
+    def archive_terminal_runs(self, retention_days: int, batch_size: int = 200) -> Dict[str, Any]:
+        """
+        Archive one batch of terminal runs older than retention_days.
+
+        Export happens before delete: if the upload fails nothing is removed;
+        if the delete fails the Parquet files are orphaned but harmless and
+        the runs are re-exported on the next attempt under a new batch_id.
+
+        Returns:
+            Summary dict: candidates, archived, tasks, blob paths, elapsed
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        start = datetime.now(timezone.utc)
+        summary: Dict[str, Any] = {
+            "retention_days": retention_days,
+            "candidates": 0,
+            "archived": 0,
+            "tasks": 0,
+        }
+
+        run_ids = self.repo.list_archivable_run_ids(retention_days, limit=batch_size)
+        summary["candidates"] = len(run_ids)
+        if not run_ids:
+            return summary
+
+        runs, tasks, deps = self.repo.fetch_runs_for_archive(run_ids)
+
+        # Fold deps into their owning task row so one file carries both
+        deps_by_task: Dict[str, List[Dict[str, Any]]] = {}
+        for dep in deps:
+            deps_by_task.setdefault(dep["task_instance_id"], []).append({
+                "depends_on_instance_id": dep["depends_on_instance_id"],
+                "optional": dep["optional"],
+            })
+        for task in tasks:
+            task["deps"] = deps_by_task.get(task["task_instance_id"], [])
+
+        batch_id = f"{start.strftime('%Y%m%dT%H%M%SZ')}_{uuid.uuid4().hex[:8]}"
+        base = f"{_ARCHIVE_PREFIX}/{start:%Y}/{start:%m}/{batch_id}"
+        runs_path = f"{base}_runs.parquet"
+        tasks_path = f"{base}_tasks.parquet"
+
+        for path, rows, json_cols in (
+            (runs_path, runs, _RUN_JSON_COLUMNS),
+            (tasks_path, tasks, _TASK_JSON_COLUMNS),
+        ):
+            table = pa.Table.from_pylist(_encode_rows(rows, json_cols))
+            buf = io.BytesIO()
+            pq.write_table(table, buf, compression="zstd")
+            self.blob_repo.write_blob(
+                self.container, path, buf.getvalue(),
+                content_type="application/vnd.apache.parquet",
+            )
+
+        task_counts: Dict[str, int] = {}
+        for task in tasks:
+            task_counts[task["run_id"]] = task_counts.get(task["run_id"], 0) + 1
+
+        archived_at = datetime.now(timezone.utc)
+        index_rows = [
+            {
+                "run_id": run["run_id"],
+                "workflow_name": run["workflow_name"],
+                "status": run["status"],
+                "created_at": run.get("created_at"),
+                "started_at": run.get("started_at"),
+                "completed_at": run.get("completed_at"),
+                "archived_at": archived_at,
+                "request_id": run.get("request_id"),
+                "asset_id": run.get("asset_id"),
+                "release_id": run.get("release_id"),
+                "schedule_id": run.get("schedule_id"),
+                "task_count": task_counts.get(run["run_id"], 0),
+                "archive_container": self.container,
+                "runs_blob_path": runs_path,
+                "tasks_blob_path": tasks_path,
+            }
+            for run in runs
+        ]
+
+        summary["archived"] = self.repo.move_runs_to_archive(index_rows)
+        summary["tasks"] = len(tasks)
+        summary["runs_blob_path"] = runs_path
+        summary["tasks_blob_path"] = tasks_path
+        summary["elapsed_seconds"] = round(
+            (datetime.now(timezone.utc) - start).total_seconds(), 2
+        )
+
+        logger.info(
+            f"Archived {summary['archived']}/{len(run_ids)} workflow runs "
+            f"({len(tasks)} tasks) to {self.container}/{base}_*.parquet "
+            f"in {summary['elapsed_seconds']}s"
+        )
+        return summary
+
+    # =========================================================================
+    # READ-THROUGH
+    # =========================================================================
+
+    def _read_archived_rows(self, blob_path: str, run_id: str) -> List[Dict[str, Any]]:
+        """Read rows for one run_id from an archive Parquet file."""
+        import pyarrow.parquet as pq
+
+        data = self.blob_repo.read_blob(self.container, blob_path)
+        table = pq.read_table(io.BytesIO(data), filters=[("run_id", "=", run_id)])
+        return table.to_pylist()
+
+    def load_archived_run(self, run_id: str):
+        """
+        Rebuild a WorkflowRun from the archive, or None if not archived.
+        """
+        from core.models.workflow_run import WorkflowRun
+
+        index = self.repo.get_archived_run(run_id)
+        if index is None:
+            return None
+
+        self._container = index["archive_container"]
+        rows = self._read_archived_rows(index["runs_blob_path"], run_id)
+        if not rows:
+            logger.warning(
+                f"Archive index for {run_id[:16]} points at "
+                f"{index['runs_blob_path']} but the row is missing"
+            )
+            return None
+        return WorkflowRun(**_decode_row(rows[0], _RUN_JSON_COLUMNS))
+
+    def load_archived_tasks(self, run_id: str) -> List[Dict[str, Any]]:
+        """Return archived task rows (with folded deps) for a run."""
+        index = self.repo.get_archived_run(run_id)
+        if index is None:
+            return []
+        self._container = index["archive_container"]
+        return [
+            _decode_row(row, _TASK_JSON_COLUMNS)
+            for row in self._read_archived_rows(index["tasks_blob_path"], run_id)
+        ]
+
+
+def get_run_with_archive(run_id: str, repo=None):
+    """
+    Read-through run lookup for status endpoints.
+
+    Returns the hot WorkflowRun when present, otherwise the archived one,
+    otherwise None.
+    """
+    if repo is None:
+        from infrastructure.workflow_run_repository import WorkflowRunRepository
+        repo = WorkflowRunRepository()
+
+    run = repo.get_by_run_id(run_id)
+    if run is not None:
+        return run
+    return WorkflowArchiveService(repo=repo).load_archived_run(run_id)
+
+
+__all__ = ['WorkflowArchiveService', 'get_run_with_archive']
@@ -26,6 +26,7 @@ the ``abfs://`` cloud URL as ``mount_path`` so downstream handlers
 import time
 from typing import Any, Dict, Optional
 
+from exceptions import InsufficientMountSpaceError
 from util_logger import LoggerFactory, ComponentType
 
 logger = LoggerFactory.create_logger(ComponentType.SERVICE, "handler_download_to_mount")
@@ -215,7 +216,9 @@ def zarr_download_to_mount(
         # ------------------------------------------------------------------
         # 6. Real download — stream blobs to mount
         # ------------------------------------------------------------------
-        result = download_prefix_to_mount(blob_repo, container, prefix, source_dir)
+        result = download_prefix_to_mount(
+            blob_repo, container, prefix, source_dir, run_id=run_id,
+        )
 
         elapsed = time.time() - start
         logger.info(
@@ -233,6 +236,14 @@ def zarr_download_to_mount(
             "total_bytes": result["total_bytes"],
         }
 
+    except InsufficientMountSpaceError as e:
+        logger.warning("zarr_download_to_mount: %s", e)
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "DiskSpaceError",
+            "retryable": True,
+        }
     except Exception as e:
         elapsed = time.time() - start
         logger.error("zarr_download_to_mount failed: %s (%0.1fs)", e, elapsed)
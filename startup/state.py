@@ -292,6 +292,21 @@ ENV_VARS_WITH_DEFAULTS: Dict[str, Dict[str, str]] = {
         "description": "Logging verbosity (DEBUG, INFO, WARNING, ERROR). Use DEBUG for verbose logging.",
         "category": "observability",
     },
+    "LOG_ASYNC": {
+        "default": "false",
+        "description": "Queue log records and write stdout/blob output from a background thread",
+        "category": "observability",
+    },
+    "LOG_QUEUE_SIZE": {
+        "default": "10000",
+        "description": "Async log queue capacity; INFO/DEBUG records are dropped (and counted) when full",
+        "category": "observability",
+    },
+    "LOG_SAMPLING": {
+        "default": "true",
+        "description": "Rate-limit INFO/DEBUG logs on hot paths (claim loops, per-run reads); false disables",
+        "category": "observability",
+    },
     # ETL metrics (separate purpose - not consolidated)
     "METRICS_ENABLED": {
         "default": "true",
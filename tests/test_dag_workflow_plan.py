@@ -0,0 +1,165 @@
+"""Tests for core.dag_workflow_plan — compiled plan cache and precompiled params."""
+import copy
+
+import pytest
+
+import core.dag_workflow_plan as plan_module
+from core.dag_workflow_plan import (
+    clear_workflow_plan_cache,
+    definition_hash,
+    get_workflow_plan,
+    workflow_plan_cache_stats,
+)
+from core.param_resolver import (
+    ParameterResolutionError,
+    resolve_fan_out_params,
+    resolve_task_params,
+    split_dotted_path,
+)
+
+
+WORKFLOW_DEF = {
+    "workflow": "test_plan",
+    "description": "Plan cache test workflow",
+    "version": 1,
+    "parameters": {},
+    "nodes": {
+        "prepare": {"type": "task", "handler": "prep_handler", "depends_on": []},
+        "scatter": {
+            "type": "fan_out",
+            "depends_on": ["prepare"],
+            "source": "prepare.result.items",
+            "task": {
+                "handler": "item_handler",
+                "params": {
+                    "path": "{{ item.path }}",
+                    "position": "{{ index }}",
+                    "run": "{{ inputs.run }}",
+                    "label": "tile-{{ item.path }}-{{ nodes.prepare.result.tag }}",
+                    "literal": 5,
+                },
+            },
+        },
+        "gather": {"type": "fan_in", "depends_on": ["scatter"], "aggregation": "collect"},
+        "use": {
+            "type": "task",
+            "handler": "use_handler",
+            "depends_on": ["prepare"],
+            "receives": {"second": "prepare.result.items.1.path", "tag": "prepare.result.tag"},
+        },
+    },
+}
+
+JOB_PARAMS = {"run": "r1"}
+OUTPUTS = {"prepare": {"result": {"items": [{"path": "a.tif"}, {"path": "b.tif"}], "tag": "v2"}}}
+
+
+def _with_version(version):
+    definition = copy.deepcopy(WORKFLOW_DEF)
+    definition["version"] = version
+    return definition
+
+
+@pytest.mark.unit
+def test_same_definition_returns_cached_plan():
+    clear_workflow_plan_cache()
+    first = get_workflow_plan(WORKFLOW_DEF)
+    second = get_workflow_plan(copy.deepcopy(WORKFLOW_DEF))
+
+    assert second is first
+    assert workflow_plan_cache_stats()["hits"] == 1
+    assert workflow_plan_cache_stats()["misses"] == 1
+
+
+@pytest.mark.unit
+def test_changed_definition_compiles_new_plan():
+    clear_workflow_plan_cache()
+    changed = copy.deepcopy(WORKFLOW_DEF)
+    changed["nodes"]["use"]["receives"]["tag"] = "prepare.result.other"
+
+    first = get_workflow_plan(WORKFLOW_DEF)
+    second = get_workflow_plan(changed)
+
+    assert definition_hash(changed) != definition_hash(WORKFLOW_DEF)
+    assert second is not first
+    assert second.receives["use"][1][1] == "prepare.result.other"
+
+
+@pytest.mark.unit
+def test_lru_evicts_least_recently_used_at_cap(monkeypatch):
+    clear_workflow_plan_cache()
+    monkeypatch.setattr(plan_module, "PLAN_CACHE_MAX_ENTRIES", 2)
+    v1 = get_workflow_plan(_with_version(1))
+    get_workflow_plan(_with_version(2))
+    get_workflow_plan(_with_version(1))  # v1 is now most recent
+    get_workflow_plan(_with_version(3))  # evicts v2
+
+    stats = workflow_plan_cache_stats()
+    assert (stats["size"], stats["evictions"]) == (2, 1)
+    assert get_workflow_plan(_with_version(1)) is v1
+    misses = workflow_plan_cache_stats()["misses"]
+    get_workflow_plan(_with_version(2))
+    assert workflow_plan_cache_stats()["misses"] == misses + 1
+
+
+@pytest.mark.unit
+def test_plan_structure():
+    plan = get_workflow_plan(WORKFLOW_DEF)
+
+    assert plan.topo_order.index("prepare") < plan.topo_order.index("scatter")
+    assert plan.topo_order.index("scatter") < plan.topo_order.index("gather")
+    assert plan.fan_in_sources == {"gather": "scatter"}
+    assert plan.fan_outs["scatter"].fan_in_names == ("gather",)
+    assert set(plan.fan_outs["scatter"].templates) == {"path", "position", "run", "label"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path, expected", [
+    ("prepare.result.tag", ("prepare", "result", "tag")),
+    ("prepare.result.items.0", ("prepare", "result", "items", "0")),
+    ("prepare", None),
+    ("prepare..tag", None),
+    ("", None),
+])
+def test_split_dotted_path(path, expected):
+    assert split_dotted_path(path) == expected
+
+
+@pytest.mark.unit
+def test_compiled_receives_resolve_like_uncompiled():
+    plan = get_workflow_plan(WORKFLOW_DEF)
+    node = plan.workflow_def.nodes["use"]
+
+    compiled = resolve_task_params(node, JOB_PARAMS, OUTPUTS, plan.receives["use"])
+    assert compiled == resolve_task_params(node, JOB_PARAMS, OUTPUTS)
+    assert compiled == {"second": "b.tif", "tag": "v2"}
+
+
+@pytest.mark.unit
+def test_compiled_fan_out_templates_render_like_uncompiled():
+    plan = get_workflow_plan(WORKFLOW_DEF)
+    task = plan.workflow_def.nodes["scatter"].task
+    templates = plan.fan_outs["scatter"].templates
+
+    for index, item in enumerate(OUTPUTS["prepare"]["result"]["items"]):
+        compiled = resolve_fan_out_params(task, item, index, JOB_PARAMS, OUTPUTS, templates)
+        assert compiled == resolve_fan_out_params(task, item, index, JOB_PARAMS, OUTPUTS)
+
+    assert compiled == {"path": "b.tif", "position": 1, "run": "r1", "label": "tile-b.tif-v2", "literal": 5}
+
+
+@pytest.mark.unit
+def test_uncompilable_template_fails_at_resolution_like_uncompiled():
+    definition = copy.deepcopy(WORKFLOW_DEF)
+    definition["nodes"]["scatter"]["task"]["params"]["broken"] = "{{ item.path "
+    plan = get_workflow_plan(definition)
+    task = plan.workflow_def.nodes["scatter"].task
+    templates = plan.fan_outs["scatter"].templates
+
+    assert "broken" not in templates
+    item = {"path": "a.tif"}
+    with pytest.raises(ParameterResolutionError) as compiled:
+        resolve_fan_out_params(task, item, 0, JOB_PARAMS, OUTPUTS, templates)
+    with pytest.raises(ParameterResolutionError) as uncompiled:
+        resolve_fan_out_params(task, item, 0, JOB_PARAMS, OUTPUTS)
+    assert str(compiled.value) == str(uncompiled.value)
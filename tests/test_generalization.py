@@ -0,0 +1,67 @@
+"""Tests for services.vector.generalization — tolerances and level selection."""
+import pytest
+
+from services.vector.generalization import (
+    metres_per_unit_from_wkt,
+    select_generalized_level,
+    tolerance_for_zoom,
+    zoom_for_bbox,
+)
+
+WGS84 = (
+    'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563]],'
+    'PRIMEM["Greenwich",0],UNIT["degree",0.0174532925199433]]'
+)
+WEB_MERCATOR = (
+    'PROJCS["WGS 84 / Pseudo-Mercator",' + WGS84 + ','
+    'PROJECTION["Mercator_1SP"],PARAMETER["central_meridian",0],'
+    'UNIT["metre",1,AUTHORITY["EPSG","9001"]],AXIS["X",EAST],AXIS["Y",NORTH]]'
+)
+US_FEET = WEB_MERCATOR.replace('UNIT["metre",1,', 'UNIT["US survey foot",0.304800609601219,')
+
+LEVELS = [
+    {"view_name": "t_z4", "min_zoom": 0, "max_zoom": 4},
+    {"view_name": "t_z7", "min_zoom": 5, "max_zoom": 7},
+    {"view_name": "t_z10", "min_zoom": 8, "max_zoom": 10},
+]
+
+
+@pytest.mark.unit
+def test_geographic_tolerance_is_one_pixel_in_degrees():
+    assert tolerance_for_zoom(0) == 360.0 / 256
+    assert tolerance_for_zoom(4) == pytest.approx(360.0 / 4096)
+
+
+@pytest.mark.unit
+def test_projected_tolerance_uses_crs_units():
+    # Web Mercator pixel at z0 is ~156 km
+    assert tolerance_for_zoom(0, 1.0) == pytest.approx(156543.034, rel=1e-6)
+    assert tolerance_for_zoom(4, 0.3048006) == pytest.approx(156543.034 / 16 / 0.3048006, rel=1e-6)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("srtext, expected", [
+    (WEB_MERCATOR, 1.0),
+    (US_FEET, 0.304800609601219),
+    (WGS84, None),
+    ("", None),
+    (None, None),
+])
+def test_metres_per_unit_from_wkt(srtext, expected):
+    assert metres_per_unit_from_wkt(srtext) == expected
+
+
+@pytest.mark.unit
+def test_zoom_for_bbox_scales_with_extent():
+    assert zoom_for_bbox([-180, -90, 180, 90]) == 2
+    assert zoom_for_bbox([10, 10, 11, 11]) == 10
+    assert zoom_for_bbox([0, 0, 0, 0]) >= 20
+
+
+@pytest.mark.unit
+def test_select_level_by_bbox():
+    assert select_generalized_level(LEVELS, bbox=[-180, -90, 180, 90])["view_name"] == "t_z4"
+    assert select_generalized_level(LEVELS, bbox=[0, 0, 20, 20])["view_name"] == "t_z7"
+    # Finer than the finest level: serve the base table
+    assert select_generalized_level(LEVELS, bbox=[0, 0, 0.01, 0.01]) is None
+    assert select_generalized_level(LEVELS) is None
@@ -0,0 +1,70 @@
+"""Tests for SystemGuardian set-based task recovery."""
+import pytest
+
+from services.system_guardian import PhaseResult, SystemGuardian, _RecoveryPlan
+
+
+class _FakeRepo:
+    def __init__(self):
+        self.incremented = []
+        self.failed = {}
+
+    def increment_task_retries(self, task_ids):
+        self.incremented.extend(task_ids)
+        return {tid: 1 for tid in task_ids}
+
+    def mark_tasks_failed(self, task_ids, error):
+        self.failed[error] = list(task_ids)
+
+
+class _FlakyQueue:
+    def __init__(self, fail_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.sent = []
+
+    def send_message(self, queue_name, msg):
+        if msg.task_id in self.fail_ids:
+            raise ConnectionError("queue unavailable")
+        self.sent.append(msg.task_id)
+
+
+def _task(task_id):
+    return {
+        "task_id": task_id,
+        "parent_job_id": "job-1",
+        "job_type": "test_job",
+        "task_type": "test_task",
+        "stage": 1,
+        "task_index": "0",
+        "parameters": {},
+        "retry_count": 0,
+    }
+
+
+def _apply(queue, task_ids):
+    repo = _FakeRepo()
+    plan = _RecoveryPlan()
+    for tid in task_ids:
+        plan.resend(_task(tid), f"resent:{tid}")
+    phase = PhaseResult(phase="task_recovery")
+    SystemGuardian(repo, queue)._apply_task_recovery(plan, phase)
+    return repo, phase
+
+
+@pytest.mark.unit
+def test_retry_counted_only_for_sent_tasks():
+    queue = _FlakyQueue(fail_ids={"t2"})
+    repo, phase = _apply(queue, ["t1", "t2", "t3"])
+
+    assert queue.sent == ["t1", "t3"]
+    assert repo.incremented == ["t1", "t3"]
+    assert phase.fixed == 2
+    assert phase.actions == ["resent:t1", "resent:t3"]
+
+
+@pytest.mark.unit
+def test_queue_outage_counts_no_retries():
+    repo, phase = _apply(_FlakyQueue(fail_ids={"t1", "t2"}), ["t1", "t2"])
+
+    assert repo.incremented == []
+    assert phase.fixed == 0
@@ -0,0 +1,74 @@
+"""Tests for H3Repository.get_changed_batch_indices query shape."""
+import contextlib
+import re
+
+import pytest
+
+from infrastructure.h3_repository import H3Repository
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query.as_string(None), params))
+
+    def fetchall(self):
+        return self.conn.rows
+
+
+class _FakeConn:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+
+def _run(rows=(), **kwargs):
+    repo = H3Repository.__new__(H3Repository)
+    conn = _FakeConn(list(rows))
+    repo._get_connection = lambda: contextlib.nullcontext(conn)
+    result = repo.get_changed_batch_indices(6, 1000, "POLYGON((0 0,1 0,1 1,0 0))", **kwargs)
+    (query, params), = conn.executed
+    return result, query, params
+
+
+def _cte(query, name):
+    return re.search(rf"{name} AS \((.*?)\n            \)", query, re.S).group(1)
+
+
+@pytest.mark.unit
+def test_intersecting_cells_found_before_numbering():
+    _, query, _ = _run()
+
+    changed = _cte(query, "changed")
+    numbered = _cte(query, "numbered")
+    assert "ST_Intersects(c.geom, p.geom)" in changed
+    assert "ROW_NUMBER()" not in changed
+    # The window ranks h3_index only; geometry is not carried through it
+    assert "ROW_NUMBER() OVER (ORDER BY c.h3_index)" in numbered
+    assert "geom" not in numbered
+    assert "JOIN changed ch ON ch.h3_index = n.h3_index" in query
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("scope, scope_params", [
+    ({}, []),
+    ({"iso3": "KEN"}, ["KEN"]),
+    ({"bbox": [1, 2, 3, 4]}, [1, 2, 3, 4]),
+])
+def test_params_line_up_with_placeholders(scope, scope_params):
+    result, query, params = _run(rows=[{"batch_index": 2, "changed_cells": 7}], **scope)
+
+    assert query.count("%s") == len(params)
+    assert params == ["POLYGON((0 0,1 0,1 1,0 0))", 6, 1000, 6] + scope_params
+    assert result == {2: 7}
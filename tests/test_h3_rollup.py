@@ -0,0 +1,84 @@
+"""Tests for H3Repository.compose_rollup_stats — parent stats from children."""
+import numpy as np
+import pytest
+
+from infrastructure.h3_repository import H3Repository
+
+compose = H3Repository.compose_rollup_stats
+ALL = H3Repository.ROLLUP_STAT_TYPES
+
+
+def _child(pixels, drop=()):
+    """Child stats as the raster pass stores them (population std)."""
+    pixels = np.asarray(pixels, dtype=float)
+    stats = {"count": float(len(pixels)), "pixel_count": len(pixels)}
+    if len(pixels):
+        stats.update(
+            sum=float(pixels.sum()),
+            mean=float(pixels.mean()),
+            min=float(pixels.min()),
+            max=float(pixels.max()),
+            std=float(pixels.std()),
+        )
+    else:
+        stats.update(sum=None, mean=None, min=None, max=None, std=None)
+    for key in drop:
+        stats[key] = None
+    return stats
+
+
+PIXELS = [[1, 2, 3, 4], [10, 20], [-5, 0, 5, 7, 9.5]]
+
+
+@pytest.mark.unit
+def test_composes_to_stats_of_pooled_pixels():
+    parent = compose([_child(p) for p in PIXELS], ALL)
+    pooled = np.concatenate([np.asarray(p, dtype=float) for p in PIXELS])
+
+    assert parent["count"] == len(pooled)
+    assert parent["sum"] == pytest.approx(pooled.sum())
+    assert parent["mean"] == pytest.approx(pooled.mean())
+    assert parent["min"] == pooled.min()
+    assert parent["max"] == pooled.max()
+    assert parent["std"] == pytest.approx(pooled.std())
+
+
+@pytest.mark.unit
+def test_sum_derived_from_mean_and_count_from_pixel_count():
+    children = [_child(PIXELS[0], drop=("sum",)), _child(PIXELS[1], drop=("count",))]
+    parent = compose(children, ALL)
+
+    assert parent["count"] == 6
+    assert parent["sum"] == pytest.approx(40)
+    assert parent["mean"] == pytest.approx(40 / 6)
+    assert parent["std"] == pytest.approx(np.std([1, 2, 3, 4, 10, 20]))
+
+
+@pytest.mark.unit
+def test_empty_child_does_not_block_or_skew():
+    parent = compose([_child(PIXELS[0]), _child([])], ALL)
+
+    assert parent == pytest.approx(compose([_child(PIXELS[0])], ALL))
+
+
+@pytest.mark.unit
+def test_all_empty_parent_has_count_zero_and_no_values():
+    parent = compose([_child([]), _child([])], ALL)
+
+    assert parent == {"count": 0.0, "sum": 0.0, "mean": None, "std": None, "min": None, "max": None}
+
+
+@pytest.mark.unit
+def test_stat_missing_on_a_child_is_not_composed():
+    parent = compose([_child(PIXELS[0]), _child(PIXELS[1], drop=("std", "min"))], ALL)
+
+    assert "std" not in parent
+    assert "min" not in parent
+    assert parent["max"] == 20
+
+
+@pytest.mark.unit
+def test_only_stored_stat_types_are_returned():
+    parent = compose([_child(p) for p in PIXELS], ["mean", "max", "median"])
+
+    assert set(parent) == {"mean", "max"}
@@ -0,0 +1,149 @@
+"""Tests for infrastructure.mount_space — reservations and LRU eviction."""
+import os
+import time
+
+import pytest
+
+from exceptions import InsufficientMountSpaceError
+from infrastructure.mount_space import MountSpaceManager
+
+CAPACITY = 10_000
+
+
+def _make_dir(root, name, nbytes, age_seconds=0):
+    path = root / name
+    path.mkdir()
+    (path / "data.bin").write_bytes(b"\0" * nbytes)
+    if age_seconds:
+        old = time.time() - age_seconds
+        os.utime(path, (old, old))
+    return path
+
+
+def _manager(root, statuses=None, prefix_statuses=None, **kwargs):
+    """Manager over *root* with a fake CAPACITY-byte filesystem."""
+    params = dict(
+        mount_root=str(root),
+        min_free_bytes=1_000,
+        claim_min_free_bytes=2_000,
+        reservation_ttl_seconds=3600,
+        orphan_grace_seconds=600,
+    )
+    params.update(kwargs)
+    manager = MountSpaceManager(
+        owner_status_fn=lambda ids: {i: s for i, s in (statuses or {}).items() if i in ids},
+        job_prefix_status_fn=lambda p: {k: v for k, v in (prefix_statuses or {}).items() if k in p},
+        **params,
+    )
+    # Reservation markers are tiny; leave them out so the arithmetic stays exact
+    manager.free_bytes = lambda: CAPACITY - sum(
+        MountSpaceManager._dir_bytes(str(p)) for p in root.iterdir() if not p.name.startswith(".")
+    )
+    return manager
+
+
+@pytest.mark.unit
+def test_reservations_count_against_available(tmp_path):
+    manager = _manager(tmp_path)
+    assert manager.available_bytes() == CAPACITY - 1_000
+
+    with manager.reserve("run-a", 4_000, "test"):
+        assert manager.reserved_bytes() == 4_000
+        with pytest.raises(InsufficientMountSpaceError):
+            with manager.reserve("run-b", 6_000, "test"):
+                pass
+
+    assert manager.reserved_bytes() == 0
+    assert manager.stats()["reservations_rejected"] == 1
+
+
+@pytest.mark.unit
+def test_bytes_written_under_reservation_are_not_counted_twice(tmp_path):
+    _make_dir(tmp_path, "run-a", 500)
+    manager = _manager(tmp_path)
+
+    with manager.reserve("run-a", 4_000, "test"):
+        assert manager.available_bytes() == CAPACITY - 1_000 - 500 - 4_000
+        (tmp_path / "run-a" / "part1.bin").write_bytes(b"\0" * 1_500)
+        assert manager.reserved_bytes() == 2_500
+        (tmp_path / "run-a" / "part2.bin").write_bytes(b"\0" * 3_000)
+        # Overshoot: the reservation is used up, free space tells the rest
+        assert manager.reserved_bytes() == 0
+        assert manager.available_bytes() == CAPACITY - 1_000 - 5_000
+        assert manager.admit_claim()
+
+
+@pytest.mark.unit
+def test_expired_reservation_markers_are_ignored(tmp_path):
+    manager = _manager(tmp_path, reservation_ttl_seconds=-1)
+    with manager.reserve("run-a", 4_000, "test"):
+        assert manager.reserved_bytes() == 0
+
+
+@pytest.mark.unit
+def test_reserve_evicts_completed_before_failed(tmp_path):
+    _make_dir(tmp_path, "done-old", 3_000, age_seconds=200)
+    _make_dir(tmp_path, "done-new", 3_000, age_seconds=100)
+    _make_dir(tmp_path, "failed", 1_000)
+    manager = _manager(tmp_path, {"done-old": "completed", "done-new": "completed", "failed": "failed"})
+
+    with manager.reserve("run-x", 4_000, "test"):
+        pass
+
+    # 7,000 used, 2,000 available: one completed dir (LRU) frees enough
+    assert sorted(os.listdir(tmp_path)) == [".mount-reservations", "done-new", "failed"]
+
+
+@pytest.mark.unit
+def test_active_reserved_and_young_orphan_dirs_are_kept(tmp_path):
+    _make_dir(tmp_path, "running", 3_000)
+    _make_dir(tmp_path, "orphan-new", 3_000)
+    _make_dir(tmp_path, "orphan-old", 1_000, age_seconds=3600)
+    _make_dir(tmp_path, "discovery_cache", 1_000, age_seconds=3600)
+    manager = _manager(tmp_path, {"running": "processing"})
+
+    summary = manager.evict_to_watermark()
+
+    assert summary["removed"] == ["orphan-old"]
+
+
+@pytest.mark.unit
+def test_dir_with_live_reservation_is_not_evicted(tmp_path):
+    _make_dir(tmp_path, "run-a", 8_000)
+    manager = _manager(tmp_path, {"run-a": "completed"})
+
+    with manager.reserve("run-a", 0, "test"):
+        assert manager.evict_to_watermark()["dirs_removed"] == 0
+    assert manager.evict_to_watermark()["removed"] == ["run-a"]
+
+
+@pytest.mark.unit
+def test_legacy_job_prefix_dirs_resolve_to_jobs(tmp_path):
+    _make_dir(tmp_path, "aaaaaaaa", 4_000, age_seconds=3600)
+    _make_dir(tmp_path, "bbbbbbbb_0123456789ab", 2_000, age_seconds=3600)
+    _make_dir(tmp_path, "cccccccc", 2_000, age_seconds=3600)
+    _make_dir(tmp_path, "collection_dddddddd", 1_000, age_seconds=3600)
+    manager = _manager(
+        tmp_path,
+        prefix_statuses={"aaaaaaaa": "processing", "bbbbbbbb": "completed", "dddddddd": "processing"},
+        claim_min_free_bytes=6_000,
+    )
+
+    summary = manager.evict_to_watermark()
+
+    # Processing jobs' dirs are kept despite being idle past the grace period
+    assert sorted(summary["removed"]) == ["bbbbbbbb_0123456789ab", "cccccccc"]
+    assert os.path.isdir(tmp_path / "aaaaaaaa")
+    assert os.path.isdir(tmp_path / "collection_dddddddd")
+
+
+@pytest.mark.unit
+def test_failed_status_lookup_evicts_nothing(tmp_path):
+    _make_dir(tmp_path, "run-a", 8_000, age_seconds=3600)
+    manager = _manager(tmp_path)
+
+    def boom(ids):
+        raise RuntimeError("db down")
+    manager._owner_status_fn = boom
+
+    assert manager.evict_to_watermark()["dirs_removed"] == 0
@@ -0,0 +1,86 @@
+"""Tests for services.vector.parquet_analytics over small GeoParquet files."""
+import json
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+import geopandas as gpd
+import pyarrow.parquet as pq
+from shapely.geometry import Point
+
+from services.vector.parquet_analytics import (
+    count_distinct_values,
+    distinct_values,
+    geoparquet_bounds,
+    parquet_column_types,
+)
+
+
+def _write(path, names, points, **extra):
+    gdf = gpd.GeoDataFrame(
+        {"name": names, "n": list(range(len(names))), **extra},
+        geometry=[Point(x, y) for x, y in points],
+        crs="EPSG:4326",
+    )
+    gdf.to_parquet(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def two_files(tmp_path):
+    return [
+        _write(tmp_path / "a.parquet", ["x", "y", None], [(0, 0), (1, 2), (3, 1)]),
+        _write(tmp_path / "b.parquet", ["y", "z"], [(-5, -1), (2, 8)]),
+    ]
+
+
+@pytest.mark.unit
+def test_column_types(tmp_path):
+    path = _write(tmp_path / "t.parquet", ["a"], [(0, 0)], raw=[b"\x00\x01"])
+    types = parquet_column_types(path)
+
+    assert types["name"] == "VARCHAR"
+    assert types["n"] == "BIGINT"
+    assert types["raw"] == "BLOB"
+    # GEOMETRY with the spatial extension loaded, raw WKB otherwise; SC-2
+    # rejects both
+    assert types["geometry"].startswith("GEOMETRY") or types["geometry"] == "BLOB"
+
+
+@pytest.mark.unit
+def test_distinct_values_across_files_skip_nulls(two_files):
+    assert count_distinct_values(two_files, "name") == 3
+    assert distinct_values(two_files, "name") == ["x", "y", "z"]
+
+
+@pytest.mark.unit
+def test_bounds_union_across_files(two_files):
+    assert geoparquet_bounds(two_files) == [-5.0, -1.0, 3.0, 8.0]
+
+
+@pytest.mark.unit
+def test_bounds_from_3d_bbox(tmp_path):
+    path = _write(tmp_path / "z.parquet", ["a"], [(0, 0)])
+    table = pq.read_table(path)
+    geo = json.loads(table.schema.metadata[b"geo"])
+    geo["columns"]["geometry"]["bbox"] = [1, 2, -10, 3, 4, 10]
+    pq.write_table(table.replace_schema_metadata({**table.schema.metadata, b"geo": json.dumps(geo)}), path)
+
+    assert geoparquet_bounds(path) == [1.0, 2.0, 3.0, 4.0]
+
+
+@pytest.mark.unit
+def test_bounds_none_without_geo_footer(tmp_path, two_files):
+    plain = str(tmp_path / "plain.parquet")
+    table = pq.read_table(two_files[0])
+    pq.write_table(table.replace_schema_metadata({}), plain)
+
+    assert geoparquet_bounds(plain) is None
+    # One file without a bbox makes the whole set unknown
+    assert geoparquet_bounds([two_files[0], plain]) is None
+
+
+@pytest.mark.unit
+def test_bounds_none_for_other_geometry_column(two_files):
+    assert geoparquet_bounds(two_files, geometry_column="geom") is None
@@ -0,0 +1,142 @@
+"""Tests for infrastructure.progress_buffer — coalescing, flushing, requeue."""
+import threading
+
+import pytest
+
+from infrastructure.progress_buffer import ProgressWriteBuffer
+
+
+class _FakeMetricsRepo:
+    def __init__(self):
+        self.rows = []
+
+    def write_batch(self, rows):
+        self.rows.extend(rows)
+        return len(rows)
+
+
+class _FakeTaskRepo:
+    """save_checkpoints sink; fails while `fail` is set, can block on `gate`."""
+
+    def __init__(self):
+        self.saved = []
+        self.fail = False
+        self.gate = None
+        self.entered = threading.Event()
+
+    def save_checkpoints(self, items):
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.fail:
+            raise RuntimeError("db down")
+        self.saved.extend(items)
+        return len(items)
+
+
+def _buffer(max_events=100):
+    buf = ProgressWriteBuffer(flush_interval=3600, max_events=max_events)
+    buf._metrics_repo = _FakeMetricsRepo()
+    # Flush only when a test asks to
+    buf._ensure_thread = lambda: None
+    return buf
+
+
+@pytest.mark.unit
+def test_snapshots_and_checkpoints_coalesce():
+    buf = _buffer()
+    repo = _FakeTaskRepo()
+    for i in range(5):
+        buf.record_snapshot("job-1", {"n": i})
+        buf.record_checkpoint("task-1", repo, i, {"phase": i})
+
+    assert buf.flush() == 2
+    assert [r["payload"] for r in buf._metrics_repo.rows] == [{"n": 4}]
+    assert [(c["checkpoint_phase"], c["checkpoint_data"]) for c in repo.saved] == [(4, {"phase": 4})]
+
+
+@pytest.mark.unit
+def test_events_are_bounded_oldest_dropped():
+    buf = _buffer(max_events=3)
+    for i in range(5):
+        buf.record_event("job-1", {"i": i})
+
+    assert buf.stats()["events_dropped"] == 2
+    buf.flush()
+    assert [r["payload"]["i"] for r in buf._metrics_repo.rows] == [2, 3, 4]
+
+
+@pytest.mark.unit
+def test_scoped_flush_leaves_other_records_pending():
+    buf = _buffer()
+    repo = _FakeTaskRepo()
+    buf.record_snapshot("job-1", {})
+    buf.record_event("job-1", {})
+    buf.record_event("job-2", {})
+    buf.record_checkpoint("task-1", repo, 1, {})
+    buf.record_checkpoint("task-2", repo, 1, {})
+
+    assert buf.flush(job_id="job-1", task_id="task-1") == 3
+
+    stats = buf.stats()
+    assert (stats["pending_snapshots"], stats["pending_events"], stats["pending_checkpoints"]) == (0, 1, 1)
+    assert [c["task_id"] for c in repo.saved] == ["task-1"]
+
+
+@pytest.mark.unit
+def test_failed_checkpoint_is_requeued():
+    buf = _buffer()
+    repo = _FakeTaskRepo()
+    repo.fail = True
+    buf.record_checkpoint("task-1", repo, 1, {"a": 1})
+
+    assert buf.flush() == 0
+    assert buf.stats()["pending_checkpoints"] == 1
+
+    repo.fail = False
+    assert buf.flush() == 1
+    assert repo.saved[0]["checkpoint_data"] == {"a": 1}
+
+
+@pytest.mark.unit
+def test_failed_checkpoint_does_not_replace_newer_one():
+    buf = _buffer()
+    repo = _FakeTaskRepo()
+    repo.fail = True
+    repo.gate = threading.Event()
+    buf.record_checkpoint("task-1", repo, 1, {"old": True})
+
+    flusher = threading.Thread(target=buf.flush)
+    flusher.start()
+    assert repo.entered.wait(5)
+    buf.record_checkpoint("task-1", repo, 2, {"new": True})
+    repo.gate.set()
+    flusher.join(5)
+
+    repo.fail, repo.gate = False, None
+    buf.flush()
+    assert [c["checkpoint_data"] for c in repo.saved] == [{"new": True}]
+
+
+@pytest.mark.unit
+def test_discard_waits_for_in_flight_flush():
+    buf = _buffer()
+    repo = _FakeTaskRepo()
+    repo.fail = True
+    repo.gate = threading.Event()
+    buf.record_checkpoint("task-1", repo, 3, {})
+
+    flusher = threading.Thread(target=buf.flush)
+    flusher.start()
+    assert repo.entered.wait(5)
+
+    discarder = threading.Thread(target=buf.discard_checkpoint, args=("task-1",))
+    discarder.start()
+    discarder.join(0.2)
+    assert discarder.is_alive()
+
+    # The in-flight write fails and re-queues; the discard must still win
+    repo.gate.set()
+    flusher.join(5)
+    discarder.join(5)
+    assert buf.stats()["pending_checkpoints"] == 0
@@ -0,0 +1,36 @@
+"""Tests for the stage_task_counters DDL in core.schema.sql_generator."""
+import pytest
+
+from core.schema.sql_generator import PydanticToSQL
+
+
+def _statements():
+    return [stmt.as_string(None) for stmt in PydanticToSQL().generate_composed_statements()]
+
+
+@pytest.mark.schema
+def test_backfill_runs_after_counter_triggers():
+    statements = _statements()
+    trigger_idx = max(
+        i for i, s in enumerate(statements) if "CREATE TRIGGER" in s and "stage_counter" in s
+    )
+    backfill_idx = next(
+        i for i, s in enumerate(statements) if "LOCK TABLE" in s and "stage_task_counters" in s
+    )
+    table_idx = next(
+        i for i, s in enumerate(statements)
+        if s.lstrip().startswith("CREATE TABLE") and "stage_task_counters" in s
+    )
+
+    assert table_idx < trigger_idx < backfill_idx
+
+
+@pytest.mark.schema
+def test_backfill_recounts_in_flight_jobs_under_share_lock():
+    backfill = PydanticToSQL().generate_stage_counter_backfill()[0].as_string(None)
+
+    assert 'LOCK TABLE "app".tasks IN SHARE MODE' in backfill
+    assert "j.status IN ('queued', 'processing')" in backfill
+    # Partial rows inserted by the trigger after deploy must be overwritten, not summed
+    assert "total_tasks = EXCLUDED.total_tasks" in backfill
+    assert "remaining_tasks = EXCLUDED.remaining_tasks" in backfill
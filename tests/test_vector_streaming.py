@@ -0,0 +1,110 @@
+"""Tests for services.vector.converters — streaming GeoParquet vs in-memory parity."""
+import geopandas as gpd
+import pytest
+
+from services.vector.converters import (
+    _convert_csv,
+    _convert_geojson,
+    stream_to_geoparquet,
+)
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def _stream(path, ext, tmp_path, **params):
+    out = str(tmp_path / "out.parquet")
+    info = stream_to_geoparquet(path, ext, out, **params)
+    return info, gpd.read_parquet(out)
+
+
+def _assert_same(streamed, expected):
+    assert len(streamed) == len(expected)
+    assert list(streamed.geometry.to_wkt()) == list(expected.geometry.to_wkt())
+    for col in expected.columns:
+        if col != expected.geometry.name:
+            assert list(streamed[col]) == list(expected[col])
+
+
+WKT_CSV = (
+    "name,geometry\n"
+    "a,POINT (1 2)\n"
+    "b,\"POLYGON ((0 0, 1 0, 1 1, 0 0))\"\n"
+    "c,not wkt\n"
+    "d,POINT (3 4)\n"
+)
+
+
+@pytest.mark.unit
+def test_csv_wkt_column_named_geometry(tmp_path):
+    path = _write(tmp_path, "wkt.csv", WKT_CSV)
+    info, streamed = _stream(path, "csv", tmp_path, wkt_column="geometry")
+
+    assert info["mode"] == "stream"
+    _assert_same(streamed, _convert_csv(path, wkt_column="geometry"))
+    assert list(streamed["name"]) == ["a", "b", "d"]
+
+
+@pytest.mark.unit
+def test_csv_wkt_column_other_name(tmp_path):
+    path = _write(tmp_path, "wkt.csv", WKT_CSV.replace("name,geometry", "name,WKT"))
+    _, streamed = _stream(path, "csv", tmp_path, wkt_column="wkt")
+
+    _assert_same(streamed, _convert_csv(path, wkt_column="wkt"))
+
+
+@pytest.mark.unit
+def test_csv_lat_lon_parity(tmp_path):
+    path = _write(tmp_path, "pts.csv", "id,lat,lon\n1,10.5,20.25\n2,-5,170\n3,0,0\n")
+    _, streamed = _stream(path, "csv", tmp_path, lat_name="lat", lon_name="lon")
+
+    _assert_same(streamed, _convert_csv(path, lat_name="lat", lon_name="lon"))
+
+
+@pytest.mark.unit
+def test_csv_null_coordinates_dropped(tmp_path):
+    path = _write(tmp_path, "pts.csv", "id,lat,lon\n1,10,20\n2,,30\n3,40,NaN\n4,1,2\n")
+    _, streamed = _stream(path, "csv", tmp_path, lat_name="lat", lon_name="lon")
+
+    assert list(streamed["id"]) == [1, 4]
+    assert not streamed.geometry.is_empty.any()
+
+
+@pytest.mark.unit
+def test_csv_all_null_coordinates_rejected(tmp_path):
+    path = _write(tmp_path, "pts.csv", "id,lat,lon\n1,1,\n" + "".join(f"{i},,\n" for i in range(2, 5)))
+    with pytest.raises(ValueError, match="null or NaN coordinates"):
+        _stream(path, "csv", tmp_path, lat_name="lat", lon_name="lon")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text", [
+    '{"type": "FeatureCollection", "features": [',   # truncated JSON
+    '{"foo": 1}',                                    # JSON, not GeoJSON
+    '{"type": "Topology", "objects": {}, "arcs": []}',
+])
+def test_geojson_invalid_matches_in_memory_error(tmp_path, text):
+    path = _write(tmp_path, "bad.geojson", text)
+    with pytest.raises(ValueError) as expected:
+        _convert_geojson(path)
+    with pytest.raises(ValueError) as streamed:
+        _stream(path, "geojson", tmp_path)
+
+    assert str(streamed.value) == str(expected.value)
+
+
+@pytest.mark.unit
+def test_geojson_parity(tmp_path):
+    path = _write(tmp_path, "ok.geojson", (
+        '{"type": "FeatureCollection", "features": ['
+        '{"type": "Feature", "properties": {"a": 1}, "geometry": {"type": "Point", "coordinates": [1, 2]}},'
+        '{"type": "Feature", "properties": {"a": 2}, "geometry": {"type": "Point", "coordinates": [3, 4]}}'
+        ']}'
+    ))
+    info, streamed = _stream(path, "geojson", tmp_path)
+
+    assert info["mode"] == "stream"
+    _assert_same(streamed, _convert_geojson(path))
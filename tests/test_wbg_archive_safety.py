@@ -0,0 +1,75 @@
+"""Tests for archive safety on the WBG pair path (ZIP listed, rasters streamed to bronze)."""
+import os
+import shutil
+import zipfile
+
+import pytest
+
+import infrastructure.blob
+import infrastructure.etl_mount
+from services.discovery.handler_wbg_process_pair import wbg_process_single_pair
+
+
+class _FakeBlobRepo:
+    """Serves one local ZIP as the bronze copy and records uploads."""
+
+    def __init__(self, zip_path):
+        self.zip_path = zip_path
+        self.written = {}
+
+    def copy_blob(self, *args):
+        pass
+
+    def stream_blob_to_mount(self, container, blob_name, dest):
+        shutil.copyfile(self.zip_path, dest)
+
+    def write_blob(self, container, blob_path, stream):
+        self.written[blob_path] = stream.read()
+
+
+def _run_pair(tmp_path, monkeypatch, members):
+    zip_path = str(tmp_path / "delivery.zip")
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+
+    repo = _FakeBlobRepo(zip_path)
+    monkeypatch.setattr(infrastructure.blob.BlobRepository, "for_zone", staticmethod(lambda zone: repo))
+    monkeypatch.setattr(infrastructure.etl_mount, "resolve_run_dir", lambda run_id: str(tmp_path / run_id))
+    os.makedirs(tmp_path / "run1", exist_ok=True)
+
+    result = wbg_process_single_pair({
+        "zip_blob": "cold/delivery.zip",
+        "container_name": "bronze",
+        "source_container": "cold",
+        "_run_id": "run1",
+    })
+    return result, repo
+
+
+@pytest.mark.unit
+def test_safe_raster_is_uploaded(tmp_path, monkeypatch):
+    result, repo = _run_pair(tmp_path, monkeypatch, {"dem.tif": os.urandom(4096), "readme.txt": b"hello"})
+
+    assert result["success"] is True
+    assert result["result"]["bronze_raster_paths"] == ["wbg_extracted/delivery/dem.tif"]
+    assert list(repo.written) == ["wbg_extracted/delivery/dem.tif"]
+
+
+@pytest.mark.unit
+def test_zip_bomb_raster_is_rejected_before_upload(tmp_path, monkeypatch):
+    result, repo = _run_pair(tmp_path, monkeypatch, {"dem.tif": b"\0" * (4 * 1024 * 1024)})
+
+    assert result["success"] is False
+    assert result["error_type"] == "ZipBombDetected"
+    assert repo.written == {}
+
+
+@pytest.mark.unit
+def test_oversized_raster_is_rejected_before_upload(tmp_path, monkeypatch):
+    monkeypatch.setenv("DISCOVERY_MAX_EXTRACT_SIZE_MB", "1")
+    result, repo = _run_pair(tmp_path, monkeypatch, {"dem.tif": os.urandom(2 * 1024 * 1024)})
+
+    assert result["success"] is False
+    assert result["error_type"] == "SafetyLimitExceeded"
+    assert repo.written == {}
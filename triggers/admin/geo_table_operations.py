@@ -632,22 +632,24 @@ class GeoTableOperations:
         """
         Check for orphaned tables and metadata in geo schema.
 
-        GET /api/dbadmin/geo?type=orphans
+        GET /api/dbadmin/geo?type=orphans[&exact_counts=true]
 
         Detects:
         - Orphaned Tables: Tables in geo schema without metadata records
         - Orphaned Metadata: Metadata records for non-existent tables
 
-        Detection only - does NOT delete anything.
+        Detection only - does NOT delete anything. Row counts are catalog
+        estimates; exact_counts=true runs COUNT(*) on each orphaned table.
 
         Returns:
             JSON with orphaned tables, orphaned metadata, tracked tables, and summary
         """
         from services.geo_orphan_detector import geo_orphan_detector
 
-        logger.info("Running geo orphan detection...")
+        exact_counts = req.params.get('exact_counts', '').lower() == 'true'
+        logger.info(f"Running geo orphan detection (exact_counts={exact_counts})...")
 
-        result = geo_orphan_detector.run()
+        result = geo_orphan_detector.run(exact_counts=exact_counts)
         status_code = 200 if result.get("success") else 500
 
         return func.HttpResponse(
@@ -135,14 +135,27 @@ def dag_get_run(req: func.HttpRequest) -> func.HttpResponse:
 
         # Fetch run
         run = repo.get_by_run_id(run_id)
+        archived = False
         if run is None:
-            return _error_response(f"Run not found: {run_id}", status_code=404)
-
-        task_counts = repo.get_task_status_counts(run_id)
+            # Read-through: terminal runs past retention live in Parquet
+            from services.workflow_archive import WorkflowArchiveService
+            archive = WorkflowArchiveService(repo=repo)
+            run = archive.load_archived_run(run_id)
+            if run is None:
+                return _error_response(f"Run not found: {run_id}", status_code=404)
+            archived = True
+
+        if archived:
+            all_tasks = archive.load_archived_tasks(run_id)
+            task_counts = {}
+            for row in all_tasks:
+                task_counts[row["status"]] = task_counts.get(row["status"], 0) + 1
+        else:
+            task_counts = repo.get_task_status_counts(run_id)
+            # Active tasks = ready + running
+            all_tasks = repo.list_task_details(run_id)
         total_tasks = sum(task_counts.values())
 
-        # Active tasks = ready + running
-        all_tasks = repo.list_task_details(run_id)
         active_tasks = [
             {
                 "task_name": row["task_name"],
@@ -165,6 +178,7 @@ def dag_get_run(req: func.HttpRequest) -> func.HttpResponse:
             "request_id": run.request_id,
             "asset_id": run.asset_id,
             "release_id": run.release_id,
+            "archived": archived,
             "task_summary": {
                 "total": total_tasks,
                 "by_status": task_counts,
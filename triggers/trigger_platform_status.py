@@ -512,8 +512,8 @@ def _build_single_status_response(
         # DAG fallback: job_id may be a DAG run_id (Epoch 5 workflows)
         if job_id:
             try:
-                from infrastructure.workflow_run_repository import WorkflowRunRepository
-                dag_run = WorkflowRunRepository().get_by_run_id(job_id)
+                from services.workflow_archive import get_run_with_archive
+                dag_run = get_run_with_archive(job_id)
                 if dag_run:
                     job_status = dag_run.status.value if hasattr(dag_run.status, 'value') else str(dag_run.status)
                     job_result = dag_run.result_data
@@ -35,6 +35,17 @@ Global Log Context (10 JAN 2026 - F7.12.A):
 
     This enables filtering logs by component in multi-app deployments.
 
+Async Logging (LOG_ASYNC=true):
+    Loggers enqueue records on a bounded in-process queue; a single background
+    QueueListener thread formats them and writes stdout + JSONL blob output.
+    When the queue is full, records below WARNING are dropped (and counted)
+    rather than blocking the caller. Queue size: LOG_QUEUE_SIZE (default 10000).
+
+Log Sampling:
+    Hot paths (claim loops, per-run repository reads) opt in with
+    enable_log_sampling(logger). WARNING+ always passes; INFO/DEBUG records are
+    limited per call site per interval. LOG_SAMPLING=false disables sampling.
+
 Exports:
     ComponentType: Enum for component types
     LogLevel: Enum for log levels
@@ -51,6 +62,8 @@ Exports:
     get_database_stats: Database utilization snapshot (connections, cache, locks)
     log_database_checkpoint: Database checkpoint logger (utilization, cache ratios)
     get_global_log_context: Get global log context fields
+    enable_log_sampling: Rate-limit INFO/DEBUG records per call site on a logger
+    get_logging_stats: Async queue / dropped / sampled-out counters
 
 Dependencies:
     Standard library only (logging, enum, dataclasses, json)
@@ -63,6 +76,8 @@ from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 import json
@@ -71,6 +86,13 @@ import traceback
 from functools import wraps
 from contextlib import contextmanager
 import threading
+import atexit
+
+# Optional fast JSON serializer - falls back to stdlib json when absent
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 
 # ============================================================================
@@ -1525,12 +1547,37 @@ class OperationResult:
 # JSON FORMATTER - Structured logging for Azure Functions
 # ============================================================================
 
+def _json_dumps(obj: Dict[str, Any]) -> str:
+    """Serialize a log dict, using orjson when installed."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, default=str).decode('utf-8')
+    return json.dumps(obj, default=str)
+
+
 class JSONFormatter(logging.Formatter):
     """
     JSON formatter for structured logging in Azure Functions.
     Outputs logs in a format that Application Insights can automatically parse.
+
+    Timestamps come from record.created (set when the record was created), so
+    output is correct even when formatting happens later on the async writer
+    thread. The per-second ISO prefix is cached to avoid building a datetime
+    for every record.
     """
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ts_second: int = -1
+        self._ts_prefix: str = ''
+
+    def _timestamp(self, created: float) -> str:
+        """Return ISO-8601 UTC timestamp with microseconds for record.created."""
+        second = int(created)
+        if second != self._ts_second:
+            self._ts_prefix = datetime.fromtimestamp(second, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+            self._ts_second = second
+        return f"{self._ts_prefix}.{int((created - second) * 1_000_000):06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON for Application Insights.
@@ -1543,7 +1590,7 @@ class JSONFormatter(logging.Formatter):
         """
         # Build base log structure
         log_obj = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': self._timestamp(record.created),
             'level': record.levelname,
             'message': record.getMessage(),
             'logger': record.name,
@@ -1561,14 +1608,213 @@ class JSONFormatter(logging.Formatter):
             log_obj['exception'] = {
                 'type': record.exc_info[0].__name__ if record.exc_info[0] else None,
                 'message': str(record.exc_info[1]) if record.exc_info[1] else None,
-                'traceback': self.formatException(record.exc_info) if record.exc_info else None
+                'traceback': record.exc_text or self.formatException(record.exc_info)
             }
         
         # Add any extra fields from the record
         if hasattr(record, 'extra_fields'):
             log_obj.update(record.extra_fields)
         
-        return json.dumps(log_obj, default=str)
+        return _json_dumps(log_obj)
+
+
+# ============================================================================
+# ASYNC LOGGING PIPELINE + SAMPLING
+# ============================================================================
+# LOG_ASYNC=true moves formatting and stdout/blob writes off the calling
+# thread. Counters are process-wide and surfaced via get_logging_stats().
+
+_ASYNC_LOGGING = os.getenv('LOG_ASYNC', 'false').lower() == 'true'
+_LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+_LOG_SAMPLING_ENABLED = os.getenv('LOG_SAMPLING', 'true').lower() != 'false'
+
+_log_counters: Dict[str, int] = {'enqueued': 0, 'dropped': 0, 'sampled_out': 0}
+_log_counters_lock = threading.Lock()
+
+
+def _bump_log_counter(name: str) -> None:
+    with _log_counters_lock:
+        _log_counters[name] += 1
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Non-blocking QueueHandler for the async logging pipeline.
+
+    Records below WARNING are dropped (and counted) when the queue is full so
+    a slow stdout consumer never stalls a worker. WARNING+ falls back to a
+    blocking put with a short timeout so errors are not lost under load.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Resolve the message on the calling thread, defer JSON formatting.
+
+        Args are merged into msg (they may be mutated after the call returns)
+        and the traceback text is rendered now; exc_info is kept for the
+        exception type/message fields.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=1.0)
+            else:
+                self.queue.put_nowait(record)
+            _bump_log_counter('enqueued')
+        except queue.Full:
+            _bump_log_counter('dropped')
+
+
+_log_queue: Optional[queue.Queue] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_lock = threading.Lock()
+
+
+def _stop_log_listener() -> None:
+    """Drain the queue and stop the writer thread (registered with atexit)."""
+    global _queue_listener
+    if _queue_listener is not None:
+        try:
+            _queue_listener.stop()
+        except Exception:
+            pass
+        _queue_listener = None
+
+
+def _get_queue_handler() -> DroppingQueueHandler:
+    """
+    Get the singleton QueueHandler, starting the background writer on first use.
+
+    The listener owns the real sinks: one stdout StreamHandler with
+    JSONFormatter, plus the JSONL blob handler when observability is enabled.
+    """
+    global _log_queue, _queue_handler, _queue_listener
+
+    if _queue_handler is not None:
+        return _queue_handler
+
+    with _queue_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        _log_queue = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setFormatter(JSONFormatter())
+        sinks = [stdout_handler]
+        jsonl_handler = _get_jsonl_handler()
+        if jsonl_handler is not None:
+            sinks.append(jsonl_handler)
+
+        _queue_listener = logging.handlers.QueueListener(
+            _log_queue, *sinks, respect_handler_level=True
+        )
+        _queue_listener.start()
+        atexit.register(_stop_log_listener)
+
+        _queue_handler = DroppingQueueHandler(_log_queue)
+        return _queue_handler
+
+
+class LogSampler(logging.Filter):
+    """
+    Per-call-site rate limiter for high-frequency log statements.
+
+    Allows up to max_per_interval records below WARNING from each call site
+    (logger name + line) per interval_seconds; the rest are suppressed and
+    counted. The first record emitted after suppression carries
+    'sampled_suppressed' in its extra_fields so gaps are visible in the logs.
+    """
+
+    def __init__(self, max_per_interval: int = 10, interval_seconds: float = 60.0):
+        super().__init__()
+        self.max_per_interval = max_per_interval
+        self.interval_seconds = interval_seconds
+        self._windows: Dict[Tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval_seconds:
+                suppressed = window[2] if window else 0
+                window = [now, 0, 0]
+                self._windows[key] = window
+            else:
+                suppressed = 0
+
+            if window[1] >= self.max_per_interval:
+                window[2] += 1
+                allowed = False
+            else:
+                window[1] += 1
+                allowed = True
+
+        if not allowed:
+            _bump_log_counter('sampled_out')
+            return False
+
+        if suppressed:
+            extra_fields = dict(getattr(record, 'extra_fields', {}) or {})
+            extra_fields['sampled_suppressed'] = suppressed
+            record.extra_fields = extra_fields
+        return True
+
+
+def enable_log_sampling(
+    logger: logging.Logger,
+    max_per_interval: int = 10,
+    interval_seconds: float = 60.0
+) -> logging.Logger:
+    """
+    Attach a LogSampler to a logger (idempotent).
+
+    Intended for module loggers on hot paths such as task claim loops and
+    per-cycle repository reads. No-op when LOG_SAMPLING=false.
+
+    Args:
+        logger: Logger returned by LoggerFactory.create_logger
+        max_per_interval: Records allowed per call site per interval
+        interval_seconds: Window length
+
+    Returns:
+        The same logger, for chaining at module level
+    """
+    if not _LOG_SAMPLING_ENABLED:
+        return logger
+    if not any(isinstance(f, LogSampler) for f in logger.filters):
+        logger.addFilter(LogSampler(max_per_interval, interval_seconds))
+    return logger
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """
+    Snapshot of logging pipeline counters.
+
+    Returns:
+        Dict with async mode flag, queue depth/capacity, and
+        enqueued / dropped / sampled_out counts since process start
+    """
+    with _log_counters_lock:
+        stats: Dict[str, Any] = dict(_log_counters)
+    stats['async'] = _ASYNC_LOGGING
+    stats['sampling_enabled'] = _LOG_SAMPLING_ENABLED
+    stats['queue_depth'] = _log_queue.qsize() if _log_queue is not None else 0
+    stats['queue_capacity'] = _LOG_QUEUE_SIZE if _ASYNC_LOGGING else 0
+    stats['serializer'] = 'orjson' if _orjson is not None else 'json'
+    return stats
 
 
 # ============================================================================
@@ -1736,9 +1982,15 @@ class LoggerFactory:
         # This prevents duplicate handlers when create_logger is called multiple times
         # (20 DEC 2025: Fixed handler duplication issue)
         has_json_handler = any(
-            isinstance(h.formatter, JSONFormatter) for h in logger.handlers
+            isinstance(h, DroppingQueueHandler) or isinstance(h.formatter, JSONFormatter)
+            for h in logger.handlers
         )
-        if not has_json_handler:
+        if not has_json_handler and _ASYNC_LOGGING:
+            # Async mode: one shared queue handler; the background listener
+            # owns the stdout and JSONL sinks. The handler stays at NOTSET:
+            # it is shared by every logger, so filtering is per-logger only.
+            logger.addHandler(_get_queue_handler())
+        elif not has_json_handler:
             # Create console handler with JSON formatting
             handler = logging.StreamHandler(sys.stdout)
             handler.setLevel(log_level)